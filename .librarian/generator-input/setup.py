@@ -50,6 +50,11 @@ dependencies = [
     "proto-plus >= 1.25.0, <2.0.0; python_version>='3.13'",
     "protobuf>=3.20.2,<7.0.0,!=4.21.0,!=4.21.1,!=4.21.2,!=4.21.3,!=4.21.4,!=4.21.5",
 ]
+extras = {
+    # faster JSON serialization, see google.cloud.logging_v2.serialization
+    "orjson": ["orjson >= 3.6.0, < 4.0.0"],
+    "ujson": ["ujson >= 5.4.0, < 6.0.0"],
+}
 url = "https://github.com/googleapis/python-logging"
 
 package_root = os.path.abspath(os.path.dirname(__file__))
@@ -94,6 +99,7 @@ setuptools.setup(
     packages=packages,
     python_requires=">=3.7",
     install_requires=dependencies,
+    extras_require=extras,
     include_package_data=True,
     zip_safe=False,
 )
@@ -19,6 +19,7 @@ from google.cloud.logging_v2 import __version__
 from google.cloud.logging_v2 import ASCENDING
 from google.cloud.logging_v2 import DESCENDING
 
+from google.cloud.logging_v2.circuit_breaker import CircuitBreaker
 from google.cloud.logging_v2.client import Client
 from google.cloud.logging_v2.entries import logger_name_from_path
 from google.cloud.logging_v2.entries import LogEntry
@@ -26,6 +27,8 @@ from google.cloud.logging_v2.entries import TextEntry
 from google.cloud.logging_v2.entries import StructEntry
 from google.cloud.logging_v2.entries import ProtobufEntry
 from google.cloud.logging_v2 import handlers
+from google.cloud.logging_v2.logger import AsyncBatch
+from google.cloud.logging_v2.logger import AsyncLogger
 from google.cloud.logging_v2.logger import Logger
 from google.cloud.logging_v2.logger import Batch
 from google.cloud.logging_v2.metric import Metric
@@ -36,7 +39,10 @@ from google.cloud.logging_v2 import types
 __all__ = (
     "__version__",
     "ASCENDING",
+    "AsyncBatch",
+    "AsyncLogger",
     "Batch",
+    "CircuitBreaker",
     "Client",
     "DESCENDING",
     "handlers",
@@ -14,6 +14,7 @@
 
 """Common logging helpers."""
 
+import collections.abc
 import logging
 
 from datetime import datetime
@@ -22,10 +23,15 @@ from datetime import timezone
 
 import requests
 
+from google.api_core import exceptions
+from google.protobuf import any_pb2
+import google.protobuf.message
+
 from google.cloud.logging_v2.entries import LogEntry
 from google.cloud.logging_v2.entries import ProtobufEntry
 from google.cloud.logging_v2.entries import StructEntry
 from google.cloud.logging_v2.entries import TextEntry
+from google.cloud.logging_v2.types import WriteLogEntriesPartialErrors
 
 try:
     from google.cloud.logging_v2.types import LogSeverity
@@ -57,6 +63,31 @@ _NORMALIZED_SEVERITIES = {
 _TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
 """Time format for timestamps used in API"""
 
+_RETRYABLE_ERRORS = (
+    exceptions.Aborted,
+    exceptions.DeadlineExceeded,
+    exceptions.InternalServerError,
+    exceptions.ServiceUnavailable,
+    exceptions.GatewayTimeout,
+    exceptions.TooManyRequests,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    ConnectionError,
+    TimeoutError,
+)
+"""Errors from writing log entries that are transient, and worth retrying."""
+
+_WRITE_REQUEST_MAX_BYTES = 10 * 1024 * 1024
+"""Size limit of a single WriteLogEntries request imposed by the API."""
+
+_LOG_ENTRY_MAX_BYTES = 256 * 1024
+"""Size limit of a single log entry imposed by the API."""
+
+_ENTRY_OVERHEAD_BYTES = 100
+"""Estimated bytes for field names, timestamp and severity of a serialized entry."""
+
+_PARTIAL_ERRORS_TYPE = "google.logging.v2.WriteLogEntriesPartialErrors"
+
 METADATA_URL = "http://metadata.google.internal./computeMetadata/v1/"
 METADATA_HEADERS = {"Metadata-Flavor": "Google"}
 
@@ -120,6 +151,60 @@ def retrieve_metadata_server(metadata_key, timeout=5):
     return None
 
 
+def _estimate_value_size(value):
+    """Cheaply estimate the JSON-serialized size of a value, in bytes.
+
+    Args:
+        value (Any): A log payload, or one of its nested values.
+
+    Returns:
+        int: The estimated size.
+    """
+    if isinstance(value, str):
+        if value.isascii():
+            return len(value) + 2
+        return len(value.encode("utf-8")) + 2
+    if isinstance(value, collections.abc.Mapping):
+        return 2 + sum(
+            _estimate_value_size(key) + _estimate_value_size(item) + 2
+            for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return 2 + sum(_estimate_value_size(item) + 1 for item in value)
+    if isinstance(value, google.protobuf.message.Message):
+        return value.ByteSize()
+    # numbers, booleans, None and other small scalars
+    return 8
+
+
+def _estimate_log_entry_size(entry):
+    """Cheaply estimate the serialized size of a log entry, in bytes.
+
+    Args:
+        entry (~logging_v2.entries.LogEntry): The entry.
+
+    Returns:
+        int: The estimated size.
+    """
+    size = _ENTRY_OVERHEAD_BYTES + _estimate_value_size(entry.payload)
+    for value in (
+        entry.log_name,
+        entry.labels,
+        entry.insert_id,
+        entry.http_request,
+        entry.trace,
+        entry.span_id,
+        entry.source_location,
+        entry.operation,
+    ):
+        if value is not None:
+            size += _estimate_value_size(value)
+    if entry.resource is not None:
+        size += _estimate_value_size(entry.resource.type)
+        size += _estimate_value_size(entry.resource.labels)
+    return size
+
+
 def _normalize_severity(stdlib_level):
     """Normalize a Python stdlib severity to LogSeverity enum.
 
@@ -132,6 +217,78 @@ def _normalize_severity(stdlib_level):
     return _NORMALIZED_SEVERITIES.get(stdlib_level, stdlib_level)
 
 
+def _is_retryable_error(exc):
+    """Whether an error from writing log entries is transient.
+
+    Args:
+        exc (Exception): The error raised by the API call.
+
+    Returns:
+        bool: True if the same call may succeed when retried.
+    """
+    return isinstance(exc, _RETRYABLE_ERRORS)
+
+
+def _partial_error_statuses(detail):
+    """Helper for :func:`_parse_partial_errors`: reads one error detail.
+
+    Returns:
+        Optional[Dict[int, Tuple[int, str]]]: The status code and message of
+        each failed entry, by index, or None if the detail is of another type.
+    """
+    if isinstance(detail, collections.abc.Mapping):
+        # from the JSON API
+        if not str(detail.get("@type", "")).endswith("/" + _PARTIAL_ERRORS_TYPE):
+            return None
+        return {
+            int(index): (status.get("code", 2), status.get("message", ""))
+            for index, status in (detail.get("logEntryErrors") or {}).items()
+        }
+    message_cls = WriteLogEntriesPartialErrors.pb()
+    if isinstance(detail, any_pb2.Any):
+        # from the gRPC API, which only unpacks the google.rpc details
+        if not detail.Is(message_cls.DESCRIPTOR):
+            return None
+        message = message_cls()
+        detail.Unpack(message)
+    elif isinstance(detail, WriteLogEntriesPartialErrors):
+        message = WriteLogEntriesPartialErrors.pb(detail)
+    elif isinstance(detail, message_cls):
+        message = detail
+    else:
+        return None
+    return {
+        index: (status.code, status.message)
+        for index, status in message.log_entry_errors.items()
+    }
+
+
+def _parse_partial_errors(err):
+    """Parses the errors of the entries of a partially written request.
+
+    With ``partial_success``, the API writes the valid entries of a request,
+    and lists the others, by index in the request, in a
+    ``WriteLogEntriesPartialErrors`` detail of the error.
+
+    Args:
+        err (~google.api_core.exceptions.GoogleAPICallError): The error
+            raised by ``write_entries``.
+
+    Returns:
+        Optional[Dict[int, ~google.api_core.exceptions.GoogleAPICallError]]:
+        The error of each entry that was not written, by index, or None if
+        the error does not list them.
+    """
+    for detail in getattr(err, "details", None) or ():
+        statuses = _partial_error_statuses(detail)
+        if statuses is not None:
+            return {
+                index: exceptions.from_grpc_status(code, message)
+                for index, (code, message) in statuses.items()
+            }
+    return None
+
+
 def _add_defaults_to_filter(filter_):
     """Modify the input filter expression to add sensible defaults.
 
@@ -16,10 +16,13 @@
 
 import functools
 
+from google.api_core import exceptions
 from google.api_core import page_iterator
 from google.cloud import _http
 
 from google.cloud.logging_v2 import __version__
+from google.cloud.logging_v2 import serialization
+from google.cloud.logging_v2._helpers import _parse_partial_errors
 from google.cloud.logging_v2._helpers import entry_from_resource
 from google.cloud.logging_v2.sink import Sink
 from google.cloud.logging_v2.metric import Metric
@@ -172,6 +175,12 @@ class _LoggingAPI(object):
                 but the entries won't be persisted nor exported.
                 Useful for checking whether the logging API endpoints are working
                 properly before sending valuable data.
+
+        Raises:
+            ~google.api_core.exceptions.GoogleAPICallError: If the entries
+                were not all written. Its ``log_entry_errors`` maps the index
+                of each entry that was not written to its error, if the API
+                listed them, as it does with ``partial_success``, or is None.
         """
         data = {
             "entries": list(entries),
@@ -188,7 +197,18 @@ class _LoggingAPI(object):
         if labels is not None:
             data["labels"] = labels
 
-        self.api_request(method="POST", path="/entries:write", data=data)
+        # serialized here rather than by the connection, with the backend
+        # of google.cloud.logging_v2.serialization
+        try:
+            self.api_request(
+                method="POST",
+                path="/entries:write",
+                data=serialization.dumps_bytes(data),
+                content_type="application/json",
+            )
+        except exceptions.GoogleAPICallError as exc:
+            exc.log_entry_errors = _parse_partial_errors(exc)
+            raise
 
     def logger_delete(self, logger_name):
         """Delete all entries in a logger.
@@ -0,0 +1,379 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Circuit breaker for writing log entries to the Cloud Logging API."""
+
+import logging
+import os
+import sys
+import threading
+import time
+import weakref
+
+from google.api_core import exceptions
+
+from google.cloud.logging_v2 import _helpers
+from google.cloud.logging_v2 import serialization
+from google.cloud.logging_v2.entries import LogEntry
+
+_DEFAULT_FAILURE_THRESHOLD = 5
+_DEFAULT_RESET_TIMEOUT = 30.0  # Seconds
+
+_LOGGER = logging.getLogger(__name__)
+
+CLOSED = "closed"
+"""Calls go through. Consecutive transient failures are counted."""
+
+OPEN = "open"
+"""Calls fail fast, or go to the fallback, until the reset timeout elapses."""
+
+HALF_OPEN = "half_open"
+"""A single probe call goes through, to find out if the API recovered."""
+
+
+class CircuitOpenError(exceptions.ServiceUnavailable):
+    """Raised instead of calling the API while the circuit is open."""
+
+
+class CircuitBreaker(object):
+    """Stops writing log entries to an API that keeps failing.
+
+    After ``failure_threshold`` consecutive transient failures, such as
+    UNAVAILABLE or DEADLINE_EXCEEDED, the circuit opens: writes fail fast with
+    :class:`CircuitOpenError`, or go to the ``fallback``, without calling the
+    API. After ``reset_timeout`` seconds, a single write is let through as a
+    probe. The circuit closes if it succeeds, and opens again otherwise.
+
+    Permanent API errors, such as INVALID_ARGUMENT, show that the API is
+    reachable, and do not count as failures. Other errors, such as a
+    :class:`TypeError` raised before the request is sent, count neither as
+    failures nor as successes.
+
+    A breaker is passed to :class:`~logging_v2.client.Client`, and shared by
+    everything writing entries through that client.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold=_DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout=_DEFAULT_RESET_TIMEOUT,
+        fallback=None,
+    ):
+        """
+        Args:
+            failure_threshold (Optional[int]): The number of consecutive
+                transient failures that opens the circuit.
+            reset_timeout (Optional[float]): The time, in seconds, after which
+                an open circuit lets a probe call through.
+            fallback (Optional[Callable]): Called instead of the API while the
+                circuit is open, with the same arguments as ``write_entries``.
+                For example, :func:`write_entries_to_stdout`. If ``None``,
+                :class:`CircuitOpenError` is raised instead.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.fallback = fallback
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._rejected_calls = 0
+        self._lock = threading.Lock()
+        _BREAKERS.add(self)
+
+    @property
+    def state(self):
+        """str: One of :data:`CLOSED`, :data:`OPEN` or :data:`HALF_OPEN`."""
+        with self._lock:
+            if self._state == OPEN and self._reset_timeout_elapsed():
+                return HALF_OPEN
+            return self._state
+
+    @property
+    def rejected_calls(self):
+        """int: The number of calls not made because the circuit was open."""
+        return self._rejected_calls
+
+    def _reset_timeout_elapsed(self):
+        return time.monotonic() - self._opened_at >= self.reset_timeout
+
+    def _acquire(self):
+        """Whether a call may go through. Must be called with the lock held."""
+        if self._state == CLOSED:
+            return True
+        if self._state == OPEN and self._reset_timeout_elapsed():
+            self._state = HALF_OPEN
+        if self._state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self._rejected_calls += 1
+        return False
+
+    def raise_if_open(self):
+        """Fails fast if the circuit is open and there is no fallback.
+
+        Lets callers skip preparing a request that would be rejected. Does not
+        count as a call.
+
+        Raises:
+            CircuitOpenError: If a call would be rejected.
+        """
+        if self.fallback is not None:
+            return
+        with self._lock:
+            rejected = self._state == OPEN and not self._reset_timeout_elapsed()
+            rejected = rejected or (self._state == HALF_OPEN and self._probing)
+        if rejected:
+            raise CircuitOpenError("Cloud Logging circuit breaker is open")
+
+    def call(self, func, *args, **kwargs):
+        """Calls ``func`` if the circuit allows it.
+
+        Args:
+            func (Callable): The API call.
+            args (tuple): Positional arguments for ``func``, and the fallback.
+            kwargs (dict): Keyword arguments for ``func``, and the fallback.
+
+        Returns:
+            Any: The result of ``func``, or of the fallback.
+
+        Raises:
+            CircuitOpenError: If the circuit is open and there is no fallback.
+        """
+        return self._call(func, self.fallback, args, kwargs)
+
+    def _call(self, func, fallback, args, kwargs):
+        """Same as :meth:`call`, with the fallback to call while open."""
+        with self._lock:
+            allowed = self._acquire()
+        if not allowed:
+            if fallback is not None:
+                return fallback(*args, **kwargs)
+            raise CircuitOpenError("Cloud Logging circuit breaker is open")
+
+        try:
+            result = func(*args, **kwargs)
+        except Exception as exc:
+            self._on_error(exc)
+            raise
+        self._on_success()
+        return result
+
+    async def call_async(self, func, *args, **kwargs):
+        """Awaits ``func`` if the circuit allows it.
+
+        Same as :meth:`call`, for a coroutine function. The fallback is
+        called synchronously.
+
+        Args:
+            func (Callable[..., Awaitable]): The API call.
+            args (tuple): Positional arguments for ``func``, and the fallback.
+            kwargs (dict): Keyword arguments for ``func``, and the fallback.
+
+        Returns:
+            Any: The result of ``func``, or of the fallback.
+
+        Raises:
+            CircuitOpenError: If the circuit is open and there is no fallback.
+        """
+        return await self._call_async(func, self.fallback, args, kwargs)
+
+    async def _call_async(self, func, fallback, args, kwargs):
+        """Same as :meth:`call_async`, with the fallback to call while open."""
+        with self._lock:
+            allowed = self._acquire()
+        if not allowed:
+            if fallback is not None:
+                return fallback(*args, **kwargs)
+            raise CircuitOpenError("Cloud Logging circuit breaker is open")
+
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as exc:
+            self._on_error(exc)
+            raise
+        self._on_success()
+        return result
+
+    def _after_fork_in_child(self):
+        """Starts the child process with a closed circuit.
+
+        The lock may have been held by another thread of the parent when it
+        forked, and the probe it was making does not exist in the child.
+        """
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def _on_error(self, exc):
+        if _helpers._is_retryable_error(exc):
+            self._on_failure()
+        elif isinstance(exc, exceptions.GoogleAPICallError):
+            # the API answered: it is reachable
+            self._on_success()
+        else:
+            # a bug on our side tells nothing about the API, but a probe
+            # must not stay in flight forever
+            with self._lock:
+                self._probing = False
+
+    def _on_success(self):
+        with self._lock:
+            if self._state != CLOSED:
+                _LOGGER.info("Cloud Logging circuit breaker closed.")
+            self._state = CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def _on_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state == CLOSED:
+                    _LOGGER.warning(
+                        "Cloud Logging circuit breaker opened after %d failures.",
+                        self._failures,
+                    )
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+
+_BREAKERS = weakref.WeakSet()
+"""Circuit breakers to reinitialize in the child process after a fork."""
+
+
+def _after_fork_in_child():
+    """Resets the circuit breakers inherited by a forked child process."""
+    for breaker in list(_BREAKERS):
+        breaker._after_fork_in_child()
+
+
+if hasattr(os, "register_at_fork"):  # pragma: NO BRANCH
+    # not available on Windows
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+class _CircuitBreakerLoggingAPI(object):
+    """Wraps a logging API helper, sending ``write_entries`` through a breaker."""
+
+    def __init__(self, api, circuit_breaker):
+        self._api = api
+        self.circuit_breaker = circuit_breaker
+
+    def __getattr__(self, name):
+        return getattr(self._api, name)
+
+    def write_entries(self, entries, **kwargs):
+        """Same as the ``write_entries`` of the wrapped API helper.
+
+        Raises:
+            CircuitOpenError: If the circuit is open and there is no fallback.
+        """
+        return self.circuit_breaker._call(
+            self._api.write_entries, self._get_fallback(), (entries,), kwargs
+        )
+
+    def _get_fallback(self):
+        """Returns the fallback of the breaker, taking the entries as mappings.
+
+        The entries are passed to the API as they are, since the gRPC API
+        encodes entry objects directly, and only converted for the fallback.
+        """
+        if self.circuit_breaker.fallback is None:
+            return None
+        return self._call_fallback
+
+    def _call_fallback(self, entries, **kwargs):
+        """Calls the fallback with the mappings it expects."""
+        entries = [
+            entry.to_api_repr() if isinstance(entry, LogEntry) else entry
+            for entry in entries
+        ]
+        return self.circuit_breaker.fallback(entries, **kwargs)
+
+
+class _CircuitBreakerAsyncLoggingAPI(_CircuitBreakerLoggingAPI):
+    """Wraps an asyncio logging API helper, sending ``write_entries`` through a breaker."""
+
+    async def write_entries(self, entries, **kwargs):
+        """Same as the ``write_entries`` of the wrapped API helper.
+
+        Raises:
+            CircuitOpenError: If the circuit is open and there is no fallback.
+        """
+        return await self.circuit_breaker._call_async(
+            self._api.write_entries, self._get_fallback(), (entries,), kwargs
+        )
+
+
+_STRUCTURED_FIELDS = {
+    "severity": "severity",
+    "timestamp": "timestamp",
+    "insertId": "logging.googleapis.com/insertId",
+    "trace": "logging.googleapis.com/trace",
+    "spanId": "logging.googleapis.com/spanId",
+    "traceSampled": "logging.googleapis.com/trace_sampled",
+    "sourceLocation": "logging.googleapis.com/sourceLocation",
+    "operation": "logging.googleapis.com/operation",
+    "httpRequest": "httpRequest",
+}
+"""Maps LogEntry API fields to structured logging fields."""
+
+
+def write_entries_to_stdout(
+    entries, *, logger_name=None, resource=None, labels=None, stream=None, **kwargs
+):
+    """Writes log entries to standard output, in the structured log format.
+
+    Meant as a :class:`CircuitBreaker` fallback on environments where a
+    logging agent collects standard output, such as GKE or Cloud Run.
+
+    Args:
+        entries (Sequence[Mapping[str, ...]]): The log entry resources, as
+            passed to ``write_entries``.
+        logger_name (Optional[str]): The default log name of the entries.
+        resource (Optional[Mapping[str, ...]]): Ignored, the logging agent
+            sets the resource.
+        labels (Optional[Mapping[str, ...]]): Default labels of the entries.
+        stream (Optional[IO]): The stream to write to. Defaults to
+            :data:`sys.stdout`.
+        kwargs (dict): Other ``write_entries`` arguments, which are ignored.
+    """
+    if stream is None:
+        stream = sys.stdout
+    for entry in entries:
+        structured = {}
+        if "textPayload" in entry:
+            structured["message"] = entry["textPayload"]
+        elif "jsonPayload" in entry:
+            structured.update(entry["jsonPayload"])
+        elif "protoPayload" in entry:
+            structured["protoPayload"] = entry["protoPayload"]
+        for field, structured_field in _STRUCTURED_FIELDS.items():
+            if field in entry:
+                structured[structured_field] = entry[field]
+        entry_labels = dict(labels or {}, **entry.get("labels", {}))
+        if entry_labels:
+            structured["logging.googleapis.com/labels"] = entry_labels
+        log_name = entry.get("logName", logger_name)
+        if log_name:
+            structured["logName"] = log_name
+        stream.write(
+            serialization.dumps(structured, serialization.default_or_str) + "\n"
+        )
+    stream.flush()
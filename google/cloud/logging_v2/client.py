@@ -17,6 +17,7 @@
 import logging
 import os
 import sys
+import time
 
 
 import google.api_core.client_options
@@ -27,14 +28,18 @@ from google.cloud.logging_v2._http import Connection
 from google.cloud.logging_v2._http import _LoggingAPI as JSONLoggingAPI
 from google.cloud.logging_v2._http import _MetricsAPI as JSONMetricsAPI
 from google.cloud.logging_v2._http import _SinksAPI as JSONSinksAPI
+from google.cloud.logging_v2.circuit_breaker import _CircuitBreakerAsyncLoggingAPI
+from google.cloud.logging_v2.circuit_breaker import _CircuitBreakerLoggingAPI
 from google.cloud.logging_v2.handlers import CloudLoggingHandler
 from google.cloud.logging_v2.handlers import StructuredLogHandler
 from google.cloud.logging_v2.handlers import setup_logging
 from google.cloud.logging_v2.handlers.handlers import EXCLUDED_LOGGER_DEFAULTS
+from google.cloud.logging_v2.handlers.transports import FlushResult
 from google.cloud.logging_v2.resource import Resource
 from google.cloud.logging_v2.handlers._monitored_resources import detect_resource
 
 
+from google.cloud.logging_v2.logger import AsyncLogger
 from google.cloud.logging_v2.logger import Logger
 from google.cloud.logging_v2.metric import Metric
 from google.cloud.logging_v2.sink import Sink
@@ -66,6 +71,7 @@ class Client(ClientWithProject):
     """Client to bundle configuration needed for API requests."""
 
     _logging_api = None
+    _async_logging_api = None
     _sinks_api = None
     _metrics_api = None
 
@@ -86,6 +92,7 @@ class Client(ClientWithProject):
         _use_grpc=None,
         client_info=None,
         client_options=None,
+        circuit_breaker=None,
     ):
         """
         Args:
@@ -118,6 +125,10 @@ class Client(ClientWithProject):
             client_options (Optional[Union[dict, google.api_core.client_options.ClientOptions]]):
                 Client options used to set user options
                 on the client. API Endpoint should be set through client_options.
+            circuit_breaker (Optional[~logging_v2.circuit_breaker.CircuitBreaker]):
+                Circuit breaker for writing log entries. It is shared by the
+                loggers, batches and logging handlers of this client. If
+                ``None``, entries are always sent to the API.
         """
         super(Client, self).__init__(
             project=project,
@@ -150,6 +161,7 @@ class Client(ClientWithProject):
             self._use_grpc = _use_grpc
 
         self._handlers = set()
+        self.circuit_breaker = circuit_breaker
 
     @property
     def logging_api(self):
@@ -164,8 +176,34 @@ class Client(ClientWithProject):
                 self._logging_api = _gapic.make_logging_api(self)
             else:
                 self._logging_api = JSONLoggingAPI(self)
+            if self.circuit_breaker is not None:
+                self._logging_api = _CircuitBreakerLoggingAPI(
+                    self._logging_api, self.circuit_breaker
+                )
         return self._logging_api
 
+    @property
+    def async_logging_api(self):
+        """Helper for logging-related API calls awaited on an asyncio event loop.
+
+        Only the ``write_entries`` call is supported.
+
+        See
+        https://cloud.google.com/logging/docs/reference/v2/rest/v2/entries/write
+
+        Raises:
+            ValueError: If the client does not use gRPC.
+        """
+        if self._async_logging_api is None:
+            if not self._use_grpc:
+                raise ValueError("asyncio logging requires the gRPC transport")
+            self._async_logging_api = _gapic.make_async_logging_api(self)
+            if self.circuit_breaker is not None:
+                self._async_logging_api = _CircuitBreakerAsyncLoggingAPI(
+                    self._async_logging_api, self.circuit_breaker
+                )
+        return self._async_logging_api
+
     @property
     def sinks_api(self):
         """Helper for log sink-related API calls.
@@ -210,6 +248,22 @@ class Client(ClientWithProject):
         """
         return Logger(name, client=self, labels=labels, resource=resource)
 
+    def async_logger(self, name, *, labels=None, resource=None):
+        """Creates a logger bound to the current client, writing entries with asyncio.
+
+        Args:
+            name (str): The name of the logger to be constructed.
+            resource (Optional[~logging_v2.Resource]): a monitored resource object
+                representing the resource the code was run on. If not given, will
+                be inferred from the environment.
+            labels (Optional[dict]): Mapping of default labels for entries written
+                via this logger.
+
+        Returns:
+            ~logging_v2.logger.AsyncLogger: Logger created with the current client.
+        """
+        return AsyncLogger(name, client=self, labels=labels, resource=resource)
+
     def list_entries(
         self,
         *,
@@ -416,11 +470,32 @@ class Client(ClientWithProject):
         self._handlers.add(handler)
         setup_logging(handler, log_level=log_level, excluded_loggers=excluded_loggers)
 
-    def flush_handlers(self):
-        """Flushes all Python log handlers associated with this Client."""
+    def flush_handlers(self, timeout=None):
+        """Flushes all Python log handlers associated with this Client.
+
+        Args:
+            timeout (Optional[float]): The maximum time to wait for all the
+                handlers together, in seconds. If ``None``, waits until all
+                pending records are submitted.
 
+        Returns:
+            ~logging_v2.handlers.transports.FlushResult: The entries sent,
+            failed and still pending, summed over the handlers.
+        """
+        start = time.monotonic()
+        results = []
         for handler in self._handlers:
-            handler.flush()
+            if not isinstance(handler, CloudLoggingHandler):
+                handler.flush()
+                continue
+            if timeout is None:
+                result = handler.flush()
+            else:
+                remaining = max(0.0, timeout - (time.monotonic() - start))
+                result = handler.flush(timeout=remaining)
+            if isinstance(result, FlushResult):
+                results.append(result)
+        return FlushResult._combine(results, elapsed=time.monotonic() - start)
 
     def close(self):
         """Closes the Client and all handlers associated with this Client."""
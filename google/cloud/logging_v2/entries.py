@@ -16,7 +16,9 @@
 
 import collections
 import json
+import math
 import re
+import time
 
 from google.protobuf.json_format import MessageToDict
 from google.protobuf.json_format import Parse
@@ -70,6 +72,52 @@ def _int_or_none(value):
     return value
 
 
+def _posix_time_to_seconds_nanos(value):
+    """Helper: split a POSIX time into the fields of a protobuf ``Timestamp``.
+
+    The time is rounded to the microsecond, as by
+    :meth:`datetime.datetime.fromtimestamp`.
+
+    Args:
+        value (float): The time, in seconds since the epoch.
+
+    Returns:
+        Tuple[int, int]: The whole seconds, and the nanoseconds.
+    """
+    fraction, seconds = math.modf(value)
+    micros = round(fraction * 1e6)
+    if micros >= 1000000:
+        seconds += 1
+        micros -= 1000000
+    elif micros < 0:
+        seconds -= 1
+        micros += 1000000
+    return int(seconds), micros * 1000
+
+
+def _is_posix_time(value):
+    """Helper: whether a timestamp is a POSIX time, rather than a datetime.
+
+    ``bool`` is a subclass of ``int``, but is not a time.
+    """
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _check_timestamp(value):
+    """Helper: reject a ``bool`` timestamp, which would pass for a POSIX time."""
+    if isinstance(value, bool):
+        raise TypeError("A timestamp must be a datetime or a number, not a bool.")
+
+
+def _posix_time_to_rfc3339(value):
+    """Helper: format a POSIX time as by :func:`_datetime_to_rfc3339`."""
+    seconds, nanos = _posix_time_to_seconds_nanos(value)
+    return "%s.%06dZ" % (
+        time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)),
+        nanos // 1000,
+    )
+
+
 _LOG_ENTRY_FIELDS = (  # (name, default)
     ("log_name", None),
     ("labels", None),
@@ -105,7 +153,8 @@ _LOG_ENTRY_PARAM_DOCSTRING = """\
         severity (Optional[str]): The severity of the event being logged.
         http_request (Optional[dict]): Info about HTTP request associated
             with the entry.
-        timestamp (Optional[datetime.datetime]): Timestamp for the entry.
+        timestamp (Optional[datetime.datetime | float]): Timestamp for the
+            entry, or a POSIX time in seconds, such as ``record.created``.
         resource (Optional[google.cloud.logging_v2.resource.Resource]):
             Monitored resource of the entry.
         trace (Optional[str]): Trace ID to apply to the entry.
@@ -235,7 +284,10 @@ class LogEntry(_LogEntryTuple):
                 info["severity"] = self.severity
         if self.http_request is not None:
             info["httpRequest"] = self.http_request
-        if self.timestamp is not None:
+        _check_timestamp(self.timestamp)
+        if _is_posix_time(self.timestamp):
+            info["timestamp"] = _posix_time_to_rfc3339(self.timestamp)
+        elif self.timestamp is not None:
             info["timestamp"] = _datetime_to_rfc3339(self.timestamp)
         if self.trace is not None:
             info["trace"] = self.trace
@@ -17,11 +17,13 @@
 import collections
 import json
 import logging
+import time
 
 from typing import Optional, IO, Type
 
 from google.cloud.logging_v2.handlers.transports import (
     BackgroundThreadTransport,
+    FlushResult,
     Transport,
 )
 from google.cloud.logging_v2.handlers._monitored_resources import (
@@ -30,6 +32,7 @@ from google.cloud.logging_v2.handlers._monitored_resources import (
 )
 from google.cloud.logging_v2.handlers._helpers import get_request_data
 from google.cloud.logging_v2.resource import Resource
+from google.cloud.logging_v2 import serialization
 
 
 DEFAULT_LOGGER_NAME = "python"
@@ -113,13 +116,9 @@ class CloudLoggingFilter(logging.Filter):
         record._trace_str = record._trace or ""
         record._span_id_str = record._span_id or ""
         record._trace_sampled_str = "true" if record._trace_sampled else "false"
-        record._http_request_str = json.dumps(
-            record._http_request or {}, ensure_ascii=False
-        )
-        record._source_location_str = json.dumps(
-            record._source_location or {}, ensure_ascii=False
-        )
-        record._labels_str = json.dumps(record._labels or {}, ensure_ascii=False)
+        record._http_request_str = serialization.dumps(record._http_request or {})
+        record._source_location_str = serialization.dumps(record._source_location or {})
+        record._labels_str = serialization.dumps(record._labels or {})
         return True
 
 
@@ -161,6 +160,7 @@ class CloudLoggingHandler(logging.StreamHandler):
         resource: Resource = None,
         labels: Optional[dict] = None,
         stream: Optional[IO] = None,
+        deferred: bool = False,
         **kwargs,
     ):
         """
@@ -181,6 +181,13 @@ class CloudLoggingHandler(logging.StreamHandler):
                 Resource for this Handler. If not given, will be inferred from the environment.
             labels (Optional[dict]): Additional labels to attach to logs.
             stream (Optional[IO]): Stream to be used by the handler.
+            deferred (bool): If True, only a snapshot of each record is taken on
+                the logging thread. Formatting, JSON parsing and label merging
+                are left to the transport, which the
+                :class:`.BackgroundThreadTransport` does on its worker thread.
+                Record arguments other than immutable scalars are still
+                rendered on the logging thread, since they could be modified
+                before the worker formats them.
         """
         super(CloudLoggingHandler, self).__init__(stream)
         if not resource:
@@ -195,6 +202,7 @@ class CloudLoggingHandler(logging.StreamHandler):
         self.project_id = client.project
         self.resource = resource
         self.labels = labels
+        self.deferred = deferred
         # add extra keys to log record
         log_filter = CloudLoggingFilter(project=self.project_id, default_labels=labels)
         self.addFilter(log_filter)
@@ -209,12 +217,6 @@ class CloudLoggingHandler(logging.StreamHandler):
         Args:
             record (logging.LogRecord): The record to be logged.
         """
-        resource = record._resource or self.resource
-        labels = record._labels
-        message = _format_and_parse_message(record, self)
-
-        labels = {**add_resource_labels(resource, record), **(labels or {})} or None
-
         # send off request
         if not self._transport_open:
             self.transport = self._transport_cls(
@@ -222,9 +224,30 @@ class CloudLoggingHandler(logging.StreamHandler):
             )
             self._transport_open = True
 
-        self.transport.send(
-            record,
-            message,
+        send_deferred = getattr(self.transport, "send_deferred", None)
+        if self.deferred and send_deferred is not None:
+            send_deferred(_snapshot_record(record), self._prepare_send)
+        else:
+            message, kwargs = self._prepare_send(record)
+            self.transport.send(record, message, **kwargs)
+
+    def _prepare_send(self, record):
+        """Formats a filtered record into the arguments for :meth:`.Transport.send`.
+
+        Args:
+            record (logging.LogRecord): The record to be logged.
+
+        Returns:
+            Tuple[str | dict | None, dict]: The message, and the keyword
+            arguments for the transport.
+        """
+        resource = record._resource or self.resource
+        labels = record._labels
+        message = _format_and_parse_message(record, self)
+
+        labels = {**add_resource_labels(resource, record), **(labels or {})} or None
+
+        return message, dict(
             resource=resource,
             labels=labels,
             trace=record._trace,
@@ -234,14 +257,48 @@ class CloudLoggingHandler(logging.StreamHandler):
             source_location=record._source_location,
         )
 
-    def flush(self):
+    def flush(self, timeout=None):
         """Forces the Transport object to submit any pending log records.
 
         For SyncTransport, this is a no-op.
+
+        Args:
+            timeout (Optional[float]): The maximum time to wait, in seconds.
+                If ``None``, waits until all pending records are submitted.
+
+        Returns:
+            ~logging_v2.handlers.transports.FlushResult: The entries sent,
+            failed and still pending.
         """
         super(CloudLoggingHandler, self).flush()
+        start = time.monotonic()
+        result = None
         if self._transport_open:
-            self.transport.flush()
+            if timeout is None:
+                # transports written before timeouts were supported
+                result = self.transport.flush()
+            else:
+                result = self.transport.flush(timeout=timeout)
+        if not isinstance(result, FlushResult):
+            result = FlushResult(
+                sent=0, failed=0, pending=0, elapsed=time.monotonic() - start
+            )
+        return result
+
+    def stats(self):
+        """Returns a snapshot of the runtime statistics of the transport.
+
+        See :meth:`.BackgroundThreadTransport.stats` for the statistics of
+        the default transport.
+
+        Returns:
+            dict: The statistics, or an empty dict if the transport is closed
+            or does not keep any.
+        """
+        stats = getattr(self.transport, "stats", None)
+        if not self._transport_open or stats is None:
+            return {}
+        return stats()
 
     def close(self):
         """Closes the log handler and cleans up all Transport objects used."""
@@ -251,6 +308,34 @@ class CloudLoggingHandler(logging.StreamHandler):
             self._transport_open = False
 
 
+_IMMUTABLE_ARG_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def _snapshot_record(record):
+    """Copies a LogRecord so that it can be formatted later on another thread.
+
+    Record attributes are copied shallowly. Message arguments that are not
+    immutable scalars are rendered into the message right away, since the
+    caller could modify them before the record is formatted.
+
+    Args:
+        record (logging.LogRecord): The record to copy.
+
+    Returns:
+        logging.LogRecord: The copy.
+    """
+    snapshot = logging.makeLogRecord(record.__dict__)
+    args = record.args
+    if isinstance(args, collections.abc.Mapping):
+        args = args.values()
+    if args and not all(isinstance(arg, _IMMUTABLE_ARG_TYPES) for arg in args):
+        snapshot.msg = record.getMessage()
+        snapshot.args = None
+    if isinstance(record.msg, collections.abc.Mapping):
+        snapshot.msg = dict(record.msg)
+    return snapshot
+
+
 def _format_and_parse_message(record, formatter_handler):
     """
     Helper function to apply formatting to a LogRecord message,
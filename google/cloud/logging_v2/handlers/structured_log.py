@@ -23,6 +23,7 @@ from google.cloud.logging_v2.handlers.handlers import CloudLoggingFilter
 from google.cloud.logging_v2.handlers.handlers import _format_and_parse_message
 import google.cloud.logging_v2
 from google.cloud.logging_v2._instrumentation import _create_diagnostic_entry
+from google.cloud.logging_v2 import serialization
 
 GCP_FORMAT = (
     "{%(_payload_str)s"
@@ -76,7 +77,8 @@ class StructuredLogHandler(logging.StreamHandler):
             labels (Optional[dict]): Additional labels to attach to logs.
             stream (Optional[IO]): Stream to be used by the handler.
             project (Optional[str]): Project Id associated with the logs.
-            json_encoder_cls (Optional[Type[JSONEncoder]]): Custom JSON encoder. Defaults to json.JSONEncoder
+            json_encoder_cls (Optional[Type[JSONEncoder]]): Custom JSON encoder. Defaults to
+                the backend of :mod:`google.cloud.logging_v2.serialization`.
         """
         super(StructuredLogHandler, self).__init__(stream=stream)
         self.project_id = project_id
@@ -98,7 +100,13 @@ class StructuredLogHandler(logging.StreamHandler):
         # make logs appear in GCP structured logging format
         self._gcp_formatter = _Formatter(GCP_FORMAT)
 
-        self._json_encoder_cls = json_encoder_cls or json.JSONEncoder
+        self._json_encoder_cls = json_encoder_cls
+
+    def _dumps(self, value):
+        """Serializes a value with the custom JSON encoder, if one was given."""
+        if self._json_encoder_cls is None:
+            return serialization.dumps(value)
+        return json.dumps(value, ensure_ascii=False, cls=self._json_encoder_cls)
 
     def format(self, record):
         """Format the message into structured log JSON.
@@ -116,18 +124,14 @@ class StructuredLogHandler(logging.StreamHandler):
                 if key in GCP_STRUCTURED_LOGGING_FIELDS:
                     del message[key]
             # if input is a dictionary, encode it as a json string
-            encoded_msg = json.dumps(
-                message, ensure_ascii=False, cls=self._json_encoder_cls
-            )
+            encoded_msg = self._dumps(message)
             # all json.dumps strings should start and end with parentheses
             # strip them out to embed these fields in the larger JSON payload
             if len(encoded_msg) > 2:
                 payload = encoded_msg[1:-1] + ","
         elif message:
             # properly break any formatting in string to make it json safe
-            encoded_message = json.dumps(
-                message, ensure_ascii=False, cls=self._json_encoder_cls
-            )
+            encoded_message = self._dumps(message)
             payload = '"message": {},'.format(encoded_message)
 
         record._payload_str = payload or ""
@@ -14,16 +14,32 @@
 
 """Transport classes for Python logging integration.
 
-Currently two options are provided, a synchronous transport that makes
-an API call for each log statement, and an asynchronous handler that
+Currently four options are provided, a synchronous transport that makes
+an API call for each log statement, an asynchronous handler that
 sends the API using a :class:`~google.cloud.logging.logger.Batch` object in
-the background.
+the background, an asynchronous handler that awaits the API on an
+asyncio event loop, and a transport that hands entries over to an uploader
+process shared by the processes of a host.
 """
 
+from google.cloud.logging_v2.handlers.transports.base import FlushResult
 from google.cloud.logging_v2.handlers.transports.base import Transport
 from google.cloud.logging_v2.handlers.transports.sync import SyncTransport
 from google.cloud.logging_v2.handlers.transports.background_thread import (
     BackgroundThreadTransport,
 )
+from google.cloud.logging_v2.handlers.transports.asyncio import AsyncioTransport
+from google.cloud.logging_v2.handlers.transports.uploader import (
+    SharedUploader,
+    SharedUploaderTransport,
+)
 
-__all__ = ["BackgroundThreadTransport", "SyncTransport", "Transport"]
+__all__ = [
+    "AsyncioTransport",
+    "BackgroundThreadTransport",
+    "FlushResult",
+    "SharedUploader",
+    "SharedUploaderTransport",
+    "SyncTransport",
+    "Transport",
+]
@@ -0,0 +1,345 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared-memory ring buffer for handing encoded log entries between processes.
+
+The buffer is a memory-mapped file: a fixed header followed by a circular
+data region. Any number of producer processes append records, and a single
+consumer reads them. Positions are byte offsets that only grow; the data
+region is indexed modulo its capacity, and a record crossing its end wraps
+around to the start.
+
+Producers hold an exclusive ``flock`` on the file only to reserve space,
+copy their record and publish the new write position, so a producer that
+dies never leaves a partial record visible. Taking and releasing it costs
+two system calls per record, so the buffer is not faster than a socket: it
+is meant not to block producers while the consumer falls behind. The consumer takes the lock
+only to read the write position and to publish its read position, and
+copies records without it: producers never write between the two.
+
+Each record carries a sequence number, which lets the consumer detect a
+corrupted buffer. Records that do not fit are dropped by the producer, and
+counted in the header.
+
+A consumer that recreates the file, for example with another capacity,
+marks the old one as replaced, so that producers still attached to it open
+the new one.
+"""
+
+import contextlib
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:  # pragma: NO COVER
+    # file locking is not available on Windows
+    fcntl = None
+
+_DEFAULT_CAPACITY = 16 * 1024 * 1024
+_MAGIC = b"GCLR"
+_VERSION = 2
+_LOGGER = logging.getLogger(__name__)
+
+_HEADER = struct.Struct(">4sIQQQQQQQQ")
+"""Buffer header: magic, version, capacity, write position, read position,
+sequence number of the next record written, sequence number of the next
+record read, number and size of the records dropped, and whether the file
+was replaced by a new one."""
+
+_RECORD_HEADER = struct.Struct(">IQ")
+"""Record header: payload length and sequence number."""
+
+
+class _RingBuffer(object):
+    """A ring buffer of byte records in a memory-mapped file.
+
+    :meth:`put` may be called from any thread of any process that opened the
+    file. :meth:`get_many` must only be called by a single consumer. A buffer
+    object must not be used across a fork: the child has to open the file
+    again, since ``flock`` does not exclude processes sharing a descriptor.
+    """
+
+    def __init__(self, path, *, capacity=None):
+        """
+        Args:
+            path (str): The path of the buffer file.
+            capacity (Optional[int]): The size of the data region. If given,
+                the file is created, or recreated if its capacity differs,
+                which is what the consumer does. Otherwise an existing file
+                is opened, which is what producers do.
+
+        Raises:
+            FileNotFoundError: If ``capacity`` is not given and the file does
+                not exist.
+            PermissionError: If the file is owned by another user.
+            ValueError: If ``capacity`` is not given and the file is not a
+                ring buffer.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        if capacity is not None and not self._is_valid(path, capacity):
+            self._create(path, capacity)
+        self._open()
+
+    def _open(self):
+        """Maps the buffer file at ``path``."""
+        path = self.path
+        self._file = open(path, "r+b")
+        try:
+            if os.fstat(self._file.fileno()).st_uid != os.getuid():
+                # never hand log entries to a file planted by another user
+                raise PermissionError(f"{path} is owned by another user")
+            self._mmap = mmap.mmap(self._file.fileno(), 0)
+            header = self._read_header()
+            if header[0] != _MAGIC or header[1] != _VERSION:
+                raise ValueError(f"{path} is not a log ring buffer")
+        except (ValueError, OSError):
+            self._file.close()
+            raise
+        self.capacity = header[2]
+        if len(self._mmap) != _HEADER.size + self.capacity:
+            self.close()
+            raise ValueError(f"{path} is truncated")
+
+    @staticmethod
+    def _is_valid(path, capacity):
+        """Whether an existing file is a ring buffer of ``capacity`` bytes."""
+        try:
+            with open(path, "rb") as file_:
+                header = file_.read(_HEADER.size)
+        except FileNotFoundError:
+            return False
+        if len(header) < _HEADER.size:
+            return False
+        magic, version, existing_capacity = _HEADER.unpack(header)[:3]
+        return (magic, version, existing_capacity) == (_MAGIC, _VERSION, capacity)
+
+    @staticmethod
+    def _create(path, capacity):
+        """Creates an empty buffer file, replacing any existing one atomically.
+
+        The new file is only accessible to the current user. An existing
+        buffer file is marked as replaced.
+        """
+        directory, name = os.path.split(path)
+        fd, tmp_path = tempfile.mkstemp(prefix=name + ".", dir=directory or None)
+        try:
+            with os.fdopen(fd, "wb") as file_:
+                file_.write(
+                    _HEADER.pack(_MAGIC, _VERSION, capacity, 0, 0, 0, 0, 0, 0, 0)
+                )
+                file_.truncate(_HEADER.size + capacity)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        try:
+            previous = open(path, "r+b")
+        except OSError:
+            previous = None
+        try:
+            os.replace(tmp_path, path)
+            if previous is not None:
+                _mark_replaced(previous)
+        finally:
+            if previous is not None:
+                previous.close()
+
+    def _read_header(self):
+        return _HEADER.unpack_from(self._mmap, 0)
+
+    def _write_header(self, header):
+        _HEADER.pack_into(self._mmap, 0, *header)
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """Holds the thread and file locks.
+
+        The file is only read once the thread lock is held, since another
+        thread may replace it meanwhile.
+        """
+        with self._lock:
+            with _FileLock(self._file):
+                yield
+
+    def _copy_in(self, position, data):
+        """Copies data to the data region, wrapping around its end."""
+        offset = position % self.capacity
+        first = min(len(data), self.capacity - offset)
+        start = _HEADER.size + offset
+        self._mmap[start : start + first] = data[:first]
+        if first < len(data):
+            self._mmap[_HEADER.size : _HEADER.size + len(data) - first] = data[first:]
+
+    def _copy_out(self, position, size):
+        """Copies data from the data region, wrapping around its end."""
+        offset = position % self.capacity
+        first = min(size, self.capacity - offset)
+        start = _HEADER.size + offset
+        data = self._mmap[start : start + first]
+        if first < size:
+            data += self._mmap[_HEADER.size : _HEADER.size + size - first]
+        return data
+
+    def _reopen(self):
+        """Maps the file now at ``path``, after the previous one was replaced."""
+        self.close()
+        self._open()
+
+    def put(self, payload):
+        """Appends a record.
+
+        If the file was replaced by the consumer, the new one is opened first.
+
+        Args:
+            payload (bytes): The record.
+
+        Returns:
+            bool: True if the record was written, False if it was dropped
+            because the buffer is full.
+
+        Raises:
+            OSError: If the file was replaced, and the new one cannot be opened.
+            ValueError: If the file was replaced, and the new one is not a
+                ring buffer.
+        """
+        with self._lock:
+            while True:
+                with _FileLock(self._file):
+                    header = list(self._read_header())
+                    if not header[9]:
+                        return self._append(header, payload)
+                # no other thread uses the file while it is replaced
+                self._reopen()
+
+    def _append(self, header, payload):
+        """Writes a record. Must be called with the locks held.
+
+        Args:
+            header (list): The current header, updated in place.
+            payload (bytes): The record.
+
+        Returns:
+            bool: True if the record was written, False if it was dropped
+            because the buffer is full.
+        """
+        size = _RECORD_HEADER.size + len(payload)
+        write_pos, read_pos, next_seq = header[3], header[4], header[5]
+        if size > self.capacity - (write_pos - read_pos):
+            header[7] += 1
+            header[8] += len(payload)
+            self._write_header(header)
+            return False
+        self._copy_in(write_pos, _RECORD_HEADER.pack(len(payload), next_seq) + payload)
+        # publish the record only once it is complete
+        header[3] = write_pos + size
+        header[5] = next_seq + 1
+        self._write_header(header)
+        return True
+
+    def get_many(self, max_records=None):
+        """Removes the oldest records. Must only be called by the consumer.
+
+        Args:
+            max_records (Optional[int]): The maximum number of records to
+                return. If ``None``, all available records are returned.
+
+        Returns:
+            List[bytes]: The records, oldest first.
+        """
+        with self._locked():
+            header = self._read_header()
+        write_pos, read_pos, read_seq = header[3], header[4], header[6]
+
+        records = []
+        while read_pos < write_pos:
+            if max_records is not None and len(records) >= max_records:
+                break
+            length, seq = _RECORD_HEADER.unpack(
+                self._copy_out(read_pos, _RECORD_HEADER.size)
+            )
+            end = read_pos + _RECORD_HEADER.size + length
+            if seq != read_seq or end > write_pos:
+                _LOGGER.error(
+                    "Log ring buffer %s is corrupted, skipping %d records.",
+                    self.path,
+                    header[5] - read_seq,
+                )
+                read_pos, read_seq = write_pos, header[5]
+                break
+            records.append(self._copy_out(read_pos + _RECORD_HEADER.size, length))
+            read_pos, read_seq = end, read_seq + 1
+
+        with self._locked():
+            header = list(self._read_header())
+            header[4], header[6] = read_pos, read_seq
+            self._write_header(header)
+        return records
+
+    @property
+    def pending_bytes(self):
+        """int: The size of the records not read yet, with their headers."""
+        header = self._read_header()
+        return header[3] - header[4]
+
+    @property
+    def dropped_records(self):
+        """int: The number of records dropped because the buffer was full."""
+        return self._read_header()[7]
+
+    @property
+    def dropped_bytes(self):
+        """int: The size of the records dropped because the buffer was full."""
+        return self._read_header()[8]
+
+    def close(self):
+        """Unmaps and closes the buffer file. Records written are kept."""
+        self._mmap.close()
+        self._file.close()
+
+
+def _mark_replaced(file_):
+    """Flags an open buffer file as replaced, for the producers still
+    attached to it. Files that are not ring buffers are left untouched."""
+    with _FileLock(file_):
+        file_.seek(0)
+        data = file_.read(_HEADER.size)
+        if len(data) < _HEADER.size:
+            return
+        header = list(_HEADER.unpack(data))
+        if header[0] != _MAGIC or header[1] != _VERSION:
+            return
+        header[9] = 1
+        file_.seek(0)
+        file_.write(_HEADER.pack(*header))
+        file_.flush()
+
+
+class _FileLock(object):
+    """Holds an exclusive ``flock`` on a file."""
+
+    def __init__(self, file_):
+        self._file = file_
+
+    def __enter__(self):
+        if fcntl is not None:
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if fcntl is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
@@ -0,0 +1,261 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Disk-backed spool for log entries that could not be sent yet.
+
+The spool is a directory of append-only segment files. Each record holds
+one batch of log entries in their JSON API representation, framed by its
+length and CRC32 checksum so that a record torn by a crash is detected and
+skipped on replay. A checkpoint file tracks the oldest record not yet
+acknowledged; fully acknowledged segments are deleted.
+"""
+
+import json
+import os
+import struct
+import threading
+import zlib
+
+from google.cloud.logging_v2 import serialization
+
+try:
+    import fcntl
+except ImportError:  # pragma: NO COVER
+    # file locking is not available on Windows
+    fcntl = None
+
+_DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+_DEFAULT_SEGMENT_BYTES = 8 * 1024 * 1024
+
+_SEGMENT_SUFFIX = ".seg"
+_CHECKPOINT_FILE = "checkpoint"
+_LOCK_FILE = "lock"
+
+_HEADER = struct.Struct(">II")
+"""Record header: payload length and CRC32 checksum of the payload."""
+
+
+class _Spool(object):
+    """A crash-safe, size-capped queue of log entry batches on disk.
+
+    A spool directory must only be used by one process at a time. Records
+    left by a previous process are replayed by the next one that opens the
+    directory.
+    """
+
+    def __init__(
+        self,
+        directory,
+        *,
+        max_bytes=_DEFAULT_MAX_BYTES,
+        segment_bytes=_DEFAULT_SEGMENT_BYTES,
+        fsync=False,
+    ):
+        """
+        Args:
+            directory (str): The directory holding the spool files. Created if
+                it does not exist.
+            max_bytes (Optional[int]): The maximum size of the records not yet
+                acknowledged. Records that would exceed it are rejected.
+            segment_bytes (Optional[int]): The size after which a new segment
+                file is started.
+            fsync (Optional[bool]): If True, each record is flushed to the disk
+                before :meth:`append` returns. Otherwise records are only
+                written to the operating system, and survive a crash of the
+                process but not of the host.
+
+        Raises:
+            ValueError: If the directory is used by another process.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.segment_bytes = segment_bytes
+        self._fsync = fsync
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        self._lock_file = open(os.path.join(directory, _LOCK_FILE), "a")
+        if fcntl is not None:
+            try:
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError as e:
+                self._lock_file.close()
+                raise ValueError(
+                    f"spool directory {directory} is used by another process"
+                ) from e
+
+        self._segments = sorted(
+            int(name[: -len(_SEGMENT_SUFFIX)])
+            for name in os.listdir(directory)
+            if name.endswith(_SEGMENT_SUFFIX)
+        )
+        self._read_seq, self._read_offset = self._load_checkpoint()
+        for seq in [seq for seq in self._segments if seq < self._read_seq]:
+            self._remove_segment(seq)
+        if self._segments and self._read_seq not in self._segments:
+            self._read_seq, self._read_offset = self._segments[0], 0
+
+        self.pending_bytes = (
+            sum(os.path.getsize(self._segment_path(seq)) for seq in self._segments)
+            - self._read_offset
+        )
+
+        # never append to a segment left by a previous process, since its
+        # tail may hold a torn record
+        self._write_seq = self._segments[-1] + 1 if self._segments else 0
+        self._write_file = None
+        self._write_size = 0
+        if not self._segments:
+            self._read_seq, self._read_offset = self._write_seq, 0
+
+    def _segment_path(self, seq):
+        return os.path.join(self.directory, f"{seq:020d}{_SEGMENT_SUFFIX}")
+
+    def _load_checkpoint(self):
+        try:
+            with open(os.path.join(self.directory, _CHECKPOINT_FILE)) as checkpoint:
+                seq, offset = checkpoint.read().split()
+                return int(seq), int(offset)
+        except (OSError, ValueError):
+            return (self._segments[0] if self._segments else 0), 0
+
+    def _save_checkpoint(self):
+        path = os.path.join(self.directory, _CHECKPOINT_FILE)
+        with open(path + ".tmp", "w") as checkpoint:
+            checkpoint.write(f"{self._read_seq} {self._read_offset}")
+        os.replace(path + ".tmp", path)
+
+    def _remove_segment(self, seq):
+        try:
+            os.remove(self._segment_path(seq))
+        except FileNotFoundError:
+            pass
+        self._segments.remove(seq)
+
+    def append(self, record):
+        """Appends a record to the spool.
+
+        Args:
+            record (dict): A JSON-serializable record.
+
+        Returns:
+            bool: True if the record was written, False if it would exceed
+            ``max_bytes``.
+        """
+        payload = serialization.dumps_bytes(record, serialization.default_or_str)
+        data = _HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        with self._lock:
+            if self.pending_bytes + len(data) > self.max_bytes:
+                return False
+            if self._write_file is None or self._write_size >= self.segment_bytes:
+                self._rotate()
+            self._write_file.write(data)
+            self._write_file.flush()
+            if self._fsync:
+                os.fsync(self._write_file.fileno())
+            self._write_size += len(data)
+            self.pending_bytes += len(data)
+            return True
+
+    def _rotate(self):
+        """Starts a new segment. Must be called with the lock held."""
+        if self._write_file is not None:
+            self._write_file.close()
+            self._write_seq += 1
+        self._write_file = open(self._segment_path(self._write_seq), "ab")
+        self._write_size = 0
+        self._segments.append(self._write_seq)
+
+    def peek(self):
+        """Returns the oldest record not yet acknowledged.
+
+        Returns:
+            Tuple[Optional[dict], Optional[tuple]]: The record, and the cursor
+            to pass to :meth:`ack` once it was delivered. Both are None if the
+            spool is empty.
+        """
+        with self._lock:
+            while self._read_seq in self._segments:
+                record, offset = self._read_record(self._read_seq, self._read_offset)
+                if record is not None:
+                    return record, (self._read_seq, offset)
+                if self._read_seq == self._write_seq and self._write_file is not None:
+                    # no more records in the active segment
+                    break
+                # end of segment, or torn record: move on to the next segment
+                self._advance_segment()
+            return None, None
+
+    def _read_record(self, seq, offset):
+        """Reads the record at ``offset``. Must be called with the lock held.
+
+        Returns:
+            Tuple[Optional[dict], int]: The record, or None if there is no
+            valid record at ``offset``, and the offset of the next record.
+        """
+        with open(self._segment_path(seq), "rb") as segment:
+            segment.seek(offset)
+            header = segment.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return None, offset
+            length, checksum = _HEADER.unpack(header)
+            payload = segment.read(length)
+        if len(payload) < length or zlib.crc32(payload) != checksum:
+            return None, offset
+        try:
+            record = json.loads(payload.decode("utf-8"))
+        except ValueError:
+            return None, offset
+        return record, offset + _HEADER.size + length
+
+    def _advance_segment(self):
+        """Deletes the segment being read, and moves to the next one.
+
+        Must be called with the lock held.
+        """
+        seq = self._read_seq
+        self.pending_bytes -= (
+            os.path.getsize(self._segment_path(seq)) - self._read_offset
+        )
+        self._remove_segment(seq)
+        later = [other for other in self._segments if other > seq]
+        self._read_seq = later[0] if later else self._write_seq
+        self._read_offset = 0
+        self._save_checkpoint()
+
+    def ack(self, cursor):
+        """Marks the records up to ``cursor`` as delivered.
+
+        Args:
+            cursor (tuple): A cursor returned by :meth:`peek`.
+        """
+        seq, offset = cursor
+        with self._lock:
+            if seq != self._read_seq or offset <= self._read_offset:
+                return
+            self.pending_bytes -= offset - self._read_offset
+            self._read_offset = offset
+            self._save_checkpoint()
+            if seq != self._write_seq or self._write_file is None:
+                # compact segments once they are fully acknowledged
+                if offset >= os.path.getsize(self._segment_path(seq)):
+                    self._advance_segment()
+
+    def close(self):
+        """Closes the spool files, and releases the directory."""
+        with self._lock:
+            if self._write_file is not None:
+                self._write_file.close()
+                self._write_file = None
+            self._lock_file.close()
@@ -0,0 +1,160 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Runtime statistics of the background transport.
+
+Recording a value is constant time, so that it can be done for every batch.
+Percentiles are only computed when a snapshot is taken, over a window of the
+most recent values.
+"""
+
+import collections
+import threading
+
+_DEFAULT_WINDOW = 1024
+_PERCENTILES = (50, 90, 99)
+
+
+class _Histogram(object):
+    """Counts non-negative integers in power-of-two buckets.
+
+    The bucket of a value is the smallest power of two greater than or equal
+    to it, with zero counted in the bucket of one.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self._buckets = collections.Counter()
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self._buckets[1 << (value - 1).bit_length() if value > 1 else 1] += 1
+
+    def snapshot(self):
+        """Returns the counts, the sum, and the non-empty buckets by upper bound."""
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "buckets": dict(sorted(self._buckets.items())),
+        }
+
+
+class _Window(object):
+    """Keeps the most recent durations, to compute their percentiles."""
+
+    def __init__(self, size=_DEFAULT_WINDOW):
+        self.count = 0
+        self._values = collections.deque(maxlen=size)
+
+    def add(self, value):
+        self.count += 1
+        self._values.append(value)
+
+    def snapshot(self):
+        """Returns the count of all values, and the percentiles of the window.
+
+        The percentiles and maximum are None when no value was recorded.
+        """
+        values = sorted(self._values)
+        result = {"count": self.count}
+        for percentile in _PERCENTILES:
+            result[f"p{percentile}"] = (
+                values[(len(values) - 1) * percentile // 100] if values else None
+            )
+        result["max"] = values[-1] if values else None
+        return result
+
+
+class _WorkerStats(object):
+    """The outcomes and batch statistics of a background worker."""
+
+    def __init__(self, *, by_log_name=False):
+        """
+        Args:
+            by_log_name (Optional[bool]): Whether to also count the outcomes
+                of each log name.
+        """
+        self._lock = threading.Lock()
+        self.committed = 0
+        self.failed = 0
+        self.committed_by_log_name = collections.Counter() if by_log_name else None
+        self.failed_by_log_name = collections.Counter() if by_log_name else None
+        self.batch_sizes = _Histogram()
+        self.batch_bytes = _Histogram()
+        self.commit_latency = _Window()
+        self.lag = _Window()
+
+    def on_outcome(self, *, sent=0, failed=0, log_names=None):
+        """Counts the entries written, and the entries dropped after failing.
+
+        Args:
+            sent (int): The number of entries written.
+            failed (int): The number of entries dropped after failing.
+            log_names (Optional[Tuple[collections.Counter, collections.Counter]]):
+                The entries written, and dropped, by log name, if counted.
+        """
+        with self._lock:
+            self.committed += sent
+            self.failed += failed
+            if log_names is not None and self.committed_by_log_name is not None:
+                self.committed_by_log_name.update(log_names[0])
+                self.failed_by_log_name.update(log_names[1])
+
+    def outcomes(self, log_name=None):
+        """Returns the number of entries written, and dropped after failing.
+
+        Args:
+            log_name (Optional[str]): If given, only the entries of this log
+                are counted, which requires counting them by log name.
+        """
+        with self._lock:
+            if log_name is None:
+                return self.committed, self.failed
+            return (
+                self.committed_by_log_name[log_name],
+                self.failed_by_log_name[log_name],
+            )
+
+    def on_batch(self, *, size, nbytes):
+        """Records the number of entries and estimated size of a new batch."""
+        with self._lock:
+            self.batch_sizes.add(size)
+            self.batch_bytes.add(nbytes)
+
+    def on_commit(self, *, latency, lag=None):
+        """Records the duration of a commit attempt.
+
+        Args:
+            latency (float): The time the commit took, in seconds.
+            lag (Optional[float]): For a successful commit, the time between
+                the creation of its oldest record and the acknowledgement.
+        """
+        with self._lock:
+            self.commit_latency.add(latency)
+            if lag is not None:
+                self.lag.add(lag)
+
+    def snapshot(self):
+        """Returns the statistics as a dict."""
+        with self._lock:
+            return {
+                "committed": self.committed,
+                "failed": self.failed,
+                "batch_size": self.batch_sizes.snapshot(),
+                "batch_bytes": self.batch_bytes.snapshot(),
+                "commit_latency": self.commit_latency.snapshot(),
+                "lag": self.lag.snapshot(),
+            }
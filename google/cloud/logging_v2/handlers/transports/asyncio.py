@@ -0,0 +1,394 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Transport for Python logging handler
+
+Uses a task on an asyncio event loop to log to Cloud Logging asynchronously.
+"""
+
+from __future__ import print_function
+
+import asyncio
+import collections
+import functools
+import logging
+import sys
+import threading
+import time
+
+from google.cloud.logging_v2.handlers.transports.background_thread import _Worker
+from google.cloud.logging_v2.handlers.transports.background_thread import _log_queued
+from google.cloud.logging_v2.handlers.transports.base import FlushResult, Transport
+from google.cloud.logging_v2.logger import _GLOBAL_RESOURCE
+
+_DEFAULT_GRACE_PERIOD = 5.0  # Seconds
+_DEFAULT_MAX_BATCH_SIZE = 10
+_DEFAULT_MAX_LATENCY = 0  # Seconds
+_DEFAULT_MAX_INFLIGHT_COMMITS = 4
+_DEFAULT_MAX_QUEUE_SIZE = 0  # Unbounded
+_LOOP_THREAD_NAME = "google.cloud.logging.AsyncioTransport"
+_LOGGER = logging.getLogger(__name__)
+
+
+class AsyncioTransport(Transport):
+    """Asynchronous transport that uses an asyncio event loop to write entries.
+
+    Entries are queued on the event loop, and a task batches them and awaits
+    ``WriteLogEntries`` through the ``LoggingServiceV2AsyncClient``, with up
+    to ``max_inflight_commits`` batches in flight. No thread is started.
+
+    The event loop is the one running when the first record is logged, unless
+    one is given. Records logged before that, or from other threads, are
+    handed over to the loop. Requires a client using the gRPC transport.
+
+    Call :meth:`flush_async` or :meth:`close_async` before the event loop
+    stops, for example on application shutdown: entries still queued when the
+    loop is closed cannot be sent.
+    """
+
+    def __init__(
+        self,
+        client,
+        name,
+        *,
+        grace_period=_DEFAULT_GRACE_PERIOD,
+        batch_size=_DEFAULT_MAX_BATCH_SIZE,
+        max_latency=_DEFAULT_MAX_LATENCY,
+        max_inflight_commits=_DEFAULT_MAX_INFLIGHT_COMMITS,
+        max_queue_size=_DEFAULT_MAX_QUEUE_SIZE,
+        resource=_GLOBAL_RESOURCE,
+        loop=None,
+        **kwargs,
+    ):
+        """
+        Args:
+            client (~logging_v2.client.Client):
+                The Logging client.
+            name (str): The name of the logger.
+            grace_period (Optional[float]): The amount of time to wait for
+                pending logs to be submitted by :meth:`flush` and :meth:`close`
+                when called from outside the event loop.
+            batch_size (Optional[int]): The maximum number of items to send at
+                a time.
+            max_latency (Optional[float]): The amount of time to wait for new
+                logs before sending a new batch.
+            max_inflight_commits (Optional[int]): The maximum number of batches
+                being committed at the same time.
+            max_queue_size (Optional[int]): The maximum number of entries
+                waiting to be sent. New entries are dropped when it is reached.
+                If zero, the queue is unbounded.
+            resource (Optional[Resource|dict]): The default monitored resource
+                to associate with logs when not specified.
+            loop (Optional[asyncio.AbstractEventLoop]): The event loop to send
+                entries from. Defaults to the loop running when the first
+                record is logged.
+        """
+        self.client = client
+        self.logger = client.async_logger(name, resource=resource)
+        self.grace_period = grace_period
+        self._batch_size = batch_size
+        self._max_latency = max_latency
+        self._max_inflight_commits = max_inflight_commits
+        self._max_queue_size = max_queue_size
+        self._loop = loop
+        self._lock = threading.Lock()
+        # entries logged before the event loop is known
+        self._pending = collections.deque()
+        self._queue = None
+        self._inflight = None
+        self._task = None
+        self._commits = set()
+        # the helper thread left running the event loop after a timeout
+        self._loop_thread = None
+        # entries queued on the event loop and not sent yet
+        self._unsent = 0
+        self._sent_entries = 0
+        self._failed_entries = 0
+        self.dropped_entries = 0
+
+    def send(self, record, message, **kwargs):
+        """Overrides Transport.send().
+
+        Args:
+            record (logging.LogRecord): Python log record that the handler was called with.
+            message (str or dict): The message from the ``LogRecord`` after being
+                formatted by the associated log formatters.
+            kwargs: Additional optional arguments for the logger
+        """
+        entry = _Worker._make_queue_entry(record, message, **kwargs)
+        loop = self._get_loop()
+        if loop is None:
+            with self._lock:
+                if 0 < self._max_queue_size <= len(self._pending):
+                    self.dropped_entries += 1
+                else:
+                    self._pending.append(entry)
+        elif _running_loop() is loop:
+            self._enqueue(entry)
+        else:
+            try:
+                loop.call_soon_threadsafe(self._enqueue, entry)
+            except RuntimeError:
+                # the event loop is closed
+                self._record_dropped()
+
+    def _record_dropped(self):
+        """Counts a dropped entry. Entries are dropped from any thread."""
+        with self._lock:
+            self.dropped_entries += 1
+
+    def _get_loop(self):
+        """Returns the event loop to send entries from, or None if not known yet."""
+        if self._loop is None:
+            self._loop = _running_loop()
+        return self._loop
+
+    def _enqueue(self, entry):
+        """Queues an entry. Must be called on the event loop."""
+        if self._queue is None:
+            self._start()
+        try:
+            self._queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            self._record_dropped()
+            return
+        self._unsent += 1
+
+    def _start(self):
+        """Starts the task sending entries. Must be called on the event loop."""
+        self._queue = asyncio.Queue(self._max_queue_size)
+        self._inflight = asyncio.Semaphore(self._max_inflight_commits)
+        with self._lock:
+            pending, self._pending = self._pending, collections.deque()
+        for entry in pending:
+            self._queue.put_nowait(entry)
+        self._unsent += len(pending)
+        self._task = self._loop.create_task(self._run())
+
+    async def _get_many(self):
+        """Gets a batch of entries, waiting up to ``max_latency`` to fill it."""
+        entries = [await self._queue.get()]
+        deadline = self._loop.time() + self._max_latency
+        while len(entries) < self._batch_size:
+            try:
+                entries.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - self._loop.time()
+            if remaining <= 0:
+                break
+            try:
+                entries.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return entries
+
+    async def _run(self):
+        """The task sending batches of entries."""
+        while True:
+            entries = await self._get_many()
+            # wait for a free slot, so at most ``max_inflight_commits``
+            # batches are pending at once
+            await self._inflight.acquire()
+            commit = self._loop.create_task(self._commit(entries))
+            self._commits.add(commit)
+            commit.add_done_callback(self._commits.discard)
+
+    async def _commit(self, entries):
+        """Writes a batch of entries, logging any error."""
+        batch = None
+        committing = False
+        try:
+            batch = self.logger.batch()
+            for entry in entries:
+                _log_queued(batch, entry)
+            committing = True
+            await batch.commit()
+            self._sent_entries += len(entries)
+            _LOGGER.debug("Submitted %d logs", len(entries))
+        except Exception:
+            # a commit leaves the entries it did not write in the batch
+            written = 0
+            if committing and batch is not None:
+                written = len(entries) - len(batch.entries)
+            failed = len(entries) - written
+            self._sent_entries += written
+            self._failed_entries += failed
+            _LOGGER.error("Failed to submit %d logs.", failed, exc_info=True)
+        finally:
+            self._inflight.release()
+            self._unsent -= len(entries)
+            for _ in entries:
+                self._queue.task_done()
+
+    async def flush_async(self, timeout=None):
+        """Waits until all entries queued so far are sent, or failed to send.
+
+        Must be awaited on the event loop of the transport.
+
+        Args:
+            timeout (Optional[float]): The maximum time to wait, in seconds.
+                If ``None``, waits until all queued entries are processed.
+
+        Returns:
+            FlushResult: The entries sent, failed and still pending.
+        """
+        start = time.monotonic()
+        sent, failed = self._sent_entries, self._failed_entries
+        if self._queue is None and self._pending and self._get_loop() is not None:
+            self._start()
+        if self._queue is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self._flush_result(start, sent, failed)
+
+    def _flush_result(self, start, sent, failed):
+        """Returns the outcome of a flush, from the counts when it started."""
+        return FlushResult(
+            sent=self._sent_entries - sent,
+            failed=self._failed_entries - failed,
+            pending=len(self._pending) + self._unsent,
+            elapsed=time.monotonic() - start,
+        )
+
+    async def close_async(self):
+        """Sends the queued entries, and stops the task sending them.
+
+        Must be awaited on the event loop of the transport.
+        """
+        await self.flush_async()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+            self._queue = None
+
+    def _run_on_loop(self, coro_func, timeout=None):
+        """Runs a coroutine on the event loop from a synchronous caller.
+
+        Returns:
+            Any: The result of the coroutine, or None if it did not complete
+            within ``timeout`` seconds, which defaults to ``grace_period``, or
+            was only scheduled.
+        """
+        if timeout is None:
+            timeout = self.grace_period
+        loop = self._loop
+        if _running_loop() is loop:
+            # the event loop cannot be blocked to wait for itself
+            loop.create_task(coro_func())
+        elif loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(coro_func(), loop)
+            try:
+                return future.result(timeout=timeout)
+            except Exception:
+                future.cancel()
+        elif _running_loop() is not None:
+            # another event loop runs in this thread, and run_until_complete
+            # would fail: run this one from a helper thread instead
+            result, thread = _run_in_thread(loop, coro_func(), timeout)
+            if thread is not None:
+                self._loop_thread = thread
+            return result
+        else:
+            return loop.run_until_complete(coro_func())
+
+    def flush(self, timeout=None):
+        """Submit any pending log records.
+
+        When called from outside the event loop, blocks for up to ``timeout``
+        seconds, or ``grace_period`` if not given. On the event loop, it
+        cannot block: the entries are only scheduled to be sent, and
+        :meth:`flush_async` should be awaited instead.
+
+        Args:
+            timeout (Optional[float]): The maximum time to wait, in seconds.
+
+        Returns:
+            FlushResult: The entries sent, failed and still pending.
+        """
+        start = time.monotonic()
+        sent, failed = self._sent_entries, self._failed_entries
+        result = None
+        if self._loop is not None and not self._loop.is_closed():
+            result = self._run_on_loop(
+                functools.partial(self.flush_async, timeout=timeout), timeout
+            )
+        if result is None:
+            result = self._flush_result(start, sent, failed)
+        return result
+
+    def close(self):
+        """Sends the pending log records, and stops sending entries.
+
+        Same as :meth:`flush` regarding blocking. A helper thread left
+        running the event loop by an earlier call is stopped.
+        """
+        if self._loop is not None and not self._loop.is_closed():
+            self._run_on_loop(self.close_async)
+        elif self._pending or self._unsent:
+            print(
+                "Failed to send %d pending logs."
+                % (len(self._pending) + self._unsent,),
+                file=sys.stderr,
+            )
+        self._stop_loop_thread()
+
+    def _stop_loop_thread(self):
+        """Stops the event loop run by a helper thread, and waits for the
+        thread to exit."""
+        thread, self._loop_thread = self._loop_thread, None
+        if thread is None or not thread.is_alive():
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        except RuntimeError:
+            # the event loop is closed
+            return
+        thread.join(self.grace_period)
+
+
+def _run_in_thread(loop, coro, timeout):
+    """Runs a coroutine on an event loop that is not running, from a new thread.
+
+    Returns:
+        Tuple[Any, Optional[threading.Thread]]: The result of the coroutine,
+        or None if it did not complete within ``timeout`` seconds, and the
+        thread if it is still running the loop then.
+    """
+    result = []
+
+    def run():
+        try:
+            result.append(loop.run_until_complete(coro))
+        except RuntimeError:
+            # the event loop was stopped before the coroutine completed
+            pass
+
+    thread = threading.Thread(target=run, name=_LOOP_THREAD_NAME, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        return None, thread
+    return (result[0] if result else None), None
+
+
+def _running_loop():
+    """Returns the event loop running in the current thread, or None."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
@@ -20,24 +20,303 @@ Uses a background worker to log to Cloud Logging asynchronously.
 from __future__ import print_function
 
 import atexit
+import collections
+import concurrent.futures
 import datetime
+import heapq
+import itertools
 import logging
+import operator
+import os
 import queue
+import random
 import sys
 import threading
 import time
+import weakref
 
 from google.cloud.logging_v2 import _helpers
-from google.cloud.logging_v2.handlers.transports.base import Transport
+from google.cloud.logging_v2._helpers import LogSeverity
+from google.cloud.logging_v2._helpers import _ENTRY_OVERHEAD_BYTES
+from google.cloud.logging_v2._helpers import _WRITE_REQUEST_MAX_BYTES
+from google.cloud.logging_v2._helpers import _estimate_log_entry_size
+from google.cloud.logging_v2._helpers import _estimate_value_size
+from google.cloud.logging_v2.circuit_breaker import CircuitOpenError
+from google.cloud.logging_v2.entries import _is_posix_time
+from google.cloud.logging_v2.handlers.transports import _spool
+from google.cloud.logging_v2.handlers.transports import _stats
+from google.cloud.logging_v2.handlers.transports.base import FlushResult, Transport
 from google.cloud.logging_v2.logger import _GLOBAL_RESOURCE
 
 _DEFAULT_GRACE_PERIOD = 5.0  # Seconds
 _DEFAULT_MAX_BATCH_SIZE = 10
+_DEFAULT_MAX_BATCH_BYTES = None  # Unbounded
 _DEFAULT_MAX_LATENCY = 0  # Seconds
+_DEFAULT_ADAPTIVE_TARGET_LATENCY = 1.0  # Seconds
+_ADAPTIVE_MAX_BATCH_SIZE = 1000
+_ADAPTIVE_STEPS = 10
+_DEFAULT_MAX_INFLIGHT_COMMITS = 1
+_DEFAULT_RETRY_DEADLINE = 60.0  # Seconds
+_DEFAULT_RETRY_INITIAL_BACKOFF = 0.5  # Seconds
+_DEFAULT_RETRY_MAX_BACKOFF = 30.0  # Seconds
+_RETRY_BACKOFF_MULTIPLIER = 2.0
+_SPOOL_HIGH_WATERMARK = 0.8  # Fraction of max_queue_size or max_queue_bytes
+_SPOOL_REPLAY_INTERVAL = 1.0  # Seconds
+_DEFAULT_MAX_QUEUE_SIZE = 0  # Unbounded
+_DEFAULT_MAX_QUEUE_BYTES = 0  # Unbounded
+_DEFAULT_BLOCK_TIMEOUT = 1.0  # Seconds
+_DEFAULT_OVERFLOW_SEVERITY = LogSeverity.WARNING
+_DEFAULT_STATS_INTERVAL = 60.0  # Seconds
+_DEFAULT_SHUTDOWN_BATCH_SIZE = 1000
 _WORKER_THREAD_NAME = "google.cloud.logging.Worker"
+_COMMITTER_THREAD_NAME = "google.cloud.logging.Committer"
+_DRAIN_THREAD_NAME = "google.cloud.logging.Drain"
 _WORKER_TERMINATOR = object()
 _LOGGER = logging.getLogger(__name__)
 
+OVERFLOW_BLOCK = "block"
+"""Block the caller, up to a timeout, until there is room in the queue."""
+
+OVERFLOW_DROP_NEWEST = "drop_newest"
+"""Discard the entry being logged when the queue is full."""
+
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+"""Evict the oldest queued entries to make room for the entry being logged."""
+
+OVERFLOW_DROP_BELOW_SEVERITY = "drop_below_severity"
+"""Shed entries below a severity threshold, oldest first, when the queue is full."""
+
+_OVERFLOW_POLICIES = frozenset(
+    (
+        OVERFLOW_BLOCK,
+        OVERFLOW_DROP_NEWEST,
+        OVERFLOW_DROP_OLDEST,
+        OVERFLOW_DROP_BELOW_SEVERITY,
+    )
+)
+
+_SHUTDOWN_MAX_BATCH_BYTES = _WRITE_REQUEST_MAX_BYTES // 2
+"""Estimated size limit of the batches sent on shutdown, leaving headroom
+for the estimation error."""
+
+_SEVERITY_NAMES = {
+    getattr(LogSeverity, name): name
+    for name in (
+        "DEFAULT",
+        "DEBUG",
+        "INFO",
+        "NOTICE",
+        "WARNING",
+        "ERROR",
+        "CRITICAL",
+        "ALERT",
+        "EMERGENCY",
+    )
+}
+
+_DeferredRecord = collections.namedtuple(
+    "_DeferredRecord", "record prepare defaults", defaults=(None,)
+)
+"""A queued log record that is formatted by the worker thread.
+
+Attributes:
+    record (logging.LogRecord): A snapshot of the record.
+    prepare (Callable[[logging.LogRecord], Tuple[str | dict | None, dict]]):
+        Computes the message and the keyword arguments for the entry.
+    defaults (Optional[dict]): Keyword arguments for the entry, overridden
+        by the ones computed by ``prepare``.
+"""
+
+
+_QUEUED_ENTRY_FIELDS = (
+    "message",
+    "log_name",
+    "labels",
+    "insert_id",
+    "severity",
+    "http_request",
+    "timestamp",
+    "resource",
+    "trace",
+    "span_id",
+    "trace_sampled",
+    "source_location",
+    "operation",
+    "logger",
+)
+_QUEUED_ENTRY_FIELD_SET = frozenset(_QUEUED_ENTRY_FIELDS)
+_get_queued_entry_fields = operator.attrgetter(*_QUEUED_ENTRY_FIELDS)
+_UNSET = object()
+
+
+class _QueuedEntry(collections.abc.Mapping):
+    """A queued log entry: the keyword arguments for :meth:`Batch.log`.
+
+    The arguments are kept in slots rather than in a dict, which takes
+    about half the memory while the entry waits in the queue. The entry
+    reads as a mapping of the arguments given, and :meth:`to_kwargs`
+    copies them to a dict.
+    """
+
+    __slots__ = _QUEUED_ENTRY_FIELDS + ("_extra",)
+
+    def __init__(
+        self,
+        message=_UNSET,
+        log_name=_UNSET,
+        labels=_UNSET,
+        insert_id=_UNSET,
+        severity=_UNSET,
+        http_request=_UNSET,
+        timestamp=_UNSET,
+        resource=_UNSET,
+        trace=_UNSET,
+        span_id=_UNSET,
+        trace_sampled=_UNSET,
+        source_location=_UNSET,
+        operation=_UNSET,
+        logger=_UNSET,
+        **extra,
+    ):
+        self.message = message
+        self.log_name = log_name
+        self.labels = labels
+        self.insert_id = insert_id
+        self.severity = severity
+        self.http_request = http_request
+        self.timestamp = timestamp
+        self.resource = resource
+        self.trace = trace
+        self.span_id = span_id
+        self.trace_sampled = trace_sampled
+        self.source_location = source_location
+        self.operation = operation
+        self.logger = logger
+        # arguments that are not log entry fields, rejected by Batch.log
+        self._extra = extra or None
+
+    def to_kwargs(self):
+        """Returns the arguments given, as a dict."""
+        kwargs = {
+            key: value
+            for key, value in zip(_QUEUED_ENTRY_FIELDS, _get_queued_entry_fields(self))
+            if value is not _UNSET
+        }
+        if self._extra is not None:
+            kwargs.update(self._extra)
+        return kwargs
+
+    def __getitem__(self, key):
+        if key in _QUEUED_ENTRY_FIELD_SET:
+            value = getattr(self, key)
+            if value is not _UNSET:
+                return value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.to_kwargs())
+
+    def __len__(self):
+        return len(self.to_kwargs())
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, self.to_kwargs())
+
+
+def _log_queued(batch, entry):
+    """Adds a queued log entry to a batch.
+
+    Args:
+        batch (logging_v2.logger.Batch): The batch.
+        entry (Mapping[str, Any]): The keyword arguments of the entry.
+    """
+    if isinstance(entry, _QueuedEntry):
+        entry = entry.to_kwargs()
+    batch.log(**entry)
+
+
+_RetryBatch = collections.namedtuple(
+    "_RetryBatch", "entries attempt deadline not_before"
+)
+"""A queued batch whose commit failed with a transient error.
+
+Attributes:
+    entries (list): The :class:`~logging_v2.entries.LogEntry` objects to resend.
+    attempt (int): The number of failed attempts so far.
+    deadline (float): The :func:`time.monotonic` time after which the batch is
+        no longer retried.
+    not_before (float): The :func:`time.monotonic` time before which the batch
+        is not resent.
+"""
+
+
+_ShutdownReport = collections.namedtuple(
+    "_ShutdownReport", "sent failed spooled unsent unconfirmed undelivered elapsed"
+)
+"""The outcome of draining the queue on shutdown.
+
+Attributes:
+    sent (int): The number of entries written.
+    failed (int): The number of entries whose commit failed.
+    spooled (int): The number of entries written to the spool instead,
+        after failing or for lack of time.
+    unsent (int): The number of entries that were not sent before the
+        deadline.
+    unconfirmed (int): The number of entries still being written at the
+        deadline, which may or may not have been delivered.
+    undelivered (Dict[str, int]): The number of failed, unsent and
+        unconfirmed entries by severity name.
+    elapsed (float): The time spent draining, in seconds.
+"""
+
+
+def _is_entry(item):
+    """Whether a queue item is a log entry, as opposed to a control item."""
+    return isinstance(item, (collections.abc.Mapping, _DeferredRecord))
+
+
+def _entry_severity(item):
+    """Returns the severity of a queued log entry, or None if it has none."""
+    if isinstance(item, _DeferredRecord):
+        return _helpers._normalize_severity(item.record.levelno)
+    return item.get("severity")
+
+
+def _severity_rank(severity):
+    """Returns the numeric value of a severity, for sorting entries by it."""
+    if severity is None:
+        return LogSeverity.DEFAULT
+    if isinstance(severity, str):
+        return getattr(LogSeverity, severity.upper(), LogSeverity.DEFAULT)
+    return severity
+
+
+def _severity_name(severity):
+    """Returns the name of a severity, for reports."""
+    return _SEVERITY_NAMES.get(severity, str(severity))
+
+
+def _oldest_timestamp(entries):
+    """Returns the earliest timestamp of log entries, as a POSIX time.
+
+    Args:
+        entries (list): The :class:`~logging_v2.entries.LogEntry` objects.
+
+    Returns:
+        Optional[float]: The timestamp, or None if no entry has one.
+    """
+    timestamps = []
+    for entry in entries:
+        timestamp = getattr(entry, "timestamp", None)
+        if isinstance(timestamp, datetime.datetime):
+            timestamps.append(timestamp.timestamp())
+        elif _is_posix_time(timestamp):
+            timestamps.append(timestamp)
+    return min(timestamps) if timestamps else None
+
+
 _CLOSE_THREAD_SHUTDOWN_ERROR_MSG = (
     "CloudLoggingHandler shutting down, cannot send logs entries to Cloud Logging due to "
     "inconsistent threading behavior at shutdown. To avoid this issue, flush the logging handler "
@@ -46,34 +325,635 @@ _CLOSE_THREAD_SHUTDOWN_ERROR_MSG = (
 )
 
 
-def _get_many(queue_, *, max_items=None, max_latency=0):
-    """Get multiple items from a Queue.
+def _estimate_entry_size(entry):
+    """Estimate the serialized size of a queued log entry, in bytes.
+
+    Args:
+        entry (Any): An item from the worker queue.
+
+    Returns:
+        int: The estimated size. Items that are not log entries, such as the
+        worker terminator, have a size of zero.
+    """
+    if isinstance(entry, _DeferredRecord):
+        record = entry.record
+        return (
+            _ENTRY_OVERHEAD_BYTES
+            + _estimate_value_size(record.msg)
+            + _estimate_value_size(record.args)
+        )
+    if not isinstance(entry, collections.abc.Mapping):
+        return 0
+    return _ENTRY_OVERHEAD_BYTES + sum(
+        len(key) + _estimate_value_size(value) for key, value in entry.items()
+    )
+
+
+class _EntryQueue(queue.Queue):
+    """A FIFO queue of log entries bounded by entry count and estimated size.
+
+    Items that are not log entries, such as the worker terminator, are never
+    counted against nor blocked by the limits.
+
+    With a ``priority_severity``, entries at or above it go to an express
+    lane, which is drained before the other entries. The limits apply to
+    both lanes together.
+
+    Items put at the front with a ``not_before`` time are held back until
+    then, and :meth:`get_many` waits for them without blocking the items
+    queued meanwhile.
+    """
+
+    def __init__(self, maxsize=0, *, max_bytes=0, priority_severity=None):
+        """
+        Args:
+            maxsize (Optional[int]): The maximum number of entries in the queue.
+                If zero or less, the entry count is unbounded.
+            max_bytes (Optional[int]): The maximum estimated size of all entries
+                in the queue. If zero or less, the size is unbounded.
+            priority_severity (Optional[int]): The severity from which entries
+                go to the express lane. If ``None``, there is a single lane.
+        """
+        super(_EntryQueue, self).__init__(maxsize)
+        self.max_bytes = max_bytes
+        self.priority_severity = priority_severity
+        self.bytes = 0
+        # statistics, updated with the mutex held
+        self.peak = 0
+        self.enqueued = 0
+        self.dequeued_bytes = 0
+
+    def _init(self, maxsize):
+        self.queue = collections.deque()
+        self._sizes = collections.deque()
+        self._express = collections.deque()
+        self._express_sizes = collections.deque()
+        # heap of (not_before, sequence, item) for the items held back
+        self._delayed = []
+        self._delayed_sequence = itertools.count()
+
+    def _qsize(self):
+        return len(self.queue) + len(self._express) + len(self._delayed)
+
+    def _ready_size(self):
+        """The number of items that can be taken now. Must be called with the
+        mutex held."""
+        return len(self.queue) + len(self._express)
+
+    def is_nearly_full(self, fraction):
+        """Whether the queue holds at least ``fraction`` of either of its limits.
+
+        An unbounded queue is never nearly full.
+        """
+        with self.mutex:
+            if 0 < self.maxsize and self.maxsize * fraction <= self._qsize():
+                return True
+            return 0 < self.max_bytes and self.max_bytes * fraction <= self.bytes
+
+    def is_priority(self, item):
+        """Whether an item goes to the express lane."""
+        if self.priority_severity is None or not _is_entry(item):
+            return False
+        severity = _entry_severity(item)
+        return severity is not None and severity >= self.priority_severity
+
+    def _put(self, item):
+        size = _estimate_entry_size(item)
+        if self.is_priority(item):
+            self._express.append(item)
+            self._express_sizes.append(size)
+        else:
+            self.queue.append(item)
+            self._sizes.append(size)
+        self.bytes += size
+        if size:
+            # only log entries have a size
+            self.enqueued += 1
+        if self._qsize() > self.peak:
+            self.peak = self._qsize()
+
+    def _get(self):
+        if not self._ready_size():
+            # only held back items are left, take them regardless of their time
+            self._release_delayed(float("inf"))
+        if self._express:
+            items, sizes = self._express, self._express_sizes
+        else:
+            items, sizes = self.queue, self._sizes
+        size = sizes.popleft()
+        self.bytes -= size
+        self.dequeued_bytes += size
+        return items.popleft()
+
+    def _has_room(self, item, size, *, count=None, nbytes=None):
+        """Whether ``item`` fits in the queue. Must be called with the mutex held."""
+        if not _is_entry(item):
+            return True
+        count = self._qsize() if count is None else count
+        nbytes = self.bytes if nbytes is None else nbytes
+        if 0 < self.maxsize <= count:
+            return False
+        # a single entry larger than the budget is accepted into an empty
+        # queue, otherwise it could never be sent
+        if 0 < self.max_bytes < nbytes + size and count > 0:
+            return False
+        return True
+
+    def put(self, item, block=True, timeout=None):
+        """Put an item into the queue.
+
+        Same as :meth:`queue.Queue.put`, but also honors ``max_bytes``.
+        """
+        size = _estimate_entry_size(item)
+        with self.not_full:
+            if not self._has_room(item, size):
+                if not block:
+                    raise queue.Full
+                elif timeout is None:
+                    while not self._has_room(item, size):
+                        self.not_full.wait()
+                elif timeout < 0:
+                    raise ValueError("'timeout' must be a non-negative number")
+                else:
+                    endtime = time.monotonic() + timeout
+                    while not self._has_room(item, size):
+                        remaining = endtime - time.monotonic()
+                        if remaining <= 0.0:
+                            raise queue.Full
+                        self.not_full.wait(remaining)
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+    def put_evicting(self, item, *, evict_if=None):
+        """Put an item into the queue without blocking, evicting queued
+        entries, oldest first, to make room for it.
+
+        Entries of the express lane are only evicted once the other lane has
+        no candidate left. Evicted entries are marked as done.
+
+        Args:
+            item (Any): The log entry to add.
+            evict_if (Optional[Callable[[Any], bool]]): Predicate selecting
+                which queued entries may be evicted. If ``None``, any queued
+                entry may be evicted.
+
+        Returns:
+            list: The evicted entries.
+
+        Raises:
+            queue.Full: If enough room cannot be made. The queue is left
+                unmodified.
+        """
+        size = _estimate_entry_size(item)
+        with self.not_full:
+            # find the eviction candidates before modifying the queue
+            lanes = ((self.queue, self._sizes), (self._express, self._express_sizes))
+            victims = ([], [])
+            count = self._qsize()
+            nbytes = self.bytes
+            lane = index = 0
+            while not self._has_room(item, size, count=count, nbytes=nbytes):
+                items, sizes = lanes[lane]
+                if index >= len(items):
+                    if lane == len(lanes) - 1:
+                        raise queue.Full
+                    lane, index = lane + 1, 0
+                    continue
+                candidate = items[index]
+                if _is_entry(candidate) and (evict_if is None or evict_if(candidate)):
+                    victims[lane].append(index)
+                    count -= 1
+                    nbytes -= sizes[index]
+                index += 1
+
+            evicted = []
+            for (items, sizes), indexes in zip(lanes, victims):
+                lane_evicted = []
+                for index in reversed(indexes):
+                    lane_evicted.append(items[index])
+                    self.bytes -= sizes[index]
+                    del items[index]
+                    del sizes[index]
+                evicted.extend(reversed(lane_evicted))
+
+            self._put(item)
+            self.unfinished_tasks += 1 - len(evicted)
+            self.not_empty.notify()
+            return evicted
+
+    def put_front(self, item, *, not_before=None, express=False):
+        """Put an item at the head of the queue, ignoring the limits.
+
+        Args:
+            item (Any): The item to get next.
+            not_before (Optional[float]): The :func:`time.monotonic` time
+                before which the item is held back. Other items are taken
+                meanwhile. If ``None``, the item is available right away.
+            express (Optional[bool]): Whether to put the item at the head of
+                the express lane, rather than of the other lane.
+        """
+        with self.mutex:
+            if not_before is not None and not_before > time.monotonic():
+                heapq.heappush(
+                    self._delayed,
+                    (not_before, next(self._delayed_sequence), item, express),
+                )
+            else:
+                self._put_head(item, express)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+    def _put_head(self, item, express):
+        """Puts an item at the head of a lane. Must be called with the mutex held."""
+        if express:
+            self._express.appendleft(item)
+            self._express_sizes.appendleft(0)
+        else:
+            self.queue.appendleft(item)
+            self._sizes.appendleft(0)
+
+    def _release_delayed(self, now):
+        """Moves the held back items due at ``now`` to the head of the queue,
+        earliest first. Must be called with the mutex held.
+
+        Returns:
+            Optional[float]: The time at which the next held back item is due,
+            or ``None`` if there is none left.
+        """
+        due = []
+        while self._delayed and self._delayed[0][0] <= now:
+            due.append(heapq.heappop(self._delayed))
+        for _, _, item, express in reversed(due):
+            self._put_head(item, express)
+        return self._delayed[0][0] if self._delayed else None
+
+    def join(self, timeout=None):
+        """Blocks until all items in the queue have been gotten and processed.
+
+        Same as :meth:`queue.Queue.join`, with a timeout.
+
+        Args:
+            timeout (Optional[float]): The maximum number of seconds to wait.
+                If ``None``, waits indefinitely.
+
+        Returns:
+            bool: True if all items were processed, False on timeout.
+        """
+        with self.all_tasks_done:
+            if timeout is None:
+                while self.unfinished_tasks:
+                    self.all_tasks_done.wait()
+                return True
+            endtime = time.monotonic() + timeout
+            while self.unfinished_tasks:
+                remaining = endtime - time.monotonic()
+                if remaining <= 0.0:
+                    return False
+                self.all_tasks_done.wait(remaining)
+            return True
+
+    def snapshot(self):
+        """Returns the items in the queue, held back ones included."""
+        with self.mutex:
+            return (
+                list(self._express)
+                + list(self.queue)
+                + [item for _, _, item, _ in self._delayed]
+            )
+
+    def _next_size(self):
+        """The estimated size of the next item. Must be called with the mutex held."""
+        if self._express_sizes:
+            return self._express_sizes[0]
+        return self._sizes[0]
+
+    def get_many(
+        self,
+        *,
+        max_items=None,
+        max_bytes=None,
+        max_latency=0,
+        timeout=None,
+        urgent=None,
+        include_delayed=False,
+    ):
+        """Remove a batch of items from the queue.
+
+        Waits for a first item, then for more items until ``max_latency``
+        seconds after the first one was taken, however many arrive in
+        between. The items available are taken together, holding the mutex
+        once rather than once per item. Does not mark the items as done.
+
+        Args:
+            max_items (Optional[int]): The maximum number of items to get.
+                If ``None``, the number of items is not limited.
+            max_bytes (Optional[int]): The maximum estimated size of the items
+                to get. The first item is always returned, even if it is larger.
+                If ``None``, the size of the items is not limited.
+            max_latency (Optional[float]): The maximum number of seconds to
+                wait for the batch to fill, after the first item was taken.
+            timeout (Optional[float]): The maximum number of seconds to wait
+                for the first item. If ``None``, waits indefinitely.
+            urgent (Optional[Callable[[Any], bool]]): Predicate selecting the
+                items that must be sent right away: once one is taken, only
+                the items already queued are added, without waiting.
+            include_delayed (Optional[bool]): Whether to also take the items
+                held back until a later time. If False, waits for them to be
+                due like for any other item.
+
+        Returns:
+            list: The items, which end with the worker terminator if it was
+            taken.
+
+        Raises:
+            queue.Empty: If no item became available within ``timeout``.
+        """
+        with self.not_empty:
+            if timeout is not None:
+                endtime = time.monotonic() + timeout
+            while True:
+                now = time.monotonic()
+                next_due = self._release_delayed(
+                    float("inf") if include_delayed else now
+                )
+                if self._ready_size():
+                    break
+                remaining = None
+                if timeout is not None:
+                    remaining = endtime - now
+                    if remaining <= 0.0:
+                        raise queue.Empty
+                if next_due is not None:
+                    # wake up when the next held back item is due
+                    until_due = next_due - now
+                    remaining = (
+                        until_due if remaining is None else min(remaining, until_due)
+                    )
+                self.not_empty.wait(remaining)
+
+            # the batch is sent at this deadline, whatever arrives meanwhile
+            flush_at = time.monotonic() + max_latency
+            items = []
+            nbytes = 0
+            full = False
+            while True:
+                taken = 0
+                while self._ready_size():
+                    size = self._next_size()
+                    if max_bytes is not None and items and nbytes + size > max_bytes:
+                        # leave the item for the next batch
+                        full = True
+                        break
+                    item = self._get()
+                    items.append(item)
+                    nbytes += size
+                    taken += 1
+                    if item is _WORKER_TERMINATOR:
+                        # nothing follows the terminator
+                        full = True
+                        break
+                    if urgent is not None and urgent(item):
+                        flush_at = 0
+                    if max_items is not None and len(items) >= max_items:
+                        full = True
+                        break
+                if taken:
+                    self.not_full.notify(taken)
+                if full:
+                    break
+                remaining = flush_at - time.monotonic()
+                if remaining <= 0.0:
+                    break
+                self.not_empty.wait(remaining)
+            return items
+
+
+def _batch_log_names(batch):
+    """Returns the log names of the entries of a batch.
+
+    Entries without a log name of their own are written to the log of the
+    batch.
+    """
+    logger = getattr(batch, "logger", None)
+    default = getattr(logger, "full_name", None)
+    return {getattr(entry, "log_name", None) or default for entry in batch.entries}
+
+
+def _entry_log_name(entry, default):
+    """Returns the log name of an entry, queued, batched or spooled.
+
+    Args:
+        entry (Any): A queued entry, a :class:`~logging_v2.entries.LogEntry`,
+            or the API representation of an entry.
+        default (str): The log name of the entries without one of their own.
+    """
+    if isinstance(entry, _DeferredRecord):
+        entry = entry.defaults or {}
+    if isinstance(entry, collections.abc.Mapping):
+        name = entry.get("log_name") or entry.get("logName")
+    else:
+        name = getattr(entry, "log_name", None)
+    return name or default
+
+
+def _written_entries(entries, batch):
+    """Returns the entries that a failed commit wrote.
 
-    Gets at least one (blocking) and at most ``max_items`` items
-    (non-blocking) from a given Queue. Does not mark the items as done.
+    Args:
+        entries (list): The entries of the batch before the commit.
+        batch (logging_v2.logger.Batch): The batch, which keeps the entries
+            it did not write.
+    """
+    unwritten = set(map(id, batch.entries))
+    return [entry for entry in entries if id(entry) not in unwritten]
+
+
+def _backoff_delay(attempt, *, initial, maximum, multiplier=_RETRY_BACKOFF_MULTIPLIER):
+    """Computes the delay before a retry, using exponential backoff with full jitter.
+
+    Randomizing the whole delay spreads out the retries of the many processes
+    that see the same outage, instead of having them retry in lockstep.
 
     Args:
-        queue_ (queue.Queue): The Queue to get items from.
-        max_items (Optional[int]): The maximum number of items to get.
-            If ``None``, then all available items in the queue are returned.
-        max_latency (Optional[float]): The maximum number of seconds to wait
-            for more than one item from a queue. This number includes
-            the time required to retrieve the first item.
+        attempt (int): The number of failed attempts so far, starting at 1.
+        initial (float): The upper bound of the first delay, in seconds.
+        maximum (float): The upper bound of any delay, in seconds.
+        multiplier (Optional[float]): The growth factor of the upper bound.
 
     Returns:
-        list: items retrieved from the queue
+        float: The delay in seconds.
     """
-    start = time.time()
-    # Always return at least one item.
-    items = [queue_.get()]
-    while max_items is None or len(items) < max_items:
-        try:
-            elapsed = time.time() - start
-            timeout = max(0, max_latency - elapsed)
-            items.append(queue_.get(timeout=timeout))
-        except queue.Empty:
-            break
-    return items
+    return random.uniform(0, min(maximum, initial * multiplier ** (attempt - 1)))
+
+
+class _RetryBudget(object):
+    """Token bucket limiting retries to a fraction of successful commits.
+
+    Every retry spends a token, and every successful commit earns back
+    ``token_ratio`` tokens. Retries are refused while at most half of the
+    tokens are left, so that a persistent outage does not multiply the
+    request rate.
+    """
+
+    def __init__(self, *, max_tokens=100, token_ratio=0.1):
+        """
+        Args:
+            max_tokens (Optional[float]): The capacity of the bucket.
+            token_ratio (Optional[float]): The tokens earned per success.
+        """
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self.tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def on_success(self):
+        """Records a successful commit."""
+        with self._lock:
+            self.tokens = min(self.max_tokens, self.tokens + self.token_ratio)
+
+    def try_spend(self):
+        """Takes a token for a retry.
+
+        Returns:
+            bool: False if the budget is exhausted and the retry must not happen.
+        """
+        with self._lock:
+            if self.tokens <= self.max_tokens / 2:
+                return False
+            self.tokens -= 1
+            return True
+
+
+_GLOBAL_RETRY_BUDGET = _RetryBudget()
+"""Retry budget shared by all background workers in the process by default."""
+
+
+_WORKERS = weakref.WeakSet()
+"""Workers to reinitialize in the child process after a fork."""
+
+_SHARED_WORKERS = weakref.WeakKeyDictionary()
+"""The worker shared by the transports of each client, its number of users,
+and the options it was created with."""
+
+_SHARED_WORKERS_LOCK = threading.Lock()
+
+
+def _after_fork_in_child():
+    """Reinitializes the background workers in a forked child process."""
+    global _SHARED_WORKERS_LOCK
+
+    _GLOBAL_RETRY_BUDGET._lock = threading.Lock()
+    _SHARED_WORKERS_LOCK = threading.Lock()
+    for worker in list(_WORKERS):
+        worker._after_fork_in_child()
+
+
+def _acquire_shared_worker(client, make_worker, options):
+    """Returns the worker shared by the transports of a client.
+
+    Args:
+        client (~logging_v2.client.Client): The Logging client.
+        make_worker (Callable[[], _Worker]): Creates and starts the worker,
+            if the client does not have one yet.
+        options (dict): The options of the worker, by transport argument.
+
+    Returns:
+        _Worker: The started worker.
+
+    Raises:
+        ValueError: If the worker of the client was created with other
+            options, which would be ignored.
+    """
+    with _SHARED_WORKERS_LOCK:
+        worker, users, shared_options = _SHARED_WORKERS.get(client, (None, 0, None))
+        if worker is None:
+            worker = make_worker()
+            shared_options = options
+        elif options != shared_options:
+            mismatched = sorted(
+                name for name in options if options[name] != shared_options[name]
+            )
+            raise ValueError(
+                "The shared worker of this client was created with other "
+                "options: %s." % (", ".join(mismatched),)
+            )
+        _SHARED_WORKERS[client] = (worker, users + 1, shared_options)
+        return worker
+
+
+def _release_shared_worker(client, worker):
+    """Releases the shared worker of a client, closing it after its last user.
+
+    Args:
+        client (~logging_v2.client.Client): The Logging client.
+        worker (_Worker): The worker returned by :func:`_acquire_shared_worker`.
+    """
+    with _SHARED_WORKERS_LOCK:
+        shared, users, options = _SHARED_WORKERS.get(client, (None, 0, None))
+        if shared is not worker:
+            # already closed
+            return
+        if users > 1:
+            _SHARED_WORKERS[client] = (worker, users - 1, options)
+            return
+        del _SHARED_WORKERS[client]
+    worker.close()
+
+
+if hasattr(os, "register_at_fork"):  # pragma: NO BRANCH
+    # not available on Windows
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+class _AdaptiveBatchController(object):
+    """Tunes the batch size and latency of a worker from observed commits.
+
+    Follows an additive-increase, multiplicative-decrease (AIMD) scheme:
+    while entries back up in the queue and commits stay under the target
+    latency, the batch size and the time spent waiting for a batch to fill
+    grow by a fixed step. When a commit fails or exceeds the target latency,
+    both are halved. When the queue drains, the waiting time is halved so
+    that entries are sent promptly at low load.
+    """
+
+    def __init__(self, *, max_batch_size, max_latency, target_latency):
+        """
+        Args:
+            max_batch_size (int): The upper bound for the batch size.
+            max_latency (float): The upper bound for the time to wait for a
+                batch to fill, in seconds.
+            target_latency (float): The commit latency, in seconds, above which
+                the batch size and waiting time are reduced.
+        """
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.target_latency = target_latency
+        self._batch_size_step = max(1, max_batch_size // _ADAPTIVE_STEPS)
+        self._latency_step = max_latency / _ADAPTIVE_STEPS
+        self._lock = threading.Lock()
+        self.batch_size = 1
+        self.latency = 0.0
+
+    def on_commit(self, *, commit_latency, succeeded, queue_depth):
+        """Adjusts the batch size and latency after a commit.
+
+        Args:
+            commit_latency (float): The time the commit took, in seconds.
+            succeeded (bool): Whether the commit succeeded.
+            queue_depth (int): The number of entries still waiting to be sent.
+        """
+        with self._lock:
+            if not succeeded or commit_latency > self.target_latency:
+                self.batch_size = max(1, self.batch_size // 2)
+                self.latency = self.latency / 2
+            elif queue_depth >= self.batch_size:
+                self.batch_size = min(
+                    self.max_batch_size, self.batch_size + self._batch_size_step
+                )
+                self.latency = min(self.max_latency, self.latency + self._latency_step)
+            elif queue_depth == 0:
+                self.latency = self.latency / 2
 
 
 class _Worker(object):
@@ -85,7 +965,28 @@ class _Worker(object):
         *,
         grace_period=_DEFAULT_GRACE_PERIOD,
         max_batch_size=_DEFAULT_MAX_BATCH_SIZE,
+        max_batch_bytes=_DEFAULT_MAX_BATCH_BYTES,
         max_latency=_DEFAULT_MAX_LATENCY,
+        adaptive=False,
+        adaptive_target_latency=_DEFAULT_ADAPTIVE_TARGET_LATENCY,
+        max_inflight_commits=_DEFAULT_MAX_INFLIGHT_COMMITS,
+        max_queue_size=_DEFAULT_MAX_QUEUE_SIZE,
+        max_queue_bytes=_DEFAULT_MAX_QUEUE_BYTES,
+        overflow_policy=OVERFLOW_DROP_NEWEST,
+        block_timeout=_DEFAULT_BLOCK_TIMEOUT,
+        overflow_severity=_DEFAULT_OVERFLOW_SEVERITY,
+        spool=None,
+        retry_deadline=_DEFAULT_RETRY_DEADLINE,
+        retry_initial_backoff=_DEFAULT_RETRY_INITIAL_BACKOFF,
+        retry_max_backoff=_DEFAULT_RETRY_MAX_BACKOFF,
+        retry_budget=None,
+        stats_callback=None,
+        stats_interval=_DEFAULT_STATS_INTERVAL,
+        priority_severity=None,
+        shutdown_parallelism=None,
+        shutdown_batch_size=_DEFAULT_SHUTDOWN_BATCH_SIZE,
+        rejected_callback=None,
+        count_by_log_name=False,
     ):
         """
         Args:
@@ -95,34 +996,679 @@ class _Worker(object):
                 be submitted when the process is shutting down.
             max_batch (Optional[int]): The maximum number of items to send at a time
                 in the background thread.
+            max_batch_bytes (Optional[int]): The maximum estimated serialized size,
+                in bytes, of the items to send at a time in the background thread.
+                Must not exceed the 10 MB WriteLogEntries request limit, and
+                should leave some headroom since sizes are estimated. If ``None``,
+                batches are only limited by ``max_batch``.
             max_latency (Optional[float]): The amount of time to wait for new logs before
                 sending a new batch. It is strongly recommended to keep this smaller
                 than the grace_period. This means this is effectively the longest
                 amount of time the background thread will hold onto log entries
                 before sending them to the server.
+            adaptive (Optional[bool]): If True, the batch size and latency start
+                low and are tuned from the queue depth and observed commit
+                latency, up to ``max_batch`` and ``max_latency``.
+            adaptive_target_latency (Optional[float]): In adaptive mode, the
+                commit latency, in seconds, above which the batch size and
+                latency are reduced.
+            max_inflight_commits (Optional[int]): The maximum number of batches
+                being committed at the same time. A batch is only committed
+                once the batches queued before it with entries of the same
+                log names are, so that each log is written in order: batches
+                run concurrently only if their log names differ, as with
+                ``shared_worker``.
+            max_queue_size (Optional[int]): The maximum number of entries waiting
+                to be sent. If zero, the queue is unbounded.
+            max_queue_bytes (Optional[int]): The maximum estimated size, in bytes,
+                of the entries waiting to be sent. If zero, the queue is unbounded.
+            overflow_policy (Optional[str]): What to do with a new entry when the
+                queue is full. One of :data:`OVERFLOW_BLOCK`,
+                :data:`OVERFLOW_DROP_NEWEST`, :data:`OVERFLOW_DROP_OLDEST` or
+                :data:`OVERFLOW_DROP_BELOW_SEVERITY`.
+            block_timeout (Optional[float]): With :data:`OVERFLOW_BLOCK`, the
+                amount of time to wait for room in the queue before dropping
+                the new entry.
+            overflow_severity (Optional[int|str]): With
+                :data:`OVERFLOW_DROP_BELOW_SEVERITY`, entries below this severity
+                are dropped when the queue is full.
+            spool (Optional[_spool._Spool]): A disk spool for batches that
+                cannot be sent: batches that fail to commit, batches formed
+                while the queue is nearly full, and entries pending at exit.
+                Only a queue bounded by ``max_queue_size`` or
+                ``max_queue_bytes`` is ever nearly full. Spooled batches are replayed once commits succeed again, or
+                by the next process using the same spool.
+            retry_deadline (Optional[float]): The amount of time, in seconds,
+                during which a batch that failed with a transient error is
+                retried. Retried batches are sent ahead of newer entries. If
+                zero, failed batches are not retried.
+            retry_initial_backoff (Optional[float]): The upper bound of the
+                randomized delay before the first retry of a batch. It doubles
+                with each further retry.
+            retry_max_backoff (Optional[float]): The upper bound of the
+                randomized delay before any retry.
+            retry_budget (Optional[_RetryBudget]): Limits the retries relative
+                to successful commits. Defaults to a budget shared by all
+                workers in the process.
+            stats_callback (Optional[Callable[[dict], None]]): Called with
+                the :meth:`stats` snapshot every ``stats_interval`` seconds,
+                on the worker thread.
+            stats_interval (Optional[float]): The time between two calls of
+                ``stats_callback``, in seconds.
+            priority_severity (Optional[int|str]): Entries at or above this
+                severity go to an express lane, which is sent first and
+                without waiting for a batch to fill. When the queue is full,
+                they make room by evicting entries of the other lane. If
+                ``None``, all entries are queued in order.
+            shutdown_parallelism (Optional[int]): If set, the entries queued
+                when the worker is closed are sent by this many threads at
+                once, in batches of up to ``shutdown_batch_size``, most
+                severe first and within ``grace_period``, as described in
+                :meth:`_drain`. If ``None``, the worker thread sends them in
+                its usual batches.
+            shutdown_batch_size (Optional[int]): The maximum number of
+                entries in a batch sent on shutdown.
+            rejected_callback (Optional[Callable[[LogEntry | dict, Exception], None]]):
+                Called, on the worker thread, with each entry that the API
+                failed to write with a permanent error, such as an invalid
+                entry, and its error. Such entries are neither retried nor
+                spooled. Entries replayed from the spool are passed in their
+                API representation. If ``None``, they are logged.
+            count_by_log_name (Optional[bool]): Whether to count the entries
+                of each log name, so that :meth:`flush` can report those of
+                one log, as for the transports sharing the worker.
+
+        Raises:
+            ValueError: If ``overflow_policy`` is not a known policy, or if
+                ``max_batch_bytes`` exceeds the request size limit.
         """
+        if overflow_policy not in _OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy: {overflow_policy!r}")
+        if max_batch_bytes is not None and max_batch_bytes > _WRITE_REQUEST_MAX_BYTES:
+            raise ValueError(
+                f"max_batch_bytes cannot exceed {_WRITE_REQUEST_MAX_BYTES} bytes"
+            )
         self._cloud_logger = cloud_logger
         self._grace_period = grace_period
         self._max_batch_size = max_batch_size
+        self._max_batch_bytes = max_batch_bytes
         self._max_latency = max_latency
-        self._queue = queue.Queue(0)
+        self._adaptive_controller = None
+        if adaptive:
+            self._adaptive_controller = _AdaptiveBatchController(
+                max_batch_size=max_batch_size or _ADAPTIVE_MAX_BATCH_SIZE,
+                max_latency=max_latency,
+                target_latency=adaptive_target_latency,
+            )
+        self._max_inflight_commits = max_inflight_commits
+        self._inflight = threading.BoundedSemaphore(max_inflight_commits)
+        self._overflow_policy = overflow_policy
+        self._block_timeout = block_timeout
+        if isinstance(overflow_severity, str):
+            overflow_severity = getattr(LogSeverity, overflow_severity.upper())
+        self._overflow_severity = overflow_severity
+        if isinstance(priority_severity, str):
+            priority_severity = getattr(LogSeverity, priority_severity.upper())
+        self._priority_severity = priority_severity
+        self._queue = _EntryQueue(
+            max_queue_size,
+            max_bytes=max_queue_bytes,
+            priority_severity=priority_severity,
+        )
+        self._spool = spool
+        self._replay_lock = threading.Lock()
+        self._retry_deadline = retry_deadline
+        self._retry_initial_backoff = retry_initial_backoff
+        self._retry_max_backoff = retry_max_backoff
+        if retry_budget is None:
+            retry_budget = _GLOBAL_RETRY_BUDGET
+        self._retry_budget = retry_budget
+        self._retry_lock = threading.Lock()
+        self._pending_retries = 0
         self._operational_lock = threading.Lock()
+        self._dropped_lock = threading.Lock()
+        self._dropped_entries = 0
+        self._dropped_bytes = 0
+        self._count_by_log_name = count_by_log_name
+        self._stats = _stats._WorkerStats(by_log_name=count_by_log_name)
+        # the entries of the items taken off the queue and not done yet, by
+        # log name, if counted
+        self._taken_lock = threading.Lock()
+        self._taken_by_log_name = collections.Counter()
+        self._stats_callback = stats_callback
+        self._stats_interval = stats_interval
+        self._next_stats_report = None
+        self._shutdown_parallelism = shutdown_parallelism
+        self._shutdown_batch_size = shutdown_batch_size
+        self._rejected_callback = rejected_callback
         self._thread = None
+        self._restart_on_emit = False
+        _WORKERS.add(self)
 
     @property
     def is_alive(self):
         """Returns True is the background thread is running."""
         return self._thread is not None and self._thread.is_alive()
 
-    def _safely_commit_batch(self, batch):
-        total_logs = len(batch.entries)
+    @property
+    def dropped_entries(self):
+        """int: The number of entries discarded because the queue was full."""
+        return self._dropped_entries
+
+    @property
+    def dropped_bytes(self):
+        """int: The estimated size of the entries discarded because the queue was full."""
+        return self._dropped_bytes
+
+    def stats(self):
+        """Returns a snapshot of the runtime statistics of the worker.
+
+        Returns:
+            dict: With the keys:
+
+            * ``queue_depth``, ``queue_bytes``: the number and estimated size
+              of the items queued.
+            * ``queue_peak``: the largest number of items queued at once.
+            * ``enqueued``: the number of entries accepted into the queue.
+            * ``committed``: the number of entries written.
+            * ``failed``: the number of entries dropped after failing to be
+              written.
+            * ``dropped``, ``dropped_bytes``: the number and estimated size of
+              the entries discarded because the queue was full.
+            * ``batch_size``, ``batch_bytes``: histograms of the number and
+              estimated size of the entries in each batch, as dicts with the
+              ``count`` and ``sum`` of the values, and the ``buckets`` that
+              count them by power-of-two upper bound.
+            * ``commit_latency``: the duration of commit attempts, in seconds.
+            * ``lag``: for each batch written, the time between the creation
+              of its oldest log record and the acknowledgement of the write,
+              in seconds.
+
+            Durations are dicts with the ``count`` of all values, and the
+            ``p50``, ``p90``, ``p99`` and ``max`` of the most recent ones.
+        """
+        snapshot = {
+            "queue_depth": self._queue.qsize(),
+            "queue_bytes": self._queue.bytes,
+            "queue_peak": self._queue.peak,
+            "enqueued": self._queue.enqueued,
+            "dropped": self._dropped_entries,
+            "dropped_bytes": self._dropped_bytes,
+        }
+        snapshot.update(self._stats.snapshot())
+        return snapshot
+
+    def _maybe_report_stats(self):
+        """Calls the statistics callback if it is due."""
+        if self._stats_callback is None:
+            return
+        now = time.monotonic()
+        if self._next_stats_report is None:
+            self._next_stats_report = now + self._stats_interval
+        if now < self._next_stats_report:
+            return
+        self._next_stats_report = now + self._stats_interval
+        try:
+            self._stats_callback(self.stats())
+        except Exception:
+            _LOGGER.error("Failed to report logging statistics.", exc_info=True)
+
+    @property
+    def current_batch_size(self):
+        """int: The maximum number of entries in the next batch."""
+        if self._adaptive_controller is not None:
+            return self._adaptive_controller.batch_size
+        return self._max_batch_size
+
+    @property
+    def current_max_latency(self):
+        """float: The maximum time to wait for the next batch to fill, in seconds."""
+        if self._adaptive_controller is not None:
+            return self._adaptive_controller.latency
+        return self._max_latency
+
+    def _safely_commit_batch(self, batch, retry=None):
+        """Commits a batch, logging any error.
+
+        A batch that fails with a transient error is queued for a retry, ahead
+        of the entries queued since.
+
+        Args:
+            batch (logging_v2.logger.Batch): The batch to commit.
+            retry (Optional[_RetryBatch]): The previous attempt, if the batch
+                is being retried.
+
+        Returns:
+            bool: False if the commit raised an error, True otherwise.
+        """
+        entries = list(batch.entries)
+        total_logs = len(entries)
 
         try:
             if total_logs > 0:
                 batch.commit()
                 _LOGGER.debug("Submitted %d logs", total_logs)
+        except Exception as exc:
+            # the batch keeps the entries it did not write
+            if total_logs > len(batch.entries):
+                self._record_outcome(sent=_written_entries(entries, batch))
+            exc = self._remove_rejected_entries(batch, exc)
+            if not batch.entries or self._schedule_retry(batch, exc, retry):
+                return False
+            _LOGGER.error(
+                "Failed to submit %d logs.", len(batch.entries), exc_info=True
+            )
+            return False
+        self._retry_budget.on_success()
+        return True
+
+    def _remove_rejected_entries(self, batch, exc):
+        """Removes the entries of a failed batch that failed for good.
+
+        The entries that the API failed to write with a permanent error are
+        counted as failed, and reported to ``rejected_callback``. The entries
+        that failed with a transient error are left in the batch.
+
+        Args:
+            batch (logging_v2.logger.Batch): The batch that failed.
+            exc (Exception): The error raised by the commit.
+
+        Returns:
+            Exception: The error to decide whether the entries left in the
+            batch are retried.
+        """
+        failures = getattr(batch, "failures", None)
+        if not failures:
+            return exc
+        rejected = []
+        transient = []
+        for entry, error in failures:
+            if _helpers._is_retryable_error(error):
+                transient.append(error)
+            else:
+                rejected.append((entry, error))
+        if rejected:
+            removed = {id(entry) for entry, _ in rejected}
+            batch.entries[:] = [
+                entry for entry in batch.entries if id(entry) not in removed
+            ]
+            self._record_outcome(failed=[entry for entry, _ in rejected])
+            self._report_rejected(rejected)
+        if transient and len(transient) == len(batch.entries):
+            # only entries that failed with a transient error are left
+            return transient[0]
+        return exc
+
+    def _report_rejected(self, rejected):
+        """Reports the entries that the API failed to write for good.
+
+        Args:
+            rejected (List[Tuple[LogEntry | dict, Exception]]): The entries,
+                and their errors.
+        """
+        if self._rejected_callback is None:
+            _LOGGER.error(
+                "%d log entries were rejected: %s", len(rejected), rejected[0][1]
+            )
+            return
+        for entry, error in rejected:
+            try:
+                self._rejected_callback(entry, error)
+            except Exception:
+                _LOGGER.error("Failed to report a rejected log entry.", exc_info=True)
+
+    def _schedule_retry(self, batch, exc, retry=None):
+        """Queues the entries of a failed batch for another attempt.
+
+        Args:
+            batch (logging_v2.logger.Batch): The batch that failed.
+            exc (Exception): The error raised by the commit.
+            retry (Optional[_RetryBatch]): The previous attempt, if the batch
+                was being retried.
+
+        Returns:
+            bool: True if the entries were queued, and removed from the batch.
+        """
+        if self._retry_deadline <= 0 or not _helpers._is_retryable_error(exc):
+            return False
+        if isinstance(exc, CircuitOpenError) and self._spool is not None:
+            # the API is known to be down: spool the batch right away
+            return False
+        now = time.monotonic()
+        attempt = retry.attempt + 1 if retry is not None else 1
+        deadline = retry.deadline if retry is not None else now + self._retry_deadline
+        delay = _backoff_delay(
+            attempt,
+            initial=self._retry_initial_backoff,
+            maximum=self._retry_max_backoff,
+        )
+        if now + delay >= deadline or not self._retry_budget.try_spend():
+            return False
+
+        total_logs = len(batch.entries)
+        # the entries go back to the lane they came from, so that express
+        # entries queued meanwhile do not get ahead of them
+        lanes = ([], [])
+        for entry in batch.entries:
+            lanes[self._is_priority_entry(entry)].append(entry)
+        with self._retry_lock:
+            self._pending_retries += sum(1 for entries in lanes if entries)
+        for express, entries in enumerate(lanes):
+            if not entries:
+                continue
+            # the batch is held in the queue until its backoff delay is over,
+            # so the worker thread keeps sending the entries queued meanwhile
+            self._queue.put_front(
+                _RetryBatch(entries, attempt, deadline, now + delay),
+                not_before=now + delay,
+                express=bool(express),
+            )
+        del batch.entries[:]
+        _LOGGER.warning(
+            "Failed to submit %d logs, retrying in %.2f seconds (attempt %d): %s",
+            total_logs,
+            delay,
+            attempt,
+            exc,
+        )
+        return True
+
+    def _is_priority_entry(self, entry):
+        """Whether a log entry object belongs to the express lane."""
+        if self._priority_severity is None:
+            return False
+        severity = getattr(entry, "severity", None)
+        return (
+            severity is not None and _severity_rank(severity) >= self._priority_severity
+        )
+
+    def _is_urgent(self, item):
+        """Whether a queue item must be sent without waiting for a full batch."""
+        if isinstance(item, _RetryBatch):
+            return any(self._is_priority_entry(entry) for entry in item.entries)
+        return self._queue.is_priority(item)
+
+    def _dequeue_retry(self):
+        """Records that a batch queued for a retry was taken off the queue."""
+        with self._retry_lock:
+            self._pending_retries -= 1
+
+    def _commit_retry(self, retry):
+        """Commits a retried batch again, once its backoff delay is over.
+
+        Args:
+            retry (_RetryBatch): The batch to retry.
+        """
+        batch = self._cloud_logger.batch()
+        batch.entries.extend(retry.entries)
+        self._commit_batch(batch, retry=retry)
+
+    def _commit_batch(self, batch, retry=None):
+        """Commits a batch, and feeds the outcome to the adaptive controller.
+
+        With a spool, the batch is spooled instead if the queue is nearly
+        full or if the commit fails, and spooled batches are replayed after
+        a successful commit.
+
+        Args:
+            batch (logging_v2.logger.Batch): The batch to commit.
+            retry (Optional[_RetryBatch]): The previous attempt, if the batch
+                is being retried.
+        """
+        if not batch.entries:
+            return
+        if self._spool is not None and self._queue.is_nearly_full(
+            _SPOOL_HIGH_WATERMARK
+        ):
+            # falling behind: spill to disk to free up the queue
+            if not self._spill_batch(batch):
+                self._record_outcome(failed=batch.entries)
+            return
+
+        entries = list(batch.entries)
+        oldest = _oldest_timestamp(entries)
+        start = time.monotonic()
+        succeeded = self._safely_commit_batch(batch, retry=retry)
+        commit_latency = time.monotonic() - start
+        lag = None
+        if succeeded and oldest is not None:
+            lag = time.time() - oldest
+        self._stats.on_commit(latency=commit_latency, lag=lag)
+        if self._adaptive_controller is not None:
+            self._adaptive_controller.on_commit(
+                commit_latency=commit_latency,
+                succeeded=succeeded,
+                queue_depth=self._queue.qsize(),
+            )
+
+        if succeeded:
+            self._record_outcome(sent=entries)
+            if self._spool is not None:
+                self._replay_spool(max_records=1)
+        elif batch.entries:
+            # not queued for a retry
+            if self._spool is None or not self._spill_batch(batch):
+                self._record_outcome(failed=batch.entries)
+
+    def _count_log_names(self, items):
+        """Counts the entries of queue items by log name.
+
+        Args:
+            items (Iterable[Any]): The items, entries or retried batches.
+
+        Returns:
+            collections.Counter: The number of entries of each log name.
+        """
+        default = self._cloud_logger.full_name
+        counts = collections.Counter()
+        for item in items:
+            if isinstance(item, _RetryBatch):
+                counts.update(_entry_log_name(entry, default) for entry in item.entries)
+            elif _is_entry(item):
+                counts[_entry_log_name(item, default)] += 1
+        return counts
+
+    def _on_taken(self, items):
+        """Counts the entries of items taken off the queue, until they are done.
+
+        Args:
+            items (List[Any]): The items.
+
+        Returns:
+            Optional[collections.Counter]: The count to pass to :meth:`_on_done`,
+            or None if entries are not counted by log name.
+        """
+        if not self._count_by_log_name:
+            return None
+        taken = self._count_log_names(items)
+        with self._taken_lock:
+            self._taken_by_log_name.update(taken)
+        return taken
+
+    def _on_done(self, taken):
+        """Stops counting the entries of items taken off the queue.
+
+        Args:
+            taken (Optional[collections.Counter]): As returned by :meth:`_on_taken`.
+        """
+        if taken:
+            with self._taken_lock:
+                self._taken_by_log_name.subtract(taken)
+
+    def _pending_entries(self, log_name):
+        """Returns the number of entries of a log still queued or being written.
+
+        The entries must be counted by log name.
+        """
+        queued = self._count_log_names(self._queue.snapshot())[log_name]
+        with self._taken_lock:
+            return queued + self._taken_by_log_name[log_name]
+
+    def _record_outcome(self, *, sent=(), failed=(), log_name=None):
+        """Counts the entries written, and the entries dropped after failing.
+
+        Args:
+            sent (Sequence): The entries written.
+            failed (Sequence): The entries dropped after failing.
+            log_name (Optional[str]): The log name of the entries without one
+                of their own. Defaults to the one of the worker's logger.
+        """
+        log_names = None
+        if self._count_by_log_name:
+            default = log_name or self._cloud_logger.full_name
+            log_names = (
+                collections.Counter(_entry_log_name(entry, default) for entry in sent),
+                collections.Counter(
+                    _entry_log_name(entry, default) for entry in failed
+                ),
+            )
+        self._stats.on_outcome(sent=len(sent), failed=len(failed), log_names=log_names)
+
+    def _spill_batch(self, batch):
+        """Writes the entries of a batch to the spool.
+
+        Args:
+            batch (logging_v2.logger.Batch): The batch to spill.
+
+        Returns:
+            bool: True if the entries were spooled.
+        """
+        total_logs = len(batch.entries)
+        try:
+            record = {
+                "logName": batch.logger.full_name,
+                "entries": [entry.to_api_repr() for entry in batch.entries],
+            }
+            if batch.logger.labels is not None:
+                record["labels"] = batch.logger.labels
+            if batch.resource is not None:
+                record["resource"] = batch.resource._to_dict()
+            if self._spool.append(record):
+                _LOGGER.debug("Spooled %d logs", total_logs)
+                del batch.entries[:]
+                return True
+            _LOGGER.error("Spool is full, dropping %d logs.", total_logs)
         except Exception:
-            _LOGGER.error("Failed to submit %d logs.", total_logs, exc_info=True)
+            _LOGGER.error("Failed to spool %d logs.", total_logs, exc_info=True)
+        return False
+
+    def _replay_spool(self, *, max_records=None):
+        """Sends spooled batches, oldest first, until one fails.
+
+        Args:
+            max_records (Optional[int]): The maximum number of spooled batches
+                to send. If ``None``, sends until the spool is empty or new
+                entries are queued.
+
+        Returns:
+            bool: False if sending a spooled batch failed.
+        """
+        if not self._replay_lock.acquire(blocking=False):
+            # another committer is replaying
+            return True
+        try:
+            replayed = 0
+            while max_records is None or replayed < max_records:
+                if max_records is None and not self._queue.empty():
+                    break
+                record, cursor = self._spool.peek()
+                if record is None:
+                    break
+                kwargs = {"logger_name": record["logName"]}
+                if "labels" in record:
+                    kwargs["labels"] = record["labels"]
+                if "resource" in record:
+                    kwargs["resource"] = record["resource"]
+                try:
+                    self._cloud_logger.client.logging_api.write_entries(
+                        record["entries"], partial_success=True, **kwargs
+                    )
+                except CircuitOpenError:
+                    _LOGGER.debug("Circuit breaker is open, not replaying the spool.")
+                    return False
+                except Exception as exc:
+                    entry_errors = getattr(exc, "log_entry_errors", None)
+                    if entry_errors is not None:
+                        self._respool_failed_entries(record, cursor, entry_errors)
+                    _LOGGER.error(
+                        "Failed to replay %d spooled logs.",
+                        len(entry_errors or record["entries"]),
+                        exc_info=True,
+                    )
+                    return False
+                self._spool.ack(cursor)
+                self._record_outcome(
+                    sent=record["entries"], log_name=record.get("logName")
+                )
+                _LOGGER.debug("Replayed %d spooled logs", len(record["entries"]))
+                replayed += 1
+            return True
+        finally:
+            self._replay_lock.release()
+
+    def _respool_failed_entries(self, record, cursor, entry_errors):
+        """Acknowledges a partially written spooled batch.
+
+        Its entries that failed with a transient error are spooled again, to
+        be replayed without those that were written; those that failed with a
+        permanent error are reported as by :meth:`_remove_rejected_entries`.
+
+        Args:
+            record (dict): The spooled batch.
+            cursor (tuple): The position of the batch in the spool.
+            entry_errors (Dict[int, Exception]): The error of each entry of
+                the batch that was not written, by index.
+        """
+        entries = record["entries"]
+        retryable = []
+        rejected = []
+        for index, error in sorted(entry_errors.items()):
+            if index >= len(entries):
+                continue
+            if _helpers._is_retryable_error(error):
+                retryable.append(entries[index])
+            else:
+                rejected.append((entries[index], error))
+        log_name = record.get("logName")
+        self._record_outcome(
+            sent=[
+                entry
+                for index, entry in enumerate(entries)
+                if index not in entry_errors
+            ],
+            log_name=log_name,
+        )
+        if rejected:
+            self._record_outcome(
+                failed=[entry for entry, _ in rejected], log_name=log_name
+            )
+            self._report_rejected(rejected)
+        if retryable and not self._spool.append(dict(record, entries=retryable)):
+            self._record_outcome(failed=retryable, log_name=log_name)
+        self._spool.ack(cursor)
+
+    def _commit_in_flight(self, batch, num_items, previous=(), taken=None):
+        """Commits a batch on a committer thread, then marks its items as done.
+
+        Args:
+            batch (logging_v2.logger.Batch): The batch to commit.
+            num_items (int): The number of queue items the batch was built from.
+            previous (Iterable[concurrent.futures.Future]): The commits of
+                the earlier batches with entries of the same log names, to
+                wait for first.
+            taken (Optional[collections.Counter]): The entries of the queue
+                items, by log name, as returned by :meth:`_on_taken`.
+        """
+        try:
+            # the earlier commits are running: at most ``max_inflight_commits``
+            # are submitted at once, as many as there are committers
+            concurrent.futures.wait(previous)
+            self._commit_batch(batch)
+        finally:
+            self._on_done(taken)
+            for _ in range(num_items):
+                self._queue.task_done()
+            self._inflight.release()
 
     def _thread_main(self):
         """The entry point for the worker thread.
@@ -132,25 +1678,120 @@ class _Worker(object):
         """
         _LOGGER.debug("Background thread started.")
 
-        done = False
-        while not done:
-            batch = self._cloud_logger.batch()
-            items = _get_many(
-                self._queue,
-                max_items=self._max_batch_size,
-                max_latency=self._max_latency,
+        committers = None
+        # the commit of the last batch submitted with entries of each log name
+        last_commits = {}
+        if self._max_inflight_commits > 1:
+            committers = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._max_inflight_commits,
+                thread_name_prefix=_COMMITTER_THREAD_NAME,
             )
 
+        urgent = None
+        if self._priority_severity is not None:
+            # entries of the express lane are sent without waiting
+            urgent = self._is_urgent
+
+        terminating = False
+        while True:
+            self._maybe_report_stats()
+            if terminating:
+                if committers is not None:
+                    # wait for the batches still in flight, whose failures may
+                    # be queued for a retry
+                    committers.shutdown(wait=True)
+                    committers = None
+                if not self._pending_retries:
+                    break
+
+            timeout = None
+            if self._spool is not None and self._spool.pending_bytes:
+                # wake up while idle to replay the spool
+                timeout = _SPOOL_REPLAY_INTERVAL
+            if self._stats_callback is not None:
+                # wake up while idle to report the statistics
+                until_report = max(0.0, self._next_stats_report - time.monotonic())
+                timeout = (
+                    until_report if timeout is None else min(timeout, until_report)
+                )
+            dequeued_bytes = self._queue.dequeued_bytes
+            try:
+                items = self._queue.get_many(
+                    max_items=self.current_batch_size,
+                    max_latency=self.current_max_latency,
+                    max_bytes=self._max_batch_bytes,
+                    timeout=timeout,
+                    urgent=urgent,
+                )
+            except queue.Empty:
+                if self._spool is not None and threading.main_thread().is_alive():
+                    self._replay_spool()
+                continue
+
+            taken = self._on_taken(items)
+            batch = self._cloud_logger.batch()
+            retries = []
+
             for item in items:
                 if item is _WORKER_TERMINATOR:
-                    done = True  # Continue processing items.
+                    terminating = True  # Continue processing items.
+                elif isinstance(item, _RetryBatch):
+                    self._dequeue_retry()
+                    retries.append(item)
+                elif isinstance(item, _DeferredRecord):
+                    entry = self._resolve_deferred(item)
+                    if entry is not None:
+                        _log_queued(batch, entry)
                 else:
-                    batch.log(**item)
+                    _log_queued(batch, item)
+            if batch.entries:
+                self._stats.on_batch(
+                    size=len(batch.entries),
+                    nbytes=self._queue.dequeued_bytes - dequeued_bytes,
+                )
 
             # We cannot commit logs upstream if the main thread is shutting down
             if threading.main_thread().is_alive():
-                self._safely_commit_batch(batch)
+                # retried batches go before the entries queued after them
+                for retry in retries:
+                    self._commit_retry(retry)
+                if committers is not None:
+                    # wait for a free committer, so at most
+                    # ``max_inflight_commits`` batches are pending at once
+                    self._inflight.acquire()
+                    log_names = _batch_log_names(batch)
+                    previous = [
+                        last_commits[name]
+                        for name in log_names
+                        if name in last_commits and not last_commits[name].done()
+                    ]
+                    try:
+                        future = committers.submit(
+                            self._commit_in_flight, batch, len(items), previous, taken
+                        )
+                    except RuntimeError:
+                        # the interpreter is shutting down
+                        self._inflight.release()
+                    else:
+                        for name in log_names:
+                            last_commits[name] = future
+                        if len(last_commits) > self._max_inflight_commits * 8:
+                            last_commits = {
+                                name: commit
+                                for name, commit in last_commits.items()
+                                if not commit.done()
+                            }
+                        continue
+                else:
+                    self._commit_batch(batch)
+            elif self._spool is not None:
+                # the entries can still be saved for the next process
+                for retry in retries:
+                    batch.entries[:0] = retry.entries
+                if batch.entries:
+                    self._spill_batch(batch)
 
+            self._on_done(taken)
             for it in items:
                 self._queue.task_done()
 
@@ -219,18 +1860,259 @@ class _Worker(object):
         if not self._queue.empty():
             print(close_msg, file=sys.stderr)
 
-        if threading.main_thread().is_alive() and self.stop(
-            grace_period=self._grace_period
-        ):
+        stopped = False
+        report = None
+        if threading.main_thread().is_alive():
+            if self._shutdown_parallelism:
+                deadline = time.monotonic() + self._grace_period
+                report = self._drain(deadline)
+                stopped = self.stop(grace_period=max(0.0, deadline - time.monotonic()))
+            else:
+                stopped = self.stop(grace_period=self._grace_period)
+
+        if report is not None and (report.undelivered or report.spooled):
+            _print_shutdown_report(report)
+        if stopped and (report is None or not (report.undelivered or report.spooled)):
             print("Sent all pending logs.", file=sys.stderr)
         elif not self._queue.empty():
-            print(
-                "Failed to send %d pending logs." % (self._queue.qsize(),),
-                file=sys.stderr,
-            )
+            spooled = self._spill_pending() if self._spool is not None else 0
+            if spooled:
+                print(
+                    "Spooled %d pending logs to %s." % (spooled, self._spool.directory),
+                    file=sys.stderr,
+                )
+            if not self._queue.empty():
+                print(
+                    "Failed to send %d pending logs." % (self._queue.qsize(),),
+                    file=sys.stderr,
+                )
 
         self._thread = None
 
+    def _drain(self, deadline):
+        """Sends the entries queued so far from parallel threads.
+
+        The entries are taken off the queue at once, sorted by decreasing
+        severity, and split into batches of up to ``shutdown_batch_size``
+        entries. Up to ``shutdown_parallelism`` threads commit the batches,
+        most severe first, without retrying them. No batch is started after
+        the deadline, and the threads still committing then are abandoned.
+        With a spool, the batches that failed or were not started are
+        spooled instead.
+
+        Entries queued while draining are left to the worker thread.
+
+        Args:
+            deadline (float): The :func:`time.monotonic` time by which to
+                return.
+
+        Returns:
+            _ShutdownReport: What was and was not delivered.
+        """
+        start = time.monotonic()
+        try:
+            items = self._queue.get_many(timeout=0, include_delayed=True)
+        except queue.Empty:
+            items = []
+        if items and items[-1] is _WORKER_TERMINATOR:
+            # the worker thread is already stopping, leave it its signal
+            self._queue.put_front(items.pop())
+            self._queue.task_done()
+
+        entries = []
+        for item in items:
+            if isinstance(item, _RetryBatch):
+                self._dequeue_retry()
+                entries.extend(
+                    (
+                        _severity_rank(entry.severity),
+                        _estimate_log_entry_size(entry),
+                        entry,
+                    )
+                    for entry in item.entries
+                )
+            elif _is_entry(item):
+                entries.append(
+                    (
+                        _severity_rank(_entry_severity(item)),
+                        _estimate_entry_size(item),
+                        item,
+                    )
+                )
+        # stable, so entries of the same severity stay in order
+        entries.sort(key=lambda entry: entry[0], reverse=True)
+
+        max_bytes = self._max_batch_bytes or _SHUTDOWN_MAX_BATCH_BYTES
+        pending = collections.deque()
+        batch = []
+        nbytes = 0
+        for severity, size, entry in entries:
+            if batch and (
+                len(batch) >= self._shutdown_batch_size or nbytes + size > max_bytes
+            ):
+                pending.append(batch)
+                batch = []
+                nbytes = 0
+            batch.append((severity, entry))
+            nbytes += size
+        if batch:
+            pending.append(batch)
+
+        lock = threading.Lock()
+        counts = collections.Counter()
+        undelivered = collections.Counter()
+        in_flight = {}
+        done = threading.Event()
+
+        def commit_batches():
+            while True:
+                with lock:
+                    if done.is_set() or not pending or time.monotonic() >= deadline:
+                        return
+                    entries = pending.popleft()
+                    in_flight[threading.get_ident()] = entries
+                outcome, severities = self._commit_drained(entries)
+                with lock:
+                    del in_flight[threading.get_ident()]
+                    if done.is_set():
+                        # reported as unconfirmed
+                        return
+                    counts.update(outcome)
+                    undelivered.update(severities)
+
+        threads = []
+        for index in range(min(self._shutdown_parallelism, len(pending))):
+            thread = threading.Thread(
+                target=commit_batches, name="%s-%d" % (_DRAIN_THREAD_NAME, index)
+            )
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+
+        with lock:
+            done.set()
+            unsent = [entry for batch in pending for entry in batch]
+            pending.clear()
+            unconfirmed = [entry for batch in in_flight.values() for entry in batch]
+        for severity, _ in unconfirmed:
+            undelivered[_severity_name(severity)] += 1
+        if unsent:
+            batch = self._cloud_logger.batch()
+            for _, entry in unsent:
+                self._log_drained(batch, entry)
+            if self._spool is not None and self._spill_batch(batch):
+                counts["spooled"] += len(unsent)
+            else:
+                counts["unsent"] += len(unsent)
+                self._record_outcome(failed=[entry for _, entry in unsent])
+                for severity, _ in unsent:
+                    undelivered[_severity_name(severity)] += 1
+        for _ in items:
+            self._queue.task_done()
+
+        return _ShutdownReport(
+            sent=counts["sent"],
+            failed=counts["failed"],
+            spooled=counts["spooled"],
+            unsent=counts["unsent"],
+            unconfirmed=len(unconfirmed),
+            undelivered=dict(undelivered),
+            elapsed=time.monotonic() - start,
+        )
+
+    def _log_drained(self, batch, entry):
+        """Adds a queued entry, or an entry of a retried batch, to a batch."""
+        if isinstance(entry, _DeferredRecord):
+            entry = self._resolve_deferred(entry)
+            if entry is None:
+                return
+        if isinstance(entry, collections.abc.Mapping):
+            _log_queued(batch, entry)
+        else:
+            batch.entries.append(entry)
+
+    def _commit_drained(self, entries):
+        """Commits a batch of entries drained on shutdown, without retrying it.
+
+        Args:
+            entries (List[Tuple[int, Any]]): The severity and the entry of
+                each item of the batch.
+
+        Returns:
+            Tuple[collections.Counter, collections.Counter]: The number of
+            entries sent, failed and spooled, and the number of entries not
+            delivered by severity name.
+        """
+        batch = self._cloud_logger.batch()
+        for _, entry in entries:
+            self._log_drained(batch, entry)
+        batch_entries = list(batch.entries)
+        total_logs = len(batch_entries)
+        outcome = collections.Counter()
+        undelivered = collections.Counter()
+        try:
+            if total_logs > 0:
+                batch.commit()
+            outcome["sent"] = total_logs
+            self._record_outcome(sent=batch_entries)
+        except Exception as exc:
+            # the batch keeps the entries it did not write
+            unwritten = list(batch.entries)
+            outcome["sent"] = total_logs - len(unwritten)
+            if outcome["sent"]:
+                self._record_outcome(sent=_written_entries(batch_entries, batch))
+            self._remove_rejected_entries(batch, exc)
+            outcome["failed"] = len(unwritten) - len(batch.entries)
+            unsent = list(batch.entries)
+            if unsent and self._spool is not None and self._spill_batch(batch):
+                outcome["spooled"] = len(unsent)
+                spooled = set(map(id, unsent))
+                unwritten = [entry for entry in unwritten if id(entry) not in spooled]
+            elif unsent:
+                _LOGGER.error("Failed to submit %d logs.", len(unsent), exc_info=True)
+                outcome["failed"] += len(unsent)
+                self._record_outcome(failed=unsent)
+            if len(unwritten) == total_logs:
+                undelivered.update(_severity_name(severity) for severity, _ in entries)
+            else:
+                undelivered.update(
+                    _severity_name(_severity_rank(getattr(entry, "severity", None)))
+                    for entry in unwritten
+                )
+        return outcome, undelivered
+
+    def _spill_pending(self):
+        """Moves the entries left in the queue to the spool.
+
+        Returns:
+            int: The number of entries spooled.
+        """
+        batch = self._cloud_logger.batch()
+        items = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            items.append(item)
+            if isinstance(item, _RetryBatch):
+                self._dequeue_retry()
+                batch.entries.extend(item.entries)
+                continue
+            if isinstance(item, _DeferredRecord):
+                item = self._resolve_deferred(item)
+            if _is_entry(item):
+                _log_queued(batch, item)
+
+        spooled = len(batch.entries)
+        if spooled and not self._spill_batch(batch):
+            spooled = 0
+        for _ in items:
+            self._queue.task_done()
+        return spooled
+
     def enqueue(self, record, message, **kwargs):
         """Queues a log entry to be written by the background thread.
 
@@ -240,25 +2122,145 @@ class _Worker(object):
                         formatted by the associated log formatters.
             kwargs: Additional optional arguments for the logger
         """
+        self._put(self._make_queue_entry(record, message, **kwargs))
+
+    def enqueue_deferred(self, record, prepare, defaults=None):
+        """Queues a log record to be formatted and written by the background thread.
+
+        Args:
+            record (logging.LogRecord): A snapshot of the record that the
+                handler was called with.
+            prepare (Callable[[logging.LogRecord], Tuple[str | dict | None, dict]]):
+                Computes the message and the additional arguments for the
+                logger from the record.
+            defaults (Optional[dict]): Additional arguments for the logger,
+                overridden by the ones computed by ``prepare``.
+        """
+        self._put(_DeferredRecord(record, prepare, defaults))
+
+    def _resolve_deferred(self, item):
+        """Formats a deferred record into a queue entry.
+
+        Args:
+            item (_DeferredRecord): The deferred record.
+
+        Returns:
+            Optional[dict]: The entry, or None if the record could not be formatted.
+        """
+        try:
+            message, kwargs = item.prepare(item.record)
+        except Exception:
+            _LOGGER.error("Failed to format a deferred log record.", exc_info=True)
+            self._record_outcome(failed=[item])
+            return None
+        if item.defaults:
+            kwargs = {**item.defaults, **kwargs}
+        return self._make_queue_entry(item.record, message, **kwargs)
+
+    @staticmethod
+    def _make_queue_entry(record, message, **kwargs):
+        """Builds the logger arguments for a record.
+
+        Args:
+            record (logging.LogRecord): Python log record that the handler was called with.
+            message (str or dict): The message from the ``LogRecord`` after being
+                        formatted by the associated log formatters.
+            kwargs: Additional optional arguments for the logger
+
+        Returns:
+            _QueuedEntry: The keyword arguments for
+            :meth:`~logging_v2.logger.Batch.log`.
+        """
         # set python logger name as label if missing
         labels = kwargs.pop("labels", {})
         if record.name:
             labels["python_logger"] = labels.get("python_logger", record.name)
         kwargs["labels"] = labels
-        # enqueue new entry
-        queue_entry = {
-            "message": message,
-            "severity": _helpers._normalize_severity(record.levelno),
-            "timestamp": datetime.datetime.fromtimestamp(
-                record.created, datetime.timezone.utc
-            ),
-        }
-        queue_entry.update(kwargs)
-        self._queue.put_nowait(queue_entry)
+        kwargs.setdefault("message", message)
+        kwargs.setdefault("severity", _helpers._normalize_severity(record.levelno))
+        # the POSIX time is encoded as is, without building a datetime
+        kwargs.setdefault("timestamp", record.created)
+        return _QueuedEntry(**kwargs)
+
+    def _put(self, queue_entry):
+        """Adds an entry to the queue, applying the overflow policy if it is full.
 
-    def flush(self):
-        """Submit any pending log records."""
-        self._queue.join()
+        Args:
+            queue_entry (dict | _DeferredRecord): The entry to add.
+        """
+        if self._restart_on_emit:
+            self._restart_after_fork()
+        policy = self._overflow_policy
+        dropped = []
+        try:
+            if (
+                self._priority_severity is not None
+                and policy in (OVERFLOW_BLOCK, OVERFLOW_DROP_NEWEST)
+                and self._queue.is_priority(queue_entry)
+            ):
+                # shed the low-severity lane rather than wait or drop
+                dropped = self._queue.put_evicting(
+                    queue_entry, evict_if=self._is_not_priority
+                )
+            elif policy == OVERFLOW_BLOCK:
+                self._queue.put(queue_entry, timeout=self._block_timeout)
+            elif policy == OVERFLOW_DROP_OLDEST:
+                dropped = self._queue.put_evicting(queue_entry)
+            elif policy == OVERFLOW_DROP_BELOW_SEVERITY:
+                if self._is_below_overflow_severity(queue_entry):
+                    self._queue.put_nowait(queue_entry)
+                else:
+                    dropped = self._queue.put_evicting(
+                        queue_entry, evict_if=self._is_below_overflow_severity
+                    )
+            else:
+                self._queue.put_nowait(queue_entry)
+        except queue.Full:
+            dropped = [queue_entry]
+
+        if dropped:
+            with self._dropped_lock:
+                self._dropped_entries += len(dropped)
+                self._dropped_bytes += sum(_estimate_entry_size(e) for e in dropped)
+
+    def _is_not_priority(self, queue_entry):
+        return not self._queue.is_priority(queue_entry)
+
+    def _is_below_overflow_severity(self, queue_entry):
+        severity = _entry_severity(queue_entry)
+        return severity is None or severity < self._overflow_severity
+
+    def flush(self, timeout=None, *, log_name=None):
+        """Submit any pending log records.
+
+        Entries written to the spool are counted when they are replayed.
+
+        Args:
+            timeout (Optional[float]): The maximum time to wait, in seconds.
+                If ``None``, waits until all queued entries are processed.
+            log_name (Optional[str]): If given, the counts only cover the
+                entries of this log, which requires the worker to count
+                entries by log name. Otherwise they cover every entry of the
+                worker. All queued entries are waited for either way.
+
+        Returns:
+            FlushResult: The entries sent, failed and still pending.
+        """
+        start = time.monotonic()
+        sent, failed = self._stats.outcomes(log_name)
+        completed = self._queue.join(timeout=timeout)
+        committed, dropped = self._stats.outcomes(log_name)
+        sent, failed = committed - sent, dropped - failed
+        if log_name is None:
+            pending = self._queue.unfinished_tasks
+        else:
+            pending = 0 if completed else self._pending_entries(log_name)
+        return FlushResult(
+            sent=sent,
+            failed=failed,
+            pending=pending,
+            elapsed=time.monotonic() - start,
+        )
 
     def close(self):
         """Signals the worker thread to stop, then closes the transport thread.
@@ -271,6 +2273,55 @@ class _Worker(object):
             "Background thread shutting down, attempting to send %d queued log "
             "entries to Cloud Logging..." % (self._queue.qsize(),)
         )
+        if self._spool is not None:
+            self._spool.close()
+
+    def _after_fork_in_child(self):
+        """Resets the state inherited from the parent process in a forked child.
+
+        The worker thread does not exist in the child, and the locks of the
+        parent may have been held by other threads when it forked. Entries
+        queued in the parent are left for the parent to send. If the worker
+        was running, it is restarted when the child logs its first entry.
+        """
+        was_running = self._thread is not None
+        self._thread = None
+        self._restart_on_emit = was_running
+        self._queue = _EntryQueue(
+            self._queue.maxsize,
+            max_bytes=self._queue.max_bytes,
+            priority_severity=self._priority_severity,
+        )
+        self._inflight = threading.BoundedSemaphore(self._max_inflight_commits)
+        self._operational_lock = threading.Lock()
+        self._dropped_lock = threading.Lock()
+        self._stats = _stats._WorkerStats(by_log_name=self._count_by_log_name)
+        self._taken_lock = threading.Lock()
+        self._taken_by_log_name = collections.Counter()
+        self._next_stats_report = None
+        self._replay_lock = threading.Lock()
+        self._retry_lock = threading.Lock()
+        self._pending_retries = 0
+        if self._adaptive_controller is not None:
+            self._adaptive_controller._lock = threading.Lock()
+        if self._spool is not None:
+            # the spool directory stays locked by the parent process
+            self._spool = None
+        atexit.unregister(self._handle_exit)
+
+        client = getattr(self._cloud_logger, "client", None)
+        if getattr(client, "_use_grpc", False):
+            # gRPC channels cannot be used across a fork, create a new one
+            client._logging_api = None
+
+    def _restart_after_fork(self):
+        """Starts the worker in a forked child, on the first entry it logs."""
+        with self._operational_lock:
+            if not self._restart_on_emit:
+                return
+            self._restart_on_emit = False
+        _LOGGER.debug("Restarting background thread after fork.")
+        self.start()
 
     def _handle_exit(self):
         """Handle system exit.
@@ -281,6 +2332,28 @@ class _Worker(object):
         self._close(_CLOSE_THREAD_SHUTDOWN_ERROR_MSG)
 
 
+def _print_shutdown_report(report):
+    """Prints the entries that could not be delivered on shutdown."""
+    if report.spooled:
+        print("Spooled %d pending logs." % (report.spooled,), file=sys.stderr)
+    if report.undelivered:
+        print(
+            "Failed to send %d pending logs (%s): %d failed, %d not sent before "
+            "the deadline, %d still being sent at the deadline."
+            % (
+                sum(report.undelivered.values()),
+                ", ".join(
+                    "%s: %d" % (name, count)
+                    for name, count in sorted(report.undelivered.items())
+                ),
+                report.failed,
+                report.unsent,
+                report.unconfirmed,
+            ),
+            file=sys.stderr,
+        )
+
+
 class BackgroundThreadTransport(Transport):
     """Asynchronous transport that uses a background thread."""
 
@@ -291,8 +2364,29 @@ class BackgroundThreadTransport(Transport):
         *,
         grace_period=_DEFAULT_GRACE_PERIOD,
         batch_size=_DEFAULT_MAX_BATCH_SIZE,
+        max_batch_bytes=_DEFAULT_MAX_BATCH_BYTES,
         max_latency=_DEFAULT_MAX_LATENCY,
+        adaptive=False,
+        adaptive_target_latency=_DEFAULT_ADAPTIVE_TARGET_LATENCY,
+        max_inflight_commits=_DEFAULT_MAX_INFLIGHT_COMMITS,
         resource=_GLOBAL_RESOURCE,
+        max_queue_size=_DEFAULT_MAX_QUEUE_SIZE,
+        max_queue_bytes=_DEFAULT_MAX_QUEUE_BYTES,
+        overflow_policy=OVERFLOW_DROP_NEWEST,
+        block_timeout=_DEFAULT_BLOCK_TIMEOUT,
+        overflow_severity=_DEFAULT_OVERFLOW_SEVERITY,
+        spool_directory=None,
+        spool_max_bytes=_spool._DEFAULT_MAX_BYTES,
+        retry_deadline=_DEFAULT_RETRY_DEADLINE,
+        retry_initial_backoff=_DEFAULT_RETRY_INITIAL_BACKOFF,
+        retry_max_backoff=_DEFAULT_RETRY_MAX_BACKOFF,
+        stats_callback=None,
+        stats_interval=_DEFAULT_STATS_INTERVAL,
+        shared_worker=False,
+        priority_severity=None,
+        shutdown_parallelism=None,
+        shutdown_batch_size=_DEFAULT_SHUTDOWN_BATCH_SIZE,
+        rejected_callback=None,
         **kwargs,
     ):
         """
@@ -303,25 +2397,208 @@ class BackgroundThreadTransport(Transport):
             grace_period (Optional[float]): The amount of time to wait for pending logs to
                 be submitted when the process is shutting down.
             batch_size (Optional[int]): The maximum number of items to send at a time in the
-                background thread.
+                background thread. If ``None``, batches are only limited by
+                ``max_batch_bytes`` and ``max_latency``.
+            max_batch_bytes (Optional[int]): The maximum estimated serialized size,
+                in bytes, of the items to send at a time in the background thread.
+                Must not exceed the 10 MB WriteLogEntries request limit, and
+                should leave some headroom since sizes are estimated. If ``None``,
+                batches are only limited by ``batch_size``.
             max_latency (Optional[float]): The amount of time to wait for new logs before
                 sending a new batch. It is strongly recommended to keep this smaller
                 than the grace_period. This means this is effectively the longest
                 amount of time the background thread will hold onto log entries
                 before sending them to the server.
+            adaptive (Optional[bool]): If True, the batch size and latency start
+                low and are tuned from the queue depth and observed commit
+                latency, up to ``batch_size`` and ``max_latency``.
+            adaptive_target_latency (Optional[float]): In adaptive mode, the
+                commit latency, in seconds, above which the batch size and
+                latency are reduced.
+            max_inflight_commits (Optional[int]): The maximum number of batches
+                being committed at the same time. A batch is only committed
+                once the batches queued before it with entries of the same
+                log names are, so that each log is written in order: batches
+                run concurrently only if their log names differ, as with
+                ``shared_worker``.
             resource (Optional[Resource|dict]): The default monitored resource to associate
                 with logs when not specified
+            max_queue_size (Optional[int]): The maximum number of entries waiting
+                to be sent. If zero, the queue is unbounded.
+            max_queue_bytes (Optional[int]): The maximum estimated size, in bytes,
+                of the entries waiting to be sent. If zero, the queue is unbounded.
+            overflow_policy (Optional[str]): What to do with a new entry when the
+                queue is full. One of :data:`OVERFLOW_BLOCK`,
+                :data:`OVERFLOW_DROP_NEWEST`, :data:`OVERFLOW_DROP_OLDEST` or
+                :data:`OVERFLOW_DROP_BELOW_SEVERITY`.
+            block_timeout (Optional[float]): With :data:`OVERFLOW_BLOCK`, the
+                amount of time to wait for room in the queue before dropping
+                the new entry.
+            overflow_severity (Optional[int|str]): With
+                :data:`OVERFLOW_DROP_BELOW_SEVERITY`, entries below this severity
+                are dropped when the queue is full.
+            spool_directory (Optional[str]): A directory in which to spool
+                batches that cannot be sent: batches that fail to commit,
+                batches formed while the queue is nearly full, and entries
+                pending at exit. Batches are only spilled for a full queue
+                when it is bounded by ``max_queue_size`` or
+                ``max_queue_bytes``. Spooled batches are replayed once commits
+                succeed again, or by the next process using the directory.
+                A directory must only be used by one process at a time.
+            spool_max_bytes (Optional[int]): The maximum size of the spool.
+                Batches that would exceed it are dropped.
+            retry_deadline (Optional[float]): The amount of time, in seconds,
+                during which a batch that failed with a transient error, such
+                as UNAVAILABLE or DEADLINE_EXCEEDED, is retried. Retried
+                batches are sent ahead of newer entries. If zero, failed
+                batches are not retried.
+            retry_initial_backoff (Optional[float]): The upper bound of the
+                randomized delay before the first retry of a batch. It doubles
+                with each further retry.
+            retry_max_backoff (Optional[float]): The upper bound of the
+                randomized delay before any retry.
+            stats_callback (Optional[Callable[[dict], None]]): Called with
+                the :meth:`stats` snapshot every ``stats_interval`` seconds.
+                It runs on the worker thread, and should return quickly.
+            stats_interval (Optional[float]): The time between two calls of
+                ``stats_callback``, in seconds.
+            shared_worker (Optional[bool]): If True, all the transports of
+                the client created with this option share a single worker
+                thread, and their entries are written together, each with
+                its own log name and resource. The worker is configured by
+                the options of the first of these transports, and closed
+                with the last one: the others must be given the same
+                options, or ValueError is raised. Flushing any of them waits
+                for the entries of all, but the :class:`FlushResult` it
+                returns only counts its own; ``transport.worker.flush()``
+                counts those of all.
+            priority_severity (Optional[int|str]): Entries at or above this
+                severity, such as ``"ERROR"``, go to an express lane, which
+                is sent first and without waiting for a batch to fill. When
+                the queue is full, they make room by evicting entries of the
+                other lane. If ``None``, all entries are queued in order.
+            shutdown_parallelism (Optional[int]): If set, the entries still
+                queued when the transport is closed are sent by this many
+                threads at once, in batches of up to ``shutdown_batch_size``,
+                most severe first, and no batch is started after
+                ``grace_period``. The entries that could not be delivered are
+                reported by severity. If ``None``, they are sent by the
+                worker thread in its usual batches.
+            shutdown_batch_size (Optional[int]): The maximum number of
+                entries in a batch sent on shutdown.
+            rejected_callback (Optional[Callable[[LogEntry | dict, Exception], None]]):
+                Called with each entry that the API failed to write with a
+                permanent error, such as an invalid entry, and its error.
+                Entries replayed from the spool are passed in their API
+                representation.
+                Entries that the API failed to write with a transient error
+                are retried on their own, without the others of their batch.
+                It runs on the worker thread, and should return quickly. If
+                ``None``, such entries are logged.
         """
         self.client = client
         logger = self.client.logger(name, resource=resource)
         self.grace_period = grace_period
-        self.worker = _Worker(
-            logger,
-            grace_period=grace_period,
-            max_batch_size=batch_size,
-            max_latency=max_latency,
-        )
-        self.worker.start()
+        self.shared_worker = shared_worker
+        self._entry_defaults = None
+
+        def make_worker():
+            spool = None
+            if spool_directory is not None:
+                spool = _spool._Spool(spool_directory, max_bytes=spool_max_bytes)
+            worker = _Worker(
+                logger,
+                grace_period=grace_period,
+                max_batch_size=batch_size,
+                max_batch_bytes=max_batch_bytes,
+                max_latency=max_latency,
+                adaptive=adaptive,
+                adaptive_target_latency=adaptive_target_latency,
+                max_inflight_commits=max_inflight_commits,
+                max_queue_size=max_queue_size,
+                max_queue_bytes=max_queue_bytes,
+                overflow_policy=overflow_policy,
+                block_timeout=block_timeout,
+                overflow_severity=overflow_severity,
+                spool=spool,
+                retry_deadline=retry_deadline,
+                retry_initial_backoff=retry_initial_backoff,
+                retry_max_backoff=retry_max_backoff,
+                stats_callback=stats_callback,
+                stats_interval=stats_interval,
+                priority_severity=priority_severity,
+                shutdown_parallelism=shutdown_parallelism,
+                shutdown_batch_size=shutdown_batch_size,
+                rejected_callback=rejected_callback,
+                count_by_log_name=shared_worker,
+            )
+            worker.start()
+            return worker
+
+        if shared_worker:
+            # the write requests of the shared worker are named after the
+            # logger of the first transport, so every entry names its own
+            self._entry_defaults = {
+                "log_name": logger.full_name,
+                "resource": logger.default_resource,
+            }
+            options = {
+                "grace_period": grace_period,
+                "batch_size": batch_size,
+                "max_batch_bytes": max_batch_bytes,
+                "max_latency": max_latency,
+                "adaptive": adaptive,
+                "adaptive_target_latency": adaptive_target_latency,
+                "max_inflight_commits": max_inflight_commits,
+                "max_queue_size": max_queue_size,
+                "max_queue_bytes": max_queue_bytes,
+                "overflow_policy": overflow_policy,
+                "block_timeout": block_timeout,
+                "overflow_severity": overflow_severity,
+                "spool_directory": spool_directory,
+                "spool_max_bytes": spool_max_bytes,
+                "retry_deadline": retry_deadline,
+                "retry_initial_backoff": retry_initial_backoff,
+                "retry_max_backoff": retry_max_backoff,
+                "stats_callback": stats_callback,
+                "stats_interval": stats_interval,
+                "priority_severity": priority_severity,
+                "shutdown_parallelism": shutdown_parallelism,
+                "shutdown_batch_size": shutdown_batch_size,
+                "rejected_callback": rejected_callback,
+            }
+            self.worker = _acquire_shared_worker(client, make_worker, options)
+        else:
+            self.worker = make_worker()
+
+    @property
+    def current_batch_size(self):
+        """int: The maximum number of entries in the next batch."""
+        return self.worker.current_batch_size
+
+    @property
+    def current_max_latency(self):
+        """float: The maximum time to wait for the next batch to fill, in seconds."""
+        return self.worker.current_max_latency
+
+    @property
+    def dropped_entries(self):
+        """int: The number of entries discarded because the queue was full."""
+        return self.worker.dropped_entries
+
+    @property
+    def dropped_bytes(self):
+        """int: The estimated size of the entries discarded because the queue was full."""
+        return self.worker.dropped_bytes
+
+    def stats(self):
+        """Overrides Transport.stats().
+
+        Returns:
+            dict: A snapshot of the runtime statistics of the worker, as
+            described in :meth:`_Worker.stats`.
+        """
+        return self.worker.stats()
 
     def send(self, record, message, **kwargs):
         """Overrides Transport.send().
@@ -332,12 +2609,50 @@ class BackgroundThreadTransport(Transport):
                 formatted by the associated log formatters.
             kwargs: Additional optional arguments for the logger
         """
+        if self._entry_defaults is not None:
+            kwargs = {**self._entry_defaults, **kwargs}
         self.worker.enqueue(record, message, **kwargs)
 
-    def flush(self):
-        """Submit any pending log records."""
-        self.worker.flush()
+    def send_deferred(self, record, prepare):
+        """Overrides Transport.send_deferred().
+
+        Queues the record as is, so that ``prepare`` runs on the worker thread.
+
+        Args:
+            record (logging.LogRecord): A snapshot of the record that the
+                handler was called with.
+            prepare (Callable[[logging.LogRecord], Tuple[str | dict | None, dict]]):
+                Computes the message and the keyword arguments for the entry
+                from the record.
+        """
+        if self._entry_defaults is not None:
+            self.worker.enqueue_deferred(record, prepare, self._entry_defaults)
+        else:
+            self.worker.enqueue_deferred(record, prepare)
+
+    def flush(self, timeout=None):
+        """Submit any pending log records.
+
+        With ``shared_worker``, the entries of the other transports sharing
+        the worker are waited for too, but not counted.
+
+        Args:
+            timeout (Optional[float]): The maximum time to wait, in seconds.
+                If ``None``, waits until all queued entries are processed.
+
+        Returns:
+            FlushResult: The entries of the transport sent, failed and still
+            pending.
+        """
+        if self._entry_defaults is not None:
+            return self.worker.flush(
+                timeout=timeout, log_name=self._entry_defaults["log_name"]
+            )
+        return self.worker.flush(timeout=timeout)
 
     def close(self):
-        """Closes the worker thread."""
-        self.worker.close()
+        """Closes the worker thread, or releases the shared worker."""
+        if self.shared_worker:
+            _release_shared_worker(self.client, self.worker)
+        else:
+            self.worker.close()
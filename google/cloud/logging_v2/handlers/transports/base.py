@@ -14,9 +14,48 @@
 
 """Module containing base class for logging transport."""
 
+import collections
+
 from google.cloud.logging_v2.logger import _GLOBAL_RESOURCE
 
 
+class FlushResult(
+    collections.namedtuple("FlushResult", ["sent", "failed", "pending", "elapsed"])
+):
+    """The outcome of flushing a transport, handler or client.
+
+    The counts cover the entries of whatever was flushed: a transport reports
+    its own entries, even when it shares a worker with others, and a client
+    reports those of all its handlers.
+
+    Attributes:
+        sent (int): The number of entries written while flushing.
+        failed (int): The number of entries that failed to be written, and
+            were dropped, while flushing.
+        pending (int): The number of entries still queued or being written
+            when the flush returned. Zero unless the flush timed out.
+        elapsed (float): The time spent flushing, in seconds.
+    """
+
+    __slots__ = ()
+
+    @property
+    def completed(self):
+        """bool: True if no entry was left pending."""
+        return self.pending == 0
+
+    @classmethod
+    def _combine(cls, results, elapsed):
+        """Sums the counts of several flushes that took ``elapsed`` seconds."""
+        results = list(results)
+        return cls(
+            sent=sum(result.sent for result in results),
+            failed=sum(result.failed for result in results),
+            pending=sum(result.pending for result in results),
+            elapsed=elapsed,
+        )
+
+
 class Transport(object):
     """Base class for Google Cloud Logging handler transports.
 
@@ -46,12 +85,46 @@ class Transport(object):
         """
         raise NotImplementedError
 
-    def flush(self):
+    def send_deferred(self, record, prepare):
+        """Send a record whose message and fields have not been computed yet.
+
+        Called by handlers in deferred mode. Transports that can do the work
+        of ``prepare`` off the logging thread should override this. By default,
+        ``prepare`` is called right away and the result is passed to :meth:`send`.
+
+        Args:
+            record (logging.LogRecord): A snapshot of the record that the
+                handler was called with.
+            prepare (Callable[[logging.LogRecord], Tuple[str | dict | None, dict]]):
+                Computes the message and the keyword arguments for :meth:`send`
+                from the record.
+        """
+        message, kwargs = prepare(record)
+        self.send(record, message, **kwargs)
+
+    def flush(self, timeout=None):
         """Submit any pending log records.
 
         For blocking/sync transports, this is a no-op.
+
+        Args:
+            timeout (Optional[float]): The maximum time to wait, in seconds.
+                If ``None``, waits until all pending records are submitted.
+
+        Returns:
+            FlushResult: The entries sent, failed and still pending.
         """
-        pass
+        return FlushResult(sent=0, failed=0, pending=0, elapsed=0.0)
+
+    def stats(self):
+        """Returns a snapshot of the runtime statistics of the transport.
+
+        Transports that do not keep statistics return an empty dict.
+
+        Returns:
+            dict: The statistics, keyed by name.
+        """
+        return {}
 
     def close(self):
         """Closes the transport and cleans up resources used by it.
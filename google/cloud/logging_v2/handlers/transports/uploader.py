@@ -0,0 +1,795 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Transport for Python logging handler
+
+Hands log entries over a Unix domain socket, or a shared-memory ring
+buffer, to one uploader process per host, which batches the entries of all
+processes and writes them to Cloud Logging. Meant for pre-fork servers such
+as gunicorn, where each worker process would otherwise hold its own
+batches, thread and connection.
+"""
+
+from __future__ import print_function
+
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import selectors
+import signal
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import threading
+import time
+import weakref
+
+from google.cloud.logging_v2 import serialization
+from google.cloud.logging_v2.handlers.transports import _ring
+from google.cloud.logging_v2.handlers.transports import _stats
+from google.cloud.logging_v2.handlers.transports.background_thread import (
+    BackgroundThreadTransport,
+    _EntryQueue,
+    _WORKER_TERMINATOR,
+    _Worker,
+)
+from google.cloud.logging_v2.handlers.transports.base import FlushResult, Transport
+from google.cloud.logging_v2.logger import _GLOBAL_RESOURCE, Batch
+
+_ADDRESS_NAME = "google-cloud-logging-uploader.sock"
+_DEFAULT_GRACE_PERIOD = 5.0  # Seconds
+_DEFAULT_MAX_BATCH_SIZE = 500
+_DEFAULT_MAX_BATCH_BYTES = 5 * 1024 * 1024
+_DEFAULT_MAX_LATENCY = 1.0  # Seconds
+_DEFAULT_MAX_QUEUE_SIZE = 0  # Unbounded
+_DEFAULT_SEND_TIMEOUT = 1.0  # Seconds
+_DEFAULT_RECONNECT_INTERVAL = 5.0  # Seconds
+_MAX_FRAME_BYTES = 4 * 1024 * 1024
+_RECEIVE_BYTES = 64 * 1024
+_SELECT_TIMEOUT = 0.1  # Seconds
+_RING_POLL_INTERVAL = 0.01  # Seconds
+_UPLOADER_THREAD_NAME = "google.cloud.logging.Uploader"
+_LOGGER = logging.getLogger(__name__)
+
+_FRAME_HEADER = struct.Struct(">I")
+"""Frame header: length of the JSON encoded entry that follows."""
+
+
+def _encode_entry(entry):
+    """Encodes a log entry resource.
+
+    Args:
+        entry (dict): The log entry resource, in its JSON API representation.
+
+    Returns:
+        bytes: The entry, as UTF-8 encoded JSON.
+    """
+    return serialization.dumps_bytes(entry, serialization.default_or_str)
+
+
+def _encode_frame(payload):
+    """Frames an encoded entry, to send it over a stream.
+
+    Args:
+        payload (bytes): The entry encoded by :func:`_encode_entry`.
+
+    Returns:
+        bytes: The frame.
+    """
+    return _FRAME_HEADER.pack(len(payload)) + payload
+
+
+def _decode_frames(buffer):
+    """Removes the complete frames at the start of a buffer.
+
+    Args:
+        buffer (bytearray): The bytes received so far. Complete frames are
+            removed, and an incomplete one at the end is left.
+
+    Returns:
+        List[bytes]: The payloads of the complete frames.
+
+    Raises:
+        ValueError: If a frame is larger than ``_MAX_FRAME_BYTES``, which
+            means the stream is corrupted.
+    """
+    payloads = []
+    offset = 0
+    while len(buffer) - offset >= _FRAME_HEADER.size:
+        (length,) = _FRAME_HEADER.unpack_from(buffer, offset)
+        if length > _MAX_FRAME_BYTES:
+            raise ValueError(f"frame of {length} bytes is too large")
+        end = offset + _FRAME_HEADER.size + length
+        if len(buffer) < end:
+            break
+        payloads.append(bytes(buffer[offset + _FRAME_HEADER.size : end]))
+        offset = end
+    del buffer[:offset]
+    return payloads
+
+
+def _runtime_directory():
+    """Returns the directory private to the current user holding the default
+    uploader socket.
+
+    That is ``$XDG_RUNTIME_DIR`` if set, or else a directory named after the
+    user ID in the temporary directory, which may not exist yet.
+    """
+    directory = os.environ.get("XDG_RUNTIME_DIR")
+    if directory:
+        return directory
+    return os.path.join(tempfile.gettempdir(), f"google-cloud-logging-{os.getuid()}")
+
+
+def _default_address():
+    """Returns the path of the default uploader socket."""
+    return os.path.join(_runtime_directory(), _ADDRESS_NAME)
+
+
+def _check_owner(path):
+    """Checks that a file was created by the current user.
+
+    Files in shared directories, such as the temporary directory, may have
+    been created by another local user to intercept the log entries.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        PermissionError: If the file is owned by another user.
+    """
+    if os.lstat(path).st_uid != os.getuid():
+        raise PermissionError(f"{path} is owned by another user")
+
+
+def _ensure_private_directory(directory):
+    """Creates a directory only the current user can access, if needed.
+
+    Raises:
+        PermissionError: If the directory exists, but is not a directory
+            owned by the current user, or other users can access it.
+    """
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    status = os.lstat(directory)
+    if (
+        not stat.S_ISDIR(status.st_mode)
+        or status.st_uid != os.getuid()
+        or status.st_mode & 0o077
+    ):
+        raise PermissionError(
+            f"{directory} must be a directory private to the current user"
+        )
+
+
+class SharedUploader(object):
+    """Receives log entries from local processes, and writes them in batches.
+
+    Listens on a Unix domain socket, where :class:`SharedUploaderTransport`
+    instances send the entries they log, and optionally reads a
+    shared-memory ring buffer they write to. Entries from all producers go
+    to a single queue, and a background thread writes them with
+    ``client.logging_api.write_entries``, so that the processes of a host
+    share larger batches and a single connection to the API.
+
+    Each entry carries its own ``logName`` and ``resource``, so entries from
+    different loggers are written in the same batches.
+    """
+
+    def __init__(
+        self,
+        client,
+        address=None,
+        *,
+        grace_period=_DEFAULT_GRACE_PERIOD,
+        batch_size=_DEFAULT_MAX_BATCH_SIZE,
+        max_batch_bytes=_DEFAULT_MAX_BATCH_BYTES,
+        max_latency=_DEFAULT_MAX_LATENCY,
+        max_queue_size=_DEFAULT_MAX_QUEUE_SIZE,
+        ring_path=None,
+        ring_capacity=_ring._DEFAULT_CAPACITY,
+    ):
+        """
+        Args:
+            client (~logging_v2.client.Client):
+                The Logging client.
+            address (Optional[str]): The path of the Unix domain socket to
+                listen on. If ``None``, a socket in ``$XDG_RUNTIME_DIR``, or
+                in a directory private to the user in the temporary
+                directory, is used.
+            grace_period (Optional[float]): The amount of time to wait for
+                pending logs to be submitted when the uploader is closed.
+            batch_size (Optional[int]): The maximum number of entries to send
+                at a time.
+            max_batch_bytes (Optional[int]): The maximum estimated size of the
+                entries to send at a time. Should stay below the 10 MB limit
+                of ``WriteLogEntries`` requests.
+            max_latency (Optional[float]): The amount of time to wait for new
+                entries before sending a new batch.
+            max_queue_size (Optional[int]): The maximum number of entries
+                waiting to be sent. New entries are dropped when it is reached.
+                If zero, the queue is unbounded.
+            ring_path (Optional[str]): The path of a shared-memory ring buffer
+                to read entries from, for transports given the same path. It
+                is created if needed, and entries left in it by a previous
+                uploader are sent.
+            ring_capacity (Optional[int]): The size of the ring buffer, in
+                bytes. Entries that do not fit are dropped by the transports.
+        """
+        self.client = client
+        self._private_directory = address is None
+        self.address = _default_address() if address is None else address
+        self._grace_period = grace_period
+        self._max_batch_size = batch_size
+        self._max_batch_bytes = max_batch_bytes
+        self._max_latency = max_latency
+        self._queue = _EntryQueue(max_queue_size)
+        self._ring_path = ring_path
+        self._ring_capacity = ring_capacity
+        self._ring = None
+        self._listener = None
+        self._selector = None
+        self._receiver = None
+        self._sender = None
+        self._stopping = threading.Event()
+        self._shutdown = threading.Event()
+        self._stats = _stats._WorkerStats()
+        self.dropped_entries = 0
+
+    @property
+    def ring_dropped_entries(self):
+        """int: The number of entries dropped because the ring buffer was full."""
+        return self._ring.dropped_records if self._ring is not None else 0
+
+    @property
+    def is_alive(self):
+        """Returns True if the uploader is receiving entries."""
+        return self._receiver is not None and self._receiver.is_alive()
+
+    def start(self):
+        """Starts listening, and the background threads sending entries.
+
+        Raises:
+            ValueError: If another uploader listens on the address.
+            PermissionError: If the socket file, or the directory of the
+                default socket, belongs to another user.
+        """
+        if self.is_alive:
+            return
+        if self._private_directory:
+            _ensure_private_directory(os.path.dirname(self.address))
+        if os.path.lexists(self.address):
+            # never connect to nor remove a socket planted by another user
+            _check_owner(self.address)
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.address)
+            except OSError:
+                # left by an uploader that did not exit cleanly
+                os.unlink(self.address)
+            else:
+                raise ValueError(f"another uploader is listening on {self.address}")
+            finally:
+                probe.close()
+
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._listener.bind(self.address)
+        self._listener.listen()
+        self._listener.setblocking(False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._listener, selectors.EVENT_READ)
+        if self._ring_path is not None:
+            self._ring = _ring._RingBuffer(
+                self._ring_path, capacity=self._ring_capacity
+            )
+        self._stopping.clear()
+
+        self._sender = threading.Thread(
+            target=self._send_main, name=_UPLOADER_THREAD_NAME + ".Sender"
+        )
+        self._sender.daemon = True
+        self._sender.start()
+        self._receiver = threading.Thread(
+            target=self._receive_main, name=_UPLOADER_THREAD_NAME + ".Receiver"
+        )
+        self._receiver.daemon = True
+        self._receiver.start()
+
+    def _receive_main(self):
+        """The entry point of the thread receiving entries."""
+        _LOGGER.debug("Uploader listening on %s", self.address)
+        # the ring buffer cannot be waited on, so it is polled
+        timeout = _SELECT_TIMEOUT if self._ring is None else _RING_POLL_INTERVAL
+        try:
+            while not self._stopping.is_set():
+                for key, _ in self._selector.select(timeout=timeout):
+                    if key.data is None:
+                        self._accept()
+                    else:
+                        self._receive(key)
+                self._receive_ring()
+            # entries already sent by the transports are queued before closing
+            while self._accept():
+                pass
+            for key in list(self._selector.get_map().values()):
+                while key.data is not None and self._receive(key):
+                    pass
+            self._receive_ring()
+        finally:
+            for key in list(self._selector.get_map().values()):
+                key.fileobj.close()
+            self._selector.close()
+            if self._ring is not None:
+                self._ring.close()
+                self._ring = None
+
+    def _receive_ring(self):
+        """Queues the entries written to the ring buffer."""
+        if self._ring is not None:
+            for payload in self._ring.get_many():
+                self._put(payload)
+
+    def _accept(self):
+        """Accepts a connection from a transport.
+
+        Returns:
+            bool: True if a connection was accepted, False if none was pending.
+        """
+        try:
+            conn, _ = self._listener.accept()
+        except BlockingIOError:
+            return False
+        conn.setblocking(False)
+        self._selector.register(conn, selectors.EVENT_READ, data=bytearray())
+        return True
+
+    def _receive(self, key):
+        """Reads from a connection, and queues the entries it completes.
+
+        Returns:
+            bool: True if data was read, False if there was none to read or
+            the connection was closed.
+        """
+        conn, buffer = key.fileobj, key.data
+        try:
+            data = conn.recv(_RECEIVE_BYTES)
+        except BlockingIOError:
+            return False
+        except OSError:
+            data = b""
+        if data:
+            buffer.extend(data)
+            try:
+                payloads = _decode_frames(buffer)
+            except ValueError:
+                _LOGGER.error("Closing corrupted uploader connection.", exc_info=True)
+                data = b""
+                payloads = []
+            for payload in payloads:
+                self._put(payload)
+        if not data:
+            # closed by the transport; an incomplete frame left in the
+            # buffer was torn by the process exiting
+            self._selector.unregister(conn)
+            conn.close()
+        return bool(data)
+
+    def _put(self, payload):
+        """Queues a received entry, dropping it if the queue is full."""
+        try:
+            entry = json.loads(payload.decode("utf-8"))
+        except ValueError:
+            _LOGGER.error("Dropping an undecodable log entry.", exc_info=True)
+            return
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped_entries += 1
+
+    def _send_main(self):
+        """The entry point of the thread writing entries."""
+        quit_ = False
+        while not quit_:
+            items = self._queue.get_many(
+                max_items=self._max_batch_size,
+                max_latency=self._max_latency,
+                max_bytes=self._max_batch_bytes,
+            )
+            entries = [item for item in items if item is not _WORKER_TERMINATOR]
+            quit_ = len(entries) < len(items)
+            if entries:
+                self._write(entries)
+            for _ in items:
+                self._queue.task_done()
+
+    def _write(self, entries):
+        """Writes a batch of entries, logging any error."""
+        try:
+            self.client.logging_api.write_entries(entries, partial_success=True)
+            _LOGGER.debug("Submitted %d logs", len(entries))
+        except Exception as exc:
+            _LOGGER.error("Failed to submit %d logs.", len(entries), exc_info=True)
+            # with partial success, the entries without an error were written
+            entry_errors = getattr(exc, "log_entry_errors", None)
+            failed = len(entries) if entry_errors is None else len(entry_errors)
+            self._stats.on_outcome(sent=len(entries) - failed, failed=failed)
+        else:
+            self._stats.on_outcome(sent=len(entries))
+
+    def flush(self, timeout=None):
+        """Waits until the entries received so far are written.
+
+        Args:
+            timeout (Optional[float]): The maximum time to wait, in seconds.
+                If ``None``, waits until all received entries are written.
+
+        Returns:
+            FlushResult: The entries sent, failed and still pending.
+        """
+        start = time.monotonic()
+        sent, failed = self._stats.outcomes()
+        self._queue.join(timeout=timeout)
+        committed, dropped = self._stats.outcomes()
+        return FlushResult(
+            sent=committed - sent,
+            failed=dropped - failed,
+            pending=self._queue.unfinished_tasks,
+            elapsed=time.monotonic() - start,
+        )
+
+    def shutdown(self):
+        """Makes :meth:`serve_forever` return. Safe to call from a signal handler."""
+        self._shutdown.set()
+
+    def serve_forever(self):
+        """Starts the uploader, and runs it until :meth:`shutdown` is called."""
+        self.start()
+        try:
+            # wake up regularly, so that signal handlers run
+            while not self._shutdown.wait(_SELECT_TIMEOUT):
+                pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+    def close(self):
+        """Stops listening, and writes the entries received so far.
+
+        Waits up to ``grace_period`` seconds for them to be written.
+        """
+        if self._receiver is None:
+            return
+        self._stopping.set()
+        self._receiver.join()
+        self._receiver = None
+        self._listener = None
+        try:
+            os.unlink(self.address)
+        except FileNotFoundError:
+            pass
+
+        self._queue.put_nowait(_WORKER_TERMINATOR)
+        self._sender.join(timeout=self._grace_period)
+        if self._sender.is_alive():
+            print(
+                "Failed to send %d pending logs." % (self._queue.qsize(),),
+                file=sys.stderr,
+            )
+        self._sender = None
+
+
+def _run_uploader(address, client_kwargs, uploader_kwargs):
+    """The entry point of the uploader process."""
+    from google.cloud.logging_v2.client import Client
+
+    uploader = SharedUploader(Client(**client_kwargs), address, **uploader_kwargs)
+    signal.signal(signal.SIGTERM, lambda signum, frame: uploader.shutdown())
+    uploader.serve_forever()
+
+
+def start_uploader_process(address=None, *, client_kwargs=None, **kwargs):
+    """Starts a :class:`SharedUploader` in a new process.
+
+    The process is started with the ``spawn`` method, and creates its own
+    client, so that no gRPC channel is inherited from the caller. It is
+    stopped with ``SIGTERM``, after writing the entries it received.
+
+    For example, from the ``on_starting`` hook of a gunicorn configuration,
+    before the workers are forked.
+
+    Args:
+        address (Optional[str]): The path of the Unix domain socket to listen
+            on. If ``None``, the default of :class:`SharedUploader` is used.
+        client_kwargs (Optional[dict]): Keyword arguments for the
+            :class:`~logging_v2.client.Client` of the uploader.
+        kwargs (dict): Other keyword arguments for :class:`SharedUploader`.
+
+    Returns:
+        multiprocessing.Process: The uploader process.
+    """
+    context = multiprocessing.get_context("spawn")
+    process = context.Process(
+        target=_run_uploader,
+        args=(address, client_kwargs or {}, kwargs),
+        name=_UPLOADER_THREAD_NAME,
+        daemon=True,
+    )
+    process.start()
+    return process
+
+
+_TRANSPORTS = weakref.WeakSet()
+"""Transports to reinitialize in the child process after a fork."""
+
+
+def _after_fork_in_child():
+    """Drops the connections inherited by a forked child process."""
+    for transport in list(_TRANSPORTS):
+        transport._after_fork_in_child()
+
+
+if hasattr(os, "register_at_fork"):  # pragma: NO BRANCH
+    # not available on Windows
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+class SharedUploaderTransport(Transport):
+    """Transport that hands entries over to a :class:`SharedUploader`.
+
+    Each entry is encoded in the logging thread, and written to the Unix
+    domain socket of the uploader, or to its shared-memory ring buffer if
+    ``ring_path`` is set. Writing to the ring buffer never waits for the
+    uploader, and entries left in it are sent by the next uploader if it
+    restarts; entries that do not fit in it are dropped and counted. It is
+    not faster than the socket, as a file lock is taken for each entry.
+
+    No thread is started, and no connection to the Cloud Logging API is
+    made, unless the uploader is unreachable: entries are then sent with
+    ``fallback_transport``, and connecting to the uploader is retried every
+    ``reconnect_interval`` seconds.
+
+    The handler only passes the client, name and resource to the transport,
+    so other arguments are bound with :func:`functools.partial`::
+
+        transport = functools.partial(SharedUploaderTransport, address=path)
+        handler = CloudLoggingHandler(client, transport=transport)
+    """
+
+    def __init__(
+        self,
+        client,
+        name,
+        *,
+        address=None,
+        timeout=_DEFAULT_SEND_TIMEOUT,
+        reconnect_interval=_DEFAULT_RECONNECT_INTERVAL,
+        fallback_transport=BackgroundThreadTransport,
+        ring_path=None,
+        resource=_GLOBAL_RESOURCE,
+        **kwargs,
+    ):
+        """
+        Args:
+            client (~logging_v2.client.Client):
+                The Logging client.
+            name (str): The name of the logger.
+            address (Optional[str]): The path of the Unix domain socket of
+                the uploader. If ``None``, the default of
+                :class:`SharedUploader` is used.
+            timeout (Optional[float]): The maximum time, in seconds, to wait
+                for the uploader to accept an entry.
+            reconnect_interval (Optional[float]): The time, in seconds, to
+                wait before connecting again after the uploader was
+                unreachable.
+            fallback_transport (Optional[Type[Transport]]): The transport
+                used while the uploader is unreachable. If ``None``, entries
+                are dropped instead.
+            ring_path (Optional[str]): The path of the ring buffer of the
+                uploader. If given, entries are written to it instead of the
+                socket.
+            resource (Optional[Resource|dict]): The default monitored resource
+                to associate with logs when not specified.
+        """
+        self.client = client
+        self.logger = client.logger(name, resource=resource)
+        self.address = _default_address() if address is None else address
+        self.timeout = timeout
+        self.reconnect_interval = reconnect_interval
+        self.ring_path = ring_path
+        self._name = name
+        self._resource = resource
+        self._fallback_transport_cls = fallback_transport
+        self._fallback_transport = None
+        self._lock = threading.Lock()
+        self._socket = None
+        self._ring = None
+        self._next_connect = 0.0
+        self.dropped_entries = 0
+        _TRANSPORTS.add(self)
+
+    def _make_entry(self, record, message, **kwargs):
+        """Builds the log entry resource of a record.
+
+        Returns:
+            dict: The entry, in its JSON API representation, with its
+            ``logName`` and ``resource`` set.
+        """
+        queue_entry = _Worker._make_queue_entry(record, message, **kwargs)
+        batch = Batch(self.logger, self.client)
+        batch.log(log_name=self.logger.full_name, **queue_entry.to_kwargs())
+        entry = batch.entries[0].to_api_repr()
+        if "resource" not in entry and self.logger.default_resource is not None:
+            entry["resource"] = self.logger.default_resource._to_dict()
+        if self.logger.labels:
+            entry["labels"] = dict(self.logger.labels, **entry.get("labels", {}))
+        return entry
+
+    def _unreachable(self, target):
+        """Waits ``reconnect_interval`` before trying the uploader again.
+
+        Must be called with the lock held.
+        """
+        self._next_connect = time.monotonic() + self.reconnect_interval
+        _LOGGER.warning(
+            "Log uploader unreachable at %s, sending logs directly.", target
+        )
+
+    def _connect(self):
+        """Returns the connection to the uploader, or None if it is unreachable.
+
+        Must be called with the lock held.
+        """
+        if self._socket is not None:
+            return self._socket
+        if time.monotonic() < self._next_connect:
+            return None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            # never send entries to a socket planted by another user
+            _check_owner(self.address)
+            sock.connect(self.address)
+        except OSError:
+            sock.close()
+            self._unreachable(self.address)
+            return None
+        self._socket = sock
+        return sock
+
+    def _open_ring(self):
+        """Returns the ring buffer of the uploader, or None if it does not exist.
+
+        Must be called with the lock held.
+        """
+        if self._ring is not None:
+            return self._ring
+        if time.monotonic() < self._next_connect:
+            return None
+        try:
+            self._ring = _ring._RingBuffer(self.ring_path)
+        except (OSError, ValueError):
+            self._unreachable(self.ring_path)
+        return self._ring
+
+    def _disconnect(self):
+        """Closes the connection to the uploader. Must be called with the lock held."""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+
+    def _after_fork_in_child(self):
+        """Drops the connection and lock inherited from the parent process."""
+        self._lock = threading.Lock()
+        self._disconnect()
+        self._fallback_transport = None
+
+    def _hand_over(self, payload):
+        """Hands an encoded entry over to the uploader.
+
+        Must be called with the lock held.
+
+        Returns:
+            bool: True if the entry was handed over, or dropped because the
+            ring buffer is full. False if the uploader is unreachable.
+        """
+        if self.ring_path is not None:
+            ring = self._open_ring()
+            if ring is None:
+                return False
+            try:
+                written = ring.put(payload)
+            except (OSError, ValueError):
+                # the uploader replaced the ring buffer with one we cannot open
+                self._disconnect()
+                self._unreachable(self.ring_path)
+                return False
+            if not written:
+                self.dropped_entries += 1
+            return True
+
+        sock = self._connect()
+        if sock is None:
+            return False
+        try:
+            sock.sendall(_encode_frame(payload))
+        except OSError:
+            # the frame may be partially written, so the connection cannot
+            # be used anymore
+            self._disconnect()
+            self._next_connect = time.monotonic() + self.reconnect_interval
+            return False
+        return True
+
+    def send(self, record, message, **kwargs):
+        """Overrides Transport.send().
+
+        Args:
+            record (logging.LogRecord): Python log record that the handler was called with.
+            message (str or dict): The message from the ``LogRecord`` after being
+                formatted by the associated log formatters.
+            kwargs: Additional optional arguments for the logger
+        """
+        payload = _encode_entry(self._make_entry(record, message, **dict(kwargs)))
+        with self._lock:
+            if self._hand_over(payload):
+                return
+            fallback = self._get_fallback_transport()
+        if fallback is None:
+            self.dropped_entries += 1
+        else:
+            fallback.send(record, message, **kwargs)
+
+    def _get_fallback_transport(self):
+        """Returns the fallback transport, creating it on first use.
+
+        Must be called with the lock held.
+        """
+        if self._fallback_transport is None and self._fallback_transport_cls:
+            self._fallback_transport = self._fallback_transport_cls(
+                self.client, self._name, resource=self._resource
+            )
+        return self._fallback_transport
+
+    def flush(self, timeout=None):
+        """Submit the log records sent through the fallback transport.
+
+        Entries handed over to the uploader are written by the uploader, and
+        are not counted.
+
+        Args:
+            timeout (Optional[float]): The maximum time to wait, in seconds.
+                If ``None``, waits until all pending records are submitted.
+
+        Returns:
+            FlushResult: The entries sent, failed and still pending.
+        """
+        if self._fallback_transport is not None:
+            return self._fallback_transport.flush(timeout=timeout)
+        return super(SharedUploaderTransport, self).flush(timeout=timeout)
+
+    def close(self):
+        """Closes the connection to the uploader, and the fallback transport."""
+        with self._lock:
+            self._disconnect()
+            fallback, self._fallback_transport = self._fallback_transport, None
+        if fallback is not None:
+            fallback.close()
@@ -18,6 +18,9 @@ import collections
 import re
 
 from google.cloud.logging_v2._helpers import _add_defaults_to_filter
+from google.cloud.logging_v2._helpers import _estimate_log_entry_size
+from google.cloud.logging_v2._helpers import _LOG_ENTRY_MAX_BYTES
+from google.cloud.logging_v2._helpers import _WRITE_REQUEST_MAX_BYTES
 from google.cloud.logging_v2.entries import LogEntry
 from google.cloud.logging_v2.entries import ProtobufEntry
 from google.cloud.logging_v2.entries import StructEntry
@@ -26,6 +29,7 @@ from google.cloud.logging_v2.resource import Resource
 from google.cloud.logging_v2.handlers._monitored_resources import detect_resource
 from google.cloud.logging_v2._instrumentation import _add_instrumentation
 
+from google.api_core.exceptions import GoogleAPICallError
 from google.api_core.exceptions import InvalidArgument
 from google.rpc.error_details_pb2 import DebugInfo
 
@@ -53,6 +57,329 @@ _OUTBOUND_ENTRY_FIELDS = (  # (name, default)
 
 _STRUCT_EXTRACTABLE_FIELDS = ["severity", "trace", "span_id"]
 
+OVERSIZE_REJECT = "reject"
+"""Do not send log entries over the size limit of a batch."""
+
+OVERSIZE_TRUNCATE = "truncate"
+"""Truncate the text of text entries over the size limit of a batch.
+
+Other entries over the limit are not sent.
+"""
+
+_OVERSIZE_POLICIES = (OVERSIZE_REJECT, OVERSIZE_TRUNCATE)
+
+_DEFAULT_MAX_REQUEST_BYTES = _WRITE_REQUEST_MAX_BYTES // 2
+"""Estimated size limit of a request of a batch, with room for the estimate's
+error."""
+
+_DEFAULT_MAX_REQUEST_ENTRIES = 1000
+"""Limit on the number of entries in a request of a batch."""
+
+_TRUNCATION_MARKER = "...[truncated]"
+
+
+_MISSING = object()
+
+
+def _hoist_shared_fields(entries, *, log_name, resource=None, labels=None):
+    """Helper for :meth:`Batch.commit`: sends the fields shared by a batch once.
+
+    The API writes each entry with the log name and resource of the request
+    when it has none, and with the labels of the request merged under its
+    own. So a log name or resource that all entries have is sent in the
+    request instead, as are the labels with the same value in all entries,
+    and the entries are stripped of the fields equal to those of the
+    request. The entries are written the same.
+
+    Args:
+        entries (Sequence[~logging_v2.entries.LogEntry]): The entries.
+        log_name (str): The default log name of the request.
+        resource (Optional[~logging_v2.resource.Resource]): The default
+            resource of the request.
+        labels (Optional[dict]): The default labels of the request.
+
+    Returns:
+        Tuple[list, str, Optional[~logging_v2.resource.Resource], Optional[dict]]:
+        The stripped entries, and the log name, resource and labels of the
+        request.
+    """
+    if not entries:
+        return list(entries), log_name, resource, labels
+
+    first = entries[0]
+    shared_log_name = log_name if first.log_name is None else first.log_name
+    shared_resource = resource if first.resource is None else first.resource
+    shared_labels = dict(first.labels) if first.labels else {}
+    for entry in entries:
+        if shared_log_name is not None:
+            entry_log_name = log_name if entry.log_name is None else entry.log_name
+            if entry_log_name != shared_log_name:
+                shared_log_name = None
+        if shared_resource is not None:
+            entry_resource = resource if entry.resource is None else entry.resource
+            if entry_resource is not shared_resource and (
+                entry_resource != shared_resource
+            ):
+                shared_resource = None
+        if shared_labels:
+            entry_labels = entry.labels or {}
+            for key, value in list(shared_labels.items()):
+                if entry_labels.get(key, _MISSING) != value:
+                    del shared_labels[key]
+
+    if shared_log_name is not None:
+        log_name = shared_log_name
+    if shared_resource is not None:
+        resource = shared_resource
+    if shared_labels:
+        labels = {**(labels or {}), **shared_labels}
+
+    stripped = []
+    for entry in entries:
+        changes = {}
+        if entry.log_name is not None and entry.log_name == log_name:
+            changes["log_name"] = None
+        if entry.resource is not None and (
+            entry.resource is resource or entry.resource == resource
+        ):
+            changes["resource"] = None
+        if entry.labels and labels:
+            own_labels = {
+                key: value
+                for key, value in entry.labels.items()
+                if labels.get(key, _MISSING) != value
+            }
+            if len(own_labels) < len(entry.labels):
+                changes["labels"] = own_labels or None
+        stripped.append(entry._replace(**changes) if changes else entry)
+    return stripped, log_name, resource, labels
+
+
+def _truncate_entry(entry, max_bytes):
+    """Helper for :meth:`Batch.commit`: cuts the text of an entry to a size.
+
+    Args:
+        entry (~logging_v2.entries.LogEntry): An entry over the size limit.
+        max_bytes (int): The size limit.
+
+    Returns:
+        Optional[~logging_v2.entries.LogEntry]: The entry with its text
+        truncated, or ``None`` if it has no text, or its other fields are
+        over the limit.
+    """
+    if not isinstance(entry.payload, str):
+        return None
+    text = entry.payload.encode("utf-8")
+    excess = _estimate_log_entry_size(entry) - max_bytes
+    keep = len(text) - excess - len(_TRUNCATION_MARKER)
+    if keep <= 0:
+        return None
+    # a character cut in the middle is dropped
+    payload = text[:keep].decode("utf-8", "ignore") + _TRUNCATION_MARKER
+    return entry._replace(payload=payload)
+
+
+class _CommitPlan(object):
+    """Helper for :meth:`Batch.commit`: the requests writing a batch.
+
+    The entries of the batch are split into requests within its limits, and
+    its entries over the size limit are truncated or rejected. The requests
+    are iterated. Of a request that the API partially wrote, only the
+    entries it listed as failed are kept; a request that the API rejected
+    as a whole is split in two, down to the rejected entries. If both halves
+    are rejected with the same error as the whole, the error is taken to
+    apply to every entry, and the halves are not split further. Without
+    partial success, the first failed request ends the commit instead.
+    :meth:`finish` leaves the entries not written in the batch.
+    """
+
+    def __init__(self, batch, partial_success):
+        self._batch = batch
+        self._partial_success = partial_success
+        self._entries = list(batch.entries)
+        self._sent = list(self._entries)
+        self._written = set()
+        self._failures = {}
+        self._current = None
+        # the error of the request the current one was split from, if it is
+        # its first half
+        self._split_error = None
+        # the first half of a split request, rejected like the whole, until
+        # the outcome of the second half is known
+        self._suspect = None
+        self.error = None
+
+        requests = []
+        request = []
+        request_bytes = 0
+        oversized = []
+        for index, entry in enumerate(self._entries):
+            size = _estimate_log_entry_size(entry)
+            if size > batch.max_entry_bytes:
+                entry = None
+                if batch.oversize_policy == OVERSIZE_TRUNCATE:
+                    entry = _truncate_entry(self._sent[index], batch.max_entry_bytes)
+                if entry is None:
+                    oversized.append(index)
+                    continue
+                self._sent[index] = entry
+                size = _estimate_log_entry_size(entry)
+            if request and (
+                len(request) >= batch.max_request_entries
+                or request_bytes + size > batch.max_request_bytes
+            ):
+                requests.append(request)
+                request = []
+                request_bytes = 0
+            request.append(index)
+            request_bytes += size
+        if request:
+            requests.append(request)
+        # a stack of (entry indexes, split error), popped in order
+        self._pending = [(request, None) for request in reversed(requests)]
+        if oversized:
+            self.error = InvalidArgument(
+                f"{len(oversized)} log entries are over the size limit of "
+                f"{batch.max_entry_bytes} bytes, and were not written"
+            )
+            for index in oversized:
+                self._failures[index] = self.error
+
+    def __iter__(self):
+        """Yields the entries of each request."""
+        while self._pending:
+            self._current, self._split_error = self._pending.pop()
+            yield [self._sent[index] for index in self._current]
+
+    def written(self):
+        """Records that the current request was written."""
+        self._written.update(self._current)
+        self._split_suspect()
+
+    def _split(self, request, err):
+        """Queues the two halves of a request rejected as a whole."""
+        middle = len(request) // 2
+        self._pending.append((request[middle:], None))
+        self._pending.append((request[:middle], err))
+
+    def _split_suspect(self):
+        """Splits the first half of a request, once the second half was not
+        rejected like it."""
+        if self._suspect is None:
+            return
+        request, err = self._suspect
+        self._suspect = None
+        if len(request) > 1:
+            self._split(request, err)
+        else:
+            self._reject(request, err)
+
+    def _reject(self, request, err):
+        """Records that the entries of a request failed with ``err``."""
+        for index in request:
+            self._failures[index] = err
+        if self.error is None:
+            self._batch._append_context_to_error(
+                err, [self._sent[index] for index in request]
+            )
+            self.error = err
+
+    def failed(self, err):
+        """Records that the current request failed.
+
+        Args:
+            err (~google.api_core.exceptions.GoogleAPICallError): The error.
+
+        Returns:
+            bool: False if the error is to be raised, leaving the current
+            request and those pending in the batch.
+        """
+        request = self._current
+        entry_errors = getattr(err, "log_entry_errors", None)
+        if not self._partial_success:
+            # nothing of the request was written: stop there, as the
+            # entries that follow are likely to fail alike
+            for position, index in enumerate(request):
+                if entry_errors is not None and position in entry_errors:
+                    self._failures[index] = entry_errors[position]
+                elif entry_errors is not None or isinstance(err, InvalidArgument):
+                    self._failures[index] = err
+            if isinstance(err, InvalidArgument):
+                self._batch._append_context_to_error(
+                    err, [self._sent[index] for index in request]
+                )
+            return False
+        suspect = self._suspect
+        if (
+            suspect is not None
+            and entry_errors is None
+            and _same_error(err, suspect[1])
+        ):
+            # both halves were rejected like the whole: the error is not
+            # about some of the entries, splitting further would not help
+            self._suspect = None
+            self._reject(suspect[0], err)
+            self._reject(request, err)
+            return True
+        if entry_errors is not None or isinstance(err, InvalidArgument):
+            self._split_suspect()
+        if entry_errors is not None:
+            for position, index in enumerate(request):
+                entry_error = entry_errors.get(position)
+                if entry_error is not None:
+                    self._failures[index] = entry_error
+                else:
+                    self._written.add(index)
+        elif not isinstance(err, InvalidArgument):
+            return False
+        elif self._split_error is not None and _same_error(err, self._split_error):
+            # wait for the second half, before telling whether the error
+            # is about some of the entries
+            self._suspect = (request, err)
+            return True
+        elif len(request) > 1:
+            # InvalidArgument is often sent when a log is too large:
+            # find the entries at fault, and write the others
+            self._split(request, err)
+            return True
+        else:
+            self._reject(request, err)
+            return True
+        if self.error is None:
+            self._batch._append_context_to_error(
+                err, [self._sent[index] for index in request]
+            )
+            self.error = err
+        return True
+
+    def finish(self):
+        """Leaves the entries not written in the batch, and lists the failed."""
+        self._batch.entries[:] = [
+            entry
+            for index, entry in enumerate(self._entries)
+            if index not in self._written
+        ]
+        self._batch.failures[:] = [
+            (self._entries[index], error)
+            for index, error in sorted(self._failures.items())
+        ]
+
+
+def _same_error(err, other):
+    """Whether two errors of write requests are the same request-level error."""
+    return type(err) is type(other) and str(err) == str(other)
+
+
+def _writes_entry_objects(client):
+    """Whether entries are passed to ``write_entries`` as they are.
+
+    The gRPC API converts entries to protobuf directly, which is much faster
+    than parsing their JSON representation. The JSON API takes the JSON
+    representation.
+    """
+    # compared to True, since test doubles may have any attribute
+    return getattr(client, "_use_grpc", False) is True
+
 
 class Logger(object):
     """Loggers represent named targets for log entries.
@@ -118,24 +445,24 @@ class Logger(object):
             client = self._client
         return client
 
-    def batch(self, *, client=None):
+    def batch(self, *, client=None, **kw):
         """Return a batch to use as a context manager.
 
         Args:
             client (Union[None, ~logging_v2.client.Client]):
                 The client to use.  If not passed, falls back to the
                 ``client`` stored on the current sink.
+            kw (Optional[dict]): The limits and oversize policy of the batch.
+                See :class:`Batch`.
 
         Returns:
             Batch: A batch to use as a context manager.
         """
         client = self._require_client(client)
-        return Batch(self, client)
-
-    def _do_log(self, client, _entry_class, payload=None, **kw):
-        """Helper for :meth:`log_empty`, :meth:`log_text`, etc."""
-        client = self._require_client(client)
+        return Batch(self, client, **kw)
 
+    def _make_entries(self, client, _entry_class, payload=None, **kw):
+        """Helper for :meth:`_do_log`: builds the entry resources to write."""
         # Apply defaults
         kw["log_name"] = kw.pop("log_name", self.full_name)
         kw["labels"] = kw.pop("labels", self.labels)
@@ -155,17 +482,30 @@ class Logger(object):
                 # dict couldn't be parsed as a Resource
                 raise TypeError("invalid resource dict") from e
 
+        circuit_breaker = getattr(client, "circuit_breaker", None)
+        if circuit_breaker is not None:
+            # skip serializing an entry that would not be sent
+            circuit_breaker.raise_if_open()
+
         if payload is not None:
             entry = _entry_class(payload=payload, **kw)
         else:
             entry = _entry_class(**kw)
 
-        api_repr = entry.to_api_repr()
-        entries = [api_repr]
+        if _writes_entry_objects(client):
+            entries = [entry]
+        else:
+            entries = [entry.to_api_repr()]
 
         if google.cloud.logging_v2._instrumentation_emitted is False:
             entries = _add_instrumentation(entries, **kw)
             google.cloud.logging_v2._instrumentation_emitted = True
+        return entries
+
+    def _do_log(self, client, _entry_class, payload=None, **kw):
+        """Helper for :meth:`log_empty`, :meth:`log_text`, etc."""
+        client = self._require_client(client)
+        entries = self._make_entries(client, _entry_class, payload, **kw)
         # partial_success is true to avoid dropping instrumentation logs
         client.logging_api.write_entries(entries, partial_success=True)
 
@@ -182,7 +522,7 @@ class Logger(object):
             kw (Optional[dict]): additional keyword arguments for the entry.
                 See :class:`~logging_v2.entries.LogEntry`.
         """
-        self._do_log(client, LogEntry, **kw)
+        return self._do_log(client, LogEntry, **kw)
 
     def log_text(self, text, *, client=None, **kw):
         """Log a text message
@@ -198,7 +538,7 @@ class Logger(object):
             kw (Optional[dict]): additional keyword arguments for the entry.
                 See :class:`~logging_v2.entries.LogEntry`.
         """
-        self._do_log(client, TextEntry, text, **kw)
+        return self._do_log(client, TextEntry, text, **kw)
 
     def log_struct(self, info, *, client=None, **kw):
         """Logs a dictionary message.
@@ -238,7 +578,7 @@ class Logger(object):
             # attempt to copy relevant fields from the payload into the LogEntry body
             if field in info and field not in kw:
                 kw[field] = info[field]
-        self._do_log(client, StructEntry, info, **kw)
+        return self._do_log(client, StructEntry, info, **kw)
 
     def log_proto(self, message, *, client=None, **kw):
         """Log a protobuf message
@@ -255,7 +595,7 @@ class Logger(object):
             kw (Optional[dict]): additional keyword arguments for the entry.
                 See :class:`~logging_v2.entries.LogEntry`.
         """
-        self._do_log(client, ProtobufEntry, message, **kw)
+        return self._do_log(client, ProtobufEntry, message, **kw)
 
     def log(self, message=None, *, client=None, **kw):
         """Log an arbitrary message. Type will be inferred based on the input.
@@ -272,13 +612,13 @@ class Logger(object):
                 See :class:`~logging_v2.entries.LogEntry`.
         """
         if isinstance(message, google.protobuf.message.Message):
-            self.log_proto(message, client=client, **kw)
+            return self.log_proto(message, client=client, **kw)
         elif isinstance(message, collections.abc.Mapping):
-            self.log_struct(message, client=client, **kw)
+            return self.log_struct(message, client=client, **kw)
         elif isinstance(message, str):
-            self.log_text(message, client=client, **kw)
+            return self.log_text(message, client=client, **kw)
         else:
-            self._do_log(client, LogEntry, message, **kw)
+            return self._do_log(client, LogEntry, message, **kw)
 
     def delete(self, logger_name=None, *, client=None):
         """Delete all entries in a logger via a DELETE request
@@ -373,11 +713,29 @@ class Logger(object):
 
 
 class Batch(object):
-    def __init__(self, logger, client, *, resource=None):
+    def __init__(
+        self,
+        logger,
+        client,
+        *,
+        resource=None,
+        max_request_bytes=_DEFAULT_MAX_REQUEST_BYTES,
+        max_request_entries=_DEFAULT_MAX_REQUEST_ENTRIES,
+        max_entry_bytes=_LOG_ENTRY_MAX_BYTES,
+        oversize_policy=OVERSIZE_REJECT,
+    ):
         """Context manager:  collect entries to log via a single API call.
 
         Helper returned by :meth:`Logger.batch`
 
+        The entries are written in as many requests as needed to keep each
+        within ``max_request_bytes`` and ``max_request_entries``, by their
+        estimated serialized size. Entries over ``max_entry_bytes`` are not
+        sent, as the API would reject them, unless ``oversize_policy`` is
+        :data:`OVERSIZE_TRUNCATE`. A request rejected by the API is split in
+        two, and so on, so that the entries at fault do not keep the others
+        from being written.
+
         Args:
             logger (logging_v2.logger.Logger):
                 the logger to which entries will be logged.
@@ -391,11 +749,33 @@ class Batch(object):
                 resource type, this parameter is only required
                 if explicitly set to None. If no entries' resource are
                 set to None, this parameter will be ignored on the server.
+            max_request_bytes (Optional[int]): The estimated size limit of
+                a request, in bytes. Defaults to half the limit of the API.
+            max_request_entries (Optional[int]): The limit on the number of
+                entries in a request. Defaults to 1000.
+            max_entry_bytes (Optional[int]): The estimated size limit of an
+                entry, in bytes. Defaults to the limit of the API, 256 KiB.
+            oversize_policy (Optional[str]): What to do with entries over
+                ``max_entry_bytes``: :data:`OVERSIZE_REJECT`, the default, or
+                :data:`OVERSIZE_TRUNCATE`.
+
+        Raises:
+            ValueError: If a limit is not positive, or ``oversize_policy`` is
+                not a known policy.
         """
+        if oversize_policy not in _OVERSIZE_POLICIES:
+            raise ValueError(f"unknown oversize policy: {oversize_policy!r}")
+        if min(max_request_bytes, max_request_entries, max_entry_bytes) <= 0:
+            raise ValueError("batch limits must be positive")
         self.logger = logger
         self.entries = []
+        self.failures = []
         self.client = client
         self.resource = resource
+        self.max_request_bytes = max_request_bytes
+        self.max_request_entries = max_request_entries
+        self.max_entry_bytes = max_entry_bytes
+        self.oversize_policy = oversize_policy
 
     def __enter__(self):
         return self
@@ -476,7 +856,13 @@ class Batch(object):
         self.entries.append(entry_type(payload=message, **kw))
 
     def commit(self, *, client=None, partial_success=True):
-        """Send saved log entries as a single API call.
+        """Send saved log entries, in as few API calls as the limits allow.
+
+        Entries that are written are removed from the batch; when an error
+        is raised, the batch keeps those that were not. The entries that the
+        API failed to write, as listed by its partial errors, or that were
+        rejected, are listed with their error in :attr:`failures`, so that
+        only those with a transient error need to be retried.
 
         Args:
             client (Optional[~logging_v2.client.Client]):
@@ -485,36 +871,91 @@ class Batch(object):
             partial_success (Optional[bool]):
                 Whether a batch's valid entries should be written even
                 if some other entry failed due to a permanent error such
-                as INVALID_ARGUMENT or PERMISSION_DENIED.
+                as INVALID_ARGUMENT or PERMISSION_DENIED. If true, a
+                request rejected by the API is split to find the entries
+                at fault, and the others are written, possibly out of the
+                order they were logged in. If false, the first request
+                that fails raises its error at once, and no further
+                request is sent.
 
         Raises:
             ValueError:
                 if one of the messages in the batch cannot be successfully parsed.
+            ~google.api_core.exceptions.GoogleAPICallError:
+                if entries were over the size limit, or failed to be written,
+                after the other entries were written; or, if a request
+                failed as a whole with another error than INVALID_ARGUMENT,
+                or any request failed without ``partial_success``, at once.
+            ~logging_v2.circuit_breaker.CircuitOpenError:
+                if the client's circuit breaker is open.
         """
         if client is None:
             client = self.client
+        self._raise_if_circuit_open(client)
 
-        kwargs = {"logger_name": self.logger.full_name}
+        plan = _CommitPlan(self, partial_success)
+        try:
+            for entries in plan:
+                request_entries, kwargs = self._make_request(client, entries)
+                try:
+                    client.logging_api.write_entries(
+                        request_entries, partial_success=partial_success, **kwargs
+                    )
+                except GoogleAPICallError as e:
+                    if not plan.failed(e):
+                        raise
+                else:
+                    plan.written()
+        finally:
+            plan.finish()
+        if plan.error is not None:
+            raise plan.error
+
+    def _raise_if_circuit_open(self, client):
+        """Helper for :meth:`commit`: fails fast if the client's circuit is open.
 
-        if self.resource is not None:
-            kwargs["resource"] = self.resource._to_dict()
+        Raises:
+            ~logging_v2.circuit_breaker.CircuitOpenError:
+                if the client's circuit breaker is open.
+        """
+        circuit_breaker = getattr(client, "circuit_breaker", None)
+        if circuit_breaker is not None and self.entries:
+            # skip sizing and serializing entries that would not be sent
+            circuit_breaker.raise_if_open()
 
-        if self.logger.labels is not None:
-            kwargs["labels"] = self.logger.labels
+    def _make_request(self, client, entries=None):
+        """Helper for :meth:`commit`: builds the entry resources to write.
 
-        entries = [entry.to_api_repr() for entry in self.entries]
-        try:
-            client.logging_api.write_entries(
-                entries, partial_success=partial_success, **kwargs
-            )
-        except InvalidArgument as e:
-            # InvalidArgument is often sent when a log is too large
-            # attempt to attach extra contex on which log caused error
-            self._append_context_to_error(e)
-            raise e
-        del self.entries[:]
-
-    def _append_context_to_error(self, err):
+        Args:
+            client (~logging_v2.client.Client): The client to use.
+            entries (Optional[Sequence[~logging_v2.entries.LogEntry]]): The
+                entries of the request. Defaults to those of the batch.
+
+        Returns:
+            Tuple[list, dict]: The entry resources, and the keyword arguments
+            for ``write_entries``.
+        """
+        if entries is None:
+            entries = self.entries
+        entries, log_name, resource, labels = _hoist_shared_fields(
+            entries,
+            log_name=self.logger.full_name,
+            resource=self.resource,
+            labels=self.logger.labels,
+        )
+        kwargs = {"logger_name": log_name}
+
+        if resource is not None:
+            kwargs["resource"] = resource._to_dict()
+
+        if labels is not None:
+            kwargs["labels"] = labels
+
+        if _writes_entry_objects(client):
+            return entries, kwargs
+        return [entry.to_api_repr() for entry in entries], kwargs
+
+    def _append_context_to_error(self, err, entries=None):
         """
         Attempts to Modify `write_entries` exception messages to contain
         context on which log in the batch caused the error.
@@ -525,17 +966,116 @@ class Batch(object):
         Args:
             err (~google.api_core.exceptions.InvalidArgument):
                 The original exception object
+            entries (Optional[Sequence[~logging_v2.entries.LogEntry]]):
+                The entries of the failed request. Defaults to those of
+                the batch.
         """
+        if entries is None:
+            entries = self.entries
         try:
             # find debug info proto if in details
             debug_info = next(x for x in err.details if isinstance(x, DebugInfo))
             # parse out the index of the faulty entry
             error_idx = re.search("(?<=key: )[0-9]+", debug_info.detail).group(0)
             # find the faulty entry object
-            found_entry = self.entries[int(error_idx)]
+            found_entry = entries[int(error_idx)]
             str_entry = str(found_entry.to_api_repr())
             # modify error message to contain extra context
             err.message = f"{err.message}: {str_entry:.2000}..."
         except Exception:
             # if parsing fails, abort changes and leave err unmodified
             pass
+
+
+class AsyncLogger(Logger):
+    """Logger writing entries with :mod:`asyncio`.
+
+    The ``log_*`` methods and :meth:`log` are coroutines, awaiting the
+    ``WriteLogEntries`` call on the running event loop through the
+    ``LoggingServiceV2AsyncClient``. Other methods are the same as for
+    :class:`Logger`. Requires a client using the gRPC transport.
+    """
+
+    def batch(self, *, client=None, **kw):
+        """Return a batch to use as an asynchronous context manager.
+
+        Args:
+            client (Union[None, ~logging_v2.client.Client]):
+                The client to use.  If not passed, falls back to the
+                ``client`` stored on the current sink.
+            kw (Optional[dict]): The limits and oversize policy of the batch.
+                See :class:`Batch`.
+
+        Returns:
+            AsyncBatch: A batch to use as an asynchronous context manager.
+        """
+        client = self._require_client(client)
+        return AsyncBatch(self, client, **kw)
+
+    async def _do_log(self, client, _entry_class, payload=None, **kw):
+        """Helper for :meth:`log_empty`, :meth:`log_text`, etc."""
+        client = self._require_client(client)
+        entries = self._make_entries(client, _entry_class, payload, **kw)
+        # partial_success is true to avoid dropping instrumentation logs
+        await client.async_logging_api.write_entries(entries, partial_success=True)
+
+
+class AsyncBatch(Batch):
+    """Asynchronous context manager: collect entries to log via a single API call.
+
+    Helper returned by :meth:`AsyncLogger.batch`. Entries are added as with
+    :class:`Batch`, and :meth:`commit` is a coroutine.
+    """
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            await self.commit()
+
+    async def commit(self, *, client=None, partial_success=True):
+        """Send saved log entries as by :meth:`Batch.commit`, awaiting the calls.
+
+        Args:
+            client (Optional[~logging_v2.client.Client]):
+                The client to use.  If not passed, falls back to the
+                ``client`` stored on the current batch.
+            partial_success (Optional[bool]):
+                Whether a batch's valid entries should be written even
+                if some other entry failed due to a permanent error such
+                as INVALID_ARGUMENT or PERMISSION_DENIED. See
+                :meth:`Batch.commit`.
+
+        Raises:
+            ValueError:
+                if one of the messages in the batch cannot be successfully parsed.
+            ~google.api_core.exceptions.GoogleAPICallError:
+                if entries were over the size limit, or failed to be written,
+                after the other entries were written; or, if a request
+                failed as a whole with another error than INVALID_ARGUMENT,
+                or any request failed without ``partial_success``, at once.
+            ~logging_v2.circuit_breaker.CircuitOpenError:
+                if the client's circuit breaker is open.
+        """
+        if client is None:
+            client = self.client
+        self._raise_if_circuit_open(client)
+
+        plan = _CommitPlan(self, partial_success)
+        try:
+            for entries in plan:
+                request_entries, kwargs = self._make_request(client, entries)
+                try:
+                    await client.async_logging_api.write_entries(
+                        request_entries, partial_success=partial_success, **kwargs
+                    )
+                except GoogleAPICallError as e:
+                    if not plan.failed(e):
+                        raise
+                else:
+                    plan.written()
+        finally:
+            plan.finish()
+        if plan.error is not None:
+            raise plan.error
@@ -0,0 +1,243 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""JSON serialization of log entries.
+
+Used for the body of the requests of the HTTP transport, the lines written
+by :class:`~logging_v2.handlers.structured_log.StructuredLogHandler`, and
+the fields that :class:`~logging_v2.handlers.handlers.CloudLoggingFilter`
+adds to log records.
+
+The backend is the standard :mod:`json` module, unless ``orjson`` or
+``ujson`` is chosen with :func:`set_backend`, which are faster but write
+slightly different JSON: without spaces after separators, and with
+``orjson``, NaN and infinities as ``null``. Whatever the backend, datetimes
+are written in ISO 8601 format, decimals as numbers, and NumPy arrays and
+scalars as lists and numbers. A value that a faster backend cannot
+serialize, such as an integer over 64 bits, is serialized with :mod:`json`
+instead.
+"""
+
+import datetime
+import decimal
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: NO COVER
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: NO COVER
+    ujson = None
+
+ORJSON = "orjson"
+"""Serialize with ``orjson``."""
+
+UJSON = "ujson"
+"""Serialize with ``ujson``."""
+
+JSON = "json"
+"""Serialize with the standard :mod:`json` module."""
+
+_MIN_UJSON_VERSION = "5.4.0"
+
+
+def default(value):
+    """Converts a value that JSON has no type for.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        Any: A value that can be serialized.
+
+    Raises:
+        TypeError: If the value cannot be converted.
+    """
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if type(value).__module__ == "numpy" and hasattr(value, "tolist"):
+        # arrays become lists, scalars become Python numbers
+        return value.tolist()
+    raise TypeError(
+        "Object of type %s is not JSON serializable" % (type(value).__name__,)
+    )
+
+
+def default_or_str(value):
+    """Converts a value as by :func:`default`, or to its string otherwise.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        Any: A value that can be serialized.
+    """
+    try:
+        return default(value)
+    except TypeError:
+        return str(value)
+
+
+class _JsonBackend(object):
+    name = JSON
+
+    @staticmethod
+    def dumps(value, default):
+        return json.dumps(value, ensure_ascii=False, default=default)
+
+
+class _OrjsonBackend(object):
+    name = ORJSON
+
+    @staticmethod
+    def dumps_bytes(value, default):
+        return orjson.dumps(
+            value,
+            default=default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+    def dumps(self, value, default):
+        return self.dumps_bytes(value, default).decode("utf-8")
+
+
+class _UjsonBackend(object):
+    name = UJSON
+
+    @staticmethod
+    def dumps(value, default):
+        return ujson.dumps(
+            value, ensure_ascii=False, escape_forward_slashes=False, default=default
+        )
+
+
+def _supports_default(backend):
+    """Whether a backend accepts ``default``, which older versions of
+    ``ujson`` do not."""
+    try:
+        backend.dumps(object(), lambda value: None)
+    except TypeError:
+        return False
+    return True
+
+
+def _make_backend(name=None):
+    """Returns the backend of a name, or the fastest installed one if None."""
+    if name is None:
+        name = ORJSON if orjson is not None else UJSON if ujson is not None else JSON
+    if name == ORJSON and orjson is not None:
+        return _OrjsonBackend()
+    if name == UJSON and ujson is not None:
+        backend = _UjsonBackend()
+        if not _supports_default(backend):
+            raise ValueError(
+                "ujson %s is too old: version %s or later is required."
+                % (getattr(ujson, "__version__", "?"), _MIN_UJSON_VERSION)
+            )
+        return backend
+    if name == JSON:
+        return _JsonBackend()
+    raise ValueError("JSON backend %r is not available." % (name,))
+
+
+_backend = _JsonBackend()
+_fallback = _backend
+
+
+def set_backend(name=None):
+    """Sets the backend used to serialize JSON.
+
+    The standard :mod:`json` module is used until this is called.
+
+    Args:
+        name (Optional[str]): :data:`ORJSON`, :data:`UJSON` or :data:`JSON`.
+            If ``None``, the fastest installed backend is used.
+
+    Raises:
+        ValueError: If the backend is not installed, or its version is too
+            old to be used.
+    """
+    global _backend
+    _backend = _make_backend(name)
+
+
+def get_backend():
+    """Returns the name of the backend used to serialize JSON.
+
+    Returns:
+        str: :data:`ORJSON`, :data:`UJSON` or :data:`JSON`.
+    """
+    return _backend.name
+
+
+def dumps(value, default=default):
+    """Serializes a value to a JSON string.
+
+    Non-ASCII characters are written as is.
+
+    Args:
+        value (Any): The value.
+        default (Optional[Callable[[Any], Any]]): Converts a value that JSON
+            has no type for. Defaults to :func:`default`; pass
+            :func:`default_or_str` to write any other value as a string.
+
+    Returns:
+        str: The JSON string.
+
+    Raises:
+        TypeError: If the value cannot be serialized.
+        ValueError: If the value contains a circular reference.
+    """
+    backend = _backend
+    if backend.name != JSON:
+        try:
+            return backend.dumps(value, default)
+        except (TypeError, ValueError, OverflowError):
+            pass
+    return _fallback.dumps(value, default)
+
+
+def dumps_bytes(value, default=default):
+    """Serializes a value to UTF-8 encoded JSON, as by :func:`dumps`.
+
+    A string with a lone surrogate is written as an escape sequence.
+
+    Args:
+        value (Any): The value.
+        default (Optional[Callable[[Any], Any]]): Converts a value that JSON
+            has no type for, as for :func:`dumps`.
+
+    Returns:
+        bytes: The encoded JSON.
+    """
+    backend = _backend
+    if backend.name == ORJSON:
+        try:
+            # orjson writes bytes, so they are not decoded and re-encoded
+            return backend.dumps_bytes(value, default)
+        except (TypeError, ValueError, OverflowError):
+            text = _fallback.dumps(value, default)
+    else:
+        text = dumps(value, default)
+    try:
+        return text.encode("utf-8")
+    except UnicodeEncodeError:
+        # lone surrogates, as decoded with "surrogateescape", cannot be
+        # encoded: they are written as escape sequences instead
+        return json.dumps(value, default=default).encode("ascii")
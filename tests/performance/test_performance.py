@@ -13,10 +13,14 @@
 # limitations under the License.
 
 import logging
+import os
 import unittest
 import mock
+import shutil
+import tempfile
 import time
 import io
+import tracemalloc
 
 import pandas as pd
 import cProfile
@@ -31,6 +35,11 @@ from google.cloud.logging_v2.services.logging_service_v2.transports import (
 )
 from google.cloud.logging_v2.handlers.transports import BackgroundThreadTransport
 from google.cloud.logging_v2.handlers.transports import SyncTransport
+from google.cloud.logging_v2.handlers.transports.background_thread import _Worker
+from google.cloud.logging_v2.handlers.transports.uploader import SharedUploader
+from google.cloud.logging_v2.handlers.transports.uploader import (
+    SharedUploaderTransport,
+)
 from google.cloud.logging.handlers import CloudLoggingHandler
 from google.cloud.logging.handlers import StructuredLogHandler
 from google.cloud.logging_v2._http import _LoggingAPI
@@ -346,3 +355,103 @@ class TestPerformance(unittest.TestCase):
         # print results dataframe
         total_time = self._print_results(pr, results, time_limit, "Batch.Log")
         self.assertLessEqual(total_time, time_limit)
+
+    def test_shared_uploader_performance(self, time_limit=2):
+        """
+        Test the performance of handing entries over to a SharedUploader
+
+        tested variations:
+        - Unix domain socket vs shared-memory ring buffer
+        - text vs json payloads
+        """
+        results = []
+        pr = cProfile.Profile()
+
+        def profiled_code(transport, payload, num_logs=1000):
+            record = logging.LogRecord(
+                "uploader", logging.ERROR, None, 0, payload, None, None
+            )
+            for i in range(num_logs):
+                transport.send(record, payload)
+
+        # Unix socket paths are limited to about 100 characters
+        directory = tempfile.mkdtemp(dir="/tmp")
+        self.addCleanup(shutil.rmtree, directory)
+        client, _ = _make_client(mock_network=True, use_grpc=False)
+        for handover, ring in [("socket", False), ("ring", True)]:
+            address = os.path.join(directory, f"{handover}.sock")
+            ring_path = address + ".ring" if ring else None
+            uploader = SharedUploader(client, address, ring_path=ring_path)
+            uploader.start()
+            transport = SharedUploaderTransport(
+                client, "uploader", address=address, ring_path=ring_path
+            )
+            for payload_type, payload in [
+                ("text", _small_text_payload),
+                ("json", _small_json_payload),
+            ]:
+                exec_time, _ = instrument_function(transport, payload, profiler=pr)(
+                    profiled_code
+                )
+                result_dict = {
+                    "payload_type": payload_type,
+                    "handover": handover,
+                    "exec_time": exec_time,
+                }
+                results.append(result_dict)
+            transport.close()
+            uploader.close()
+        # print results dataframe
+        total_time = self._print_results(pr, results, time_limit, "SharedUploader")
+        self.assertLessEqual(total_time, time_limit)
+
+    def test_queued_entry_memory(self, memory_limit=1024):
+        """
+        Test the memory taken by each entry waiting in the background queue
+
+        tested variations:
+        - text vs json payloads
+        """
+        results = []
+        num_logs = 10000
+        client, cloud_logger = _make_client(mock_network=True)
+        handler = CloudLoggingHandler(client, transport=SyncTransport)
+        for payload_type, payload in [
+            ("text", _small_text_payload),
+            ("json", _small_json_payload),
+        ]:
+            # the worker is not started, so the entries stay in its queue
+            worker = _Worker(cloud_logger)
+            records = [
+                logging.LogRecord("memory", logging.ERROR, None, 0, payload, None, None)
+                for i in range(num_logs)
+            ]
+            for record in records:
+                handler.filter(record)
+            tracemalloc.start()
+            for record in records:
+                message, kwargs = handler._prepare_send(record)
+                worker.enqueue(record, message, **kwargs)
+            queued_bytes, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.assertEqual(worker._queue.qsize(), num_logs)
+            result_dict = {
+                "payload_type": payload_type,
+                "bytes_per_entry": queued_bytes / num_logs,
+            }
+            results.append(result_dict)
+        # print results dataframe
+        print()
+        rich.print(Panel("[blue]Queued Entry Memory Performance Tests"))
+        results_df = pd.DataFrame(results)
+        print(results_df)
+        max_bytes = results_df["bytes_per_entry"].max()
+        if max_bytes <= memory_limit:
+            rich.print(
+                f"Max Bytes per Entry:[green] {max_bytes:.0f} (limit: {memory_limit}) \u2705"
+            )
+        else:
+            rich.print(
+                f"Max Bytes per Entry:[red] {max_bytes:.0f} (limit: {memory_limit}) \u274c"
+            )
+        self.assertLessEqual(max_bytes, memory_limit)
@@ -91,7 +91,7 @@ class TestCloudLoggingFilter(unittest.TestCase):
 
         self.assertEqual(record.msg, message)
         self.assertEqual(record._source_location, expected_location)
-        self.assertEqual(record._source_location_str, json.dumps(expected_location))
+        self.assertEqual(json.loads(record._source_location_str), expected_location)
         self.assertIsNone(record._resource)
         self.assertIsNone(record._trace)
         self.assertEqual(record._trace_str, "")
@@ -102,7 +102,7 @@ class TestCloudLoggingFilter(unittest.TestCase):
         self.assertIsNone(record._http_request)
         self.assertEqual(record._http_request_str, "{}")
         self.assertEqual(record._labels, expected_label)
-        self.assertEqual(record._labels_str, json.dumps(expected_label))
+        self.assertEqual(json.loads(record._labels_str), expected_label)
 
     def test_minimal_record(self):
         """
@@ -189,7 +189,7 @@ class TestCloudLoggingFilter(unittest.TestCase):
             self.assertTrue(record._trace_sampled)
             self.assertEqual(record._trace_sampled_str, "true")
             self.assertEqual(record._http_request, expected_request)
-            self.assertEqual(record._http_request_str, json.dumps(expected_request))
+            self.assertEqual(json.loads(record._http_request_str), expected_request)
 
     def test_record_with_traceparent_request(self):
         """
@@ -236,7 +236,7 @@ class TestCloudLoggingFilter(unittest.TestCase):
             self.assertTrue(record._trace_sampled)
             self.assertEqual(record._trace_sampled_str, "true")
             self.assertEqual(record._http_request, expected_request)
-            self.assertEqual(record._http_request_str, json.dumps(expected_request))
+            self.assertEqual(json.loads(record._http_request_str), expected_request)
 
     def test_record_with_opentelemetry_span_no_request(self):
         filter_obj = self._make_one()
@@ -308,7 +308,7 @@ class TestCloudLoggingFilter(unittest.TestCase):
                 self.assertEqual(record._trace_sampled_str, "true")
 
                 self.assertEqual(record._http_request, expected_request)
-                self.assertEqual(record._http_request_str, json.dumps(expected_request))
+                self.assertEqual(json.loads(record._http_request_str), expected_request)
 
     def test_record_with_opentelemetry_span_and_request_with_overrides(self):
         """
@@ -366,7 +366,7 @@ class TestCloudLoggingFilter(unittest.TestCase):
                 )
 
                 self.assertEqual(record._http_request, expected_request)
-                self.assertEqual(record._http_request_str, json.dumps(expected_request))
+                self.assertEqual(json.loads(record._http_request_str), expected_request)
 
     def test_user_overrides(self):
         """
@@ -423,11 +423,11 @@ class TestCloudLoggingFilter(unittest.TestCase):
             self.assertEqual(record._span_id_str, overwritten_span)
             self.assertEqual(record._http_request, overwritten_request_object)
             self.assertEqual(
-                record._http_request_str, json.dumps(overwritten_request_object)
+                json.loads(record._http_request_str), overwritten_request_object
             )
             self.assertEqual(record._source_location, overwritten_source_location)
             self.assertEqual(
-                record._source_location_str, json.dumps(overwritten_source_location)
+                json.loads(record._source_location_str), overwritten_source_location
             )
             self.assertEqual(record._resource, overwritten_resource)
 
@@ -887,6 +887,107 @@ class TestCloudLoggingHandler(unittest.TestCase):
             ),
         )
 
+    def test_emit_deferred(self):
+        from google.cloud.logging_v2.logger import _GLOBAL_RESOURCE
+
+        client = _Client(self.PROJECT)
+        handler = self._make_one(
+            client,
+            transport=_DeferredTransport,
+            resource=_GLOBAL_RESOURCE,
+            deferred=True,
+        )
+        logname = "loggername"
+        record = logging.LogRecord(
+            logname, logging.INFO, None, None, "name: %s", ("Daniel",), None
+        )
+        handler.handle(record)
+
+        # nothing is formatted on the logging thread
+        self.assertFalse(hasattr(handler.transport, "send_called_with"))
+        snapshot, prepare = handler.transport.send_deferred_called_with
+        self.assertIsNot(snapshot, record)
+        self.assertEqual(snapshot.args, ("Daniel",))
+
+        message, kwargs = prepare(snapshot)
+        self.assertEqual(message, "name: Daniel")
+        self.assertEqual(
+            kwargs,
+            {
+                "resource": _GLOBAL_RESOURCE,
+                "labels": {"python_logger": logname},
+                "trace": None,
+                "span_id": None,
+                "trace_sampled": False,
+                "http_request": None,
+                "source_location": None,
+            },
+        )
+
+    def test_emit_deferred_unsupported_transport(self):
+        from google.cloud.logging_v2.logger import _GLOBAL_RESOURCE
+
+        client = _Client(self.PROJECT)
+        handler = self._make_one(
+            client,
+            transport=_Transport,
+            resource=_GLOBAL_RESOURCE,
+            deferred=True,
+        )
+        record = logging.LogRecord(None, logging.INFO, None, None, "hi", None, None)
+        handler.handle(record)
+
+        self.assertEqual(handler.transport.send_called_with[:2], (record, "hi"))
+
+    def test_flush_with_timeout(self):
+        from google.cloud.logging_v2.handlers.transports import FlushResult
+        from google.cloud.logging_v2.logger import _GLOBAL_RESOURCE
+
+        client = _Client(self.PROJECT)
+        handler = self._make_one(
+            client, transport=_Transport, resource=_GLOBAL_RESOURCE
+        )
+        expected = FlushResult(sent=2, failed=1, pending=0, elapsed=0.5)
+        handler.transport.flush = mock.Mock(return_value=expected)
+
+        result = handler.flush(timeout=3)
+
+        handler.transport.flush.assert_called_once_with(timeout=3)
+        self.assertIs(result, expected)
+
+    def test_flush_transport_without_result(self):
+        from google.cloud.logging_v2.handlers.transports import FlushResult
+        from google.cloud.logging_v2.logger import _GLOBAL_RESOURCE
+
+        client = _Client(self.PROJECT)
+        handler = self._make_one(
+            client, transport=_Transport, resource=_GLOBAL_RESOURCE
+        )
+        handler.transport.flush = mock.Mock(return_value=None)
+
+        result = handler.flush()
+
+        handler.transport.flush.assert_called_once_with()
+        self.assertIsInstance(result, FlushResult)
+        self.assertEqual(result[:3], (0, 0, 0))
+        self.assertTrue(result.completed)
+
+    def test_stats(self):
+        from google.cloud.logging_v2.logger import _GLOBAL_RESOURCE
+
+        client = _Client(self.PROJECT)
+        handler = self._make_one(
+            client, transport=_Transport, resource=_GLOBAL_RESOURCE
+        )
+        # the transport does not keep statistics
+        self.assertEqual(handler.stats(), {})
+
+        handler.transport.stats = mock.Mock(return_value={"queue_depth": 1})
+        self.assertEqual(handler.stats(), {"queue_depth": 1})
+
+        handler.close()
+        self.assertEqual(handler.stats(), {})
+
     def test_close(self):
         from google.cloud.logging_v2.logger import _GLOBAL_RESOURCE
 
@@ -906,6 +1007,60 @@ class TestCloudLoggingHandler(unittest.TestCase):
         self.assertFalse(handler._transport_open)
 
 
+class TestSnapshotRecord(unittest.TestCase):
+    @staticmethod
+    def _call_fut(record):
+        from google.cloud.logging_v2.handlers.handlers import _snapshot_record
+
+        return _snapshot_record(record)
+
+    def test_immutable_args_kept(self):
+        record = logging.LogRecord(
+            "name", logging.INFO, None, None, "%s %d", ("a", 1), None
+        )
+        record._labels = {"python_logger": "name"}
+
+        snapshot = self._call_fut(record)
+
+        self.assertIsNot(snapshot, record)
+        self.assertEqual(snapshot.msg, "%s %d")
+        self.assertEqual(snapshot.args, ("a", 1))
+        self.assertEqual(snapshot.created, record.created)
+        self.assertIs(snapshot._labels, record._labels)
+
+    def test_mutable_args_rendered(self):
+        items = ["a"]
+        record = logging.LogRecord(
+            "name", logging.INFO, None, None, "%s", (items,), None
+        )
+
+        snapshot = self._call_fut(record)
+        items.append("b")
+
+        self.assertEqual(snapshot.getMessage(), "['a']")
+        self.assertIsNone(snapshot.args)
+
+    def test_mapping_args(self):
+        record = logging.LogRecord(
+            "name", logging.INFO, None, None, "%(a)s", ({"a": []},), None
+        )
+
+        snapshot = self._call_fut(record)
+
+        self.assertEqual(snapshot.msg, "[]")
+
+    def test_dict_message_copied(self):
+        message = {"key": "value"}
+        record = logging.LogRecord(
+            "name", logging.INFO, None, None, message, None, None
+        )
+
+        snapshot = self._call_fut(record)
+        message["key"] = "changed"
+
+        self.assertEqual(snapshot.msg, {"key": "value"})
+
+
 class TestFormatAndParseMessage(unittest.TestCase):
     def test_none(self):
         """
@@ -1242,3 +1397,8 @@ class _Transport(object):
 
     def close(self):
         self.close_called = True
+
+
+class _DeferredTransport(_Transport):
+    def send_deferred(self, record, prepare):
+        self.send_deferred_called_with = (record, prepare)
@@ -313,11 +313,11 @@ class TestStructuredLogHandler(unittest.TestCase):
         """
         Handler should parse json encoded as a string
         """
+        import json
         import logging
 
         handler = self._make_one()
         message = {"x": "test"}
-        expected_result = '"x": "test"'
         record = logging.LogRecord(
             "logname",
             logging.INFO,
@@ -329,20 +329,44 @@ class TestStructuredLogHandler(unittest.TestCase):
         )
         record.created = None
         handler.filter(record)
-        result = handler.format(record)
-        self.assertIn(expected_result, result)
+        result = json.loads(handler.format(record))
+        self.assertEqual(result["x"], "test")
         self.assertNotIn("message", result)
 
+    def test_dict_w_datetime(self):
+        """
+        Handler should serialize datetimes in a dict message
+        """
+        import datetime
+        import json
+        import logging
+
+        handler = self._make_one()
+        message = {"when": datetime.datetime(2026, 1, 2, 3, 4, 5)}
+        record = logging.LogRecord(
+            "logname",
+            logging.INFO,
+            None,
+            None,
+            message,
+            None,
+            None,
+        )
+        record.created = None
+        handler.filter(record)
+        result = json.loads(handler.format(record))
+        self.assertEqual(result["when"], "2026-01-02T03:04:05")
+
     def test_encoded_json(self):
         """
         Handler should parse json encoded as a string
         """
+        import json
         import logging
 
         handler = self._make_one()
         logFormatter = logging.Formatter(fmt='{ "name" : "%(name)s" }')
         handler.setFormatter(logFormatter)
-        expected_result = '"name": "logname"'
         record = logging.LogRecord(
             "logname",
             logging.INFO,
@@ -354,8 +378,8 @@ class TestStructuredLogHandler(unittest.TestCase):
         )
         record.created = None
         handler.filter(record)
-        result = handler.format(record)
-        self.assertIn(expected_result, result)
+        result = json.loads(handler.format(record))
+        self.assertEqual(result["name"], "logname")
         self.assertNotIn("message", result)
 
     def test_format_with_arguments(self):
@@ -0,0 +1,213 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+import mock
+
+
+class Test_RingBuffer(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, "ring")
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.logging_v2.handlers.transports._ring import _RingBuffer
+
+        return _RingBuffer
+
+    def _make_one(self, **kw):
+        ring = self._get_target_class()(self.path, **kw)
+        self.addCleanup(ring.close)
+        return ring
+
+    def test_put_get_many(self):
+        consumer = self._make_one(capacity=1024)
+        producer = self._make_one()
+
+        self.assertTrue(producer.put(b"1"))
+        self.assertTrue(producer.put(b"22"))
+        self.assertGreater(consumer.pending_bytes, 0)
+
+        self.assertEqual(consumer.get_many(max_records=1), [b"1"])
+        self.assertEqual(consumer.get_many(), [b"22"])
+        self.assertEqual(consumer.get_many(), [])
+        self.assertEqual(consumer.pending_bytes, 0)
+
+    def test_open_missing(self):
+        with self.assertRaises(FileNotFoundError):
+            self._make_one()
+
+    def test_open_not_a_ring(self):
+        with open(self.path, "wb") as file_:
+            file_.write(b"\0" * 100)
+
+        with self.assertRaises(ValueError):
+            self._make_one()
+
+    def test_wrap_around(self):
+        from google.cloud.logging_v2.handlers.transports._ring import _RECORD_HEADER
+
+        record_size = _RECORD_HEADER.size + 10
+        # the third record crosses the end of the data region
+        ring = self._make_one(capacity=record_size * 2 + 5)
+
+        received = []
+        for n in range(10):
+            payload = str(n).encode() * 10
+            self.assertTrue(ring.put(payload))
+            received.extend(ring.get_many())
+
+        self.assertEqual(received, [str(n).encode() * 10 for n in range(10)])
+
+    def test_overflow(self):
+        from google.cloud.logging_v2.handlers.transports._ring import _RECORD_HEADER
+
+        ring = self._make_one(capacity=(_RECORD_HEADER.size + 4) * 2)
+
+        self.assertTrue(ring.put(b"1111"))
+        self.assertTrue(ring.put(b"2222"))
+        self.assertFalse(ring.put(b"3333"))
+        self.assertFalse(ring.put(b"44"))
+
+        self.assertEqual(ring.dropped_records, 2)
+        self.assertEqual(ring.dropped_bytes, 6)
+        self.assertEqual(ring.get_many(), [b"1111", b"2222"])
+        # space is reclaimed once read
+        self.assertTrue(ring.put(b"5555"))
+
+    def test_records_kept_for_next_consumer(self):
+        ring = self._make_one(capacity=1024)
+        ring.put(b"1")
+        ring.close()
+
+        ring = self._make_one(capacity=1024)
+
+        self.assertEqual(ring.get_many(), [b"1"])
+
+    def test_capacity_changed(self):
+        ring = self._make_one(capacity=1024)
+        ring.put(b"1")
+        ring.close()
+
+        ring = self._make_one(capacity=2048)
+
+        self.assertEqual(ring.capacity, 2048)
+        self.assertEqual(ring.get_many(), [])
+
+    def test_consumer_restarted_with_producer_attached(self):
+        consumer = self._make_one(capacity=1024)
+        producer = self._make_one()
+        self.assertTrue(producer.put(b"1"))
+        consumer.close()
+
+        # the new consumer recreates the file with another capacity
+        consumer = self._make_one(capacity=2048)
+        self.assertTrue(producer.put(b"2"))
+
+        self.assertEqual(producer.capacity, 2048)
+        self.assertEqual(consumer.get_many(), [b"2"])
+
+    def test_put_from_threads_while_reopening(self):
+        consumer = self._make_one(capacity=1024)
+        producer = self._make_one()
+        consumer.close()
+        consumer = self._make_one(capacity=2048)
+        reopen = producer._reopen
+        threads = []
+        results = []
+
+        def reopen_with_concurrent_put():
+            # another thread puts while the replaced file is being closed
+            thread = threading.Thread(target=lambda: results.append(producer.put(b"2")))
+            threads.append(thread)
+            thread.start()
+            thread.join(0.1)
+            reopen()
+
+        with mock.patch.object(producer, "_reopen", reopen_with_concurrent_put):
+            self.assertTrue(producer.put(b"1"))
+        threads[0].join()
+
+        self.assertEqual(results, [True])
+        self.assertEqual(consumer.get_many(), [b"1", b"2"])
+
+    def test_created_private(self):
+        self._make_one(capacity=1024)
+
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+        # no temporary file is left behind
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["ring"])
+
+    def test_open_owned_by_another_user(self):
+        self._make_one(capacity=1024)
+
+        with mock.patch("os.getuid", return_value=os.getuid() + 1):
+            with self.assertRaises(PermissionError):
+                self._make_one()
+
+    def test_corrupted_sequence(self):
+        from google.cloud.logging_v2.handlers.transports import _ring
+
+        ring = self._make_one(capacity=1024)
+        ring.put(b"1")
+        ring.put(b"2")
+        # overwrite the sequence number of the first record
+        _ring._RECORD_HEADER.pack_into(ring._mmap, _ring._HEADER.size, 1, 7)
+
+        with self.assertLogs(_ring.__name__, "ERROR"):
+            self.assertEqual(ring.get_many(), [])
+        ring.put(b"3")
+        self.assertEqual(ring.get_many(), [b"3"])
+
+    def test_producer_processes(self):
+        ring = self._make_one(capacity=64 * 1024)
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(target=_produce, args=(self.path, name, 100))
+            for name in ("a", "b", "c")
+        ]
+        for process in processes:
+            process.start()
+        received = []
+        while any(process.is_alive() for process in processes):
+            received.extend(ring.get_many())
+        for process in processes:
+            process.join()
+        received.extend(ring.get_many())
+
+        self.assertEqual(len(received), 300)
+        for name in ("a", "b", "c"):
+            records = [
+                record for record in received if record.startswith(name.encode())
+            ]
+            # each producer's records are received in order
+            self.assertEqual(records, [f"{name}{n}".encode() for n in range(100)])
+
+
+def _produce(path, name, count):
+    from google.cloud.logging_v2.handlers.transports._ring import _RingBuffer
+
+    ring = _RingBuffer(path)
+    for n in range(count):
+        while not ring.put(f"{name}{n}".encode()):
+            pass
+    ring.close()
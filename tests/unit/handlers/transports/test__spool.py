@@ -0,0 +1,152 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class Test_Spool(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.logging_v2.handlers.transports._spool import _Spool
+
+        return _Spool
+
+    def _make_one(self, **kw):
+        spool = self._get_target_class()(self.directory, **kw)
+        self.addCleanup(spool.close)
+        return spool
+
+    def _segments(self):
+        return sorted(name for name in os.listdir(self.directory) if ".seg" in name)
+
+    def test_empty(self):
+        spool = self._make_one()
+
+        self.assertEqual(spool.peek(), (None, None))
+        self.assertEqual(spool.pending_bytes, 0)
+
+    def test_append_peek_ack(self):
+        spool = self._make_one()
+
+        self.assertTrue(spool.append({"n": 1}))
+        self.assertTrue(spool.append({"n": 2}))
+        self.assertGreater(spool.pending_bytes, 0)
+
+        record, cursor = spool.peek()
+        self.assertEqual(record, {"n": 1})
+        # peeking again returns the same record until it is acknowledged
+        self.assertEqual(spool.peek(), (record, cursor))
+
+        spool.ack(cursor)
+        record, cursor = spool.peek()
+        self.assertEqual(record, {"n": 2})
+
+        spool.ack(cursor)
+        self.assertEqual(spool.peek(), (None, None))
+        self.assertEqual(spool.pending_bytes, 0)
+
+    def test_ack_stale_cursor(self):
+        spool = self._make_one()
+        spool.append({"n": 1})
+        spool.append({"n": 2})
+        _, cursor = spool.peek()
+        spool.ack(cursor)
+
+        spool.ack(cursor)
+
+        self.assertEqual(spool.peek()[0], {"n": 2})
+
+    def test_max_bytes(self):
+        spool = self._make_one(max_bytes=100)
+
+        self.assertTrue(spool.append({"message": "x" * 50}))
+        self.assertFalse(spool.append({"message": "x" * 50}))
+
+        spool.ack(spool.peek()[1])
+        self.assertTrue(spool.append({"message": "x" * 50}))
+
+    def test_rotation_and_compaction(self):
+        spool = self._make_one(segment_bytes=1)
+
+        for n in range(3):
+            spool.append({"n": n})
+        self.assertEqual(len(self._segments()), 3)
+
+        for n in range(3):
+            record, cursor = spool.peek()
+            self.assertEqual(record, {"n": n})
+            spool.ack(cursor)
+
+        # fully acknowledged segments are deleted, except the active one
+        self.assertEqual(len(self._segments()), 1)
+        self.assertEqual(spool.pending_bytes, 0)
+
+    def test_replay_after_reopen(self):
+        spool = self._make_one()
+        for n in range(3):
+            spool.append({"n": n})
+        spool.ack(spool.peek()[1])
+        spool.close()
+
+        spool = self._make_one()
+        # records are not appended to segments left by the previous process
+        spool.append({"n": 3})
+
+        replayed = []
+        while True:
+            record, cursor = spool.peek()
+            if record is None:
+                break
+            replayed.append(record["n"])
+            spool.ack(cursor)
+
+        self.assertEqual(replayed, [1, 2, 3])
+        self.assertEqual(spool.pending_bytes, 0)
+        self.assertEqual(len(self._segments()), 1)
+
+    def test_torn_record_skipped(self):
+        spool = self._make_one()
+        spool.append({"n": 1})
+        spool.append({"n": 2})
+        spool.close()
+        (segment,) = self._segments()
+        path = os.path.join(self.directory, segment)
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) - 3)
+
+        spool = self._make_one()
+        spool.append({"n": 3})
+
+        record, cursor = spool.peek()
+        self.assertEqual(record, {"n": 1})
+        spool.ack(cursor)
+        # the rest of the torn segment is skipped
+        record, cursor = spool.peek()
+        self.assertEqual(record, {"n": 3})
+        spool.ack(cursor)
+        self.assertEqual(spool.peek(), (None, None))
+        self.assertEqual(spool.pending_bytes, 0)
+
+    def test_directory_locked(self):
+        self._make_one()
+
+        with self.assertRaises(ValueError):
+            self._get_target_class()(self.directory)
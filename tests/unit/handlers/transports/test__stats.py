@@ -0,0 +1,118 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+
+class Test_Histogram(unittest.TestCase):
+    @staticmethod
+    def _make_one():
+        from google.cloud.logging_v2.handlers.transports._stats import _Histogram
+
+        return _Histogram()
+
+    def test_snapshot(self):
+        histogram = self._make_one()
+        for value in (0, 1, 2, 3, 4, 5, 1000):
+            histogram.add(value)
+
+        self.assertEqual(
+            histogram.snapshot(),
+            {"count": 7, "sum": 1015, "buckets": {1: 2, 2: 1, 4: 2, 8: 1, 1024: 1}},
+        )
+
+    def test_snapshot_empty(self):
+        self.assertEqual(
+            self._make_one().snapshot(), {"count": 0, "sum": 0, "buckets": {}}
+        )
+
+
+class Test_Window(unittest.TestCase):
+    @staticmethod
+    def _make_one(**kw):
+        from google.cloud.logging_v2.handlers.transports._stats import _Window
+
+        return _Window(**kw)
+
+    def test_snapshot(self):
+        window = self._make_one()
+        for value in range(100, 0, -1):
+            window.add(value / 100)
+
+        self.assertEqual(
+            window.snapshot(),
+            {"count": 100, "p50": 0.5, "p90": 0.9, "p99": 0.99, "max": 1.0},
+        )
+
+    def test_snapshot_empty(self):
+        self.assertEqual(
+            self._make_one().snapshot(),
+            {"count": 0, "p50": None, "p90": None, "p99": None, "max": None},
+        )
+
+    def test_recent_values(self):
+        window = self._make_one(size=2)
+        for value in (10.0, 1.0, 2.0):
+            window.add(value)
+
+        snapshot = window.snapshot()
+
+        self.assertEqual(snapshot["count"], 3)
+        self.assertEqual(snapshot["max"], 2.0)
+
+
+class Test_WorkerStats(unittest.TestCase):
+    @staticmethod
+    def _make_one(**kw):
+        from google.cloud.logging_v2.handlers.transports._stats import _WorkerStats
+
+        return _WorkerStats(**kw)
+
+    def test_snapshot(self):
+        stats = self._make_one()
+        stats.on_outcome(sent=3)
+        stats.on_outcome(failed=1)
+        stats.on_batch(size=4, nbytes=400)
+        stats.on_commit(latency=0.25, lag=1.5)
+        stats.on_commit(latency=0.5)
+
+        snapshot = stats.snapshot()
+
+        self.assertEqual(stats.outcomes(), (3, 1))
+        self.assertEqual(snapshot["committed"], 3)
+        self.assertEqual(snapshot["failed"], 1)
+        self.assertEqual(snapshot["batch_size"]["buckets"], {4: 1})
+        self.assertEqual(snapshot["batch_bytes"]["sum"], 400)
+        self.assertEqual(snapshot["commit_latency"]["count"], 2)
+        self.assertEqual(snapshot["commit_latency"]["max"], 0.5)
+        self.assertEqual(snapshot["lag"]["count"], 1)
+        self.assertEqual(snapshot["lag"]["p50"], 1.5)
+
+    def test_outcomes_by_log_name(self):
+        import collections
+
+        stats = self._make_one(by_log_name=True)
+        stats.on_outcome(
+            sent=3,
+            failed=1,
+            log_names=(
+                collections.Counter({"first": 2, "second": 1}),
+                collections.Counter({"second": 1}),
+            ),
+        )
+
+        self.assertEqual(stats.outcomes(), (3, 1))
+        self.assertEqual(stats.outcomes("first"), (2, 0))
+        self.assertEqual(stats.outcomes("second"), (1, 1))
+        self.assertEqual(stats.outcomes("third"), (0, 0))
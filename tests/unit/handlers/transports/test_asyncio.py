@@ -0,0 +1,340 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import threading
+import unittest
+
+import mock
+
+
+class TestAsyncioTransport(unittest.TestCase):
+    PROJECT = "PROJECT"
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.logging.handlers.transports import AsyncioTransport
+
+        return AsyncioTransport
+
+    def _make_one(self, **kw):
+        client = _Client(self.PROJECT)
+        return self._get_target_class()(client, "python_logger", **kw), client
+
+    @staticmethod
+    def _send(transport, message, levelno=logging.INFO):
+        record = logging.LogRecord("testing", levelno, None, None, message, None, None)
+        transport.send(record, message)
+
+    @staticmethod
+    def _sent_messages(client):
+        return [
+            [entry["textPayload"] for entry in call[0][0]]
+            for call in client.async_logging_api.write_entries.call_args_list
+        ]
+
+    def test_constructor(self):
+        transport, client = self._make_one()
+
+        self.assertIs(transport.client, client)
+        self.assertEqual(transport.logger.name, "python_logger")
+        self.assertIsNone(transport._task)
+
+    def test_send_and_flush(self):
+        transport, client = self._make_one(batch_size=2)
+
+        async def main():
+            for message in ("1", "2", "3"):
+                self._send(transport, message)
+            await transport.flush_async()
+
+        asyncio.run(main())
+
+        self.assertEqual(self._sent_messages(client), [["1", "2"], ["3"]])
+        kwargs = client.async_logging_api.write_entries.call_args[1]
+        self.assertEqual(kwargs["logger_name"], "projects/PROJECT/logs/python_logger")
+        self.assertTrue(kwargs["partial_success"])
+
+    def test_entry_fields(self):
+        from google.cloud.logging_v2._helpers import LogSeverity
+
+        transport, client = self._make_one()
+
+        async def main():
+            self._send(transport, "hello", levelno=logging.ERROR)
+            await transport.flush_async()
+
+        asyncio.run(main())
+
+        (entry,) = client.async_logging_api.write_entries.call_args[0][0]
+        kwargs = client.async_logging_api.write_entries.call_args[1]
+        self.assertEqual(entry["severity"], LogSeverity.ERROR)
+        # the labels of the batch are sent once for all its entries
+        self.assertEqual(kwargs["labels"], {"python_logger": "testing"})
+        self.assertIn("timestamp", entry)
+
+    def test_send_before_loop(self):
+        transport, client = self._make_one()
+        # logged before the event loop runs
+        self._send(transport, "early")
+
+        async def main():
+            self._send(transport, "late")
+            await transport.close_async()
+
+        asyncio.run(main())
+
+        self.assertEqual(self._sent_messages(client), [["early", "late"]])
+        self.assertIsNone(transport._task)
+
+    def test_send_from_other_thread(self):
+        transport, client = self._make_one()
+
+        async def main():
+            self._send(transport, "loop")
+            thread = threading.Thread(target=self._send, args=(transport, "thread"))
+            thread.start()
+            thread.join()
+            # let the hand-over callback run
+            await asyncio.sleep(0)
+            await transport.flush_async()
+
+        asyncio.run(main())
+
+        self.assertEqual(sum(self._sent_messages(client), []), ["loop", "thread"])
+
+    def test_max_inflight_commits(self):
+        transport, client = self._make_one(batch_size=1, max_inflight_commits=2)
+        inflight = []
+        peak = []
+
+        async def write_entries(entries, **kwargs):
+            inflight.append(entries)
+            peak.append(len(inflight))
+            await asyncio.sleep(0.01)
+            inflight.remove(entries)
+
+        client.async_logging_api.write_entries.side_effect = write_entries
+
+        async def main():
+            for message in "12345":
+                self._send(transport, message)
+            await transport.flush_async()
+
+        asyncio.run(main())
+
+        self.assertEqual(max(peak), 2)
+        self.assertEqual(client.async_logging_api.write_entries.call_count, 5)
+
+    def test_max_latency(self):
+        transport, client = self._make_one(batch_size=10, max_latency=0.05)
+
+        async def main():
+            self._send(transport, "1")
+            await asyncio.sleep(0.01)
+            self._send(transport, "2")
+            await transport.flush_async()
+
+        asyncio.run(main())
+
+        self.assertEqual(self._sent_messages(client), [["1", "2"]])
+
+    def test_max_queue_size(self):
+        transport, client = self._make_one(max_queue_size=1)
+        self._send(transport, "1")
+        self._send(transport, "2")
+
+        self.assertEqual(transport.dropped_entries, 1)
+
+    def test_commit_error(self):
+        transport, client = self._make_one()
+        client.async_logging_api.write_entries.side_effect = [
+            Exception("failed"),
+            None,
+        ]
+
+        async def main():
+            self._send(transport, "1")
+            await transport.flush_async()
+            self._send(transport, "2")
+            await transport.flush_async()
+
+        with self.assertLogs(
+            "google.cloud.logging_v2.handlers.transports.asyncio", level="ERROR"
+        ):
+            asyncio.run(main())
+
+        self.assertEqual(self._sent_messages(client), [["1"], ["2"]])
+
+    def test_commit_error_making_batch(self):
+        transport, client = self._make_one()
+
+        async def main():
+            self._send(transport, "1")
+            with mock.patch.object(
+                transport.logger, "batch", side_effect=Exception("failed")
+            ):
+                with self.assertLogs(
+                    "google.cloud.logging_v2.handlers.transports.asyncio",
+                    level="ERROR",
+                ):
+                    return await transport.flush_async()
+
+        result = asyncio.run(main())
+
+        client.async_logging_api.write_entries.assert_not_called()
+        self.assertEqual(result[:3], (0, 1, 0))
+
+    def test_send_after_loop_closed(self):
+        transport, client = self._make_one()
+
+        async def main():
+            self._send(transport, "1")
+            await transport.flush_async()
+
+        asyncio.run(main())
+        self._send(transport, "2")
+
+        self.assertEqual(transport.dropped_entries, 1)
+
+    def test_flush_from_other_thread(self):
+        transport, client = self._make_one()
+
+        async def main():
+            self._send(transport, "1")
+            await asyncio.get_running_loop().run_in_executor(None, transport.flush)
+            self.assertEqual(self._sent_messages(client), [["1"]])
+
+        asyncio.run(main())
+
+    def test_flush_while_other_loop_running(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        transport, client = self._make_one(loop=loop)
+        self._send(transport, "1")
+
+        async def main():
+            # the loop of the transport is not running, and cannot be run
+            # from this thread
+            return transport.flush()
+
+        result = asyncio.run(main())
+
+        self.assertEqual(self._sent_messages(client), [["1"]])
+        self.assertEqual(result[:3], (1, 0, 0))
+        transport.close()
+
+    def test_close_stops_loop_thread(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        transport, client = self._make_one(loop=loop, grace_period=0.05)
+        stop = threading.Event()
+        self.addCleanup(stop.set)
+
+        async def write_entries(*args, **kwargs):
+            while not stop.is_set():
+                await asyncio.sleep(0.01)
+
+        client.async_logging_api.write_entries.side_effect = write_entries
+        self._send(transport, "1")
+
+        async def main():
+            transport.flush(timeout=0.05)
+            thread = transport._loop_thread
+            transport.close()
+            return thread
+
+        thread = asyncio.run(main())
+
+        self.assertIsNotNone(thread)
+        self.assertFalse(thread.is_alive())
+        self.assertFalse(loop.is_running())
+        # let the commit and the stopped tasks finish before closing the loop
+        stop.set()
+        loop.run_until_complete(transport.close_async())
+        loop.run_until_complete(asyncio.sleep(0.05))
+
+    def test_flush_without_loop(self):
+        transport, client = self._make_one()
+        self._send(transport, "1")
+
+        result = transport.flush()
+
+        client.async_logging_api.write_entries.assert_not_called()
+        self.assertEqual(result[:3], (0, 0, 1))
+
+    def test_flush_result(self):
+        transport, client = self._make_one(batch_size=1)
+        client.async_logging_api.write_entries.side_effect = [
+            Exception("failed"),
+            None,
+        ]
+
+        async def main():
+            self._send(transport, "1")
+            self._send(transport, "2")
+            with self.assertLogs(
+                "google.cloud.logging_v2.handlers.transports.asyncio", level="ERROR"
+            ):
+                return await transport.flush_async()
+
+        result = asyncio.run(main())
+
+        self.assertEqual(result[:3], (1, 1, 0))
+        self.assertTrue(result.completed)
+
+    def test_flush_timeout(self):
+        transport, client = self._make_one()
+
+        async def write_entries(*args, **kwargs):
+            await asyncio.sleep(1)
+
+        client.async_logging_api.write_entries.side_effect = write_entries
+
+        async def main():
+            self._send(transport, "1")
+            result = await transport.flush_async(timeout=0.01)
+            await transport.close_async()
+            return result
+
+        result = asyncio.run(main())
+
+        self.assertEqual(result[:3], (0, 0, 1))
+        self.assertFalse(result.completed)
+
+    def test_close_after_loop_closed(self):
+        transport, client = self._make_one()
+
+        async def main():
+            self._send(transport, "1")
+
+        asyncio.run(main())
+
+        with mock.patch("sys.stderr") as stderr:
+            transport.close()
+
+        stderr.write.assert_any_call("Failed to send 1 pending logs.")
+
+
+class _Client(object):
+    def __init__(self, project):
+        self.project = project
+        self.async_logging_api = mock.Mock(spec=["write_entries"])
+        self.async_logging_api.write_entries = mock.AsyncMock()
+
+    def async_logger(self, name, resource=None):
+        from google.cloud.logging_v2.logger import AsyncLogger
+
+        return AsyncLogger(name, self, resource=resource)
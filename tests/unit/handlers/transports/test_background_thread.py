@@ -146,6 +146,17 @@ class TestBackgroundThreadHandler(unittest.TestCase):
             span_id=span_id,
         )
 
+    def test_send_deferred(self):
+        client = _Client(self.PROJECT)
+        transport, _ = self._make_one(client, "python_logger")
+        record = logging.LogRecord("mylogger", logging.INFO, None, None, "", None, None)
+        prepare = mock.Mock()
+
+        transport.send_deferred(record, prepare)
+
+        transport.worker.enqueue_deferred.assert_called_once_with(record, prepare)
+        prepare.assert_not_called()
+
     def test_flush(self):
         client = _Client(self.PROJECT)
         name = "python_logger"
@@ -176,6 +187,298 @@ class TestBackgroundThreadHandler(unittest.TestCase):
         self.assertEqual(worker_batch_size, batch_size)
         self.assertEqual(worker_max_latency, max_latency)
 
+    def test_worker_shutdown_options(self):
+        client = _Client(self.PROJECT)
+        transport, worker = self._make_one(
+            client, "python_logger", shutdown_parallelism=8, shutdown_batch_size=500
+        )
+        self.assertEqual(worker.call_args[1]["shutdown_parallelism"], 8)
+        self.assertEqual(worker.call_args[1]["shutdown_batch_size"], 500)
+
+    def test_worker_queue_limits(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        client = _Client(self.PROJECT)
+        transport, worker = self._make_one(
+            client,
+            "python_logger",
+            max_queue_size=100,
+            max_queue_bytes=1024,
+            overflow_policy=background_thread.OVERFLOW_DROP_BELOW_SEVERITY,
+            block_timeout=0.5,
+            overflow_severity="ERROR",
+        )
+        worker_kwargs = worker.call_args[1]
+        self.assertEqual(worker_kwargs["max_queue_size"], 100)
+        self.assertEqual(worker_kwargs["max_queue_bytes"], 1024)
+        self.assertEqual(
+            worker_kwargs["overflow_policy"],
+            background_thread.OVERFLOW_DROP_BELOW_SEVERITY,
+        )
+        self.assertEqual(worker_kwargs["block_timeout"], 0.5)
+        self.assertEqual(worker_kwargs["overflow_severity"], "ERROR")
+
+    def test_worker_max_batch_bytes(self):
+        client = _Client(self.PROJECT)
+        transport, worker = self._make_one(
+            client, "python_logger", batch_size=None, max_batch_bytes=1024
+        )
+        self.assertIsNone(worker.call_args[1]["max_batch_size"])
+        self.assertEqual(worker.call_args[1]["max_batch_bytes"], 1024)
+
+    def test_worker_adaptive(self):
+        client = _Client(self.PROJECT)
+        transport, worker = self._make_one(
+            client, "python_logger", adaptive=True, adaptive_target_latency=0.5
+        )
+        self.assertTrue(worker.call_args[1]["adaptive"])
+        self.assertEqual(worker.call_args[1]["adaptive_target_latency"], 0.5)
+
+        transport.worker.current_batch_size = 4
+        transport.worker.current_max_latency = 0.25
+        self.assertEqual(transport.current_batch_size, 4)
+        self.assertEqual(transport.current_max_latency, 0.25)
+
+    def test_worker_priority_severity(self):
+        client = _Client(self.PROJECT)
+        transport, worker = self._make_one(
+            client, "python_logger", priority_severity="ERROR"
+        )
+        self.assertEqual(worker.call_args[1]["priority_severity"], "ERROR")
+
+    def test_worker_stats(self):
+        client = _Client(self.PROJECT)
+        callback = mock.Mock()
+        transport, worker = self._make_one(
+            client, "python_logger", stats_callback=callback, stats_interval=5
+        )
+        self.assertIs(worker.call_args[1]["stats_callback"], callback)
+        self.assertEqual(worker.call_args[1]["stats_interval"], 5)
+
+        transport.worker.stats.return_value = {"queue_depth": 1}
+        self.assertEqual(transport.stats(), {"queue_depth": 1})
+
+    def test_worker_max_inflight_commits(self):
+        client = _Client(self.PROJECT)
+        transport, worker = self._make_one(
+            client, "python_logger", max_inflight_commits=4
+        )
+        self.assertEqual(worker.call_args[1]["max_inflight_commits"], 4)
+
+    def test_worker_spool(self):
+        import shutil
+        import tempfile
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        client = _Client(self.PROJECT)
+        transport, worker = self._make_one(
+            client, "python_logger", spool_directory=directory, spool_max_bytes=1024
+        )
+        spool = worker.call_args[1]["spool"]
+        self.addCleanup(spool.close)
+        self.assertEqual(spool.directory, directory)
+        self.assertEqual(spool.max_bytes, 1024)
+
+    def test_worker_no_spool(self):
+        client = _Client(self.PROJECT)
+        transport, worker = self._make_one(client, "python_logger")
+        self.assertIsNone(worker.call_args[1]["spool"])
+
+    def test_worker_retry(self):
+        client = _Client(self.PROJECT)
+        transport, worker = self._make_one(
+            client,
+            "python_logger",
+            retry_deadline=10.0,
+            retry_initial_backoff=0.1,
+            retry_max_backoff=2.0,
+        )
+        worker_kwargs = worker.call_args[1]
+        self.assertEqual(worker_kwargs["retry_deadline"], 10.0)
+        self.assertEqual(worker_kwargs["retry_initial_backoff"], 0.1)
+        self.assertEqual(worker_kwargs["retry_max_backoff"], 2.0)
+
+    def test_dropped_counters(self):
+        client = _Client(self.PROJECT)
+        transport, _ = self._make_one(client, "python_logger")
+        transport.worker.dropped_entries = 3
+        transport.worker.dropped_bytes = 300
+
+        self.assertEqual(transport.dropped_entries, 3)
+        self.assertEqual(transport.dropped_bytes, 300)
+
+
+class TestSharedWorker(unittest.TestCase):
+    PROJECT = "PROJECT"
+
+    @staticmethod
+    def _make_one(client, name, **kw):
+        from google.cloud.logging_v2.handlers.transports import (
+            BackgroundThreadTransport,
+        )
+        from google.cloud.logging_v2.resource import Resource
+
+        kw.setdefault("resource", Resource(type=name, labels={}))
+        return BackgroundThreadTransport(client, name, shared_worker=True, **kw)
+
+    @staticmethod
+    def _send(transport, message):
+        record = logging.LogRecord(
+            "testing", logging.INFO, None, None, message, None, None
+        )
+        transport.send(record, message)
+
+    def test_multiplexes_log_names(self):
+        client = _SharedClient(self.PROJECT)
+        first = self._make_one(client, "first", batch_size=2)
+        second = self._make_one(client, "second", batch_size=2)
+        self.addCleanup(second.close)
+        self.addCleanup(first.close)
+
+        self.assertIs(first.worker, second.worker)
+        self.assertEqual(first.worker._max_batch_size, 2)
+        self._send(first, "1")
+        self._send(second, "2")
+        first.flush()
+
+        client.logging_api.write_entries.assert_called_once()
+        entries, kwargs = client.logging_api.write_entries.call_args
+        # entries without a log name are written to the one of the request
+        self.assertEqual(
+            [
+                (entry.get("logName", kwargs["logger_name"]), entry["resource"]["type"])
+                for entry in entries[0]
+            ],
+            [
+                ("projects/PROJECT/logs/first", "first"),
+                ("projects/PROJECT/logs/second", "second"),
+            ],
+        )
+
+    def test_mismatched_options(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        client = _SharedClient(self.PROJECT)
+        first = self._make_one(client, "first", batch_size=2, max_latency=1)
+        self.addCleanup(first.close)
+
+        with self.assertRaises(ValueError) as context:
+            self._make_one(client, "second", batch_size=100, max_latency=2)
+
+        self.assertIn("batch_size, max_latency", str(context.exception))
+        # the failed transport is not counted as a user of the worker
+        _, users, _ = background_thread._SHARED_WORKERS[client]
+        self.assertEqual(users, 1)
+
+    def test_flush_counts_own_entries(self):
+        client = _SharedClient(self.PROJECT)
+        first = self._make_one(client, "first")
+        second = self._make_one(client, "second")
+        self.addCleanup(second.close)
+        self.addCleanup(first.close)
+        self._send(first, "1")
+        self._send(second, "2")
+        self._send(second, "3")
+
+        result = first.flush()
+
+        # the entries of the other transport are sent, but not counted
+        self.assertEqual(result[:3], (1, 0, 0))
+        self.assertEqual(client.logging_api.write_entries.call_count, 1)
+
+    def test_flush_counts_own_failed_entries(self):
+        from google.api_core.exceptions import InvalidArgument
+
+        def write_entries(entries, **kw):
+            if any(entry.get("textPayload") == "2" for entry in entries):
+                raise InvalidArgument("invalid")
+
+        client = _SharedClient(self.PROJECT)
+        client.logging_api.write_entries.side_effect = write_entries
+        first = self._make_one(client, "first")
+        second = self._make_one(client, "second")
+        self.addCleanup(second.close)
+        self.addCleanup(first.close)
+        self._send(first, "1")
+        self._send(second, "2")
+
+        with self.assertLogs(
+            "google.cloud.logging_v2.handlers.transports.background_thread",
+            logging.ERROR,
+        ):
+            result = second.flush()
+
+        self.assertEqual(result[:3], (0, 1, 0))
+        self.assertEqual(first.worker.stats()["committed"], 1)
+
+    def test_flush_counts_own_pending_entries(self):
+        import threading
+
+        client = _SharedClient(self.PROJECT)
+        release = threading.Event()
+        client.logging_api.write_entries.side_effect = lambda *args, **kw: (
+            release.wait()
+        )
+        first = self._make_one(client, "first")
+        second = self._make_one(client, "second")
+        self.addCleanup(second.close)
+        self.addCleanup(first.close)
+        self.addCleanup(release.set)
+        self._send(first, "1")
+
+        self.assertEqual(first.flush(timeout=0.1)[:3], (0, 0, 1))
+        self.assertEqual(second.flush(timeout=0.1)[:3], (0, 0, 0))
+        # the worker counts the entries of all its transports
+        self.assertEqual(first.worker.flush(timeout=0)[:3], (0, 0, 1))
+
+        release.set()
+        self.assertEqual(first.flush()[:3], (1, 0, 0))
+
+    def test_send_deferred(self):
+        client = _SharedClient(self.PROJECT)
+        transport = self._make_one(client, "first")
+        self.addCleanup(transport.close)
+        record = logging.LogRecord("testing", logging.INFO, None, None, "1", None, None)
+
+        transport.send_deferred(record, lambda record: (record.msg, {}))
+        transport.flush()
+
+        (entry,) = client.logging_api.write_entries.call_args[0][0]
+        kwargs = client.logging_api.write_entries.call_args[1]
+        self.assertEqual(kwargs["logger_name"], "projects/PROJECT/logs/first")
+        self.assertEqual(kwargs["resource"]["type"], "first")
+        self.assertEqual(entry["textPayload"], "1")
+
+    def test_closed_with_last_transport(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        client = _SharedClient(self.PROJECT)
+        first = self._make_one(client, "first")
+        second = self._make_one(client, "second")
+        worker = first.worker
+
+        first.close()
+        self.assertTrue(worker.is_alive)
+        second.close()
+        self.assertFalse(worker.is_alive)
+        self.assertNotIn(client, background_thread._SHARED_WORKERS)
+        # closing again is a no-op
+        second.close()
+
+        third = self._make_one(client, "third")
+        self.addCleanup(third.close)
+        self.assertIsNot(third.worker, worker)
+        self.assertTrue(third.worker.is_alive)
+
+    def test_separate_clients(self):
+        first = self._make_one(_SharedClient(self.PROJECT), "first")
+        second = self._make_one(_SharedClient(self.PROJECT), "second")
+        self.addCleanup(second.close)
+        self.addCleanup(first.close)
+
+        self.assertIsNot(first.worker, second.worker)
+
 
 class Test_Worker(unittest.TestCase):
     NAME = "python_logger"
@@ -325,6 +628,185 @@ class Test_Worker(unittest.TestCase):
 
         self.assertFalse(worker.is_alive)
 
+    def _make_draining_worker(self, batch_cls=None, **kw):
+        logger = _Logger(self.NAME)
+        if batch_cls is not None:
+            logger._batch_cls = batch_cls
+        worker = self._make_one(logger, shutdown_parallelism=1, **kw)
+        self._start_with_thread_patch(worker)
+        return worker, logger
+
+    def test__drain_most_severe_first(self):
+        worker, logger = self._make_draining_worker(shutdown_batch_size=2)
+        for index in range(3):
+            self._enqueue_record(worker, "info%d" % index)
+        self._enqueue_record(worker, "error", logging.ERROR)
+        self._enqueue_record(worker, "warning", logging.WARNING)
+
+        report = worker._drain(time.monotonic() + 5.0)
+
+        self.assertEqual([batch.commit_count for batch in logger._batches], [2, 2, 1])
+        self.assertEqual(
+            [batch.log_called_with[0] for batch in logger._batches],
+            ["warning", "info1", "info2"],
+        )
+        self.assertEqual(report.sent, 5)
+        self.assertEqual(report.undelivered, {})
+        self.assertEqual(worker._queue.unfinished_tasks, 0)
+        self.assertEqual(worker.stats()["committed"], 5)
+
+    def test__drain_in_parallel(self):
+        import threading
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        started = threading.Barrier(3, timeout=5.0)
+        threads = set()
+
+        class _ParallelBatch(_Batch):
+            def commit(self):
+                threads.add(threading.current_thread().name)
+                started.wait()
+                super(_ParallelBatch, self).commit()
+
+        worker, logger = self._make_draining_worker(
+            _ParallelBatch, shutdown_batch_size=10
+        )
+        worker._shutdown_parallelism = 3
+        for index in range(30):
+            self._enqueue_record(worker, str(index))
+
+        report = worker._drain(time.monotonic() + 5.0)
+
+        # the three batches were committed at the same time
+        self.assertEqual(report.sent, 30)
+        self.assertEqual(len(threads), 3)
+        for name in threads:
+            self.assertTrue(name.startswith(background_thread._DRAIN_THREAD_NAME))
+
+    def test__drain_deadline(self):
+        import threading
+
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        class _BlockingBatch(_Batch):
+            def commit(self):
+                release.wait()
+                super(_BlockingBatch, self).commit()
+
+        worker, logger = self._make_draining_worker(
+            _BlockingBatch, shutdown_batch_size=1
+        )
+        self._enqueue_record(worker, "error", logging.ERROR)
+        self._enqueue_record(worker, "info1")
+        self._enqueue_record(worker, "info2")
+
+        start = time.monotonic()
+        report = worker._drain(start + 0.2)
+
+        self.assertLess(time.monotonic() - start, 2.0)
+        self.assertEqual(report.sent, 0)
+        self.assertEqual(report.unconfirmed, 1)
+        self.assertEqual(report.unsent, 2)
+        self.assertEqual(report.undelivered, {"ERROR": 1, "INFO": 2})
+        self.assertEqual(worker._queue.unfinished_tasks, 0)
+
+    def test__drain_failed_commit(self):
+        worker, logger = self._make_draining_worker(_RaisingBatch)
+        self._enqueue_record(worker, "error", logging.ERROR)
+        self._enqueue_record(worker, "info")
+
+        report = worker._drain(time.monotonic() + 5.0)
+
+        self.assertEqual(report.sent, 0)
+        self.assertEqual(report.failed, 2)
+        self.assertEqual(report.undelivered, {"ERROR": 1, "INFO": 1})
+        self.assertEqual(worker.stats()["failed"], 2)
+
+    def test__drain_partially_written_commit(self):
+        from google.api_core import exceptions
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, api = self._make_retry_worker(shutdown_parallelism=1)
+        self._start_with_thread_patch(worker)
+        error = exceptions.InvalidArgument("partially written")
+        error.log_entry_errors = {1: exceptions.InvalidArgument("invalid")}
+        api.write_entries.side_effect = error
+        self._enqueue_record(worker, "error", logging.ERROR)
+        self._enqueue_record(worker, "info")
+
+        with self.assertLogs(background_thread.__name__, level="ERROR"):
+            report = worker._drain(time.monotonic() + 5.0)
+
+        self.assertEqual(report.sent, 1)
+        self.assertEqual(report.failed, 1)
+        self.assertEqual(report.undelivered, {"INFO": 1})
+
+    def test__drain_spools_failed_commit(self):
+        worker, api = self._make_spool_worker(shutdown_parallelism=2)
+        api.write_entries.side_effect = Exception("unavailable")
+        self._enqueue_record(worker, "1")
+        self._enqueue_record(worker, "2")
+
+        report = worker._drain(time.monotonic() + 5.0)
+
+        self.assertEqual(report.spooled, 2)
+        self.assertEqual(report.undelivered, {})
+        record, _ = worker._spool.peek()
+        self.assertEqual(len(record["entries"]), 2)
+
+    def test__drain_retried_batch(self):
+        from google.cloud.logging_v2.entries import LogEntry
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, logger = self._make_draining_worker()
+        self._enqueue_record(worker, "info")
+        worker._pending_retries = 1
+        entry = LogEntry(payload="retried", severity="ERROR")
+        worker._queue.put_front(background_thread._RetryBatch([entry], 1, 0, 0))
+
+        report = worker._drain(time.monotonic() + 5.0)
+
+        self.assertEqual(report.sent, 2)
+        self.assertEqual(worker._pending_retries, 0)
+
+    def test__drain_leaves_terminator(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, logger = self._make_draining_worker()
+        self._enqueue_record(worker, "info")
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+
+        report = worker._drain(time.monotonic() + 5.0)
+
+        self.assertEqual(report.sent, 1)
+        self.assertIs(worker._queue.get_nowait(), background_thread._WORKER_TERMINATOR)
+
+    def test__close_drains(self):
+        worker, logger = self._make_draining_worker()
+        self._enqueue_record(worker, "info")
+
+        with mock.patch("sys.stderr", new_callable=StringIO) as stderr_mock:
+            worker._close("")
+
+        self.assertEqual(logger._batch.commit_count, 1)
+        self.assertFalse(worker.is_alive)
+        self.assertIn("Sent all pending logs.", stderr_mock.getvalue())
+
+    def test__close_drain_reports_undelivered(self):
+        worker, logger = self._make_draining_worker(_RaisingBatch)
+        self._enqueue_record(worker, "error", logging.ERROR)
+        self._enqueue_record(worker, "info")
+
+        with mock.patch("sys.stderr", new_callable=StringIO) as stderr_mock:
+            worker._close("")
+
+        self.assertIn(
+            "Failed to send 2 pending logs (ERROR: 1, INFO: 1): 2 failed",
+            stderr_mock.getvalue(),
+        )
+        self.assertNotIn("Sent all pending logs.", stderr_mock.getvalue())
+
     def test__handle_exit(self):
         from google.cloud.logging_v2.handlers.transports.background_thread import (
             _CLOSE_THREAD_SHUTDOWN_ERROR_MSG,
@@ -389,7 +871,6 @@ class Test_Worker(unittest.TestCase):
         worker.enqueue(record, message, **kw)
 
     def test_enqueue_defaults(self):
-        import datetime
         from google.cloud.logging_v2._helpers import LogSeverity
 
         worker = self._make_one(_Logger(self.NAME))
@@ -401,7 +882,7 @@ class Test_Worker(unittest.TestCase):
         entry = worker._queue.get_nowait()
         self.assertEqual(entry["message"], message)
         self.assertEqual(entry["severity"], LogSeverity.INFO)
-        self.assertIsInstance(entry["timestamp"], datetime.datetime)
+        self.assertIsInstance(entry["timestamp"], float)
         self.assertNotIn("resource", entry.keys())
         self.assertNotIn("trace", entry.keys())
         self.assertNotIn("span_id", entry.keys())
@@ -409,7 +890,6 @@ class Test_Worker(unittest.TestCase):
         self.assertEqual(entry["labels"], {"python_logger": "testing"})
 
     def test_enqueue_explicit(self):
-        import datetime
         from google.cloud.logging_v2._helpers import LogSeverity
 
         worker = self._make_one(_Logger(self.NAME))
@@ -438,7 +918,7 @@ class Test_Worker(unittest.TestCase):
         self.assertEqual(entry["labels"], {**labels, "python_logger": "testing"})
         self.assertIs(entry["trace"], trace)
         self.assertIs(entry["span_id"], span_id)
-        self.assertIsInstance(entry["timestamp"], datetime.datetime)
+        self.assertIsInstance(entry["timestamp"], float)
 
     def test__thread_main(self):
         from google.cloud.logging_v2.handlers.transports import background_thread
@@ -508,169 +988,1741 @@ class Test_Worker(unittest.TestCase):
 
         self.assertFalse(worker._cloud_logger._batch.commit_called)
 
-    @mock.patch("time.time", autospec=True, return_value=1)
-    def test__thread_main_max_latency(self, time):
-        # Note: this test is a bit brittle as it assumes the operation of
-        # _get_many invokes queue.get() followed by queue._get(). It fails
-        # the "change detector" test in that way. However, this is still a
-        # useful test to verify the queue timeout is appropriately calculated.
+    def test__thread_main_max_latency(self):
+        import threading
         from google.cloud.logging_v2.handlers.transports import background_thread
 
-        # Use monotonically increasing time.
-        time.side_effect = range(1, 6)
+        worker = self._make_one(_Logger(self.NAME), max_latency=0.05, max_batch_size=10)
+        self._enqueue_record(worker, "1")
 
-        worker = self._make_one(_Logger(self.NAME), max_latency=2, max_batch_size=10)
-        worker._queue = mock.create_autospec(queue.Queue, instance=True)
+        def enqueue_later():
+            self._enqueue_record(worker, "2")
+            worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
 
-        worker._queue.get.side_effect = [
-            {"message": 1},  # Single record.
-            queue.Empty(),  # Emulate a queue.get() timeout.
-            {"message": "2"},  # Second record.
-            background_thread._WORKER_TERMINATOR,  # Stop the thread.
-            queue.Empty(),  # Emulate a queue.get() timeout.
-        ]
+        # the first batch is sent once its latency expired, without waiting
+        # for the next entry
+        timer = threading.Timer(0.5, enqueue_later)
+        timer.start()
+        self.addCleanup(timer.cancel)
 
         worker._thread_main()
 
         self.assertEqual(worker._cloud_logger._num_batches, 2)
-        self.assertTrue(worker._cloud_logger._batch.commit_called)
+        self.assertEqual(worker._cloud_logger._batches[0].commit_count, 1)
         self.assertEqual(worker._cloud_logger._batch.commit_count, 1)
 
-        # Time should have been called five times.
-        #
-        #   For the first batch, it should have been called:
-        #       * Once to get the start time. (1)
-        #       * Once to get the elapsed time while grabbing the second item.
-        #         (2)
-        #
-        #   For the second batch, it should have been called:
-        #       * Once to get start time. (3)
-        #       * Once to get the elapsed time while grabbing the second item.
-        #         (3)
-        #       * Once to get the elapsed time while grabbing the final
-        #         item. (4)
-        #       * Once final time to get the elapsed time while receiving
-        #         the empty queue.
-        #
-        self.assertEqual(time.call_count, 5)
-
-        # Queue.get should've been called 5 times as well, but with different
-        # timeouts due to the monotonically increasing time.
-        #
-        #   For the first batch, it will be called once without a timeout
-        #   (for the first item) and then with timeout=1, as start will be
-        #   1 and now will be 2.
-        #
-        #   For the second batch, it will be called once without a timeout
-        #   (for the first item) and then with timeout=1, as start will be
-        #   3 and now will be 4, and finally with timeout=0 as start will be 3
-        #   and now will be 5.
-        #
-        worker._queue.get.assert_has_calls(
-            [
-                mock.call(),
-                mock.call(timeout=1),
-                mock.call(),
-                mock.call(timeout=1),
-                mock.call(timeout=0),
-            ]
+    def test__thread_main_deferred(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker = self._make_one(_Logger(self.NAME))
+        record = logging.LogRecord(
+            "testing", logging.ERROR, None, None, "%s", ("hi",), None
         )
+        prepare_thread = []
+
+        def prepare(record):
+            import threading
+
+            prepare_thread.append(threading.current_thread())
+            return record.getMessage(), {"labels": {"foo": "bar"}}
+
+        worker.enqueue_deferred(record, prepare)
+        self.assertEqual(prepare_thread, [])
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+
+        worker._thread_main()
+
+        batch = worker._cloud_logger._batch
+        self.assertEqual(batch.commit_count, 1)
+        message, severity, _, labels, _, _ = batch.log_called_with
+        self.assertEqual(message, "hi")
+        self.assertEqual(severity, 500)
+        self.assertEqual(labels, {"foo": "bar", "python_logger": "testing"})
+
+    def test__thread_main_deferred_error(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
 
-    def test_flush(self):
         worker = self._make_one(_Logger(self.NAME))
-        worker._queue = mock.Mock(spec=queue.Queue)
+        record = logging.LogRecord("testing", logging.INFO, None, None, "", None, None)
 
-        # Queue is empty, should not block.
-        worker.flush()
-        worker._queue.join.assert_called()
+        worker.enqueue_deferred(record, mock.Mock(side_effect=ValueError))
+        self._enqueue_record(worker, "ok")
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
 
+        worker._thread_main()
 
-class _Thread(object):
-    def __init__(self, target, name):
-        self._target = target
-        self._name = name
-        self._timeout = None
-        self._terminate_on_join = True
-        self.daemon = False
+        # the record that failed to format is skipped
+        self.assertEqual(worker._cloud_logger._batches[0].commit_count, 1)
+        self.assertEqual(worker._queue.unfinished_tasks, 0)
 
-    def is_alive(self):
-        return self._is_alive
+    def test_enqueue_deferred_overflow(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
 
-    def start(self):
-        self._is_alive = True
+        worker = self._make_one(
+            _Logger(self.NAME),
+            max_queue_size=1,
+            overflow_policy=background_thread.OVERFLOW_DROP_BELOW_SEVERITY,
+        )
+        info = logging.LogRecord("testing", logging.INFO, None, None, "", None, None)
+        error = logging.LogRecord("testing", logging.ERROR, None, None, "", None, None)
 
-    def stop(self):
-        self._is_alive = False
+        worker.enqueue_deferred(info, mock.Mock())
+        worker.enqueue_deferred(error, mock.Mock())
 
-    def join(self, timeout=None):
-        self._timeout = timeout
-        if self._terminate_on_join:
-            self.stop()
+        self.assertEqual(worker._queue.qsize(), 1)
+        self.assertIs(worker._queue.get_nowait().record, error)
+        self.assertEqual(worker.dropped_entries, 1)
 
+    def test_current_batch_values_fixed(self):
+        worker = self._make_one(_Logger(self.NAME), max_batch_size=20, max_latency=2)
 
-class _Batch(object):
-    def __init__(self):
-        self.entries = []
-        self.commit_called = False
-        self.commit_count = None
+        self.assertEqual(worker.current_batch_size, 20)
+        self.assertEqual(worker.current_max_latency, 2)
 
-    def log(
-        self,
-        message,
-        severity=logging.INFO,
-        resource=None,
-        labels=None,
-        trace=None,
-        span_id=None,
-        timestamp=None,
-        http_request=None,
-    ):
-        from google.cloud.logging_v2.logger import _GLOBAL_RESOURCE
+    def test__thread_main_adaptive(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
 
-        assert resource is None
-        resource = _GLOBAL_RESOURCE
+        worker = self._make_one(
+            _Logger(self.NAME), max_batch_size=100, max_latency=1, adaptive=True
+        )
+        # start small to keep latency low
+        self.assertEqual(worker.current_batch_size, 1)
+        self.assertEqual(worker.current_max_latency, 0)
 
-        self.log_called_with = (message, severity, resource, labels, trace, span_id)
-        self.entries.append(message)
+        for i in range(30):
+            self._enqueue_record(worker, str(i))
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
 
-    def commit(self):
-        self.commit_called = True
-        self.commit_count = len(self.entries)
-        del self.entries[:]
+        worker._thread_main()
 
+        commit_counts = [batch.commit_count for batch in worker._cloud_logger._batches]
+        # batches grow while the backlog is draining
+        self.assertEqual(commit_counts, [1, 11, 18])
+        self.assertEqual(worker._queue.qsize(), 0)
 
-class _RaisingBatch(_Batch):
-    def commit(self):
-        self.commit_called = True
-        raise ValueError("This batch raises on commit.")
+    def test__thread_main_adaptive_error(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
 
+        worker = self._make_one(
+            _Logger(self.NAME), max_batch_size=100, max_latency=1, adaptive=True
+        )
+        worker._adaptive_controller.batch_size = 40
+        worker._cloud_logger._batch_cls = _RaisingBatch
 
-class _Logger(object):
-    def __init__(self, name, resource=None):
-        self.name = name
-        self._batch_cls = _Batch
-        self._batch = None
-        self._num_batches = 0
-        self.resource = resource
+        self._enqueue_record(worker, "1")
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
 
-    def batch(self):
-        self._batch = self._batch_cls()
-        self._num_batches += 1
-        return self._batch
+        worker._thread_main()
 
+        self.assertEqual(worker.current_batch_size, 20)
 
-class _Client(object):
-    def __init__(self, project, _http=None, credentials=None):
-        import mock
+    def test__thread_main_inflight_commits(self):
+        import threading
+        from google.cloud.logging_v2.handlers.transports import background_thread
 
-        self.project = project
-        self._http = _http
-        self._credentials = credentials
-        self._connection = mock.Mock(credentials=credentials, spec=["credentials"])
+        inflight = 3
+        barrier = threading.Barrier(inflight, timeout=5)
+        worker, api = self._make_retry_worker(
+            max_batch_size=1, max_inflight_commits=inflight
+        )
+        # only passes if ``inflight`` commits run concurrently
+        api.write_entries.side_effect = lambda entries, **kwargs: barrier.wait()
 
-    def logger(self, name, resource=None):  # pylint: disable=unused-argument
-        self._logger = _Logger(name, resource=resource)
-        return self._logger
+        for i in range(inflight * 2):
+            self._enqueue_record(
+                worker, str(i), log_name=f"projects/P/logs/log{i % inflight}"
+            )
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+
+        worker._thread_main()
+
+        self.assertFalse(barrier.broken)
+        self.assertEqual(api.write_entries.call_count, inflight * 2)
+        # all items are marked done once their commits complete
+        self.assertEqual(worker._queue.unfinished_tasks, 0)
+
+    def test__thread_main_inflight_commits_same_log_in_order(self):
+        import threading
+        import time
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        lock = threading.Lock()
+        running = []
+        overlaps = []
+        sent = []
+        worker, api = self._make_retry_worker(max_batch_size=1, max_inflight_commits=4)
+
+        def write_entries(entries, **kwargs):
+            with lock:
+                overlaps.append(bool(running))
+                running.append(entries)
+            time.sleep(0.01)
+            with lock:
+                running.remove(entries)
+                sent.append(entries[0]["textPayload"])
+
+        api.write_entries.side_effect = write_entries
+        for i in range(6):
+            self._enqueue_record(worker, str(i))
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+
+        worker._thread_main()
+
+        # two batches of one log name are never committed at the same time
+        self.assertEqual(overlaps, [False] * 6)
+        self.assertEqual(sent, [str(i) for i in range(6)])
+        self.assertEqual(worker._queue.unfinished_tasks, 0)
+
+    def test__thread_main_inflight_commits_error(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker = self._make_one(_Logger(self.NAME), max_inflight_commits=2)
+        worker._cloud_logger._batch_cls = _RaisingBatch
+
+        self._enqueue_record(worker, "1")
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+
+        worker._thread_main()
+
+        self.assertTrue(worker._cloud_logger._batch.commit_called)
+        self.assertEqual(worker._queue.unfinished_tasks, 0)
+
+    def test_constructor_max_batch_bytes_too_large(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        with self.assertRaises(ValueError):
+            self._make_one(
+                _Logger(self.NAME),
+                max_batch_bytes=background_thread._WRITE_REQUEST_MAX_BYTES + 1,
+            )
+
+    def test__thread_main_max_batch_bytes(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        message = "x" * 400
+        entry_size = background_thread._estimate_entry_size(
+            {
+                "message": message,
+                "severity": 200,
+                "timestamp": None,
+                "labels": {"python_logger": "testing"},
+            }
+        )
+        worker = self._make_one(
+            _Logger(self.NAME), max_batch_size=None, max_batch_bytes=entry_size * 2
+        )
+
+        for _ in range(5):
+            self._enqueue_record(worker, message)
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+
+        worker._thread_main()
+
+        commit_counts = [batch.commit_count for batch in worker._cloud_logger._batches]
+        self.assertEqual(commit_counts, [2, 2, 1])
+        self.assertEqual(worker._queue.qsize(), 0)
+
+    def test_constructor_invalid_overflow_policy(self):
+        with self.assertRaises(ValueError):
+            self._make_one(_Logger(self.NAME), overflow_policy="unknown")
+
+    def test_enqueue_drop_newest(self):
+        worker = self._make_one(_Logger(self.NAME), max_queue_size=2)
+
+        self._enqueue_record(worker, "1")
+        self._enqueue_record(worker, "2")
+        self._enqueue_record(worker, "3")
+
+        self.assertEqual(worker._queue.qsize(), 2)
+        self.assertEqual(worker._queue.get_nowait()["message"], "1")
+        self.assertEqual(worker._queue.get_nowait()["message"], "2")
+        self.assertEqual(worker.dropped_entries, 1)
+        self.assertGreater(worker.dropped_bytes, 0)
+
+    def test_enqueue_drop_oldest(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker = self._make_one(
+            _Logger(self.NAME),
+            max_queue_size=2,
+            overflow_policy=background_thread.OVERFLOW_DROP_OLDEST,
+        )
+
+        self._enqueue_record(worker, "1")
+        self._enqueue_record(worker, "2")
+        self._enqueue_record(worker, "3")
+
+        self.assertEqual(worker._queue.qsize(), 2)
+        self.assertEqual(worker._queue.get_nowait()["message"], "2")
+        self.assertEqual(worker._queue.get_nowait()["message"], "3")
+        self.assertEqual(worker.dropped_entries, 1)
+        # evicted entries should not be waited on by flush
+        self.assertEqual(worker._queue.unfinished_tasks, 2)
+
+    def test_enqueue_drop_below_severity(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker = self._make_one(
+            _Logger(self.NAME),
+            max_queue_size=2,
+            overflow_policy=background_thread.OVERFLOW_DROP_BELOW_SEVERITY,
+            overflow_severity="warning",
+        )
+
+        self._enqueue_record(worker, "error", levelno=logging.ERROR)
+        self._enqueue_record(worker, "info", levelno=logging.INFO)
+        # low severity entries are dropped when the queue is full
+        self._enqueue_record(worker, "debug", levelno=logging.DEBUG)
+        # high severity entries evict queued low severity entries
+        self._enqueue_record(worker, "critical", levelno=logging.CRITICAL)
+        # nothing left to evict, so the new entry is dropped
+        self._enqueue_record(worker, "error2", levelno=logging.ERROR)
+
+        self.assertEqual(worker._queue.get_nowait()["message"], "error")
+        self.assertEqual(worker._queue.get_nowait()["message"], "critical")
+        self.assertEqual(worker.dropped_entries, 3)
+
+    def test_enqueue_block_timeout(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker = self._make_one(
+            _Logger(self.NAME),
+            max_queue_size=1,
+            overflow_policy=background_thread.OVERFLOW_BLOCK,
+            block_timeout=0.01,
+        )
+
+        self._enqueue_record(worker, "1")
+        self._enqueue_record(worker, "2")
+
+        self.assertEqual(worker._queue.qsize(), 1)
+        self.assertEqual(worker.dropped_entries, 1)
+
+    def test_enqueue_max_queue_bytes(self):
+        worker = self._make_one(_Logger(self.NAME), max_queue_bytes=1000)
+
+        # a single oversized entry is accepted into an empty queue
+        self._enqueue_record(worker, "x" * 2000)
+        self._enqueue_record(worker, "small")
+
+        self.assertEqual(worker._queue.qsize(), 1)
+        self.assertEqual(worker.dropped_entries, 1)
+
+        worker._queue.get_nowait()
+        self.assertEqual(worker._queue.bytes, 0)
+
+    def test_stop_full_queue(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker = self._make_one(_Logger(self.NAME), max_queue_size=1)
+        self._start_with_thread_patch(worker)
+        self._enqueue_record(worker, "1")
+
+        # the terminator is never blocked by the queue limits
+        worker.stop()
+
+        self.assertEqual(worker._queue.qsize(), 2)
+        worker._queue.get_nowait()
+        self.assertIs(worker._queue.get_nowait(), background_thread._WORKER_TERMINATOR)
+
+    def _make_spool_worker(self, **kw):
+        import shutil
+        import tempfile
+        from google.cloud.logging_v2.handlers.transports._spool import _Spool
+        from google.cloud.logging_v2.logger import Logger
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        spool = _Spool(directory)
+        self.addCleanup(spool.close)
+        client = _APIClient("PROJECT")
+        worker = self._make_one(Logger(self.NAME, client), spool=spool, **kw)
+        return worker, client.logging_api
+
+    def test__thread_main_spools_failed_batch(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, api = self._make_spool_worker()
+        api.write_entries.side_effect = Exception("unavailable")
+
+        self._enqueue_record(worker, "1")
+        self._enqueue_record(worker, "2")
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+        worker._thread_main()
+
+        record, _ = worker._spool.peek()
+        self.assertEqual(record["logName"], "projects/PROJECT/logs/" + self.NAME)
+        self.assertEqual(
+            [entry["textPayload"] for entry in record["entries"]],
+            ["1", "2"],
+        )
+
+    def test__thread_main_replays_spool(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, api = self._make_spool_worker()
+        api.write_entries.side_effect = [Exception("unavailable"), None, None]
+
+        self._enqueue_record(worker, "1")
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+        worker._thread_main()
+        self._enqueue_record(worker, "2")
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+        worker._thread_main()
+
+        # the spooled batch is replayed after the next successful commit
+        self.assertEqual(api.write_entries.call_count, 3)
+        replayed_entries = api.write_entries.call_args_list[2][0][0]
+        self.assertEqual(replayed_entries[0]["textPayload"], "1")
+        self.assertEqual(
+            api.write_entries.call_args_list[2][1]["logger_name"],
+            "projects/PROJECT/logs/" + self.NAME,
+        )
+        self.assertEqual(worker._spool.peek(), (None, None))
+
+    def test__replay_spool_respools_failed_entries(self):
+        from google.api_core import exceptions
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        rejected = []
+        worker, api = self._make_spool_worker(
+            rejected_callback=lambda entry, error: rejected.append(entry)
+        )
+        entries = [{"textPayload": str(i)} for i in range(3)]
+        worker._spool.append(
+            {"logName": "projects/PROJECT/logs/old", "entries": entries}
+        )
+        error = exceptions.InvalidArgument("partially written")
+        error.log_entry_errors = {
+            0: exceptions.InvalidArgument("invalid"),
+            2: exceptions.ServiceUnavailable("unavailable"),
+        }
+        api.write_entries.side_effect = [error, None]
+
+        with self.assertLogs(background_thread.__name__, level="ERROR"):
+            self.assertFalse(worker._replay_spool())
+        self.assertTrue(worker._replay_spool())
+
+        self.assertEqual(rejected, [entries[0]])
+        self.assertEqual(api.write_entries.call_args_list[1][0][0], [entries[2]])
+        self.assertEqual(worker._spool.peek(), (None, None))
+        self.assertEqual(worker.stats()["committed"], 2)
+        self.assertEqual(worker.stats()["failed"], 1)
+
+    def test__thread_main_idle_replays_spool(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, api = self._make_spool_worker()
+        worker._spool.append({"logName": "projects/PROJECT/logs/old", "entries": []})
+
+        def _terminate_on_replay(*args, **kwargs):
+            worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+
+        api.write_entries.side_effect = _terminate_on_replay
+        with mock.patch.object(background_thread, "_SPOOL_REPLAY_INTERVAL", new=0):
+            worker._thread_main()
+
+        api.write_entries.assert_called_once_with(
+            [], partial_success=True, logger_name="projects/PROJECT/logs/old"
+        )
+        self.assertEqual(worker._spool.pending_bytes, 0)
+
+    def test__thread_main_spills_when_queue_nearly_full(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, api = self._make_spool_worker(max_queue_size=5, max_batch_size=1)
+        for i in range(5):
+            self._enqueue_record(worker, str(i))
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+        worker._thread_main()
+
+        committed = [
+            call[0][0][0]["textPayload"] for call in api.write_entries.call_args_list
+        ]
+        # batches formed while the queue is nearly full are spilled, and
+        # replayed after later commits
+        self.assertEqual(committed, ["2", "0", "3", "1", "4"])
+        self.assertEqual(worker._spool.peek(), (None, None))
+
+    def test__thread_main_spills_when_queue_of_one_full(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, api = self._make_spool_worker(max_queue_size=1, max_batch_size=1)
+        self._enqueue_record(worker, "1")
+        # the queue still holds the terminator when the batch is formed
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+        worker._thread_main()
+
+        api.write_entries.assert_not_called()
+        record, _ = worker._spool.peek()
+        self.assertEqual(len(record["entries"]), 1)
+
+    def test__thread_main_spills_when_queue_bytes_nearly_full(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, api = self._make_spool_worker(
+            max_queue_bytes=1024 * 1024, max_batch_size=1
+        )
+        for i in range(5):
+            self._enqueue_record(worker, str(i))
+        # make the queued entries fill the byte budget exactly
+        worker._queue.max_bytes = worker._queue.bytes
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+        worker._thread_main()
+
+        committed = [
+            call[0][0][0]["textPayload"] for call in api.write_entries.call_args_list
+        ]
+        # only the first batch is formed with 80% of the bytes still queued
+        self.assertEqual(committed, ["1", "0", "2", "3", "4"])
+        self.assertEqual(worker._spool.peek(), (None, None))
+
+    def test__thread_main_unbounded_queue_never_spills(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, api = self._make_spool_worker(max_batch_size=1)
+        for i in range(5):
+            self._enqueue_record(worker, str(i))
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+        worker._thread_main()
+
+        committed = [
+            call[0][0][0]["textPayload"] for call in api.write_entries.call_args_list
+        ]
+        self.assertEqual(committed, ["0", "1", "2", "3", "4"])
+        self.assertEqual(worker._spool.peek(), (None, None))
+
+    def test__close_spools_pending(self):
+        worker, api = self._make_spool_worker()
+        self._start_with_thread_patch(worker)
+        self._enqueue_record(worker, "1")
+        self._enqueue_record(worker, "2")
+
+        with self._init_main_thread_is_alive_mock(False):
+            worker._close("")
+
+        self.assertEqual(worker._queue.qsize(), 0)
+        record, _ = worker._spool.peek()
+        self.assertEqual(len(record["entries"]), 2)
+        api.write_entries.assert_not_called()
+
+    def test__thread_main_spools_on_open_circuit(self):
+        from google.cloud.logging_v2.circuit_breaker import CircuitOpenError
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, api = self._make_spool_worker(
+            retry_budget=background_thread._RetryBudget()
+        )
+        api.write_entries.side_effect = CircuitOpenError("open")
+
+        self._enqueue_record(worker, "1")
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+        worker._thread_main()
+
+        # spooled right away instead of retried, and not replayed
+        api.write_entries.assert_called_once()
+        record, _ = worker._spool.peek()
+        self.assertEqual(record["entries"][0]["textPayload"], "1")
+
+    def _make_retry_worker(self, **kw):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+        from google.cloud.logging_v2.logger import Logger
+
+        client = _APIClient("PROJECT")
+        kw.setdefault("retry_initial_backoff", 0)
+        kw.setdefault("retry_budget", background_thread._RetryBudget())
+        worker = self._make_one(Logger(self.NAME, client), **kw)
+        return worker, client.logging_api
+
+    def test__thread_main_retries_transient_error(self):
+        from google.api_core import exceptions
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, api = self._make_retry_worker()
+        api.write_entries.side_effect = [
+            exceptions.ServiceUnavailable("unavailable"),
+            exceptions.DeadlineExceeded("deadline"),
+            None,
+        ]
+
+        self._enqueue_record(worker, "1")
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+        worker._thread_main()
+
+        self.assertEqual(api.write_entries.call_count, 3)
+        for call in api.write_entries.call_args_list:
+            self.assertEqual(call[0][0][0]["textPayload"], "1")
+        self.assertEqual(worker._queue.qsize(), 0)
+        self.assertEqual(worker._queue.unfinished_tasks, 0)
+        self.assertEqual(worker._pending_retries, 0)
+
+    def test__thread_main_retry_ahead_of_new_entries(self):
+        from google.api_core import exceptions
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, api = self._make_retry_worker(max_batch_size=1)
+
+        def _fail_first(entries, **kwargs):
+            if api.write_entries.call_count == 1:
+                raise exceptions.ServiceUnavailable("unavailable")
+
+        api.write_entries.side_effect = _fail_first
+        self._enqueue_record(worker, "1")
+        self._enqueue_record(worker, "2")
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+        worker._thread_main()
+
+        sent = [
+            call[0][0][0]["textPayload"] for call in api.write_entries.call_args_list
+        ]
+        self.assertEqual(sent, ["1", "1", "2"])
+
+    def test__thread_main_retry_ahead_of_new_express_entries(self):
+        from google.api_core import exceptions
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, api = self._make_retry_worker(
+            max_batch_size=1, priority_severity="ERROR"
+        )
+
+        def _fail_first(entries, **kwargs):
+            if api.write_entries.call_count == 1:
+                raise exceptions.ServiceUnavailable("unavailable")
+
+        api.write_entries.side_effect = _fail_first
+        self._enqueue_record(worker, "e1", logging.ERROR)
+        self._enqueue_record(worker, "e2", logging.ERROR)
+        self._enqueue_record(worker, "i1")
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+        worker._thread_main()
+
+        # the retried express entry stays ahead of the express entries
+        # queued after it
+        sent = [
+            call[0][0][0]["textPayload"] for call in api.write_entries.call_args_list
+        ]
+        self.assertEqual(sent, ["e1", "e1", "e2", "i1"])
+        self.assertEqual(worker._queue.unfinished_tasks, 0)
+        self.assertEqual(worker._pending_retries, 0)
+
+    def test__is_urgent(self):
+        from google.cloud.logging_v2.entries import LogEntry
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, _ = self._make_retry_worker(priority_severity="ERROR")
+        info = LogEntry(payload="info", severity="INFO")
+        error = LogEntry(payload="error", severity="ERROR")
+
+        self.assertTrue(
+            worker._is_urgent(background_thread._RetryBatch([error], 1, 0, 0))
+        )
+        self.assertFalse(
+            worker._is_urgent(background_thread._RetryBatch([info], 1, 0, 0))
+        )
+        self.assertFalse(worker._is_urgent(background_thread._WORKER_TERMINATOR))
+
+    def test__schedule_retry_splits_lanes(self):
+        from google.api_core import exceptions
+        from google.cloud.logging_v2.entries import LogEntry
+
+        worker, _ = self._make_retry_worker(priority_severity="ERROR")
+        batch = worker._cloud_logger.batch()
+        info = LogEntry(payload="info", severity="INFO")
+        error = LogEntry(payload="error", severity="ERROR")
+        batch.entries.extend([info, error])
+
+        scheduled = worker._schedule_retry(
+            batch, exceptions.ServiceUnavailable("unavailable")
+        )
+
+        self.assertTrue(scheduled)
+        self.assertEqual(worker._pending_retries, 2)
+        self.assertEqual(list(worker._queue._express)[0].entries, [error])
+        self.assertEqual(list(worker._queue.queue)[0].entries, [info])
+
+    def test__thread_main_sends_new_entries_during_retry_backoff(self):
+        from google.api_core import exceptions
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, api = self._make_retry_worker(max_batch_size=1)
+
+        def _fail_first(entries, **kwargs):
+            if api.write_entries.call_count == 1:
+                raise exceptions.ServiceUnavailable("unavailable")
+
+        api.write_entries.side_effect = _fail_first
+        self._enqueue_record(worker, "1")
+        self._enqueue_record(worker, "2")
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+        with mock.patch(
+            "google.cloud.logging_v2.handlers.transports.background_thread._backoff_delay",
+            return_value=0.2,
+        ):
+            worker._thread_main()
+
+        # the entry queued after the failed batch is not held up by its backoff
+        sent = [
+            call[0][0][0]["textPayload"] for call in api.write_entries.call_args_list
+        ]
+        self.assertEqual(sent, ["1", "2", "1"])
+        self.assertEqual(worker._queue.unfinished_tasks, 0)
+        self.assertEqual(worker._pending_retries, 0)
+
+    def test__thread_main_permanent_error_not_retried(self):
+        from google.api_core import exceptions
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, api = self._make_retry_worker()
+        api.write_entries.side_effect = exceptions.PermissionDenied("denied")
+
+        self._enqueue_record(worker, "1")
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+        worker._thread_main()
+
+        api.write_entries.assert_called_once()
+
+    def test__thread_main_retries_only_failed_entries(self):
+        from google.api_core import exceptions
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        rejected = []
+        worker, api = self._make_retry_worker(
+            rejected_callback=lambda entry, error: rejected.append((entry, error))
+        )
+        invalid = exceptions.InvalidArgument("invalid")
+        error = exceptions.InvalidArgument("partially written")
+        error.log_entry_errors = {
+            0: invalid,
+            2: exceptions.ServiceUnavailable("unavailable"),
+        }
+        api.write_entries.side_effect = [error, None]
+
+        for message in ("1", "2", "3"):
+            self._enqueue_record(worker, message)
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+        worker._thread_main()
+
+        sent = [
+            [entry["textPayload"] for entry in call[0][0]]
+            for call in api.write_entries.call_args_list
+        ]
+        self.assertEqual(sent, [["1", "2", "3"], ["3"]])
+        self.assertEqual(
+            [(entry.payload, e) for entry, e in rejected], [("1", invalid)]
+        )
+        self.assertEqual(worker.stats()["committed"], 2)
+        self.assertEqual(worker.stats()["failed"], 1)
+
+    def test__thread_main_logs_rejected_entries_wo_callback(self):
+        from google.api_core import exceptions
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, api = self._make_retry_worker()
+        error = exceptions.InvalidArgument("partially written")
+        error.log_entry_errors = {1: exceptions.InvalidArgument("invalid")}
+        api.write_entries.side_effect = error
+
+        self._enqueue_record(worker, "1")
+        self._enqueue_record(worker, "2")
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+        with self.assertLogs(background_thread.__name__, level="ERROR") as logs:
+            worker._thread_main()
+
+        api.write_entries.assert_called_once()
+        self.assertIn("1 log entries were rejected", logs.output[0])
+        self.assertEqual(worker.stats()["committed"], 1)
+        self.assertEqual(worker.stats()["failed"], 1)
+
+    def test__thread_main_retry_deadline(self):
+        from google.api_core import exceptions
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, api = self._make_retry_worker(
+            retry_deadline=0.05, retry_initial_backoff=0.02, retry_max_backoff=0.02
+        )
+        api.write_entries.side_effect = exceptions.ServiceUnavailable("unavailable")
+
+        self._enqueue_record(worker, "1")
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+        with mock.patch("random.uniform", side_effect=lambda low, high: high):
+            worker._thread_main()
+
+        # attempts at 0, 0.02 and 0.04 seconds; the next would pass the deadline
+        self.assertEqual(api.write_entries.call_count, 3)
+        self.assertEqual(worker._queue.qsize(), 0)
+
+    def test__thread_main_retry_budget(self):
+        from google.api_core import exceptions
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        budget = background_thread._RetryBudget(max_tokens=2)
+        worker, api = self._make_retry_worker(retry_budget=budget)
+        api.write_entries.side_effect = exceptions.ServiceUnavailable("unavailable")
+
+        self._enqueue_record(worker, "1")
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+        worker._thread_main()
+
+        # a single retry is allowed by the budget
+        self.assertEqual(api.write_entries.call_count, 2)
+
+    def test__thread_main_retries_disabled(self):
+        from google.api_core import exceptions
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, api = self._make_retry_worker(retry_deadline=0)
+        api.write_entries.side_effect = exceptions.ServiceUnavailable("unavailable")
+
+        self._enqueue_record(worker, "1")
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+        worker._thread_main()
+
+        api.write_entries.assert_called_once()
+
+    def test__thread_main_inflight_retry(self):
+        from google.api_core import exceptions
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, api = self._make_retry_worker(max_inflight_commits=2)
+        api.write_entries.side_effect = [
+            exceptions.ServiceUnavailable("unavailable"),
+            None,
+        ]
+
+        self._enqueue_record(worker, "1")
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+        worker._thread_main()
+
+        # the retry queued by the committer is sent before the worker exits
+        self.assertEqual(api.write_entries.call_count, 2)
+        self.assertEqual(worker._queue.unfinished_tasks, 0)
+
+    def test__close_spools_pending_retry(self):
+        from google.cloud.logging_v2.entries import TextEntry
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker, api = self._make_spool_worker()
+        self._start_with_thread_patch(worker)
+        self._enqueue_record(worker, "new")
+        worker._pending_retries = 1
+        worker._queue.put_front(
+            background_thread._RetryBatch([TextEntry(payload="retried")], 1, 0, 0)
+        )
+
+        with self._init_main_thread_is_alive_mock(False):
+            worker._close("")
+
+        record, _ = worker._spool.peek()
+        self.assertEqual(
+            [entry["textPayload"] for entry in record["entries"]], ["retried", "new"]
+        )
+        self.assertEqual(worker._pending_retries, 0)
+
+    def test_flush(self):
+        worker = self._make_one(_Logger(self.NAME))
+        worker._queue = mock.Mock(spec=queue.Queue)
+        worker._queue.unfinished_tasks = 0
+
+        # Queue is empty, should not block.
+        worker.flush()
+        worker._queue.join.assert_called()
+
+    def test_flush_result(self):
+        import threading
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker = self._make_one(_Logger(self.NAME), max_batch_size=2)
+        self._enqueue_record(worker, "1")
+        self._enqueue_record(worker, "2")
+        self._enqueue_record(worker, "fail")
+        worker._cloud_logger._batch_cls = _SelectiveRaisingBatch
+        thread = threading.Thread(target=worker._thread_main)
+        self.addCleanup(thread.join)
+        self.addCleanup(worker._queue.put_nowait, background_thread._WORKER_TERMINATOR)
+        join = worker._queue.join
+
+        def start_and_join(timeout=None):
+            # process the queue only once the flush started
+            thread.start()
+            return join(timeout=timeout)
+
+        with mock.patch.object(worker._queue, "join", new=start_and_join):
+            result = worker.flush(timeout=5)
+
+        self.assertEqual(result.sent, 2)
+        self.assertEqual(result.failed, 1)
+        self.assertEqual(result.pending, 0)
+        self.assertTrue(result.completed)
+        self.assertGreaterEqual(result.elapsed, 0)
+
+    def test__thread_main_partially_written_batch(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker = self._make_one(_Logger(self.NAME), max_batch_size=3)
+        worker._cloud_logger._batch_cls = _PartiallyWritingBatch
+        self._enqueue_record(worker, "1")
+        self._enqueue_record(worker, "fail")
+        self._enqueue_record(worker, "2")
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+
+        with self.assertLogs(background_thread.__name__, level="ERROR"):
+            worker._thread_main()
+
+        # the entries written before the error are counted as sent
+        self.assertEqual(worker.stats()["committed"], 2)
+        self.assertEqual(worker.stats()["failed"], 1)
+
+    def test_flush_timeout(self):
+        worker = self._make_one(_Logger(self.NAME))
+        # no thread processes the queue
+        self._enqueue_record(worker, "1")
+
+        result = worker.flush(timeout=0.01)
+
+        self.assertEqual(result.sent, 0)
+        self.assertEqual(result.pending, 1)
+        self.assertFalse(result.completed)
+        self.assertGreaterEqual(result.elapsed, 0.01)
+
+    def test__put_priority_sheds_low_severity(self):
+        from google.cloud.logging_v2._helpers import LogSeverity
+
+        worker = self._make_one(
+            _Logger(self.NAME), max_queue_size=2, priority_severity="error"
+        )
+        self.assertEqual(worker._priority_severity, LogSeverity.ERROR)
+        self._enqueue_record(worker, "1")
+        self._enqueue_record(worker, "2", levelno=logging.ERROR)
+        self._enqueue_record(worker, "3", levelno=logging.ERROR)
+
+        self.assertEqual(worker.dropped_entries, 1)
+        # the low severity lane is empty, a new entry is dropped
+        self._enqueue_record(worker, "4", levelno=logging.CRITICAL)
+        self._enqueue_record(worker, "5")
+
+        self.assertEqual(worker.dropped_entries, 3)
+        self.assertEqual(
+            [worker._queue.get_nowait()["message"] for _ in range(2)], ["2", "3"]
+        )
+
+    def test__thread_main_priority_lane(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker = self._make_one(
+            _Logger(self.NAME), max_batch_size=10, priority_severity="ERROR"
+        )
+        self._enqueue_record(worker, "1")
+        self._enqueue_record(worker, "2", levelno=logging.ERROR)
+        worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+
+        with mock.patch.object(
+            worker._queue, "get_many", wraps=worker._queue.get_many
+        ) as get_many:
+            worker._thread_main()
+
+        self.assertEqual(get_many.call_args[1]["urgent"], worker._is_urgent)
+        self.assertEqual(worker._cloud_logger._batch.entries, [])
+        self.assertEqual(worker._cloud_logger._batch.commit_count, 2)
+
+    def test__resolve_deferred_defaults(self):
+        from google.cloud.logging_v2.handlers.transports.background_thread import (
+            _DeferredRecord,
+        )
+
+        worker = self._make_one(_Logger(self.NAME))
+        record = logging.LogRecord("testing", logging.INFO, None, None, "1", None, None)
+        item = _DeferredRecord(
+            record,
+            lambda record: ("1", {"resource": "prepared"}),
+            {"log_name": "default", "resource": "default"},
+        )
+
+        entry = worker._resolve_deferred(item)
+
+        self.assertEqual(entry["log_name"], "default")
+        self.assertEqual(entry["resource"], "prepared")
+
+    def test_stats(self):
+        from google.cloud.logging_v2.handlers.transports.background_thread import (
+            _WORKER_TERMINATOR,
+        )
+
+        worker = self._make_one(_Logger(self.NAME), max_batch_size=2, max_queue_size=3)
+        worker._cloud_logger._batch_cls = _SelectiveRaisingBatch
+        for message in ("1", "2", "fail", "dropped"):
+            self._enqueue_record(worker, message)
+        worker._queue.put_nowait(_WORKER_TERMINATOR)
+
+        worker._thread_main()
+        stats = worker.stats()
+
+        self.assertEqual(stats["queue_depth"], 0)
+        self.assertEqual(stats["queue_bytes"], 0)
+        self.assertEqual(stats["queue_peak"], 4)
+        self.assertEqual(stats["enqueued"], 3)
+        self.assertEqual(stats["committed"], 2)
+        self.assertEqual(stats["failed"], 1)
+        self.assertEqual(stats["dropped"], 1)
+        self.assertGreater(stats["dropped_bytes"], 0)
+        self.assertEqual(stats["batch_size"]["count"], 2)
+        self.assertEqual(stats["batch_size"]["sum"], 3)
+        self.assertEqual(stats["batch_size"]["buckets"], {1: 1, 2: 1})
+        self.assertGreater(stats["batch_bytes"]["sum"], 0)
+        self.assertEqual(stats["commit_latency"]["count"], 2)
+        # the fake batches have no timestamps
+        self.assertEqual(stats["lag"]["count"], 0)
+
+    def test_stats_lag(self):
+        import time
+        from google.cloud.logging_v2.handlers.transports.background_thread import (
+            _WORKER_TERMINATOR,
+        )
+        from google.cloud.logging_v2.logger import Logger
+
+        client = _APIClient("PROJECT")
+        worker = self._make_one(Logger(self.NAME, client))
+        record = logging.LogRecord("testing", logging.INFO, None, None, "1", None, None)
+        record.created = time.time() - 10
+        worker.enqueue(record, "1")
+        worker._queue.put_nowait(_WORKER_TERMINATOR)
+
+        worker._thread_main()
+        lag = worker.stats()["lag"]
+
+        client.logging_api.write_entries.assert_called_once()
+        self.assertEqual(lag["count"], 1)
+        self.assertGreaterEqual(lag["p50"], 10)
+        self.assertEqual(lag["p50"], lag["max"])
+
+    def test__maybe_report_stats(self):
+        callback = mock.Mock()
+        worker = self._make_one(
+            _Logger(self.NAME), stats_callback=callback, stats_interval=60
+        )
+
+        worker._maybe_report_stats()
+        callback.assert_not_called()
+
+        worker._next_stats_report = 0
+        worker._maybe_report_stats()
+        worker._maybe_report_stats()
+
+        callback.assert_called_once()
+        (stats,) = callback.call_args[0]
+        self.assertEqual(stats["enqueued"], 0)
+
+    def test__maybe_report_stats_error(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker = self._make_one(
+            _Logger(self.NAME), stats_callback=mock.Mock(side_effect=ValueError)
+        )
+        worker._next_stats_report = 0
+
+        with self.assertLogs(background_thread.__name__, "ERROR"):
+            worker._maybe_report_stats()
+
+        self.assertGreater(worker._next_stats_report, 0)
+
+    def test__thread_main_reports_stats_while_idle(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker = self._make_one(
+            _Logger(self.NAME), stats_callback=mock.Mock(), stats_interval=0.01
+        )
+
+        def report(stats):
+            worker._queue.put_nowait(background_thread._WORKER_TERMINATOR)
+
+        worker._stats_callback.side_effect = report
+
+        worker._thread_main()
+
+        worker._stats_callback.assert_called_once()
+
+    def test__after_fork_in_child(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        worker = self._make_one(_Logger(self.NAME), max_queue_size=10)
+        with self._init_atexit_mock() as atexit_mock:
+            self._start_with_thread_patch(worker)
+            self._enqueue_record(worker, "parent")
+            operational_lock = worker._operational_lock
+            inflight = worker._inflight
+            worker._pending_retries = 1
+
+            # leave alone the workers other tests have not released yet
+            with mock.patch.object(background_thread, "_WORKERS", {worker}):
+                background_thread._after_fork_in_child()
+
+        self.assertIsNone(worker._thread)
+        self.assertTrue(worker._restart_on_emit)
+        self.assertEqual(worker._queue.qsize(), 0)
+        self.assertEqual(worker._queue.maxsize, 10)
+        self.assertEqual(worker._pending_retries, 0)
+        self.assertIsNot(worker._operational_lock, operational_lock)
+        self.assertIsNot(worker._inflight, inflight)
+        self.assertNotIn(worker._handle_exit, atexit_mock.registered_funcs)
+
+        # the worker is restarted by the first entry logged in the child
+        with self._init_atexit_mock():
+            with mock.patch("threading.Thread", new=_Thread):
+                self._enqueue_record(worker, "child")
+
+        self.assertTrue(worker.is_alive)
+        self.assertFalse(worker._restart_on_emit)
+        self.assertEqual(worker._queue.get_nowait()["message"], "child")
+
+    def test__after_fork_in_child_not_started(self):
+        worker = self._make_one(_Logger(self.NAME))
+
+        worker._after_fork_in_child()
+        self._enqueue_record(worker, "child")
+
+        self.assertFalse(worker._restart_on_emit)
+        self.assertIsNone(worker._thread)
+
+    def test__after_fork_in_child_resets_grpc_api(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        logger = _Logger(self.NAME)
+        logger.client = mock.Mock(_use_grpc=True, _logging_api=object())
+        worker = self._make_one(logger)
+        budget_lock = background_thread._GLOBAL_RETRY_BUDGET._lock
+
+        background_thread._after_fork_in_child()
+
+        self.assertIsNone(worker._cloud_logger.client._logging_api)
+        self.assertIsNot(background_thread._GLOBAL_RETRY_BUDGET._lock, budget_lock)
+
+    def test__after_fork_in_child_resets_stats(self):
+        worker = self._make_one(_Logger(self.NAME))
+        worker._record_outcome(sent=[{"message": "1"}])
+
+        worker._after_fork_in_child()
+
+        self.assertEqual(worker.stats()["committed"], 0)
+
+    def test__after_fork_in_child_releases_spool(self):
+        worker, _ = self._make_spool_worker()
+
+        worker._after_fork_in_child()
+
+        self.assertIsNone(worker._spool)
+
+
+class Test__EntryQueue(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        return background_thread._EntryQueue
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_unbounded(self):
+        queue_ = self._make_one()
+        for i in range(100):
+            queue_.put_nowait({"message": str(i)})
+
+        self.assertEqual(queue_.qsize(), 100)
+
+    def test_byte_accounting(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        queue_ = self._make_one()
+        entry = {"message": "hello"}
+        queue_.put_nowait(entry)
+
+        self.assertEqual(queue_.bytes, background_thread._estimate_entry_size(entry))
+        queue_.get_nowait()
+        self.assertEqual(queue_.bytes, 0)
+
+    def test_is_nearly_full_unbounded(self):
+        queue_ = self._make_one()
+        for i in range(100):
+            queue_.put_nowait({"message": str(i)})
+
+        self.assertFalse(queue_.is_nearly_full(0.8))
+
+    def test_is_nearly_full_maxsize(self):
+        queue_ = self._make_one(1)
+        self.assertFalse(queue_.is_nearly_full(0.8))
+        queue_.put_nowait({"message": "1"})
+        self.assertTrue(queue_.is_nearly_full(0.8))
+
+    def test_is_nearly_full_max_bytes(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        entry = {"message": "hello"}
+        size = background_thread._estimate_entry_size(entry)
+        queue_ = self._make_one(max_bytes=size * 2)
+        queue_.put_nowait(entry)
+        self.assertFalse(queue_.is_nearly_full(0.8))
+        queue_.put_nowait(dict(entry))
+        self.assertTrue(queue_.is_nearly_full(0.8))
+
+    def test_put_nowait_full(self):
+        queue_ = self._make_one(1)
+        queue_.put_nowait({"message": "1"})
+
+        with self.assertRaises(queue.Full):
+            queue_.put_nowait({"message": "2"})
+
+    def test_put_evicting_no_candidates(self):
+        queue_ = self._make_one(1)
+        queue_.put_nowait({"message": "1", "severity": 500})
+
+        with self.assertRaises(queue.Full):
+            queue_.put_evicting(
+                {"message": "2"}, evict_if=lambda e: e["severity"] < 400
+            )
+
+        # the queue should be left unmodified
+        self.assertEqual(queue_.qsize(), 1)
+        self.assertEqual(queue_.unfinished_tasks, 1)
+
+    def test_put_front(self):
+        queue_ = self._make_one(1)
+        queue_.put_nowait({"message": "1"})
+
+        # items put at the front ignore the limits
+        queue_.put_front("retry")
+
+        self.assertEqual(queue_.get_nowait(), "retry")
+        self.assertEqual(queue_.get_nowait(), {"message": "1"})
+        self.assertEqual(queue_.unfinished_tasks, 2)
+
+    def test_put_front_not_before(self):
+        queue_ = self._make_one()
+        queue_.put_front("retry", not_before=time.monotonic() + 0.2)
+        queue_.put_nowait({"message": "1"})
+
+        # the held back item does not delay the other items
+        self.assertEqual(queue_.get_many(timeout=0), [{"message": "1"}])
+        with self.assertRaises(queue.Empty):
+            queue_.get_many(timeout=0)
+        self.assertEqual(queue_.qsize(), 1)
+
+        # and is returned once due
+        self.assertEqual(queue_.get_many(timeout=5.0), ["retry"])
+        self.assertEqual(queue_.unfinished_tasks, 2)
+
+    def test_get_many_include_delayed(self):
+        queue_ = self._make_one()
+        queue_.put_nowait({"message": "1"})
+        queue_.put_front("retry", not_before=time.monotonic() + 60)
+
+        items = queue_.get_many(timeout=0, include_delayed=True)
+
+        self.assertEqual(items, ["retry", {"message": "1"}])
+
+    def test_put_evicting_marks_done(self):
+        queue_ = self._make_one(1)
+        queue_.put_nowait({"message": "1"})
+
+        evicted = queue_.put_evicting({"message": "2"})
+
+        self.assertEqual(evicted, [{"message": "1"}])
+        queue_.get_nowait()
+        queue_.task_done()
+        # join should not block on the evicted entry
+        queue_.join()
+
+    def test_express_lane(self):
+        queue_ = self._make_one(priority_severity=500)
+        queue_.put_nowait({"message": "1", "severity": 200})
+        queue_.put_nowait({"message": "2", "severity": 500})
+        queue_.put_nowait({"message": "3"})
+        queue_.put_nowait({"message": "4", "severity": 800})
+
+        self.assertEqual(queue_.qsize(), 4)
+        self.assertEqual(queue_._next_size(), queue_._express_sizes[0])
+        self.assertEqual(
+            [queue_.get_nowait()["message"] for _ in range(4)], ["2", "4", "1", "3"]
+        )
+        self.assertEqual(queue_.bytes, 0)
+
+    def test_put_evicting_express_lane_last(self):
+        queue_ = self._make_one(2, priority_severity=500)
+        queue_.put_nowait({"message": "1", "severity": 500})
+        queue_.put_nowait({"message": "2", "severity": 200})
+
+        evicted = queue_.put_evicting({"message": "3", "severity": 200})
+        self.assertEqual(evicted, [{"message": "2", "severity": 200}])
+
+        evicted = queue_.put_evicting({"message": "4", "severity": 500})
+        self.assertEqual(evicted, [{"message": "3", "severity": 200}])
+
+        evicted = queue_.put_evicting({"message": "5", "severity": 500})
+        self.assertEqual(evicted, [{"message": "1", "severity": 500}])
+        self.assertEqual(queue_.qsize(), 2)
+        self.assertEqual(queue_.unfinished_tasks, 2)
+
+
+class Test__EntryQueueStats(unittest.TestCase):
+    def test_counts(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        queue_ = background_thread._EntryQueue()
+        queue_.put({"message": "1"})
+        queue_.put({"message": "2"})
+        queue_.put(background_thread._WORKER_TERMINATOR)
+        size = queue_.bytes
+        queue_.get()
+        queue_.get()
+
+        self.assertEqual(queue_.peak, 3)
+        self.assertEqual(queue_.enqueued, 2)
+        self.assertEqual(queue_.dequeued_bytes, size)
+
+
+class Test__backoff_delay(unittest.TestCase):
+    @staticmethod
+    def _call_fut(attempt, **kw):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        return background_thread._backoff_delay(attempt, **kw)
+
+    def test_exponential_with_full_jitter(self):
+        with mock.patch("random.uniform", side_effect=lambda low, high: high) as m:
+            delays = [self._call_fut(n, initial=0.5, maximum=3.0) for n in (1, 2, 3, 4)]
+
+        self.assertEqual(delays, [0.5, 1.0, 2.0, 3.0])
+        self.assertTrue(all(call[0][0] == 0 for call in m.call_args_list))
+
+
+class Test__oldest_timestamp(unittest.TestCase):
+    @staticmethod
+    def _call_fut(entries):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        return background_thread._oldest_timestamp(entries)
+
+    def test_mixed_timestamps(self):
+        import datetime
+        from google.cloud.logging_v2.entries import TextEntry
+
+        earliest = datetime.datetime(2016, 12, 31, tzinfo=datetime.timezone.utc)
+        entries = [
+            TextEntry(payload="1", timestamp=earliest.timestamp() + 1),
+            TextEntry(payload="2", timestamp=earliest),
+            TextEntry(payload="3"),
+        ]
+
+        self.assertEqual(self._call_fut(entries), earliest.timestamp())
+
+    def test_ignores_bool(self):
+        from google.cloud.logging_v2.entries import TextEntry
+
+        entries = [TextEntry(payload="1", timestamp=True)]
+
+        self.assertIsNone(self._call_fut(entries))
+
+
+class Test__RetryBudget(unittest.TestCase):
+    @staticmethod
+    def _make_one(**kw):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        return background_thread._RetryBudget(**kw)
+
+    def test_exhausted(self):
+        budget = self._make_one(max_tokens=4, token_ratio=0.5)
+
+        self.assertTrue(budget.try_spend())
+        self.assertTrue(budget.try_spend())
+        # retries stop once half of the tokens are spent
+        self.assertFalse(budget.try_spend())
+
+        budget.on_success()
+        budget.on_success()
+        self.assertTrue(budget.try_spend())
+
+    def test_on_success_capped(self):
+        budget = self._make_one(max_tokens=4)
+
+        budget.on_success()
+
+        self.assertEqual(budget.tokens, 4)
+
+
+class Test__AdaptiveBatchController(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        return background_thread._AdaptiveBatchController
+
+    def _make_one(self, max_batch_size=100, max_latency=1.0, target_latency=1.0):
+        return self._get_target_class()(
+            max_batch_size=max_batch_size,
+            max_latency=max_latency,
+            target_latency=target_latency,
+        )
+
+    def test_additive_increase_under_backlog(self):
+        controller = self._make_one()
+
+        controller.on_commit(commit_latency=0.1, succeeded=True, queue_depth=50)
+        controller.on_commit(commit_latency=0.1, succeeded=True, queue_depth=50)
+
+        self.assertEqual(controller.batch_size, 21)
+        self.assertAlmostEqual(controller.latency, 0.2)
+
+    def test_increase_capped(self):
+        controller = self._make_one()
+
+        for _ in range(20):
+            controller.on_commit(commit_latency=0.1, succeeded=True, queue_depth=500)
+
+        self.assertEqual(controller.batch_size, 100)
+        self.assertEqual(controller.latency, 1.0)
+
+    def test_multiplicative_decrease_on_failure(self):
+        controller = self._make_one()
+        controller.batch_size = 80
+        controller.latency = 0.8
+
+        controller.on_commit(commit_latency=0.1, succeeded=False, queue_depth=500)
+
+        self.assertEqual(controller.batch_size, 40)
+        self.assertAlmostEqual(controller.latency, 0.4)
+
+    def test_multiplicative_decrease_on_slow_commit(self):
+        controller = self._make_one(target_latency=0.5)
+        controller.batch_size = 1
+
+        controller.on_commit(commit_latency=2.0, succeeded=True, queue_depth=500)
+
+        self.assertEqual(controller.batch_size, 1)
+
+    def test_idle_reduces_latency(self):
+        controller = self._make_one()
+        controller.batch_size = 50
+        controller.latency = 0.8
+
+        controller.on_commit(commit_latency=0.1, succeeded=True, queue_depth=0)
+
+        self.assertEqual(controller.batch_size, 50)
+        self.assertAlmostEqual(controller.latency, 0.4)
+
+
+class Test__EntryQueueGetMany(unittest.TestCase):
+    @staticmethod
+    def _make_queue(*entries, **kw):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        queue_ = background_thread._EntryQueue(**kw)
+        for entry in entries:
+            queue_.put_nowait(entry)
+        return queue_
+
+    def test_max_items(self):
+        queue_ = self._make_queue(*({"message": str(i)} for i in range(5)))
+
+        items = queue_.get_many(max_items=3)
+
+        self.assertEqual(len(items), 3)
+        self.assertEqual(queue_.qsize(), 2)
+
+    def test_all_available(self):
+        queue_ = self._make_queue(*({"message": str(i)} for i in range(5)))
+
+        items = queue_.get_many()
+
+        self.assertEqual([item["message"] for item in items], list("01234"))
+        self.assertEqual(queue_.unfinished_tasks, 5)
+
+    def test_stops_at_terminator(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        terminator = background_thread._WORKER_TERMINATOR
+        queue_ = self._make_queue({"message": "1"}, terminator, {"message": "2"})
+
+        start = time.monotonic()
+        items = queue_.get_many(max_items=3, max_latency=5)
+
+        self.assertEqual(items, [{"message": "1"}, terminator])
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_max_bytes(self):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        small = {"message": "a"}
+        large = {"message": "a" * 1000}
+        queue_ = self._make_queue(small, small, large, small)
+        max_bytes = background_thread._estimate_entry_size(small) * 3
+
+        items = queue_.get_many(max_bytes=max_bytes)
+
+        # the large entry does not fit, and is left for the next batch
+        self.assertEqual(items, [small, small])
+        self.assertEqual(queue_.qsize(), 2)
+
+    def test_max_bytes_oversized_first_item(self):
+        large = {"message": "a" * 1000}
+        queue_ = self._make_queue(large, {"message": "a"})
+
+        items = queue_.get_many(max_bytes=10)
+
+        self.assertEqual(items, [large])
+
+    def test_timeout(self):
+        queue_ = self._make_queue()
+
+        with self.assertRaises(queue.Empty):
+            queue_.get_many(timeout=0)
+
+    def test_max_latency(self):
+        import threading
+
+        queue_ = self._make_queue({"message": "1"})
+        timer = threading.Timer(0.05, queue_.put_nowait, ({"message": "2"},))
+        timer.start()
+        self.addCleanup(timer.join)
+
+        start = time.monotonic()
+        items = queue_.get_many(max_items=2, max_latency=5)
+
+        # entries arriving within the latency join the batch, which is sent
+        # as soon as it is full
+        self.assertEqual(len(items), 2)
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_urgent(self):
+        queue_ = self._make_queue(
+            {"message": "1"}, {"message": "2", "severity": 500}, priority_severity=500
+        )
+
+        start = time.monotonic()
+        items = queue_.get_many(max_items=10, max_latency=5, urgent=queue_.is_priority)
+
+        # the urgent entry ends the wait, but queued entries are still added
+        self.assertEqual([item["message"] for item in items], ["2", "1"])
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_unblocks_producers(self):
+        import threading
+
+        queue_ = self._make_queue({"message": "1"}, {"message": "2"}, maxsize=2)
+        put = threading.Thread(target=queue_.put, args=({"message": "3"},))
+        put.start()
+
+        items = queue_.get_many()
+        put.join(timeout=5)
+
+        self.assertEqual(len(items), 2)
+        self.assertFalse(put.is_alive())
+        self.assertEqual(queue_.qsize(), 1)
+
+
+class Test__estimate_entry_size(unittest.TestCase):
+    @staticmethod
+    def _call_fut(entry):
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        return background_thread._estimate_entry_size(entry)
+
+    def test_non_entry(self):
+        self.assertEqual(self._call_fut(object()), 0)
+
+    def test_grows_with_payload(self):
+        small = self._call_fut({"message": "a"})
+        large = self._call_fut({"message": "a" * 1000})
+
+        self.assertEqual(large - small, 999)
+
+    def test_non_ascii(self):
+        ascii_size = self._call_fut({"message": "aa"})
+        utf8_size = self._call_fut({"message": "\u00e9\u00e9"})
+
+        self.assertEqual(utf8_size - ascii_size, 2)
+
+    def test_nested_payload(self):
+        size = self._call_fut(
+            {"message": {"key": ["value", 1, None, {"nested": True}]}}
+        )
+
+        self.assertGreater(size, self._call_fut({"message": "value"}))
+
+
+class Test__QueuedEntry(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.logging_v2.handlers.transports import background_thread
+
+        return background_thread._QueuedEntry
+
+    def _make_one(self, **kwargs):
+        return self._get_target_class()(**kwargs)
+
+    def test_mapping_of_given_arguments(self):
+        entry = self._make_one(message="hello", severity="INFO")
+
+        self.assertEqual(entry, {"message": "hello", "severity": "INFO"})
+        self.assertEqual(len(entry), 2)
+        self.assertEqual(entry["message"], "hello")
+        self.assertIsNone(entry.get("resource"))
+        self.assertNotIn("resource", entry)
+        with self.assertRaises(KeyError):
+            entry["resource"]
+
+    def test_none_is_kept(self):
+        entry = self._make_one(message="hello", resource=None)
+
+        self.assertIn("resource", entry)
+        self.assertIsNone(entry["resource"])
+        self.assertEqual(entry.to_kwargs(), {"message": "hello", "resource": None})
+
+    def test_extra_arguments(self):
+        entry = self._make_one(message="hello", unknown=1)
+
+        self.assertEqual(entry, {"message": "hello", "unknown": 1})
+        self.assertEqual(entry["unknown"], 1)
+        self.assertEqual(entry.to_kwargs(), {"message": "hello", "unknown": 1})
+
+    def test_no_instance_dict(self):
+        entry = self._make_one(message="hello")
+
+        self.assertFalse(hasattr(entry, "__dict__"))
+
+    def test__log_queued(self):
+        from google.cloud.logging_v2.entries import TextEntry
+        from google.cloud.logging_v2.handlers.transports.background_thread import (
+            _log_queued,
+        )
+        from google.cloud.logging_v2.logger import Batch
+
+        batch = Batch(_Logger("test"), client=None)
+        _log_queued(batch, self._make_one(message="hello", resource=None))
+        _log_queued(batch, {"message": "world"})
+
+        self.assertEqual(
+            batch.entries,
+            [TextEntry(payload="hello", resource=None), TextEntry(payload="world")],
+        )
+
+
+class _Thread(object):
+    def __init__(self, target, name):
+        self._target = target
+        self._name = name
+        self._timeout = None
+        self._terminate_on_join = True
+        self.daemon = False
+
+    def is_alive(self):
+        return self._is_alive
+
+    def start(self):
+        self._is_alive = True
+
+    def stop(self):
+        self._is_alive = False
+
+    def join(self, timeout=None):
+        self._timeout = timeout
+        if self._terminate_on_join:
+            self.stop()
+
+
+class _Batch(object):
+    def __init__(self):
+        self.entries = []
+        self.commit_called = False
+        self.commit_count = None
+
+    def log(
+        self,
+        message,
+        severity=logging.INFO,
+        resource=None,
+        labels=None,
+        trace=None,
+        span_id=None,
+        timestamp=None,
+        http_request=None,
+    ):
+        from google.cloud.logging_v2.logger import _GLOBAL_RESOURCE
+
+        assert resource is None
+        resource = _GLOBAL_RESOURCE
+
+        self.log_called_with = (message, severity, resource, labels, trace, span_id)
+        self.entries.append(message)
+
+    def commit(self):
+        self.commit_called = True
+        self.commit_count = len(self.entries)
+        del self.entries[:]
+
+
+class _RaisingBatch(_Batch):
+    def commit(self):
+        self.commit_called = True
+        raise ValueError("This batch raises on commit.")
+
+
+class _SelectiveRaisingBatch(_Batch):
+    def commit(self):
+        if "fail" in self.entries:
+            self.commit_called = True
+            raise ValueError("This batch raises on commit.")
+        super(_SelectiveRaisingBatch, self).commit()
+
+
+class _PartiallyWritingBatch(_Batch):
+    def commit(self):
+        # writes the other entries, as Batch does with a rejected entry
+        self.commit_called = True
+        self.entries[:] = [entry for entry in self.entries if entry == "fail"]
+        if self.entries:
+            raise ValueError("This batch rejects an entry.")
+
+
+class _Logger(object):
+    def __init__(self, name, resource=None):
+        self.name = name
+        self._batch_cls = _Batch
+        self._batch = None
+        self._batches = []
+        self._num_batches = 0
+        self.resource = resource
+
+    def batch(self):
+        self._batch = self._batch_cls()
+        self._batches.append(self._batch)
+        self._num_batches += 1
+        return self._batch
+
+
+class _Client(object):
+    def __init__(self, project, _http=None, credentials=None):
+        import mock
+
+        self.project = project
+        self._http = _http
+        self._credentials = credentials
+        self._connection = mock.Mock(credentials=credentials, spec=["credentials"])
+
+    def logger(self, name, resource=None):  # pylint: disable=unused-argument
+        self._logger = _Logger(name, resource=resource)
+        return self._logger
+
+
+class _APIClient(object):
+    def __init__(self, project):
+        self.project = project
+        self.logging_api = mock.Mock(spec=["write_entries"])
+
+
+class _SharedClient(_APIClient):
+    def logger(self, name, resource=None):
+        from google.cloud.logging_v2.logger import Logger
+
+        return Logger(name, self, resource=resource)
 
 
 class _AtexitMock(object):
@@ -35,10 +35,48 @@ class TestBaseHandler(unittest.TestCase):
     def test_resource_is_valid_argunent(self):
         self._make_one("client", "name", resource="resource")
 
+    def test_send_deferred_defaults_to_send(self):
+        import mock
+
+        target = self._make_one("client", "name")
+        target.send = mock.Mock()
+        record = object()
+        prepare = mock.Mock(return_value=("message", {"resource": "resource"}))
+
+        target.send_deferred(record, prepare)
+
+        prepare.assert_called_once_with(record)
+        target.send.assert_called_once_with(record, "message", resource="resource")
+
     def test_flush_is_abstract_and_optional(self):
         target = self._make_one("client", "name")
-        target.flush()
+        result = target.flush(timeout=1)
+
+        self.assertEqual(tuple(result), (0, 0, 0, 0.0))
+        self.assertTrue(result.completed)
+
+    def test_stats_is_optional(self):
+        target = self._make_one("client", "name")
+
+        self.assertEqual(target.stats(), {})
 
     def test_close_is_abstract_and_optional(self):
         target = self._make_one("client", "name")
         target.close()
+
+
+class TestFlushResult(unittest.TestCase):
+    def test_completed(self):
+        from google.cloud.logging_v2.handlers.transports.base import FlushResult
+
+        self.assertTrue(FlushResult(sent=1, failed=1, pending=0, elapsed=0).completed)
+        self.assertFalse(FlushResult(sent=1, failed=0, pending=1, elapsed=0).completed)
+
+    def test__combine(self):
+        from google.cloud.logging_v2.handlers.transports.base import FlushResult
+
+        result = FlushResult._combine(
+            [FlushResult(1, 2, 3, 0.5), FlushResult(10, 20, 30, 0.25)], elapsed=1.0
+        )
+
+        self.assertEqual(result, FlushResult(11, 22, 33, 1.0))
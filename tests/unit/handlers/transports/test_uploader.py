@@ -0,0 +1,533 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+import shutil
+import socket
+import tempfile
+import unittest
+
+import mock
+
+
+class Test__frames(unittest.TestCase):
+    def test_roundtrip(self):
+        from google.cloud.logging_v2.handlers.transports.uploader import (
+            _decode_frames,
+            _encode_entry,
+            _encode_frame,
+        )
+
+        data = _encode_frame(_encode_entry({"textPayload": "1"})) + _encode_frame(
+            _encode_entry({"x": "é"})
+        )
+        buffer = bytearray(data[:-3])
+
+        self.assertEqual(_decode_frames(buffer), [b'{"textPayload": "1"}'])
+        # the incomplete frame is left in the buffer
+        buffer.extend(data[-3:])
+        self.assertEqual(_decode_frames(buffer), ['{"x": "é"}'.encode("utf-8")])
+        self.assertEqual(buffer, bytearray())
+
+    def test_too_large(self):
+        from google.cloud.logging_v2.handlers.transports import uploader
+
+        buffer = bytearray(uploader._FRAME_HEADER.pack(uploader._MAX_FRAME_BYTES + 1))
+
+        with self.assertRaises(ValueError):
+            uploader._decode_frames(buffer)
+
+
+class _UploaderTestBase(unittest.TestCase):
+    PROJECT = "PROJECT"
+
+    def setUp(self):
+        # Unix socket paths are limited to about 100 characters
+        directory = tempfile.mkdtemp(dir="/tmp")
+        self.addCleanup(shutil.rmtree, directory)
+        self.address = os.path.join(directory, "uploader.sock")
+
+    def _make_uploader(self, **kw):
+        from google.cloud.logging_v2.handlers.transports.uploader import (
+            SharedUploader,
+        )
+
+        client = _Client(self.PROJECT)
+        kw.setdefault("max_latency", 0)
+        uploader = SharedUploader(client, self.address, **kw)
+        self.addCleanup(uploader.close)
+        return uploader, client.logging_api
+
+    def _make_transport(self, **kw):
+        from google.cloud.logging_v2.handlers.transports.uploader import (
+            SharedUploaderTransport,
+        )
+
+        client = _Client(self.PROJECT)
+        transport = SharedUploaderTransport(
+            client, "python_logger", address=self.address, **kw
+        )
+        self.addCleanup(transport.close)
+        return transport, client
+
+    @staticmethod
+    def _send(transport, message, levelno=logging.INFO, **kw):
+        record = logging.LogRecord("testing", levelno, None, None, message, None, None)
+        transport.send(record, message, **kw)
+
+    @staticmethod
+    def _written_entries(api):
+        return [
+            entry for call in api.write_entries.call_args_list for entry in call[0][0]
+        ]
+
+
+class TestSharedUploader(_UploaderTestBase):
+    def test_send_through_uploader(self):
+        from google.cloud.logging_v2._helpers import LogSeverity
+
+        uploader, api = self._make_uploader()
+        uploader.start()
+        transport, client = self._make_transport()
+
+        self._send(transport, "1")
+        self._send(transport, {"key": "value"}, levelno=logging.ERROR)
+        transport.close()
+        uploader.close()
+
+        entries = self._written_entries(api)
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(entries[0]["textPayload"], "1")
+        self.assertEqual(entries[1]["jsonPayload"], {"key": "value"})
+        self.assertEqual(entries[1]["severity"], LogSeverity.ERROR)
+        for entry in entries:
+            self.assertEqual(entry["logName"], "projects/PROJECT/logs/python_logger")
+            self.assertEqual(entry["resource"], {"type": "global", "labels": {}})
+            self.assertEqual(entry["labels"], {"python_logger": "testing"})
+        self.assertTrue(api.write_entries.call_args[1]["partial_success"])
+        self.assertFalse(os.path.exists(self.address))
+        client.logging_api.write_entries.assert_not_called()
+
+    def test_flush(self):
+        from google.cloud.logging_v2.handlers.transports.uploader import (
+            _encode_entry,
+        )
+
+        uploader, api = self._make_uploader()
+        uploader.start()
+        uploader._put(_encode_entry({"textPayload": "1"}))
+        uploader._put(_encode_entry({"textPayload": "2"}))
+
+        result = uploader.flush()
+
+        self.assertEqual(result[:3], (2, 0, 0))
+        self.assertEqual(len(self._written_entries(api)), 2)
+
+    def test_flush_w_partial_errors(self):
+        from google.api_core.exceptions import InvalidArgument
+        from google.cloud.logging_v2.handlers.transports.uploader import (
+            _encode_entry,
+        )
+
+        error = InvalidArgument("invalid")
+        error.log_entry_errors = {1: InvalidArgument("invalid entry")}
+        uploader, api = self._make_uploader()
+        api.write_entries.side_effect = error
+        uploader.start()
+        uploader._put(_encode_entry({"textPayload": "1"}))
+        uploader._put(_encode_entry({"textPayload": "2"}))
+
+        with self.assertLogs(
+            "google.cloud.logging_v2.handlers.transports.uploader", logging.ERROR
+        ):
+            result = uploader.flush()
+
+        self.assertEqual(result[:3], (1, 1, 0))
+
+    def test_flush_timeout(self):
+        import threading
+        from google.cloud.logging_v2.handlers.transports.uploader import (
+            _encode_entry,
+        )
+
+        release = threading.Event()
+        uploader, api = self._make_uploader()
+        api.write_entries.side_effect = lambda *args, **kw: release.wait()
+        self.addCleanup(release.set)
+        uploader.start()
+        uploader._put(_encode_entry({"textPayload": "1"}))
+
+        result = uploader.flush(timeout=0.1)
+
+        self.assertEqual(result[:3], (0, 0, 1))
+        self.assertFalse(result.completed)
+        release.set()
+        self.assertEqual(uploader.flush()[:3], (1, 0, 0))
+
+    def test_batches_across_connections(self):
+        uploader, api = self._make_uploader(batch_size=2, max_latency=5)
+        uploader.start()
+        first, _ = self._make_transport()
+        second, _ = self._make_transport()
+
+        self._send(first, "1")
+        self._send(second, "2")
+        first.close()
+        second.close()
+        uploader.close()
+
+        api.write_entries.assert_called_once()
+        entries = self._written_entries(api)
+        self.assertEqual(sorted(e["textPayload"] for e in entries), ["1", "2"])
+
+    def test_write_error(self):
+        uploader, api = self._make_uploader()
+        api.write_entries.side_effect = ValueError("invalid")
+        uploader.start()
+        transport, _ = self._make_transport()
+
+        with self.assertLogs(
+            "google.cloud.logging_v2.handlers.transports.uploader", "ERROR"
+        ):
+            self._send(transport, "1")
+            transport.close()
+            uploader.close()
+
+        api.write_entries.assert_called_once()
+
+    def test_queue_full(self):
+        uploader, _ = self._make_uploader(max_queue_size=1)
+
+        uploader._put(b'{"textPayload": "1"}')
+        uploader._put(b'{"textPayload": "2"}')
+
+        self.assertEqual(uploader._queue.qsize(), 1)
+        self.assertEqual(uploader.dropped_entries, 1)
+
+    def test_another_uploader_listening(self):
+        uploader, _ = self._make_uploader()
+        uploader.start()
+        other, _ = self._make_uploader()
+
+        with self.assertRaises(ValueError):
+            other.start()
+
+    def test_stale_socket_file(self):
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(self.address)
+        stale.close()
+        uploader, _ = self._make_uploader()
+
+        uploader.start()
+
+        self.assertTrue(uploader.is_alive)
+
+    def test_socket_file_of_another_user(self):
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(self.address)
+        stale.close()
+        uploader, _ = self._make_uploader()
+
+        with mock.patch("os.getuid", return_value=os.getuid() + 1):
+            with self.assertRaises(PermissionError):
+                uploader.start()
+
+        # the file is neither used nor removed
+        self.assertFalse(uploader.is_alive)
+        self.assertTrue(os.path.exists(self.address))
+
+    def test_default_address(self):
+        from google.cloud.logging_v2.handlers.transports.uploader import (
+            SharedUploader,
+        )
+
+        tmpdir = os.path.dirname(self.address)
+        with mock.patch.dict(os.environ, {"XDG_RUNTIME_DIR": ""}):
+            with mock.patch("tempfile.gettempdir", return_value=tmpdir):
+                uploader = SharedUploader(_Client(self.PROJECT))
+        self.addCleanup(uploader.close)
+
+        uploader.start()
+
+        directory = os.path.dirname(uploader.address)
+        self.assertEqual(os.path.dirname(directory), tmpdir)
+        self.assertEqual(os.stat(directory).st_mode & 0o777, 0o700)
+        self.assertTrue(uploader.is_alive)
+
+    def test_default_address_xdg_runtime_dir(self):
+        from google.cloud.logging_v2.handlers.transports.uploader import (
+            SharedUploader,
+        )
+
+        directory = os.path.dirname(self.address)
+        with mock.patch.dict(os.environ, {"XDG_RUNTIME_DIR": directory}):
+            uploader = SharedUploader(_Client(self.PROJECT))
+
+        self.assertEqual(
+            uploader.address,
+            os.path.join(directory, "google-cloud-logging-uploader.sock"),
+        )
+
+    def test_default_directory_not_private(self):
+        from google.cloud.logging_v2.handlers.transports.uploader import (
+            SharedUploader,
+        )
+
+        directory = os.path.dirname(self.address)
+        os.chmod(directory, 0o777)
+        with mock.patch.dict(os.environ, {"XDG_RUNTIME_DIR": directory}):
+            uploader = SharedUploader(_Client(self.PROJECT))
+
+        with self.assertRaises(PermissionError):
+            uploader.start()
+        self.assertFalse(uploader.is_alive)
+
+    def test_serve_forever(self):
+        uploader, _ = self._make_uploader()
+        uploader.shutdown()
+
+        uploader.serve_forever()
+
+        self.assertFalse(uploader.is_alive)
+        self.assertFalse(os.path.exists(self.address))
+
+    def test_start_uploader_process(self):
+        from google.cloud.logging_v2.handlers.transports import uploader
+
+        with mock.patch("multiprocessing.get_context") as get_context:
+            process = uploader.start_uploader_process(
+                self.address, client_kwargs={"project": "p"}, batch_size=5
+            )
+
+        get_context.assert_called_once_with("spawn")
+        context = get_context.return_value
+        self.assertIs(process, context.Process.return_value)
+        kwargs = context.Process.call_args[1]
+        self.assertIs(kwargs["target"], uploader._run_uploader)
+        self.assertEqual(
+            kwargs["args"], (self.address, {"project": "p"}, {"batch_size": 5})
+        )
+        self.assertTrue(kwargs["daemon"])
+        process.start.assert_called_once_with()
+
+    def test_send_through_ring_buffer(self):
+        ring_path = self.address + ".ring"
+        uploader, api = self._make_uploader(ring_path=ring_path, ring_capacity=4096)
+        uploader.start()
+        transport, _ = self._make_transport(ring_path=ring_path)
+
+        self._send(transport, "1")
+        self._send(transport, "2")
+        transport.close()
+        uploader.close()
+
+        entries = self._written_entries(api)
+        self.assertEqual([entry["textPayload"] for entry in entries], ["1", "2"])
+        self.assertEqual(entries[0]["logName"], "projects/PROJECT/logs/python_logger")
+        self.assertEqual(uploader.ring_dropped_entries, 0)
+
+    def test_ring_buffer_full(self):
+        ring_path = self.address + ".ring"
+        uploader, _ = self._make_uploader(ring_path=ring_path, ring_capacity=64)
+        uploader.start()
+        transport, _ = self._make_transport(ring_path=ring_path)
+        with mock.patch.object(uploader, "_receive_ring"):
+            self._send(transport, "x" * 100)
+
+            self.assertEqual(transport.dropped_entries, 1)
+            self.assertEqual(uploader.ring_dropped_entries, 1)
+
+
+class TestSharedUploaderTransport(_UploaderTestBase):
+    def test_fallback_when_unreachable(self):
+        fallback = mock.Mock()
+        transport, client = self._make_transport(fallback_transport=fallback)
+
+        with self.assertLogs(
+            "google.cloud.logging_v2.handlers.transports.uploader", "WARNING"
+        ):
+            self._send(transport, "1")
+        self._send(transport, "2")
+
+        fallback.assert_called_once_with(
+            client, "python_logger", resource=transport._resource
+        )
+        self.assertEqual(fallback.return_value.send.call_count, 2)
+        transport.flush()
+        fallback.return_value.flush.assert_called_once_with(timeout=None)
+        transport.close()
+        fallback.return_value.close.assert_called_once_with()
+
+    def test_socket_of_another_user(self):
+        uploader, _ = self._make_uploader()
+        uploader.start()
+        fallback = mock.Mock()
+        transport, _ = self._make_transport(fallback_transport=fallback)
+
+        with mock.patch("os.getuid", return_value=os.getuid() + 1):
+            with self.assertLogs(
+                "google.cloud.logging_v2.handlers.transports.uploader", "WARNING"
+            ):
+                self._send(transport, "1")
+
+        self.assertIsNone(transport._socket)
+        fallback.return_value.send.assert_called_once()
+
+    def test_drop_when_unreachable_without_fallback(self):
+        transport, _ = self._make_transport(fallback_transport=None)
+
+        with self.assertLogs(
+            "google.cloud.logging_v2.handlers.transports.uploader", "WARNING"
+        ):
+            self._send(transport, "1")
+
+        self.assertEqual(transport.dropped_entries, 1)
+
+    def test_reconnect_interval(self):
+        transport, _ = self._make_transport(
+            fallback_transport=None, reconnect_interval=60
+        )
+        with self.assertLogs(
+            "google.cloud.logging_v2.handlers.transports.uploader", "WARNING"
+        ):
+            self._send(transport, "1")
+        uploader, api = self._make_uploader()
+        uploader.start()
+
+        # not connecting again before the interval elapsed
+        self._send(transport, "2")
+        self.assertEqual(transport.dropped_entries, 2)
+
+        transport._next_connect = 0
+        self._send(transport, "3")
+        transport.close()
+        uploader.close()
+
+        self.assertEqual([e["textPayload"] for e in self._written_entries(api)], ["3"])
+
+    def test_send_error_disconnects(self):
+        uploader, _ = self._make_uploader()
+        uploader.start()
+        fallback = mock.Mock()
+        transport, _ = self._make_transport(fallback_transport=fallback)
+        self._send(transport, "1")
+
+        transport._socket = mock.Mock(spec=["sendall", "close"])
+        transport._socket.sendall.side_effect = socket.timeout()
+        self._send(transport, "2")
+
+        self.assertIsNone(transport._socket)
+        self.assertGreater(transport._next_connect, 0)
+        fallback.return_value.send.assert_called_once()
+
+    def test_labels_and_fields(self):
+        transport, _ = self._make_transport()
+        transport.logger.labels = {"default": "label"}
+
+        record = logging.LogRecord("testing", logging.INFO, None, None, "1", None, None)
+        entry = transport._make_entry(
+            record, "1", trace="projects/p/traces/t", labels={"key": "value"}
+        )
+
+        self.assertEqual(entry["trace"], "projects/p/traces/t")
+        self.assertEqual(
+            entry["labels"],
+            {"default": "label", "key": "value", "python_logger": "testing"},
+        )
+        self.assertIn("timestamp", entry)
+
+    def test_ring_buffer_missing(self):
+        fallback = mock.Mock()
+        transport, _ = self._make_transport(
+            fallback_transport=fallback, ring_path=self.address + ".ring"
+        )
+
+        with self.assertLogs(
+            "google.cloud.logging_v2.handlers.transports.uploader", "WARNING"
+        ):
+            self._send(transport, "1")
+
+        fallback.return_value.send.assert_called_once()
+
+    def test_ring_buffer_replaced(self):
+        from google.cloud.logging_v2.handlers.transports import _ring
+
+        ring_path = self.address + ".ring"
+        consumer = _ring._RingBuffer(ring_path, capacity=1024)
+        self.addCleanup(consumer.close)
+        transport, _ = self._make_transport(ring_path=ring_path)
+        self._send(transport, "1")
+        consumer.close()
+
+        # a restarted uploader recreates the ring buffer
+        consumer = _ring._RingBuffer(ring_path, capacity=2048)
+        self.addCleanup(consumer.close)
+        self._send(transport, "2")
+
+        (payload,) = consumer.get_many()
+        self.assertIn(b'"2"', payload)
+
+    def test_ring_buffer_replaced_unreadable(self):
+        from google.cloud.logging_v2.handlers.transports import _ring
+
+        ring_path = self.address + ".ring"
+        consumer = _ring._RingBuffer(ring_path, capacity=1024)
+        self.addCleanup(consumer.close)
+        fallback = mock.Mock()
+        transport, _ = self._make_transport(
+            fallback_transport=fallback, ring_path=ring_path
+        )
+        self._send(transport, "1")
+        consumer = _ring._RingBuffer(ring_path, capacity=2048)
+        self.addCleanup(consumer.close)
+
+        with mock.patch("os.getuid", return_value=os.getuid() + 1):
+            with self.assertLogs(
+                "google.cloud.logging_v2.handlers.transports.uploader", "WARNING"
+            ):
+                self._send(transport, "2")
+
+        self.assertIsNone(transport._ring)
+        fallback.return_value.send.assert_called_once()
+
+    def test__after_fork_in_child(self):
+        from google.cloud.logging_v2.handlers.transports import uploader as module
+
+        uploader, _ = self._make_uploader()
+        uploader.start()
+        transport, _ = self._make_transport()
+        self._send(transport, "1")
+        lock = transport._lock
+
+        transport._ring = mock.Mock(spec=["close"])
+        ring = transport._ring
+
+        module._after_fork_in_child()
+
+        self.assertIsNone(transport._socket)
+        self.assertIsNone(transport._ring)
+        ring.close.assert_called_once_with()
+        self.assertIsNot(transport._lock, lock)
+
+
+class _Client(object):
+    def __init__(self, project):
+        self.project = project
+        self.logging_api = mock.Mock(spec=["write_entries"])
+
+    def logger(self, name, resource=None):
+        from google.cloud.logging_v2.logger import Logger
+
+        return Logger(name, self, resource=resource)
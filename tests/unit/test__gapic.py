@@ -175,6 +175,57 @@ class Test_LoggingAPI(unittest.TestCase):
         assert request.entries[0].resource.type == entry["resource"]["type"]
         assert request.entries[0].text_payload == "text"
 
+    def test_write_entries_log_entry(self):
+        from google.cloud.logging_v2.entries import TextEntry
+
+        client = self.make_logging_api()
+
+        with mock.patch.object(
+            type(client._gapic_api.transport.write_log_entries), "__call__"
+        ) as call:
+            call.return_value = logging_v2.types.WriteLogEntriesResponse()
+            client.write_entries(
+                [TextEntry(log_name=self.LOG_PATH, payload="text", severity="ERROR")]
+            )
+
+        request = call.call_args.args[0]
+        assert request.entries[0].log_name == self.LOG_PATH
+        assert request.entries[0].resource.type == "global"
+        assert request.entries[0].text_payload == "text"
+        assert request.entries[0].severity == logging_v2._helpers.LogSeverity.ERROR
+
+    def test_write_entries_log_entry_error(self):
+        from google.cloud.logging_v2.entries import StructEntry
+
+        client = self.make_logging_api()
+        with self.assertRaises(ValueError):
+            with mock.patch.object(
+                type(client._gapic_api.transport.write_log_entries), "__call__"
+            ) as call:
+                client.write_entries([StructEntry(payload={"time": datetime.now()})])
+
+        call.assert_not_called()
+
+    def test_write_entries_w_partial_errors(self):
+        from google.api_core.exceptions import InvalidArgument
+        from google.protobuf import any_pb2
+
+        partial_errors = logging_v2.types.WriteLogEntriesPartialErrors.pb()()
+        partial_errors.log_entry_errors[1].code = 3
+        detail = any_pb2.Any()
+        detail.Pack(partial_errors)
+        client = self.make_logging_api()
+        with mock.patch.object(
+            type(client._gapic_api.transport.write_log_entries), "__call__"
+        ) as call:
+            call.side_effect = InvalidArgument("partial", details=[detail])
+            with self.assertRaises(InvalidArgument) as context:
+                client.write_entries([{"textPayload": "0"}, {"textPayload": "1"}])
+
+        entry_errors = context.exception.log_entry_errors
+        self.assertEqual(list(entry_errors), [1])
+        self.assertIsInstance(entry_errors[1], InvalidArgument)
+
     def test_write_entries_parse_error(self):
         client = self.make_logging_api()
         with self.assertRaises(ValueError):
@@ -201,6 +252,43 @@ class Test_LoggingAPI(unittest.TestCase):
         assert call.call_args.args[0].log_name == self.LOG_PATH
 
 
+class Test_AsyncLoggingAPI(unittest.TestCase):
+    LOG_PATH = f"projects/{PROJECT}/logs/log_name"
+
+    def test_write_entries(self):
+        import asyncio
+
+        gapic_client = mock.Mock(spec=["write_log_entries"])
+        gapic_client.write_log_entries = mock.AsyncMock()
+        api = _gapic._AsyncLoggingAPI(gapic_client, mock.sentinel.client)
+        entry = {
+            "logName": self.LOG_PATH,
+            "resource": {"type": "global"},
+            "textPayload": "text",
+        }
+
+        asyncio.run(api.write_entries([entry], labels={"key": "value"}))
+
+        gapic_client.write_log_entries.assert_awaited_once()
+        request = gapic_client.write_log_entries.call_args.kwargs["request"]
+        assert request.partial_success is True
+        assert request.labels == {"key": "value"}
+        assert request.entries[0].log_name == entry["logName"]
+        assert request.entries[0].text_payload == "text"
+
+    def test_write_entries_parse_error(self):
+        import asyncio
+
+        gapic_client = mock.Mock(spec=["write_log_entries"])
+        gapic_client.write_log_entries = mock.AsyncMock()
+        api = _gapic._AsyncLoggingAPI(gapic_client, mock.sentinel.client)
+        entry = {"logName": self.LOG_PATH, "jsonPayload": {"time": datetime.now()}}
+
+        with self.assertRaises(ValueError):
+            asyncio.run(api.write_entries([entry]))
+        gapic_client.write_log_entries.assert_not_called()
+
+
 class Test_SinksAPI(unittest.TestCase):
     SINK_NAME = "sink_name"
     PARENT_PATH = f"projects/{PROJECT}"
@@ -726,6 +814,155 @@ class Test__log_entry_mapping_to_pb(unittest.TestCase):
         self.assertEqual(result, entry_pb)
 
 
+class Test__log_entry_to_pb(unittest.TestCase):
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.logging_v2._gapic import _log_entry_to_pb
+
+        return _log_entry_to_pb(*args, **kwargs)
+
+    def _assert_same_as_mapping(self, entry):
+        from google.cloud.logging_v2._gapic import _log_entry_mapping_to_pb
+
+        self.assertEqual(
+            self._call_fut(entry), _log_entry_mapping_to_pb(entry.to_api_repr())
+        )
+
+    @staticmethod
+    def _fields():
+        from google.cloud.logging_v2.resource import Resource
+
+        return {
+            "log_name": "projects/PROJECT/logs/name",
+            "labels": {"key": "value"},
+            "insert_id": "IID",
+            "severity": "warning",
+            "http_request": {"requestMethod": "GET", "status": 200},
+            "timestamp": datetime(2016, 12, 31, 0, 1, 2, 999999),
+            "resource": Resource(type="gae_app", labels={"module_id": "default"}),
+            "trace": "projects/PROJECT/traces/TRACE",
+            "span_id": "000000000000004a",
+            "trace_sampled": True,
+            "source_location": {"file": "app.py", "line": 42, "function": "main"},
+            "operation": {"id": "OPID", "producer": "app", "first": True},
+        }
+
+    def test_log_entry(self):
+        from google.cloud.logging_v2.entries import LogEntry
+
+        self._assert_same_as_mapping(LogEntry(**self._fields()))
+
+    def test_text_entry(self):
+        from google.cloud.logging_v2.entries import TextEntry
+
+        self._assert_same_as_mapping(TextEntry(payload="text", **self._fields()))
+
+    def test_struct_entry(self):
+        from google.cloud.logging_v2.entries import StructEntry
+
+        payload = {"message": "text", "count": 3, "nested": {"items": [1, "a", None]}}
+        self._assert_same_as_mapping(StructEntry(payload=payload, **self._fields()))
+
+    def test_struct_entry_empty(self):
+        from google.cloud.logging_v2.entries import StructEntry
+
+        result = self._call_fut(StructEntry(payload={}))
+        self.assertIn("json_payload", result)
+
+    def test_protobuf_entry(self):
+        from google.cloud.logging_v2.entries import LogEntry
+        from google.cloud.logging_v2.entries import ProtobufEntry
+        from google.protobuf.struct_pb2 import Struct, Value
+
+        message = Struct(fields={"foo": Value(bool_value=True)})
+        result = self._call_fut(ProtobufEntry(payload=message, **self._fields()))
+
+        unpacked = Struct()
+        self.assertTrue(LogEntryPB.pb(result).proto_payload.Unpack(unpacked))
+        self.assertEqual(unpacked, message)
+        # the other fields are the same as for any entry
+        result.proto_payload = None
+        self.assertEqual(result, self._call_fut(LogEntry(**self._fields())))
+
+    def test_protobuf_entry_json_payload(self):
+        from google.cloud.logging_v2.entries import ProtobufEntry
+
+        payload = {
+            "@type": "type.googleapis.com/google.protobuf.Struct",
+            "value": {"foo": "bar"},
+        }
+        self._assert_same_as_mapping(ProtobufEntry(payload=payload))
+
+    def test_numeric_severity(self):
+        from google.cloud.logging_v2._helpers import LogSeverity
+        from google.cloud.logging_v2.entries import TextEntry
+
+        self._assert_same_as_mapping(
+            TextEntry(payload="text", severity=LogSeverity.ERROR)
+        )
+
+    def test_aware_timestamp(self):
+        from datetime import timedelta
+        from datetime import timezone
+        from google.cloud.logging_v2.entries import TextEntry
+
+        timestamp = datetime(
+            2016, 12, 31, 5, 1, 2, 123456, timezone(timedelta(hours=5))
+        )
+        result = self._call_fut(TextEntry(payload="text", timestamp=timestamp))
+
+        # the time zone is ignored, as in the JSON representation
+        self.assertEqual(
+            result.timestamp, datetime(2016, 12, 31, 5, 1, 2, 123456, timezone.utc)
+        )
+        self._assert_same_as_mapping(TextEntry(payload="text", timestamp=timestamp))
+
+    def test_posix_timestamp(self):
+        from datetime import timezone
+        from google.cloud.logging_v2.entries import TextEntry
+
+        for posix_time, expected in (
+            (1483142462.123456, datetime(2016, 12, 31, 0, 1, 2, 123456)),
+            (1483142462.9999996, datetime(2016, 12, 31, 0, 1, 3)),
+            (-0.5, datetime(1969, 12, 31, 23, 59, 59, 500000)),
+        ):
+            entry = TextEntry(payload="text", timestamp=posix_time)
+            result = self._call_fut(entry)
+
+            # rounded to the microsecond, as a datetime from the same time
+            self.assertEqual(
+                result.timestamp,
+                datetime.fromtimestamp(posix_time, timezone.utc),
+            )
+            self.assertEqual(result.timestamp, expected.replace(tzinfo=timezone.utc))
+            self._assert_same_as_mapping(entry)
+
+    def test_bool_timestamp(self):
+        from google.cloud.logging_v2.entries import TextEntry
+
+        with self.assertRaises(TypeError):
+            self._call_fut(TextEntry(payload="text", timestamp=True))
+
+    def test_source_location_without_line(self):
+        from google.cloud.logging_v2.entries import TextEntry
+
+        self._assert_same_as_mapping(
+            TextEntry(payload="text", source_location={"file": "app.py"})
+        )
+
+    def test_invalid_label(self):
+        from google.cloud.logging_v2.entries import TextEntry
+
+        with self.assertRaises(TypeError):
+            self._call_fut(TextEntry(payload="text", labels={"key": 1}))
+
+    def test_invalid_severity(self):
+        from google.cloud.logging_v2.entries import TextEntry
+
+        with self.assertRaises(ValueError):
+            self._call_fut(TextEntry(payload="text", severity="LOUD"))
+
+
 @mock.patch("google.cloud.logging_v2._gapic.LoggingServiceV2Client", autospec=True)
 def test_make_logging_api(gapic_client):
     client = mock.Mock(spec=["_credentials", "_client_info", "_client_options"])
@@ -739,6 +976,19 @@ def test_make_logging_api(gapic_client):
     )
 
 
+@mock.patch("google.cloud.logging_v2._gapic.LoggingServiceV2AsyncClient", autospec=True)
+def test_make_async_logging_api(gapic_client):
+    client = mock.Mock(spec=["_credentials", "_client_info", "_client_options"])
+    api = _gapic.make_async_logging_api(client)
+    assert api._client == client
+    assert api._gapic_api == gapic_client.return_value
+    gapic_client.assert_called_once_with(
+        credentials=client._credentials,
+        client_info=client._client_info,
+        client_options=client._client_options,
+    )
+
+
 @mock.patch("google.cloud.logging_v2._gapic.MetricsServiceV2Client", autospec=True)
 def test_make_metrics_api(gapic_client):
     client = mock.Mock(spec=["_credentials", "_client_info", "_client_options"])
@@ -125,6 +125,27 @@ class Test_retrieve_metadata_server(unittest.TestCase):
         self.assertIsNone(metadata)
 
 
+class Test__estimate_log_entry_size(unittest.TestCase):
+    @staticmethod
+    def _call_fut(entry):
+        from google.cloud.logging_v2._helpers import _estimate_log_entry_size
+
+        return _estimate_log_entry_size(entry)
+
+    def test_grows_with_payload_and_fields(self):
+        from google.cloud.logging import StructEntry
+        from google.cloud.logging import TextEntry
+
+        small = self._call_fut(TextEntry(payload="x"))
+        self.assertGreater(self._call_fut(TextEntry(payload="x" * 1000)), small + 998)
+        self.assertGreater(
+            self._call_fut(TextEntry(payload="x", labels={"key": "value"})), small
+        )
+        self.assertGreater(
+            self._call_fut(StructEntry(payload={"key": "é" * 100})), small + 200
+        )
+
+
 class Test__normalize_severity(unittest.TestCase):
     @staticmethod
     def _stackdriver_severity():
@@ -166,6 +187,96 @@ class Test__normalize_severity(unittest.TestCase):
         self._normalize_severity_helper(unknown_level, unknown_level)
 
 
+class Test__is_retryable_error(unittest.TestCase):
+    @staticmethod
+    def _call_fut(exc):
+        from google.cloud.logging_v2._helpers import _is_retryable_error
+
+        return _is_retryable_error(exc)
+
+    def test_transient(self):
+        from google.api_core import exceptions
+
+        self.assertTrue(self._call_fut(exceptions.ServiceUnavailable("unavailable")))
+        self.assertTrue(self._call_fut(exceptions.DeadlineExceeded("deadline")))
+        self.assertTrue(self._call_fut(exceptions.ResourceExhausted("quota")))
+        self.assertTrue(self._call_fut(ConnectionResetError()))
+
+    def test_permanent(self):
+        from google.api_core import exceptions
+
+        self.assertFalse(self._call_fut(exceptions.InvalidArgument("invalid")))
+        self.assertFalse(self._call_fut(exceptions.PermissionDenied("denied")))
+        self.assertFalse(self._call_fut(ValueError()))
+
+
+class Test__parse_partial_errors(unittest.TestCase):
+    @staticmethod
+    def _call_fut(err):
+        from google.cloud.logging_v2._helpers import _parse_partial_errors
+
+        return _parse_partial_errors(err)
+
+    @staticmethod
+    def _make_partial_errors():
+        from google.cloud.logging_v2.types import WriteLogEntriesPartialErrors
+
+        message = WriteLogEntriesPartialErrors.pb()()
+        message.log_entry_errors[0].code = 3
+        message.log_entry_errors[0].message = "invalid"
+        message.log_entry_errors[2].code = 14
+        return message
+
+    def _check(self, entry_errors):
+        from google.api_core.exceptions import InvalidArgument
+        from google.api_core.exceptions import ServiceUnavailable
+
+        self.assertEqual(sorted(entry_errors), [0, 2])
+        self.assertIsInstance(entry_errors[0], InvalidArgument)
+        self.assertEqual(entry_errors[0].message, "invalid")
+        self.assertIsInstance(entry_errors[2], ServiceUnavailable)
+
+    def test_wo_partial_errors(self):
+        from google.api_core.exceptions import InvalidArgument
+        from google.rpc.error_details_pb2 import DebugInfo
+
+        self.assertIsNone(self._call_fut(InvalidArgument("bad")))
+        self.assertIsNone(self._call_fut(ValueError("bad")))
+        err = InvalidArgument("bad", details=[DebugInfo(), {"@type": "other"}])
+        self.assertIsNone(self._call_fut(err))
+
+    def test_w_packed_message(self):
+        from google.api_core.exceptions import InvalidArgument
+        from google.protobuf import any_pb2
+
+        detail = any_pb2.Any()
+        detail.Pack(self._make_partial_errors())
+        other = any_pb2.Any(type_url="type.googleapis.com/google.rpc.Other")
+
+        self._check(self._call_fut(InvalidArgument("bad", details=[other, detail])))
+
+    def test_w_message(self):
+        from google.api_core.exceptions import InvalidArgument
+        from google.cloud.logging_v2.types import WriteLogEntriesPartialErrors
+
+        message = self._make_partial_errors()
+        self._check(self._call_fut(InvalidArgument("bad", details=[message])))
+        wrapped = WriteLogEntriesPartialErrors.wrap(message)
+        self._check(self._call_fut(InvalidArgument("bad", details=[wrapped])))
+
+    def test_w_json(self):
+        from google.api_core.exceptions import InvalidArgument
+
+        detail = {
+            "@type": "type.googleapis.com/google.logging.v2.WriteLogEntriesPartialErrors",
+            "logEntryErrors": {
+                "0": {"code": 3, "message": "invalid"},
+                "2": {"code": 14},
+            },
+        }
+        self._check(self._call_fut(InvalidArgument("bad", details=[detail])))
+
+
 class Test__add_defaults_to_filter(unittest.TestCase):
     @staticmethod
     def _time_format():
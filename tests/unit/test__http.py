@@ -293,6 +293,8 @@ class Test_LoggingAPI(unittest.TestCase):
         )
 
     def test_write_entries_single(self):
+        import json
+
         TEXT = "TEXT"
         ENTRY = {
             "textPayload": TEXT,
@@ -309,9 +311,12 @@ class Test_LoggingAPI(unittest.TestCase):
         self.assertEqual(conn._called_with["method"], "POST")
         path = f"/{self.WRITE_ENTRIES_PATH}"
         self.assertEqual(conn._called_with["path"], path)
-        self.assertEqual(conn._called_with["data"], SENT)
+        self.assertEqual(conn._called_with["content_type"], "application/json")
+        self.assertEqual(json.loads(conn._called_with["data"]), SENT)
 
     def test_write_entries_multiple(self):
+        import json
+
         TEXT = "TEXT"
         LOG_NAME = f"projects/{self.PROJECT}/logs/{self.LOGGER_NAME}"
         RESOURCE = {"type": "global"}
@@ -337,7 +342,65 @@ class Test_LoggingAPI(unittest.TestCase):
         self.assertEqual(conn._called_with["method"], "POST")
         path = f"/{self.WRITE_ENTRIES_PATH}"
         self.assertEqual(conn._called_with["path"], path)
-        self.assertEqual(conn._called_with["data"], SENT)
+        self.assertEqual(conn._called_with["content_type"], "application/json")
+        self.assertEqual(json.loads(conn._called_with["data"]), SENT)
+
+    def test_write_entries_w_datetime_and_decimal(self):
+        import datetime
+        import decimal
+        import json
+
+        ENTRY = {
+            "jsonPayload": {
+                "when": datetime.datetime(2026, 1, 2, 3, 4, 5),
+                "amount": decimal.Decimal("1.5"),
+            }
+        }
+        conn = _Connection({})
+        client = _Client(conn)
+        api = self._make_one(client)
+
+        api.write_entries([ENTRY])
+
+        sent = json.loads(conn._called_with["data"])
+        self.assertEqual(
+            sent["entries"],
+            [{"jsonPayload": {"when": "2026-01-02T03:04:05", "amount": 1.5}}],
+        )
+
+    def test_write_entries_w_lone_surrogate(self):
+        import json
+
+        ENTRY = {"textPayload": "bytes: \udcff"}
+        conn = _Connection({})
+        client = _Client(conn)
+        api = self._make_one(client)
+
+        api.write_entries([ENTRY])
+
+        sent = json.loads(conn._called_with["data"])
+        self.assertEqual(sent["entries"], [ENTRY])
+
+    def test_write_entries_w_partial_errors(self):
+        from google.api_core.exceptions import InvalidArgument
+
+        detail = {
+            "@type": "type.googleapis.com/google.logging.v2.WriteLogEntriesPartialErrors",
+            "logEntryErrors": {"1": {"code": 3, "message": "invalid"}},
+        }
+        conn = _Connection()
+        conn.api_request = mock.Mock(
+            side_effect=InvalidArgument("partial", details=[detail])
+        )
+        api = self._make_one(_Client(conn))
+
+        with self.assertRaises(InvalidArgument) as context:
+            api.write_entries([{"textPayload": "0"}, {"textPayload": "1"}])
+
+        entry_errors = context.exception.log_entry_errors
+        self.assertEqual(list(entry_errors), [1])
+        self.assertIsInstance(entry_errors[1], InvalidArgument)
+        self.assertEqual(entry_errors[1].message, "invalid")
 
     def test_logger_delete(self):
         path = f"/projects/{self.PROJECT}/logs/{self.LOGGER_NAME}"
@@ -0,0 +1,370 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import json
+import unittest
+
+import mock
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.logging_v2.circuit_breaker import CircuitBreaker
+
+        return CircuitBreaker
+
+    def _make_one(self, **kw):
+        return self._get_target_class()(**kw)
+
+    @staticmethod
+    def _unavailable(*args, **kwargs):
+        from google.api_core import exceptions
+
+        raise exceptions.ServiceUnavailable("unavailable")
+
+    def _fail(self, breaker, times):
+        from google.api_core import exceptions
+
+        for _ in range(times):
+            with self.assertRaises(exceptions.ServiceUnavailable):
+                breaker.call(self._unavailable)
+
+    def test_ctor_defaults(self):
+        from google.cloud.logging_v2 import circuit_breaker
+
+        breaker = self._make_one()
+
+        self.assertEqual(breaker.state, circuit_breaker.CLOSED)
+        self.assertEqual(breaker.failure_threshold, 5)
+        self.assertEqual(breaker.reset_timeout, 30.0)
+        self.assertIsNone(breaker.fallback)
+        self.assertEqual(breaker.rejected_calls, 0)
+
+    def test_call_success(self):
+        breaker = self._make_one()
+        func = mock.Mock(return_value="result")
+
+        self.assertEqual(breaker.call(func, 1, key="value"), "result")
+        func.assert_called_once_with(1, key="value")
+
+    def test_opens_after_consecutive_failures(self):
+        from google.cloud.logging_v2 import circuit_breaker
+
+        breaker = self._make_one(failure_threshold=2)
+        func = mock.Mock()
+
+        self._fail(breaker, 2)
+
+        self.assertEqual(breaker.state, circuit_breaker.OPEN)
+        with self.assertRaises(circuit_breaker.CircuitOpenError):
+            breaker.call(func)
+        func.assert_not_called()
+        self.assertEqual(breaker.rejected_calls, 1)
+
+    def test_success_resets_failures(self):
+        from google.cloud.logging_v2 import circuit_breaker
+
+        breaker = self._make_one(failure_threshold=2)
+
+        self._fail(breaker, 1)
+        breaker.call(mock.Mock())
+        self._fail(breaker, 1)
+
+        self.assertEqual(breaker.state, circuit_breaker.CLOSED)
+
+    def test_permanent_errors_not_counted(self):
+        from google.api_core import exceptions
+        from google.cloud.logging_v2 import circuit_breaker
+
+        breaker = self._make_one(failure_threshold=1)
+        func = mock.Mock(side_effect=exceptions.InvalidArgument("invalid"))
+
+        with self.assertRaises(exceptions.InvalidArgument):
+            breaker.call(func)
+
+        self.assertEqual(breaker.state, circuit_breaker.CLOSED)
+
+    def test_other_errors_not_counted(self):
+        from google.cloud.logging_v2 import circuit_breaker
+
+        breaker = self._make_one(failure_threshold=2)
+        func = mock.Mock(side_effect=TypeError("bug"))
+
+        self._fail(breaker, 1)
+        with self.assertRaises(TypeError):
+            breaker.call(func)
+        self._fail(breaker, 1)
+
+        # the error did not reset the count of failures
+        self.assertEqual(breaker.state, circuit_breaker.OPEN)
+
+    def test_half_open_probe_other_error(self):
+        from google.cloud.logging_v2 import circuit_breaker
+
+        breaker = self._make_one(failure_threshold=1, reset_timeout=0)
+        self._fail(breaker, 1)
+
+        with self.assertRaises(AttributeError):
+            breaker.call(mock.Mock(side_effect=AttributeError("bug")))
+
+        # the circuit does not close, and lets another probe through
+        self.assertEqual(breaker.state, circuit_breaker.HALF_OPEN)
+        breaker.call(mock.Mock())
+        self.assertEqual(breaker.state, circuit_breaker.CLOSED)
+
+    def test_half_open_probe_success(self):
+        from google.cloud.logging_v2 import circuit_breaker
+
+        breaker = self._make_one(failure_threshold=1, reset_timeout=0)
+        self._fail(breaker, 1)
+        self.assertEqual(breaker.state, circuit_breaker.HALF_OPEN)
+
+        breaker.call(mock.Mock())
+
+        self.assertEqual(breaker.state, circuit_breaker.CLOSED)
+
+    def test_half_open_probe_failure(self):
+        from google.cloud.logging_v2 import circuit_breaker
+
+        breaker = self._make_one(failure_threshold=3, reset_timeout=0)
+        self._fail(breaker, 3)
+
+        with mock.patch("time.monotonic", return_value=0.0):
+            # a single failed probe opens the circuit again
+            self._fail(breaker, 1)
+            breaker.reset_timeout = 10
+            self.assertEqual(breaker.state, circuit_breaker.OPEN)
+
+    def test_half_open_single_probe(self):
+        from google.cloud.logging_v2 import circuit_breaker
+
+        breaker = self._make_one(failure_threshold=1, reset_timeout=0)
+        self._fail(breaker, 1)
+
+        def probe():
+            # other calls are rejected while the probe is pending
+            with self.assertRaises(circuit_breaker.CircuitOpenError):
+                breaker.call(mock.Mock())
+            with self.assertRaises(circuit_breaker.CircuitOpenError):
+                breaker.raise_if_open()
+
+        breaker.call(probe)
+
+        self.assertEqual(breaker.state, circuit_breaker.CLOSED)
+
+    def test_fallback(self):
+        breaker = self._make_one(failure_threshold=1)
+        fallback = breaker.fallback = mock.Mock(return_value="fallback")
+        self._fail(breaker, 1)
+        func = mock.Mock()
+
+        result = breaker.call(func, ["entry"], logger_name="name")
+
+        self.assertEqual(result, "fallback")
+        fallback.assert_called_once_with(["entry"], logger_name="name")
+        func.assert_not_called()
+
+    def test_raise_if_open(self):
+        from google.cloud.logging_v2 import circuit_breaker
+
+        breaker = self._make_one(failure_threshold=1)
+        breaker.raise_if_open()
+        self._fail(breaker, 1)
+
+        with self.assertRaises(circuit_breaker.CircuitOpenError):
+            breaker.raise_if_open()
+
+        # does not raise when there is a fallback to call
+        breaker.fallback = mock.Mock()
+        breaker.raise_if_open()
+
+    def test_call_async(self):
+        import asyncio
+        from google.api_core import exceptions
+        from google.cloud.logging_v2 import circuit_breaker
+
+        breaker = self._make_one(failure_threshold=1)
+        func = mock.AsyncMock(return_value="result")
+
+        self.assertEqual(asyncio.run(breaker.call_async(func, 1)), "result")
+        func.assert_awaited_once_with(1)
+
+        func.side_effect = self._unavailable
+        with self.assertRaises(exceptions.ServiceUnavailable):
+            asyncio.run(breaker.call_async(func))
+        self.assertEqual(breaker.state, circuit_breaker.OPEN)
+        with self.assertRaises(circuit_breaker.CircuitOpenError):
+            asyncio.run(breaker.call_async(func))
+
+    def test__after_fork_in_child(self):
+        from google.cloud.logging_v2 import circuit_breaker
+
+        breaker = self._make_one(failure_threshold=1, reset_timeout=0)
+        self._fail(breaker, 1)
+        breaker._lock.acquire()
+        lock = breaker._lock
+
+        circuit_breaker._after_fork_in_child()
+
+        self.assertIsNot(breaker._lock, lock)
+        self.assertEqual(breaker.state, circuit_breaker.CLOSED)
+        self.assertEqual(breaker._failures, 0)
+        self.assertFalse(breaker._probing)
+
+    def test_circuit_open_error_is_retryable(self):
+        from google.cloud.logging_v2._helpers import _is_retryable_error
+        from google.cloud.logging_v2.circuit_breaker import CircuitOpenError
+
+        self.assertTrue(_is_retryable_error(CircuitOpenError("open")))
+
+
+class Test_CircuitBreakerLoggingAPI(unittest.TestCase):
+    @staticmethod
+    def _make_one(api, breaker):
+        from google.cloud.logging_v2.circuit_breaker import _CircuitBreakerLoggingAPI
+
+        return _CircuitBreakerLoggingAPI(api, breaker)
+
+    def test_write_entries(self):
+        breaker = mock.Mock(spec=["_call", "fallback"], fallback=None)
+        api = mock.Mock()
+        wrapped = self._make_one(api, breaker)
+
+        wrapped.write_entries(["entry"], logger_name="name")
+
+        breaker._call.assert_called_once_with(
+            api.write_entries, None, (["entry"],), {"logger_name": "name"}
+        )
+
+    def test_write_entries_converts_entries_for_fallback(self):
+        from google.cloud.logging_v2.circuit_breaker import CircuitBreaker
+        from google.cloud.logging_v2.entries import TextEntry
+
+        fallback = mock.Mock(return_value="fallback")
+        breaker = CircuitBreaker(failure_threshold=1, fallback=fallback)
+        breaker._on_failure()
+        wrapped = self._make_one(mock.Mock(), breaker)
+        entry = TextEntry(log_name="name", payload="text")
+
+        result = wrapped.write_entries([entry, {"textPayload": "mapping"}])
+
+        self.assertEqual(result, "fallback")
+        fallback.assert_called_once_with(
+            [entry.to_api_repr(), {"textPayload": "mapping"}]
+        )
+
+    def test_write_entries_closed_w_fallback_keeps_entries(self):
+        from google.cloud.logging_v2.circuit_breaker import CircuitBreaker
+        from google.cloud.logging_v2.entries import TextEntry
+
+        api = mock.Mock()
+        fallback = mock.Mock()
+        breaker = CircuitBreaker(fallback=fallback)
+        wrapped = self._make_one(api, breaker)
+        entry = TextEntry(log_name="name", payload="text")
+
+        wrapped.write_entries([entry], partial_success=True)
+
+        # the entry objects reach the API unconverted
+        api.write_entries.assert_called_once_with([entry], partial_success=True)
+        self.assertIsInstance(api.write_entries.call_args[0][0][0], TextEntry)
+        fallback.assert_not_called()
+
+    def test_delegates(self):
+        api = mock.Mock()
+        wrapped = self._make_one(api, mock.Mock())
+
+        wrapped.logger_delete("name")
+
+        api.logger_delete.assert_called_once_with("name")
+
+
+class Test_CircuitBreakerAsyncLoggingAPI(unittest.TestCase):
+    def test_write_entries(self):
+        import asyncio
+        from google.cloud.logging_v2.circuit_breaker import CircuitBreaker
+        from google.cloud.logging_v2.circuit_breaker import (
+            _CircuitBreakerAsyncLoggingAPI,
+        )
+
+        api = mock.Mock(spec=["write_entries"])
+        api.write_entries = mock.AsyncMock(return_value="result")
+        wrapped = _CircuitBreakerAsyncLoggingAPI(api, CircuitBreaker())
+
+        result = asyncio.run(wrapped.write_entries(["entry"], logger_name="name"))
+
+        self.assertEqual(result, "result")
+        api.write_entries.assert_awaited_once_with(["entry"], logger_name="name")
+
+
+class Test_write_entries_to_stdout(unittest.TestCase):
+    @staticmethod
+    def _call_fut(entries, **kw):
+        from google.cloud.logging_v2.circuit_breaker import write_entries_to_stdout
+
+        return write_entries_to_stdout(entries, **kw)
+
+    def test_structured_format(self):
+        stream = io.StringIO()
+        entries = [
+            {
+                "textPayload": "hello",
+                "severity": "ERROR",
+                "labels": {"entry": "1"},
+                "trace": "projects/p/traces/t",
+                "spanId": "s",
+                "timestamp": "2026-01-01T00:00:00.000000Z",
+            },
+            {"jsonPayload": {"message": "struct", "key": "value"}, "logName": "other"},
+        ]
+
+        self._call_fut(
+            entries,
+            logger_name="projects/p/logs/name",
+            resource={"type": "global"},
+            labels={"default": "2"},
+            partial_success=True,
+            stream=stream,
+        )
+
+        first, second = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(
+            first,
+            {
+                "message": "hello",
+                "severity": "ERROR",
+                "timestamp": "2026-01-01T00:00:00.000000Z",
+                "logging.googleapis.com/trace": "projects/p/traces/t",
+                "logging.googleapis.com/spanId": "s",
+                "logging.googleapis.com/labels": {"default": "2", "entry": "1"},
+                "logName": "projects/p/logs/name",
+            },
+        )
+        self.assertEqual(
+            second,
+            {
+                "message": "struct",
+                "key": "value",
+                "logging.googleapis.com/labels": {"default": "2"},
+                "logName": "other",
+            },
+        )
+
+    def test_default_stream(self):
+        with mock.patch("sys.stdout", new=io.StringIO()) as stdout:
+            self._call_fut([{"textPayload": "hello"}])
+
+        self.assertEqual(json.loads(stdout.getvalue()), {"message": "hello"})
@@ -152,6 +152,65 @@ class TestClient(unittest.TestCase):
         again = client.logging_api
         self.assertIs(again, api)
 
+    def test_logging_api_w_circuit_breaker(self):
+        from google.cloud.logging_v2._http import _LoggingAPI
+        from google.cloud.logging_v2.circuit_breaker import CircuitBreaker
+
+        breaker = CircuitBreaker()
+        client = self._make_one(
+            project=self.PROJECT,
+            credentials=_make_credentials(),
+            _use_grpc=False,
+            circuit_breaker=breaker,
+        )
+
+        api = client.logging_api
+
+        self.assertIs(client.circuit_breaker, breaker)
+        self.assertIs(api.circuit_breaker, breaker)
+        self.assertIsInstance(api._api, _LoggingAPI)
+        # API instance is cached
+        self.assertIs(client.logging_api, api)
+
+    def test_async_logging_api_wo_gapic(self):
+        client = self._make_one(
+            project=self.PROJECT, credentials=_make_credentials(), _use_grpc=False
+        )
+
+        with self.assertRaises(ValueError):
+            client.async_logging_api
+
+    def test_async_logging_api_w_gapic(self):
+        creds = _make_credentials()
+        client = self._make_one(project=self.PROJECT, credentials=creds, _use_grpc=True)
+
+        patch = mock.patch("google.cloud.logging_v2.client._gapic")
+        with patch as gapic_module:
+            api = client.async_logging_api
+
+        self.assertIs(api, gapic_module.make_async_logging_api.return_value)
+        gapic_module.make_async_logging_api.assert_called_once_with(client)
+        # API instance is cached
+        self.assertIs(client.async_logging_api, api)
+
+    def test_async_logging_api_w_circuit_breaker(self):
+        from google.cloud.logging_v2.circuit_breaker import CircuitBreaker
+
+        breaker = CircuitBreaker()
+        client = self._make_one(
+            project=self.PROJECT,
+            credentials=_make_credentials(),
+            _use_grpc=True,
+            circuit_breaker=breaker,
+        )
+
+        patch = mock.patch("google.cloud.logging_v2.client._gapic")
+        with patch as gapic_module:
+            api = client.async_logging_api
+
+        self.assertIs(api.circuit_breaker, breaker)
+        self.assertIs(api._api, gapic_module.make_async_logging_api.return_value)
+
     def test_veneer_grpc_headers(self):
         # test that client APIs have client_info populated with the expected veneer headers
         # required for proper instrumentation
@@ -311,6 +370,22 @@ class TestClient(unittest.TestCase):
         self.assertEqual(logger.default_resource, _GLOBAL_RESOURCE)
         self.assertEqual(logger.labels, labels)
 
+    def test_async_logger(self):
+        from google.cloud.logging import AsyncLogger
+        from google.cloud.logging_v2.logger import _GLOBAL_RESOURCE
+
+        creds = _make_credentials()
+        client = self._make_one(project=self.PROJECT, credentials=creds)
+        labels = {"test": "true"}
+        logger = client.async_logger(
+            self.LOGGER_NAME, resource=_GLOBAL_RESOURCE, labels=labels
+        )
+        self.assertIsInstance(logger, AsyncLogger)
+        self.assertEqual(logger.name, self.LOGGER_NAME)
+        self.assertIs(logger.client, client)
+        self.assertEqual(logger.default_resource, _GLOBAL_RESOURCE)
+        self.assertEqual(logger.labels, labels)
+
     def test_list_entries_defaults(self):
         from google.cloud.logging import TextEntry
 
@@ -978,6 +1053,28 @@ class TestClient(unittest.TestCase):
         client.flush_handlers()
         handler.flush.assert_called_once_with()
 
+    def test_flush_handlers_timeout(self):
+        from google.cloud.logging.handlers import CloudLoggingHandler
+        from google.cloud.logging_v2.handlers.transports import FlushResult
+
+        credentials = _make_credentials()
+        client = self._make_one(
+            project=self.PROJECT, credentials=credentials, _use_grpc=False
+        )
+        first = CloudLoggingHandler(client)
+        second = CloudLoggingHandler(client)
+        first.flush = mock.Mock(return_value=FlushResult(1, 0, 0, 0.1))
+        second.flush = mock.Mock(return_value=FlushResult(2, 1, 3, 0.1))
+
+        result = client.flush_handlers(timeout=10)
+
+        for handler in (first, second):
+            (timeout,) = handler.flush.call_args[1].values()
+            self.assertGreater(timeout, 0)
+            self.assertLessEqual(timeout, 10)
+        self.assertEqual(result[:3], (3, 1, 3))
+        self.assertFalse(result.completed)
+
     def test_flush_handlers_structured_log(self):
         import io
         from google.cloud.logging.handlers import StructuredLogHandler
@@ -409,6 +409,23 @@ class TestLogEntry(unittest.TestCase):
         }
         self.assertEqual(entry.to_api_repr(), expected)
 
+    def test_to_api_repr_w_posix_timestamp(self):
+        import datetime
+        from google.cloud._helpers import _datetime_to_rfc3339
+
+        timestamp = 1483142462.123456
+        entry = self._make_one(log_name="test.log", timestamp=timestamp)
+        expected = _datetime_to_rfc3339(
+            datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
+        )
+        self.assertEqual(entry.to_api_repr()["timestamp"], expected)
+        self.assertEqual(expected, "2016-12-31T00:01:02.123456Z")
+
+    def test_to_api_repr_w_bool_timestamp(self):
+        entry = self._make_one(log_name="test.log", timestamp=True)
+        with self.assertRaises(TypeError):
+            entry.to_api_repr()
+
     def test_to_api_repr_explicit(self):
         import datetime
         from google.cloud.logging import Resource
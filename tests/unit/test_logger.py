@@ -206,6 +206,36 @@ class TestLogger(unittest.TestCase):
             api._write_entries_called_with, (ENTRIES, None, None, None, True)
         )
 
+    def test_log_text_w_grpc(self):
+        from google.cloud.logging_v2.entries import TextEntry
+
+        client = _Client(self.PROJECT)
+        client._use_grpc = True
+        api = client.logging_api = _DummyLoggingAPI()
+        logger = self._make_one(self.LOGGER_NAME, client=client)
+
+        logger.log_text("TEXT")
+
+        # the entry is converted to protobuf by the gRPC API
+        (entry,) = api._write_entries_called_with[0]
+        self.assertIsInstance(entry, TextEntry)
+        self.assertEqual(entry.payload, "TEXT")
+        self.assertEqual(entry.log_name, logger.full_name)
+
+    def test_log_text_w_open_circuit_breaker(self):
+        from google.cloud.logging_v2.circuit_breaker import CircuitOpenError
+
+        client = _Client(self.PROJECT)
+        api = client.logging_api = _DummyLoggingAPI()
+        client.circuit_breaker = mock.Mock(spec=["raise_if_open"])
+        client.circuit_breaker.raise_if_open.side_effect = CircuitOpenError("open")
+        logger = self._make_one(self.LOGGER_NAME, client=client)
+
+        with self.assertRaises(CircuitOpenError):
+            logger.log_text("TEXT")
+
+        self.assertIsNone(api._write_entries_called_with)
+
     def test_log_text_w_unicode_and_default_labels(self):
         from google.cloud.logging_v2.handlers._monitored_resources import (
             detect_resource,
@@ -1460,6 +1490,25 @@ class TestBatch(unittest.TestCase):
         )
         self.assertEqual(batch.entries, [ENTRY])
 
+    def test_commit_w_open_circuit_breaker(self):
+        from google.cloud.logging_v2.circuit_breaker import CircuitOpenError
+
+        client = _Client(project=self.PROJECT)
+        api = client.logging_api = _DummyLoggingAPI()
+        client.circuit_breaker = mock.Mock(spec=["raise_if_open"])
+        client.circuit_breaker.raise_if_open.side_effect = CircuitOpenError("open")
+        entry = mock.Mock(spec=["to_api_repr"])
+        batch = self._make_one(_Logger(), client)
+        batch.entries.append(entry)
+
+        with self.assertRaises(CircuitOpenError):
+            batch.commit()
+
+        # entries are neither serialized nor cleared
+        entry.to_api_repr.assert_not_called()
+        self.assertIsNone(api._write_entries_called_with)
+        self.assertEqual(batch.entries, [entry])
+
     def test_commit_w_unknown_entry_type(self):
         from google.cloud.logging import LogEntry
         from google.cloud.logging_v2.entries import _GLOBAL_RESOURCE
@@ -1469,14 +1518,14 @@ class TestBatch(unittest.TestCase):
         api = client.logging_api = _DummyLoggingAPI()
         batch = self._make_one(logger, client)
         batch.entries.append(LogEntry(severity="blah"))
-        ENTRY = {"severity": "BLAH", "resource": _GLOBAL_RESOURCE._to_dict()}
+        ENTRY = {"severity": "BLAH"}
 
         batch.commit()
 
         self.assertEqual(list(batch.entries), [])
         self.assertEqual(
             api._write_entries_called_with,
-            ([ENTRY], logger.full_name, None, None, True),
+            ([ENTRY], logger.full_name, _GLOBAL_RESOURCE._to_dict(), None, True),
         )
 
     def test_commit_w_lowercase_severity_type(self):
@@ -1492,17 +1541,17 @@ class TestBatch(unittest.TestCase):
         batch.entries.append(LogEntry(severity="error"))
         batch.entries.append(LogEntry(severity="fatal"))
         ENTRIES = [
-            {"severity": "INFO", "resource": _GLOBAL_RESOURCE._to_dict()},
-            {"severity": "WARN", "resource": _GLOBAL_RESOURCE._to_dict()},
-            {"severity": "ERROR", "resource": _GLOBAL_RESOURCE._to_dict()},
-            {"severity": "FATAL", "resource": _GLOBAL_RESOURCE._to_dict()},
+            {"severity": "INFO"},
+            {"severity": "WARN"},
+            {"severity": "ERROR"},
+            {"severity": "FATAL"},
         ]
 
         batch.commit()
         self.assertEqual(list(batch.entries), [])
         self.assertEqual(
             api._write_entries_called_with,
-            (ENTRIES, logger.full_name, None, None, True),
+            (ENTRIES, logger.full_name, _GLOBAL_RESOURCE._to_dict(), None, True),
         )
 
     def test_commit_w_resource_specified(self):
@@ -1559,7 +1608,6 @@ class TestBatch(unittest.TestCase):
                 "textPayload": TEXT,
                 "insertId": IID1,
                 "timestamp": _datetime_to_rfc3339(TIMESTAMP1),
-                "resource": _GLOBAL_RESOURCE._to_dict(),
                 "trace": TRACE1,
                 "spanId": SPANID1,
                 "traceSampled": True,
@@ -1568,7 +1616,6 @@ class TestBatch(unittest.TestCase):
                 "jsonPayload": STRUCT,
                 "insertId": IID2,
                 "timestamp": _datetime_to_rfc3339(TIMESTAMP2),
-                "resource": _GLOBAL_RESOURCE._to_dict(),
                 "trace": TRACE2,
                 "spanId": SPANID2,
                 "traceSampled": False,
@@ -1577,7 +1624,6 @@ class TestBatch(unittest.TestCase):
                 "protoPayload": json.loads(MessageToJson(message)),
                 "insertId": IID3,
                 "timestamp": _datetime_to_rfc3339(TIMESTAMP3),
-                "resource": _GLOBAL_RESOURCE._to_dict(),
                 "trace": TRACE3,
                 "spanId": SPANID3,
                 "traceSampled": True,
@@ -1617,8 +1663,31 @@ class TestBatch(unittest.TestCase):
         self.assertEqual(list(batch.entries), [])
         self.assertEqual(
             api._write_entries_called_with,
-            (ENTRIES, logger.full_name, None, None, True),
+            (ENTRIES, logger.full_name, _GLOBAL_RESOURCE._to_dict(), None, True),
+        )
+
+    def test_commit_w_grpc(self):
+        client = _Client(project=self.PROJECT)
+        client._use_grpc = True
+        api = client.logging_api = _DummyLoggingAPI()
+        logger = _Logger()
+        batch = self._make_one(logger, client=client)
+        batch.log_text("first")
+        batch.log_struct({"message": "second"})
+        entries = list(batch.entries)
+
+        batch.commit()
+
+        # the shared resource is sent once, in the request
+        self.assertEqual(
+            api._write_entries_called_with[0],
+            [entry._replace(resource=None) for entry in entries],
+        )
+        self.assertEqual(api._write_entries_called_with[1], logger.full_name)
+        self.assertEqual(
+            api._write_entries_called_with[2], {"type": "global", "labels": {}}
         )
+        self.assertEqual(batch.entries, [])
 
     def test_commit_w_alternate_client(self):
         import json
@@ -1646,17 +1715,14 @@ class TestBatch(unittest.TestCase):
             {
                 "textPayload": TEXT,
                 "labels": LABELS,
-                "resource": _GLOBAL_RESOURCE._to_dict(),
             },
             {
                 "jsonPayload": STRUCT,
                 "severity": SEVERITY,
-                "resource": _GLOBAL_RESOURCE._to_dict(),
             },
             {
                 "protoPayload": json.loads(MessageToJson(message)),
                 "httpRequest": REQUEST,
-                "resource": _GLOBAL_RESOURCE._to_dict(),
             },
         ]
         batch = self._make_one(logger, client=client1)
@@ -1669,7 +1735,13 @@ class TestBatch(unittest.TestCase):
         self.assertEqual(list(batch.entries), [])
         self.assertEqual(
             api._write_entries_called_with,
-            (ENTRIES, logger.full_name, None, DEFAULT_LABELS, False),
+            (
+                ENTRIES,
+                logger.full_name,
+                _GLOBAL_RESOURCE._to_dict(),
+                DEFAULT_LABELS,
+                False,
+            ),
         )
 
     def test_context_mgr_success(self):
@@ -1697,16 +1769,13 @@ class TestBatch(unittest.TestCase):
             {
                 "textPayload": TEXT,
                 "httpRequest": REQUEST,
-                "resource": _GLOBAL_RESOURCE._to_dict(),
             },
             {
                 "jsonPayload": STRUCT,
                 "labels": LABELS,
-                "resource": _GLOBAL_RESOURCE._to_dict(),
             },
             {
                 "protoPayload": json.loads(MessageToJson(message)),
-                "resource": _GLOBAL_RESOURCE._to_dict(),
                 "severity": SEVERITY,
             },
         ]
@@ -1720,7 +1789,13 @@ class TestBatch(unittest.TestCase):
         self.assertEqual(list(batch.entries), [])
         self.assertEqual(
             api._write_entries_called_with,
-            (ENTRIES, logger.full_name, None, DEFAULT_LABELS, True),
+            (
+                ENTRIES,
+                logger.full_name,
+                _GLOBAL_RESOURCE._to_dict(),
+                DEFAULT_LABELS,
+                True,
+            ),
         )
 
     def test_context_mgr_failure(self):
@@ -1843,6 +1918,502 @@ class TestBatch(unittest.TestCase):
             api_entry = expected_log.to_api_repr()
             self.assertEqual(e.message, f"{starting_message}: {str(api_entry)}...")
 
+    def test_ctor_w_invalid_limits(self):
+        logger = _Logger()
+        client = _Client(project=self.PROJECT)
+        with self.assertRaises(ValueError):
+            self._make_one(logger, client, oversize_policy="unknown")
+        with self.assertRaises(ValueError):
+            self._make_one(logger, client, max_request_entries=0)
+
+    def test_commit_splits_by_entries(self):
+        client = _Client(project=self.PROJECT)
+        api = client.logging_api = _RejectingLoggingAPI()
+        batch = self._make_one(_Logger(), client, max_request_entries=2)
+        for i in range(5):
+            batch.log_text(str(i))
+
+        batch.commit()
+
+        self.assertEqual(api.requests, [["0", "1"], ["2", "3"], ["4"]])
+        self.assertEqual(batch.entries, [])
+
+    def test_commit_splits_by_bytes(self):
+        client = _Client(project=self.PROJECT)
+        api = client.logging_api = _RejectingLoggingAPI()
+        batch = self._make_one(_Logger(), client, max_request_bytes=1000)
+        for i in range(4):
+            batch.log_text(str(i) * 300)
+
+        batch.commit()
+
+        self.assertEqual([len(request) for request in api.requests], [2, 2])
+        self.assertEqual(batch.entries, [])
+
+    def test_commit_rejects_oversized_entries(self):
+        from google.api_core.exceptions import InvalidArgument
+
+        client = _Client(project=self.PROJECT)
+        api = client.logging_api = _RejectingLoggingAPI()
+        batch = self._make_one(_Logger(), client, max_entry_bytes=1000)
+        batch.log_text("small")
+        batch.log_text("x" * 2000)
+        batch.log_struct({"big": "y" * 2000})
+        oversized = batch.entries[1:]
+
+        with self.assertRaises(InvalidArgument) as context:
+            batch.commit()
+
+        self.assertIn("2 log entries", context.exception.message)
+        self.assertEqual(api.requests, [["small"]])
+        self.assertEqual(batch.entries, oversized)
+
+    def test_commit_truncates_oversized_text(self):
+        from google.api_core.exceptions import InvalidArgument
+        from google.cloud.logging_v2._helpers import _estimate_log_entry_size
+        from google.cloud.logging_v2.logger import OVERSIZE_TRUNCATE
+
+        client = _Client(project=self.PROJECT)
+        api = client.logging_api = _RejectingLoggingAPI()
+        batch = self._make_one(
+            _Logger(), client, max_entry_bytes=1000, oversize_policy=OVERSIZE_TRUNCATE
+        )
+        batch.log_text("é" * 1000)
+        batch.log_struct({"big": "y" * 2000})
+
+        with self.assertRaises(InvalidArgument):
+            batch.commit()
+
+        ((text,),) = api.requests
+        self.assertTrue(text.startswith("éé"))
+        self.assertTrue(text.endswith("...[truncated]"))
+        truncated = batch.entries[0]._replace(payload=text)
+        self.assertLessEqual(_estimate_log_entry_size(truncated), 1000)
+        # the struct entry cannot be truncated
+        self.assertEqual(len(batch.entries), 1)
+        self.assertEqual(batch.entries[0].payload, {"big": "y" * 2000})
+
+    def test_commit_isolates_rejected_entry(self):
+        from google.api_core.exceptions import InvalidArgument
+
+        client = _Client(project=self.PROJECT)
+        api = client.logging_api = _RejectingLoggingAPI(rejected={"5"})
+        batch = self._make_one(_Logger(), client)
+        for i in range(8):
+            batch.log_text(str(i))
+        poison = batch.entries[5]
+
+        with self.assertRaises(InvalidArgument) as context:
+            batch.commit()
+
+        # the halves of a rejected request are not written in order
+        written = sorted(payload for request in api.written for payload in request)
+        self.assertEqual(written, ["0", "1", "2", "3", "4", "6", "7"])
+        self.assertEqual(batch.entries, [poison])
+        self.assertEqual(batch.failures, [(poison, context.exception)])
+
+    def test_commit_stops_splitting_request_level_error(self):
+        from google.api_core.exceptions import InvalidArgument
+
+        client = _Client(project=self.PROJECT)
+        texts = [str(i) for i in range(64)]
+        # every request is rejected, whichever entries it holds
+        api = client.logging_api = _RejectingLoggingAPI(rejected=texts)
+        batch = self._make_one(_Logger(), client)
+        for text in texts:
+            batch.log_text(text)
+        entries = list(batch.entries)
+
+        with self.assertRaises(InvalidArgument) as context:
+            batch.commit()
+
+        # the whole request, then both halves, instead of 2N - 1 requests
+        self.assertEqual(len(api.requests), 3)
+        self.assertEqual(batch.entries, entries)
+        self.assertEqual(
+            [entry for entry, _ in batch.failures],
+            entries,
+        )
+        self.assertIs(batch.failures[0][1], context.exception)
+
+    def test_commit_isolates_rejected_entry_in_first_half(self):
+        from google.api_core.exceptions import InvalidArgument
+
+        client = _Client(project=self.PROJECT)
+        api = client.logging_api = _RejectingLoggingAPI(rejected={"1"})
+        batch = self._make_one(_Logger(), client)
+        for i in range(8):
+            batch.log_text(str(i))
+        poison = batch.entries[1]
+
+        with self.assertRaises(InvalidArgument):
+            batch.commit()
+
+        written = sorted(payload for request in api.written for payload in request)
+        self.assertEqual(written, ["0", "2", "3", "4", "5", "6", "7"])
+        self.assertEqual(batch.entries, [poison])
+
+    def test_commit_wo_partial_success_does_not_split_rejected_request(self):
+        from google.api_core.exceptions import InvalidArgument
+
+        client = _Client(project=self.PROJECT)
+        api = client.logging_api = _RejectingLoggingAPI(rejected={"1"})
+        batch = self._make_one(_Logger(), client)
+        for i in range(4):
+            batch.log_text(str(i))
+        entries = list(batch.entries)
+
+        with self.assertRaises(InvalidArgument):
+            batch.commit(partial_success=False)
+
+        self.assertEqual(len(api.requests), 1)
+        self.assertEqual(batch.entries, entries)
+
+    def test_commit_wo_partial_success_stops_at_rejected_request(self):
+        from google.api_core.exceptions import InvalidArgument
+
+        client = _Client(project=self.PROJECT)
+        api = client.logging_api = _RejectingLoggingAPI(rejected={"3"})
+        batch = self._make_one(_Logger(), client, max_request_entries=2)
+        for i in range(6):
+            batch.log_text(str(i))
+        entries = list(batch.entries)
+
+        with self.assertRaises(InvalidArgument) as context:
+            batch.commit(partial_success=False)
+
+        # the requests that follow the rejected one are not sent
+        self.assertEqual(api.written, [["0", "1"]])
+        self.assertEqual(len(api.requests), 2)
+        self.assertEqual(batch.entries, entries[2:])
+        self.assertEqual(
+            batch.failures,
+            [(entries[2], context.exception), (entries[3], context.exception)],
+        )
+
+    def test_commit_keeps_entries_failed_in_partial_write(self):
+        from google.api_core.exceptions import InvalidArgument
+        from google.api_core.exceptions import ServiceUnavailable
+
+        invalid = InvalidArgument("invalid")
+        unavailable = ServiceUnavailable("unavailable")
+        client = _Client(project=self.PROJECT)
+        api = client.logging_api = _RejectingLoggingAPI(
+            entry_errors={"1": invalid, "3": unavailable}
+        )
+        batch = self._make_one(_Logger(), client)
+        for i in range(5):
+            batch.log_text(str(i))
+        entries = list(batch.entries)
+
+        with self.assertRaises(InvalidArgument):
+            batch.commit()
+
+        # the request is not split, and the listed entries are kept
+        self.assertEqual(len(api.requests), 1)
+        self.assertEqual(batch.entries, [entries[1], entries[3]])
+        self.assertEqual(
+            batch.failures, [(entries[1], invalid), (entries[3], unavailable)]
+        )
+
+    def test_commit_wo_partial_success_keeps_all_entries_of_failed_request(self):
+        from google.api_core.exceptions import InvalidArgument
+
+        invalid = InvalidArgument("invalid")
+        client = _Client(project=self.PROJECT)
+        client.logging_api = _RejectingLoggingAPI(entry_errors={"1": invalid})
+        batch = self._make_one(_Logger(), client)
+        for i in range(3):
+            batch.log_text(str(i))
+        entries = list(batch.entries)
+
+        with self.assertRaises(InvalidArgument) as context:
+            batch.commit(partial_success=False)
+
+        self.assertEqual(batch.entries, entries)
+        self.assertEqual(
+            batch.failures,
+            [
+                (entries[0], context.exception),
+                (entries[1], invalid),
+                (entries[2], context.exception),
+            ],
+        )
+
+    def test_commit_w_permission_denied_wo_entry_errors(self):
+        from google.api_core.exceptions import PermissionDenied
+
+        client = _Client(project=self.PROJECT)
+        api = client.logging_api = _RejectingLoggingAPI(
+            errors=[PermissionDenied("denied")]
+        )
+        batch = self._make_one(_Logger(), client)
+        for i in range(3):
+            batch.log_text(str(i))
+        entries = list(batch.entries)
+
+        with self.assertRaises(PermissionDenied):
+            batch.commit()
+
+        # raised at once, without splitting the request
+        self.assertEqual(len(api.requests), 1)
+        self.assertEqual(batch.entries, entries)
+        self.assertEqual(batch.failures, [])
+
+    def test_commit_transient_error_keeps_unwritten_entries(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        client = _Client(project=self.PROJECT)
+        api = client.logging_api = _RejectingLoggingAPI(
+            errors=[None, ServiceUnavailable("unavailable")]
+        )
+        batch = self._make_one(_Logger(), client, max_request_entries=2)
+        for i in range(6):
+            batch.log_text(str(i))
+        unwritten = batch.entries[2:]
+
+        with self.assertRaises(ServiceUnavailable):
+            batch.commit()
+
+        self.assertEqual(api.written, [["0", "1"]])
+        self.assertEqual(batch.entries, unwritten)
+
+
+class Test__hoist_shared_fields(unittest.TestCase):
+    LOG_NAME = "projects/test-project/logs/test-log"
+    OTHER_LOG_NAME = "projects/test-project/logs/other-log"
+
+    @staticmethod
+    def _call_fut(entries, **kw):
+        from google.cloud.logging_v2.logger import _hoist_shared_fields
+
+        return _hoist_shared_fields(entries, **kw)
+
+    def test_empty(self):
+        result = self._call_fut([], log_name=self.LOG_NAME, labels={"a": "1"})
+        self.assertEqual(result, ([], self.LOG_NAME, None, {"a": "1"}))
+
+    def test_shared_log_name_and_resource(self):
+        from google.cloud.logging import Resource
+        from google.cloud.logging import TextEntry
+        from google.cloud.logging_v2.logger import _GLOBAL_RESOURCE
+
+        resource = Resource(type="gce_instance", labels={"zone": "us-east1"})
+        entries = [
+            TextEntry(payload=str(i), log_name=self.OTHER_LOG_NAME, resource=resource)
+            for i in range(3)
+        ]
+        stripped, log_name, hoisted, labels = self._call_fut(
+            entries, log_name=self.LOG_NAME, resource=_GLOBAL_RESOURCE
+        )
+        self.assertEqual(log_name, self.OTHER_LOG_NAME)
+        self.assertIs(hoisted, resource)
+        self.assertIsNone(labels)
+        self.assertEqual(
+            stripped,
+            [entry._replace(log_name=None, resource=None) for entry in entries],
+        )
+
+    def test_mixed_log_names(self):
+        from google.cloud.logging import TextEntry
+
+        entries = [
+            TextEntry(payload="a", resource=None, log_name=self.LOG_NAME),
+            TextEntry(payload="b", resource=None, log_name=self.OTHER_LOG_NAME),
+            TextEntry(payload="c", resource=None),
+        ]
+        stripped, log_name, _, _ = self._call_fut(entries, log_name=self.LOG_NAME)
+        self.assertEqual(log_name, self.LOG_NAME)
+        self.assertEqual(
+            stripped, [entries[0]._replace(log_name=None), entries[1], entries[2]]
+        )
+
+    def test_default_resource_prevents_hoisting(self):
+        from google.cloud.logging import Resource
+        from google.cloud.logging import TextEntry
+        from google.cloud.logging_v2.logger import _GLOBAL_RESOURCE
+
+        resource = Resource(type="gce_instance", labels={})
+        entries = [
+            TextEntry(payload="a", resource=resource),
+            TextEntry(payload="b", resource=None),
+        ]
+        stripped, _, hoisted, _ = self._call_fut(
+            entries, log_name=self.LOG_NAME, resource=_GLOBAL_RESOURCE
+        )
+        self.assertIs(hoisted, _GLOBAL_RESOURCE)
+        self.assertEqual(stripped, entries)
+
+    def test_shared_labels(self):
+        from google.cloud.logging import TextEntry
+
+        entries = [
+            TextEntry(
+                payload="a", resource=None, labels={"a": "2", "b": "1", "c": "1"}
+            ),
+            TextEntry(
+                payload="b", resource=None, labels={"a": "2", "b": "2", "c": "1"}
+            ),
+            TextEntry(payload="c", resource=None, labels={"a": "2", "c": "1"}),
+        ]
+        stripped, _, _, labels = self._call_fut(
+            entries, log_name=self.LOG_NAME, labels={"a": "1", "d": "1"}
+        )
+        self.assertEqual(labels, {"a": "2", "c": "1", "d": "1"})
+        self.assertEqual(
+            stripped,
+            [
+                entries[0]._replace(labels={"b": "1"}),
+                entries[1]._replace(labels={"b": "2"}),
+                entries[2]._replace(labels=None),
+            ],
+        )
+
+    def test_labels_equal_to_defaults_are_stripped(self):
+        from google.cloud.logging import TextEntry
+
+        entries = [
+            TextEntry(payload="a", resource=None, labels={"a": "1", "b": "1"}),
+            TextEntry(payload="b", resource=None),
+        ]
+        stripped, _, _, labels = self._call_fut(
+            entries, log_name=self.LOG_NAME, labels={"a": "1"}
+        )
+        self.assertEqual(labels, {"a": "1"})
+        self.assertEqual(stripped, [entries[0]._replace(labels={"b": "1"}), entries[1]])
+
+
+class TestAsyncLogger(unittest.TestCase):
+    PROJECT = "test-project"
+    LOGGER_NAME = "logger-name"
+
+    def setUp(self):
+        import google.cloud.logging_v2
+
+        google.cloud.logging_v2._instrumentation_emitted = True
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.logging import AsyncLogger
+
+        return AsyncLogger
+
+    def _make_one(self, *args, **kw):
+        from google.cloud.logging_v2.logger import _GLOBAL_RESOURCE
+
+        kw.setdefault("resource", _GLOBAL_RESOURCE)
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _make_client(project):
+        client = _Client(project)
+        client.async_logging_api = mock.Mock(spec=["write_entries"])
+        client.async_logging_api.write_entries = mock.AsyncMock()
+        return client
+
+    def test_log_text(self):
+        import asyncio
+
+        client = self._make_client(self.PROJECT)
+        logger = self._make_one(self.LOGGER_NAME, client=client)
+
+        asyncio.run(logger.log_text("TEXT", severity="warning"))
+
+        client.async_logging_api.write_entries.assert_awaited_once_with(
+            [
+                {
+                    "logName": logger.full_name,
+                    "textPayload": "TEXT",
+                    "severity": "WARNING",
+                    "resource": {"type": "global", "labels": {}},
+                }
+            ],
+            partial_success=True,
+        )
+
+    def test_log_dispatches_on_payload(self):
+        import asyncio
+
+        client = self._make_client(self.PROJECT)
+        logger = self._make_one(self.LOGGER_NAME, client=client)
+
+        async def main():
+            await logger.log({"key": "value"})
+            await logger.log("text")
+            await logger.log()
+
+        asyncio.run(main())
+
+        entries = [
+            call[0][0][0]
+            for call in client.async_logging_api.write_entries.call_args_list
+        ]
+        self.assertEqual(entries[0]["jsonPayload"], {"key": "value"})
+        self.assertEqual(entries[1]["textPayload"], "text")
+        self.assertNotIn("textPayload", entries[2])
+
+    def test_batch(self):
+        import asyncio
+        from google.cloud.logging import AsyncBatch
+
+        client = self._make_client(self.PROJECT)
+        logger = self._make_one(self.LOGGER_NAME, client=client)
+
+        async def main():
+            async with logger.batch() as batch:
+                self.assertIsInstance(batch, AsyncBatch)
+                batch.log_text("one")
+                batch.log_struct({"two": 2})
+            return batch
+
+        batch = asyncio.run(main())
+
+        self.assertEqual(batch.entries, [])
+        args, kwargs = client.async_logging_api.write_entries.call_args
+        self.assertEqual([entry.get("textPayload") for entry in args[0]], ["one", None])
+        self.assertEqual(kwargs["logger_name"], logger.full_name)
+        self.assertTrue(kwargs["partial_success"])
+
+    def test_batch_isolates_rejected_entry(self):
+        import asyncio
+        from google.api_core.exceptions import InvalidArgument
+
+        client = self._make_client(self.PROJECT)
+        written = []
+
+        async def write_entries(entries, **kwargs):
+            payloads = [entry["textPayload"] for entry in entries]
+            if "bad" in payloads:
+                raise InvalidArgument("bad")
+            written.extend(payloads)
+
+        client.async_logging_api.write_entries.side_effect = write_entries
+        logger = self._make_one(self.LOGGER_NAME, client=client)
+        batch = logger.batch(max_request_entries=2)
+        for text in ("one", "two", "bad", "four", "five"):
+            batch.log_text(text)
+
+        with self.assertRaises(InvalidArgument):
+            asyncio.run(batch.commit())
+
+        self.assertEqual(written, ["one", "two", "four", "five"])
+        self.assertEqual([entry.payload for entry in batch.entries], ["bad"])
+
+    def test_batch_commit_error_keeps_entries(self):
+        import asyncio
+        from google.api_core.exceptions import InvalidArgument
+
+        client = self._make_client(self.PROJECT)
+        client.async_logging_api.write_entries.side_effect = InvalidArgument("bad")
+        logger = self._make_one(self.LOGGER_NAME, client=client)
+        batch = logger.batch()
+        batch.log_text("one")
+
+        with self.assertRaises(InvalidArgument):
+            asyncio.run(batch.commit())
+
+        self.assertEqual(len(batch.entries), 1)
+
 
 class _Logger(object):
     labels = None
@@ -1894,6 +2465,46 @@ class _DummyLoggingExceptionAPI(object):
         raise self.exception
 
 
+class _RejectingLoggingAPI(object):
+    """Records the text of the entries of each request.
+
+    Requests with a text in ``rejected`` are rejected as a whole. Entries
+    with a text in ``entry_errors`` fail with that error, and the others
+    are written, as with ``partial_success``. Otherwise, ``errors`` are
+    raised in turn.
+    """
+
+    def __init__(self, rejected=(), entry_errors=None, errors=()):
+        self.rejected = set(rejected)
+        self.entry_errors = entry_errors or {}
+        self.errors = list(errors)
+        self.requests = []
+        self.written = []
+
+    def write_entries(self, entries, *, partial_success=False, **kwargs):
+        from google.api_core.exceptions import InvalidArgument
+
+        payloads = [entry.get("textPayload") for entry in entries]
+        self.requests.append(payloads)
+        error = self.errors.pop(0) if self.errors else None
+        if error is not None:
+            raise error
+        if self.rejected.intersection(payloads):
+            raise InvalidArgument("rejected")
+        entry_errors = {
+            index: self.entry_errors[payload]
+            for index, payload in enumerate(payloads)
+            if payload in self.entry_errors
+        }
+        if entry_errors:
+            error = InvalidArgument("partially written")
+            error.log_entry_errors = entry_errors
+            if partial_success:
+                self.written.append([p for p in payloads if p not in self.entry_errors])
+            raise error
+        self.written.append(payloads)
+
+
 class _Client(object):
     def __init__(self, project, connection=None):
         self.project = project
@@ -0,0 +1,230 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import decimal
+import json
+import unittest
+
+import mock
+
+
+class _FakeArray(object):
+    """Stands in for a NumPy array, which has a ``tolist`` method."""
+
+    __module__ = "numpy"
+
+    def __init__(self, values):
+        self._values = values
+
+    def tolist(self):
+        return list(self._values)
+
+
+def _installed_backends():
+    from google.cloud.logging_v2 import serialization
+
+    backends = [serialization.JSON]
+    if serialization.orjson is not None:
+        backends.append(serialization.ORJSON)
+    if serialization.ujson is not None:
+        backends.append(serialization.UJSON)
+    return backends
+
+
+class Test_default(unittest.TestCase):
+    @staticmethod
+    def _call_fut(value):
+        from google.cloud.logging_v2.serialization import default
+
+        return default(value)
+
+    def test_datetime(self):
+        value = datetime.datetime(2026, 1, 2, 3, 4, 5, 6, datetime.timezone.utc)
+        self.assertEqual(self._call_fut(value), "2026-01-02T03:04:05.000006+00:00")
+
+    def test_date_and_time(self):
+        self.assertEqual(self._call_fut(datetime.date(2026, 1, 2)), "2026-01-02")
+        self.assertEqual(self._call_fut(datetime.time(3, 4, 5)), "03:04:05")
+
+    def test_decimal(self):
+        self.assertEqual(self._call_fut(decimal.Decimal("1.25")), 1.25)
+
+    def test_numpy(self):
+        self.assertEqual(self._call_fut(_FakeArray((1, 2))), [1, 2])
+
+    def test_unsupported(self):
+        with self.assertRaises(TypeError):
+            self._call_fut(object())
+
+
+class Test_default_or_str(unittest.TestCase):
+    @staticmethod
+    def _call_fut(value):
+        from google.cloud.logging_v2.serialization import default_or_str
+
+        return default_or_str(value)
+
+    def test_supported(self):
+        self.assertEqual(self._call_fut(decimal.Decimal("1.25")), 1.25)
+
+    def test_unsupported(self):
+        class _Unsupported(object):
+            def __str__(self):
+                return "unsupported"
+
+        self.assertEqual(self._call_fut(_Unsupported()), "unsupported")
+
+
+class Test_backends(unittest.TestCase):
+    def setUp(self):
+        from google.cloud.logging_v2 import serialization
+
+        self._backend = serialization.get_backend()
+
+    def tearDown(self):
+        from google.cloud.logging_v2 import serialization
+
+        serialization.set_backend(self._backend)
+
+    def test_default_backend_is_json(self):
+        import importlib
+        from google.cloud.logging_v2 import serialization
+
+        importlib.reload(serialization)
+
+        self.assertEqual(serialization.get_backend(), serialization.JSON)
+
+    def test_set_backend_fastest_installed(self):
+        from google.cloud.logging_v2 import serialization
+
+        serialization.set_backend()
+
+        if serialization.orjson is not None:
+            expected = serialization.ORJSON
+        elif serialization.ujson is not None:
+            expected = serialization.UJSON
+        else:
+            expected = serialization.JSON
+        self.assertEqual(serialization.get_backend(), expected)
+
+    def test_set_backend_ujson_wo_default(self):
+        from google.cloud.logging_v2 import serialization
+
+        def dumps(value, ensure_ascii=True, escape_forward_slashes=True):
+            return json.dumps(value, ensure_ascii=ensure_ascii)
+
+        # older versions of ujson do not accept ``default``
+        ujson = mock.Mock(dumps=dumps, __version__="5.1.0")
+        serialization.set_backend(serialization.JSON)
+        with mock.patch.object(serialization, "ujson", ujson):
+            with self.assertRaises(ValueError) as context:
+                serialization.set_backend(serialization.UJSON)
+
+        self.assertIn("5.1.0", str(context.exception))
+        self.assertEqual(serialization.get_backend(), serialization.JSON)
+
+    def test_set_backend_ujson_w_default(self):
+        from google.cloud.logging_v2 import serialization
+
+        def dumps(value, ensure_ascii=True, escape_forward_slashes=True, default=None):
+            return json.dumps(value, ensure_ascii=ensure_ascii, default=default)
+
+        ujson = mock.Mock(dumps=dumps)
+        with mock.patch.object(serialization, "ujson", ujson):
+            serialization.set_backend(serialization.UJSON)
+
+            self.assertEqual(serialization.get_backend(), serialization.UJSON)
+            self.assertEqual(serialization.dumps({"x": "é"}), '{"x": "é"}')
+
+    def test_set_backend_unknown(self):
+        from google.cloud.logging_v2 import serialization
+
+        with self.assertRaises(ValueError):
+            serialization.set_backend("unknown")
+
+    def test_dumps(self):
+        from google.cloud.logging_v2 import serialization
+
+        value = {
+            "text": "héllo/world",
+            "when": datetime.datetime(2026, 1, 2, 3, 4, 5),
+            "amount": decimal.Decimal("1.5"),
+            "array": _FakeArray((1, 2)),
+            1: None,
+        }
+        expected = {
+            "text": "héllo/world",
+            "when": "2026-01-02T03:04:05",
+            "amount": 1.5,
+            "array": [1, 2],
+            "1": None,
+        }
+        for backend in _installed_backends():
+            serialization.set_backend(backend)
+            with self.subTest(backend=backend):
+                result = serialization.dumps(value)
+                self.assertIsInstance(result, str)
+                # non-ASCII characters are not escaped
+                self.assertIn("héllo", result)
+                self.assertEqual(json.loads(result), expected)
+                encoded = serialization.dumps_bytes(value)
+                self.assertEqual(json.loads(encoded.decode("utf-8")), expected)
+
+    def test_dumps_falls_back_to_json(self):
+        from google.cloud.logging_v2 import serialization
+
+        value = {"big": 2**70}
+        for backend in _installed_backends():
+            serialization.set_backend(backend)
+            with self.subTest(backend=backend):
+                self.assertEqual(json.loads(serialization.dumps(value)), value)
+                self.assertEqual(json.loads(serialization.dumps_bytes(value)), value)
+
+    def test_dumps_bytes_w_lone_surrogate(self):
+        from google.cloud.logging_v2 import serialization
+
+        value = {"message": "caf\udcff é"}
+        for backend in _installed_backends():
+            serialization.set_backend(backend)
+            with self.subTest(backend=backend):
+                encoded = serialization.dumps_bytes(value)
+                self.assertEqual(json.loads(encoded.decode("utf-8")), value)
+
+    def test_dumps_unsupported(self):
+        from google.cloud.logging_v2 import serialization
+
+        for backend in _installed_backends():
+            serialization.set_backend(backend)
+            with self.subTest(backend=backend):
+                with self.assertRaises(TypeError):
+                    serialization.dumps({"value": object()})
+
+    def test_dumps_w_default_or_str(self):
+        from google.cloud.logging_v2 import serialization
+
+        for backend in _installed_backends():
+            serialization.set_backend(backend)
+            with self.subTest(backend=backend):
+                result = serialization.dumps(
+                    {"value": 2**70, "other": Ellipsis},
+                    serialization.default_or_str,
+                )
+                self.assertEqual(
+                    json.loads(result), {"value": 2**70, "other": "Ellipsis"}
+                )
+                result = serialization.dumps_bytes(
+                    {"other": Ellipsis}, serialization.default_or_str
+                )
+                self.assertEqual(json.loads(result), {"other": "Ellipsis"})